@@ -39,10 +39,12 @@
     resume_partition_backfill as resume_partition_backfill,
     retry_partition_backfill as retry_partition_backfill,
 )
+from dagster_graphql.implementation.execution.run_event_hub import RunEventStream, get_run_event_hub
+from dagster_graphql.implementation.response_cache import invalidate_response_cache
 from dagster_graphql.implementation.utils import assert_permission, assert_permission_for_location
 
 if TYPE_CHECKING:
-    from dagster._core.storage.compute_log_manager import CapturedLogData
+    from dagster._core.storage.event_log.base import EventLogConnection
 
     from dagster_graphql.schema.errors import GrapheneRunNotFoundError
     from dagster_graphql.schema.logs.compute_logs import GrapheneCapturedLogs
@@ -225,6 +227,84 @@ def get_chunk_size() -> int:
     )
 
 
+def get_live_event_batch_size() -> int:
+    return int(os.getenv("DAGSTER_UI_LIVE_EVENT_BATCH_SIZE", "500"))
+
+
+def get_live_event_batch_interval() -> float:
+    return int(os.getenv("DAGSTER_UI_LIVE_EVENT_BATCH_INTERVAL_MS", "50")) / 1000
+
+
+def get_live_event_queue_limit() -> int:
+    return int(os.getenv("DAGSTER_UI_LIVE_EVENT_QUEUE_LIMIT", "10000"))
+
+
+class LiveEventBuffer:
+    """Buffers the live events of a run between the event log watcher thread and a subscription.
+
+    If the subscription falls too far behind the watcher, the buffer stops accepting events and is
+    marked as having fallen behind, at which point the subscription should stop watching and catch
+    up by loading events from storage instead.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, limit: int):
+        self._loop = loop
+        self._limit = limit
+        self._queue: asyncio.Queue[tuple[EventLogEntry, str]] = asyncio.Queue()
+        self.fell_behind = False
+
+    def enqueue(self, event: EventLogEntry, cursor: str) -> None:
+        # called from the watcher thread
+        self._loop.call_soon_threadsafe(self._put, event, cursor)
+
+    def _put(self, event: EventLogEntry, cursor: str) -> None:
+        if self.fell_behind:
+            return
+        if self._queue.qsize() >= self._limit:
+            self.fell_behind = True
+            return
+        self._queue.put_nowait((event, cursor))
+
+    async def get_batch(
+        self, max_size: int, max_interval: float
+    ) -> Sequence[tuple[EventLogEntry, str]]:
+        """Waits for the next event, then returns it along with any events that arrive within
+        max_interval seconds of it, up to max_size events in total.
+        """
+        batch = [await self._queue.get()]
+        deadline = self._loop.time() + max_interval
+        while len(batch) < max_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+
+            remaining = deadline - self._loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+
+async def _gen_event_record_chunks(
+    stream: RunEventStream, cursor: Optional[str]
+) -> AsyncIterator["EventLogConnection"]:
+    chunk_size = get_chunk_size()
+    has_more = True
+    while has_more:
+        # run the fetch in a thread since it may need to load the events from storage
+        connection = await run_in_threadpool(
+            stream.get_records_for_run, cursor=cursor, limit=chunk_size
+        )
+        yield connection
+        has_more = connection.has_more
+        cursor = connection.cursor
+
+
 async def gen_events_for_run(
     graphene_info: "ResolveInfo",
     run_id: str,
@@ -265,54 +345,69 @@ async def gen_events_for_run(
         dont_send_past_records = True
         after_cursor = None
 
-    chunk_size = get_chunk_size()
-    # load the existing events in chunks
-    has_more = True
-    while has_more:
-        # run the fetch in a thread since its sync
-        connection = await run_in_threadpool(
-            instance.get_records_for_run,
-            run_id=run_id,
-            cursor=after_cursor,
-            limit=chunk_size,
-        )
-
-        if not dont_send_past_records:
-            yield GraphenePipelineRunLogsSubscriptionSuccess(
-                run=GrapheneRun(record),
-                messages=get_graphene_events_from_records_connection(
-                    instance, connection, run.job_name
-                ),
-                hasMorePastEvents=connection.has_more,
-                cursor=connection.cursor,
-            )
-        has_more = connection.has_more
-        after_cursor = connection.cursor
-
-    loop = asyncio.get_event_loop()
-    queue: asyncio.Queue[tuple[EventLogEntry, str]] = asyncio.Queue()
-
-    def _enqueue(event: EventLogEntry, cursor: str):
-        loop.call_soon_threadsafe(queue.put_nowait, (event, cursor))
-
-    # watch for live events
-    instance.watch_event_logs(run_id, after_cursor, _enqueue)
-    show_failed_to_materialize = instance.can_read_asset_failure_events()
+    # the events of the run are shared with every other subscriber watching it
+    hub = get_run_event_hub(instance)
+    stream = await run_in_threadpool(hub.acquire, run_id)
     try:
+        # load the existing events in chunks
+        async for connection in _gen_event_record_chunks(stream, after_cursor):
+            if not dont_send_past_records:
+                yield GraphenePipelineRunLogsSubscriptionSuccess(
+                    run=GrapheneRun(record),
+                    messages=get_graphene_events_from_records_connection(
+                        instance, connection, run.job_name
+                    ),
+                    hasMorePastEvents=connection.has_more,
+                    cursor=connection.cursor,
+                )
+            after_cursor = connection.cursor
+
+        loop = asyncio.get_event_loop()
+        batch_size = get_live_event_batch_size()
+        batch_interval = get_live_event_batch_interval()
+        queue_limit = get_live_event_queue_limit()
+        show_failed_to_materialize = instance.can_read_asset_failure_events()
         while True:
-            event, cursor = await queue.get()
-            if (
-                show_failed_to_materialize
-                or event.dagster_event_type != DagsterEventType.ASSET_FAILED_TO_MATERIALIZE
-            ):
+            # watch for live events, coalescing the events that arrive in quick succession into a
+            # single message
+            buffer = LiveEventBuffer(loop, queue_limit)
+            if stream.subscribe(after_cursor, buffer.enqueue):
+                try:
+                    while not buffer.fell_behind:
+                        batch = await buffer.get_batch(batch_size, batch_interval)
+                        after_cursor = batch[-1][1]
+                        messages = [
+                            from_event_record(event, run.job_name)
+                            for event, _ in batch
+                            if show_failed_to_materialize
+                            or event.dagster_event_type
+                            != DagsterEventType.ASSET_FAILED_TO_MATERIALIZE
+                        ]
+                        if messages:
+                            yield GraphenePipelineRunLogsSubscriptionSuccess(
+                                run=GrapheneRun(record),
+                                messages=messages,
+                                hasMorePastEvents=False,
+                                cursor=after_cursor,
+                            )
+                finally:
+                    stream.unsubscribe(buffer.enqueue)
+
+            # the subscriber is consuming events more slowly than they are being written, or is
+            # behind the events buffered for the run, so drop the queued events and catch up from
+            # the last sent cursor in chunks before watching for live events again
+            async for connection in _gen_event_record_chunks(stream, after_cursor):
                 yield GraphenePipelineRunLogsSubscriptionSuccess(
                     run=GrapheneRun(record),
-                    messages=[from_event_record(event, run.job_name)],
-                    hasMorePastEvents=False,
-                    cursor=cursor,
+                    messages=get_graphene_events_from_records_connection(
+                        instance, connection, run.job_name
+                    ),
+                    hasMorePastEvents=connection.has_more,
+                    cursor=connection.cursor,
                 )
+                after_cursor = connection.cursor
     finally:
-        instance.end_watch_event_logs(run_id, _enqueue)
+        hub.release(stream)
 
 
 async def gen_captured_log_data(
@@ -326,20 +421,28 @@ async def gen_captured_log_data(
     subscription = compute_log_manager.subscribe(log_key, cursor)
 
     loop = asyncio.get_event_loop()
-    queue: asyncio.Queue[CapturedLogData] = asyncio.Queue()
+    updated = asyncio.Event()
 
-    def _enqueue(new_event):
-        loop.call_soon_threadsafe(queue.put_nowait, new_event)
+    def _notify():
+        loop.call_soon_threadsafe(updated.set)
 
-    # subscription object will attempt to fetch when started, so move off main thread
-    await run_in_threadpool(subscription, _enqueue)
+    # the logs are followed rather than observed, so that only the data appended since the last
+    # frame is read, one bounded frame at a time, as fast as the subscriber consumes it
+    await run_in_threadpool(subscription.follow, _notify)
 
-    is_complete = False
     try:
-        while not is_complete:
-            update = await queue.get()
-            yield from_captured_log_data(update)
-            is_complete = subscription.is_complete and queue.empty()
+        while True:
+            await updated.wait()
+            updated.clear()
+            # read before the frames, so that the data written before completion is sent
+            is_complete = subscription.is_complete
+            while True:
+                frame = await run_in_threadpool(subscription.read_frame)
+                if frame is None:
+                    break
+                yield from_captured_log_data(frame)
+            if is_complete:
+                break
     finally:
         subscription.dispose()
 
@@ -380,6 +483,7 @@ def wipe_assets(
                 )
 
     instance.wipe_assets(whole_assets_to_wipe)
+    invalidate_response_cache(graphene_info.context)
 
     result_ranges = [
         GrapheneAssetPartitionRange(asset_key=apr.asset_key, partition_range=apr.partition_range)
@@ -428,5 +532,6 @@ def report_runless_asset_events(
         instance.report_runless_asset_event(
             create_asset_event(event_type, asset_key, None, description, tags)
         )
+    invalidate_response_cache(graphene_info.context)
 
     return GrapheneReportRunlessAssetEventsSuccess(assetKey=asset_key)
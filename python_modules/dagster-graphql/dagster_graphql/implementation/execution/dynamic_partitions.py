@@ -4,6 +4,7 @@
 from dagster._core.definitions.selector import RepositorySelector
 from dagster._core.workspace.permissions import Permissions
 
+from dagster_graphql.implementation.response_cache import invalidate_response_cache
 from dagster_graphql.implementation.utils import (
     UserFacingGraphQLError,
     assert_permission_for_location,
@@ -92,6 +93,7 @@ def add_dynamic_partition(
         )
 
     graphene_info.context.instance.add_dynamic_partitions(partitions_def_name, [partition_key])
+    invalidate_response_cache(graphene_info.context)
     return GrapheneAddDynamicPartitionSuccess(
         partitionsDefName=partitions_def_name, partitionKey=partition_key
     )
@@ -128,5 +130,6 @@ def delete_dynamic_partitions(
 
     for partition_key in partition_keys:
         graphene_info.context.instance.delete_dynamic_partition(partitions_def_name, partition_key)
+    invalidate_response_cache(graphene_info.context)
 
     return GrapheneDeleteDynamicPartitionsSuccess(partitionsDefName=partitions_def_name)
@@ -0,0 +1,283 @@
+import bisect
+import os
+import threading
+import weakref
+from collections import deque
+from collections.abc import Sequence
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Optional
+
+import dagster._check as check
+from dagster._core.event_api import EventLogCursor, EventLogRecord
+from dagster._core.instance import DagsterInstance
+from dagster._core.storage.event_log.base import EventLogConnection
+
+if TYPE_CHECKING:
+    from dagster._core.events.log import EventLogEntry
+
+RunEventCallback = Callable[["EventLogEntry", str], None]
+
+
+def get_run_event_hub_max_events_per_run() -> int:
+    return int(os.getenv("DAGSTER_UI_RUN_EVENT_HUB_MAX_EVENTS_PER_RUN", "10000"))
+
+
+def get_run_event_hub_max_events() -> int:
+    return int(os.getenv("DAGSTER_UI_RUN_EVENT_HUB_MAX_EVENTS", "100000"))
+
+
+def _cursor_storage_id(cursor: str) -> int:
+    return EventLogCursor.parse(cursor).storage_id()
+
+
+class RunEventStream:
+    """The events of a single run which is being watched by one or more subscribers.
+
+    A bounded buffer of the most recent events of the run is kept in memory, and is kept up to date
+    by a single event log watch which is shared between all subscribers. Pages of events which are
+    fully contained in the buffer are served from it, and older pages are loaded from storage.
+    """
+
+    def __init__(self, instance: DagsterInstance, run_id: str, capacity: int):
+        self._instance = instance
+        self._run_id = run_id
+        self._capacity = capacity
+        self._lock = threading.Lock()
+        self._records: deque[EventLogRecord] = deque()
+        self._storage_ids: deque[int] = deque()
+        # every event of the run with a storage id greater than this has been buffered, up to the
+        # latest event delivered by the watch. None until the stream has been loaded
+        self._covered_after_id: Optional[int] = None
+        self._latest_storage_id: Optional[int] = None
+        self._subscribers: dict[RunEventCallback, int] = {}
+        self._on_event_callback = self._on_event
+        self._is_watching = False
+        self.num_references = 0
+
+    @property
+    def run_id(self) -> str:
+        return self._run_id
+
+    @property
+    def num_buffered_events(self) -> int:
+        return len(self._records)
+
+    def load(self) -> None:
+        """Loads the most recent events of the run into the buffer and starts watching for new
+        events, if that has not already been done.
+        """
+        with self._lock:
+            if self._is_watching:
+                return
+
+            connection = self._instance.get_records_for_run(
+                self._run_id, limit=max(self._capacity, 1), ascending=False
+            )
+            for record in reversed(connection.records):
+                self._append(record)
+            self._covered_after_id = (
+                # the run has fewer events than the buffer can hold, so all of them are buffered
+                -1
+                if not connection.has_more or not connection.records
+                # otherwise, all events from the earliest loaded one onwards are buffered
+                else connection.records[-1].storage_id - 1
+            )
+            self._trim()
+
+            cursor = (
+                str(EventLogCursor.from_storage_id(self._latest_storage_id))
+                if self._latest_storage_id is not None
+                else None
+            )
+            self._instance.watch_event_logs(self._run_id, cursor, self._on_event_callback)
+            self._is_watching = True
+
+    def close(self) -> None:
+        with self._lock:
+            was_watching = self._is_watching
+            self._is_watching = False
+            self._records.clear()
+            self._storage_ids.clear()
+            self._covered_after_id = None
+            self._latest_storage_id = None
+            self._subscribers.clear()
+
+        # the watcher may be waiting on the lock to deliver an event while holding its own lock, so
+        # the watch is ended outside of it
+        if was_watching:
+            self._instance.end_watch_event_logs(self._run_id, self._on_event_callback)
+
+    def set_capacity(self, capacity: int) -> None:
+        with self._lock:
+            self._capacity = capacity
+            self._trim()
+
+    def _append(self, record: EventLogRecord) -> None:
+        self._records.append(record)
+        self._storage_ids.append(record.storage_id)
+        self._latest_storage_id = record.storage_id
+
+    def _trim(self) -> None:
+        while len(self._records) > self._capacity:
+            self._records.popleft()
+            self._covered_after_id = self._storage_ids.popleft()
+
+    def _is_covered(self, cursor: Optional[str]) -> bool:
+        if self._covered_after_id is None:
+            return False
+        if cursor is None:
+            return self._covered_after_id == -1
+        cursor_obj = EventLogCursor.parse(cursor)
+        return cursor_obj.is_id_cursor() and cursor_obj.storage_id() >= self._covered_after_id
+
+    def _get_buffered_records_after(
+        self, cursor: Optional[str], limit: Optional[int] = None
+    ) -> Sequence[EventLogRecord]:
+        start = (
+            bisect.bisect_right(self._storage_ids, _cursor_storage_id(cursor))
+            if cursor is not None
+            else 0
+        )
+        return list(islice(self._records, start, start + limit if limit is not None else None))
+
+    def get_records_for_run(self, cursor: Optional[str], limit: int) -> EventLogConnection:
+        """Returns a page of the events of the run after the given cursor, in the same way as
+        `DagsterInstance.get_records_for_run`, serving it from the buffer where possible.
+        """
+        with self._lock:
+            if self._is_covered(cursor):
+                # ask for one more record than needed to find out whether there are more
+                records = self._get_buffered_records_after(cursor, limit + 1)
+                has_more = len(records) > limit
+                records = records[:limit]
+                if records:
+                    next_cursor = str(EventLogCursor.from_storage_id(records[-1].storage_id))
+                else:
+                    next_cursor = cursor or str(EventLogCursor.from_storage_id(-1))
+                return EventLogConnection(records=records, cursor=next_cursor, has_more=has_more)
+
+        return self._instance.get_records_for_run(self._run_id, cursor=cursor, limit=limit)
+
+    def subscribe(self, cursor: Optional[str], callback: RunEventCallback) -> bool:
+        """Calls the callback with each event of the run after the given cursor, starting with the
+        buffered ones. Returns False without subscribing if the buffer does not contain every event
+        after the cursor, in which case the subscriber should first catch up from
+        `get_records_for_run`.
+        """
+        with self._lock:
+            if not self._is_covered(cursor):
+                return False
+
+            after_id = _cursor_storage_id(cursor) if cursor is not None else -1
+            for record in self._get_buffered_records_after(cursor):
+                callback(
+                    record.event_log_entry, str(EventLogCursor.from_storage_id(record.storage_id))
+                )
+                after_id = record.storage_id
+            self._subscribers[callback] = after_id
+            return True
+
+    def unsubscribe(self, callback: RunEventCallback) -> None:
+        with self._lock:
+            self._subscribers.pop(callback, None)
+
+    def _on_event(self, event: "EventLogEntry", cursor: str) -> None:
+        # called from the watcher thread
+        storage_id = _cursor_storage_id(cursor)
+        with self._lock:
+            if not self._is_watching or (
+                self._latest_storage_id is not None and storage_id <= self._latest_storage_id
+            ):
+                return
+            self._append(EventLogRecord(storage_id=storage_id, event_log_entry=event))
+            self._trim()
+            for callback, after_id in self._subscribers.items():
+                # subscribers may have loaded events from storage ahead of the watch
+                if storage_id > after_id:
+                    callback(event, cursor)
+                    self._subscribers[callback] = storage_id
+
+
+class RunEventHub:
+    """Shares the events of the runs which are being watched between all of their subscribers,
+    so that each run is watched and loaded at most once no matter how many subscribers it has.
+
+    Each watched run holds at most `max_events_per_run` events in memory, and the events held by all
+    watched runs are limited to `max_events` by evenly shrinking the buffer of each run. A run is
+    evicted as soon as its last subscriber releases it.
+    """
+
+    def __init__(self, instance: DagsterInstance, max_events_per_run: int, max_events: int):
+        self._instance = check.inst_param(instance, "instance", DagsterInstance)
+        self._max_events_per_run = check.int_param(max_events_per_run, "max_events_per_run")
+        self._max_events = check.int_param(max_events, "max_events")
+        self._lock = threading.Lock()
+        self._streams: dict[str, RunEventStream] = {}
+
+    @property
+    def watched_run_ids(self) -> Sequence[str]:
+        with self._lock:
+            return list(self._streams)
+
+    def _get_capacity(self) -> int:
+        return min(self._max_events_per_run, self._max_events // max(len(self._streams), 1))
+
+    def acquire(self, run_id: str) -> RunEventStream:
+        """Returns the event stream of the given run, loading it if the run is not yet watched.
+        Every acquired stream must be released.
+        """
+        check.str_param(run_id, "run_id")
+        with self._lock:
+            stream = self._streams.get(run_id)
+            if stream is None:
+                stream = RunEventStream(self._instance, run_id, self._get_capacity())
+                self._streams[run_id] = stream
+                capacity = self._get_capacity()
+                streams = list(self._streams.values())
+            else:
+                streams = []
+            stream.num_references += 1
+
+        # shrink the buffers of the other runs to make room for the new one
+        for other in streams:
+            other.set_capacity(capacity)
+
+        try:
+            stream.load()
+        except Exception:
+            self.release(stream)
+            raise
+        return stream
+
+    def release(self, stream: RunEventStream) -> None:
+        with self._lock:
+            stream.num_references -= 1
+            should_evict = stream.num_references == 0
+            if should_evict:
+                del self._streams[stream.run_id]
+                capacity = self._get_capacity()
+                streams = list(self._streams.values())
+
+        if should_evict:
+            stream.close()
+            # let the buffers of the remaining runs grow into the freed space
+            for other in streams:
+                other.set_capacity(capacity)
+
+
+_hubs: "weakref.WeakKeyDictionary[DagsterInstance, RunEventHub]" = weakref.WeakKeyDictionary()
+_hubs_lock = threading.Lock()
+
+
+def get_run_event_hub(instance: DagsterInstance) -> RunEventHub:
+    """Returns the run event hub shared by all subscriptions against the given instance."""
+    with _hubs_lock:
+        hub = _hubs.get(instance)
+        if hub is None:
+            hub = RunEventHub(
+                instance,
+                max_events_per_run=get_run_event_hub_max_events_per_run(),
+                max_events=get_run_event_hub_max_events(),
+            )
+            _hubs[instance] = hub
+        return hub
@@ -1,7 +1,6 @@
 import datetime
-from collections import defaultdict
 from collections.abc import Mapping, Sequence
-from typing import TYPE_CHECKING, AbstractSet, Any, Optional, Union  # noqa: UP035
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from dagster import (
     AssetKey,
@@ -11,8 +10,8 @@
 from dagster._core.errors import DagsterInvariantViolationError, DagsterRunNotFoundError
 from dagster._core.execution.backfill import BulkActionsFilter, BulkActionStatus
 from dagster._core.instance import DagsterInstance
+from dagster._core.storage.asset_latest_info_record import AssetLatestInfoRecord
 from dagster._core.storage.dagster_run import DagsterRunStatus, RunRecord, RunsFilter
-from dagster._core.storage.event_log.base import AssetRecord
 from dagster._core.storage.tags import BACKFILL_ID_TAG, TagType, get_tag_type
 from dagster._record import copy, record
 from dagster._time import datetime_from_timestamp
@@ -141,112 +140,26 @@ def get_run_ids(
     return instance.get_run_ids(filters=filters, cursor=cursor, limit=limit)
 
 
-PENDING_STATUSES = [
-    DagsterRunStatus.STARTING,
-    DagsterRunStatus.MANAGED,
-    DagsterRunStatus.NOT_STARTED,
-    DagsterRunStatus.QUEUED,
-    DagsterRunStatus.STARTED,
-    DagsterRunStatus.CANCELING,
-]
-IN_PROGRESS_STATUSES = [
-    DagsterRunStatus.STARTED,
-    DagsterRunStatus.CANCELING,
-]
-
-
-def _get_latest_planned_run_id(instance: DagsterInstance, asset_record: AssetRecord):
-    if instance.event_log_storage.asset_records_have_last_planned_and_failed_materializations:
-        return asset_record.asset_entry.last_planned_materialization_run_id
-    else:
-        planned_info = instance.get_latest_planned_materialization_info(
-            asset_record.asset_entry.asset_key
-        )
-        return planned_info.run_id if planned_info else None
-
-
 def get_assets_latest_info(
     graphene_info: "ResolveInfo", step_keys_by_asset: Mapping[AssetKey, Sequence[str]]
 ) -> Sequence["GrapheneAssetLatestInfo"]:
+    from dagster_graphql.implementation.fetch_assets import get_unique_asset_id
     from dagster_graphql.schema.asset_graph import GrapheneAssetLatestInfo
     from dagster_graphql.schema.logs.events import GrapheneMaterializationEvent
     from dagster_graphql.schema.pipelines.pipeline import GrapheneRun
 
-    instance = graphene_info.context.instance
-
     asset_keys = list(step_keys_by_asset.keys())
 
     if not asset_keys:
         return []
 
-    asset_nodes = {
-        asset_key: graphene_info.context.asset_graph.get(asset_key) for asset_key in asset_keys
-    }
-
-    asset_records = [
-        record
-        for record in AssetRecord.blocking_get_many(graphene_info.context, asset_keys)
-        if record is not None
-    ]
-
-    latest_materialization_by_asset = {
-        asset_record.asset_entry.asset_key: (
-            GrapheneMaterializationEvent(event=asset_record.asset_entry.last_materialization)
-            if asset_record.asset_entry.last_materialization
-            and asset_record.asset_entry.asset_key in step_keys_by_asset
-            else None
-        )
-        for asset_record in asset_records
-    }
-
-    # Build a lookup table of asset keys to last materialization run IDs. We will filter these
-    # run IDs out of the "in progress" run lists that are generated below since they have already
-    # emitted an output for the run.
-    latest_materialization_run_id_by_asset: dict[AssetKey, Optional[str]] = {
-        asset_record.asset_entry.asset_key: (
-            asset_record.asset_entry.last_materialization.run_id
-            if asset_record.asset_entry.last_materialization
-            and asset_record.asset_entry.asset_key in step_keys_by_asset
-            else None
-        )
-        for asset_record in asset_records
-    }
-
-    latest_planned_run_ids_by_asset = {
-        k: v
-        for k, v in {
-            asset_record.asset_entry.asset_key: _get_latest_planned_run_id(instance, asset_record)
-            for asset_record in asset_records
-        }.items()
-        if v
-    }
-
-    run_records_by_run_id = {}
-
-    run_ids = (
-        list(set(latest_planned_run_ids_by_asset.values()))
-        if latest_planned_run_ids_by_asset
-        else []
-    )
-    if run_ids:
-        run_records = instance.get_run_records(RunsFilter(run_ids=run_ids))
-        for run_record in run_records:
-            run_records_by_run_id[run_record.dagster_run.run_id] = run_record
-
-    (
-        in_progress_run_ids_by_asset,
-        unstarted_run_ids_by_asset,
-    ) = _get_in_progress_runs_for_assets(
-        run_records_by_run_id,
-        latest_materialization_run_id_by_asset,
-        latest_planned_run_ids_by_asset,
-    )
-
-    from dagster_graphql.implementation.fetch_assets import get_unique_asset_id
-
     latest_infos = []
-    for asset_key in step_keys_by_asset.keys():
-        asset_node = asset_nodes[asset_key]
+    for record_or_none in AssetLatestInfoRecord.blocking_get_many(
+        graphene_info.context, asset_keys
+    ):
+        latest_info_record = check.not_none(record_or_none)
+        asset_key = latest_info_record.asset_key
+        asset_node = graphene_info.context.asset_graph.get(asset_key)
         if asset_node:
             handle = asset_node.resolve_to_singular_repo_scoped_node().repository_handle
             node_id = get_unique_asset_id(
@@ -257,19 +170,23 @@ def get_assets_latest_info(
         else:
             node_id = get_unique_asset_id(asset_key)
 
+        latest_materialization = latest_info_record.latest_materialization
         latest_infos.append(
             GrapheneAssetLatestInfo(
                 id=node_id,
                 assetKey=asset_key,
-                latestMaterialization=latest_materialization_by_asset.get(asset_key),
-                unstartedRunIds=list(unstarted_run_ids_by_asset.get(asset_key, [])),
-                inProgressRunIds=list(in_progress_run_ids_by_asset.get(asset_key, [])),
+                latestMaterialization=(
+                    GrapheneMaterializationEvent(event=latest_materialization)
+                    if latest_materialization
+                    else None
+                ),
+                unstartedRunIds=list(latest_info_record.unstarted_run_ids),
+                inProgressRunIds=list(latest_info_record.in_progress_run_ids),
+                # Dagster UI error occurs if a run is terminated at the same time that this endpoint
+                # is called, so there is no latest run if its record no longer exists.
                 latestRun=(
-                    GrapheneRun(run_records_by_run_id[latest_planned_run_ids_by_asset[asset_key]])
-                    # Dagster UI error occurs if a run is terminated at the same time that this endpoint is
-                    # called so we check to make sure the run ID exists in the run records.
-                    if asset_key in latest_planned_run_ids_by_asset
-                    and latest_planned_run_ids_by_asset[asset_key] in run_records_by_run_id
+                    GrapheneRun(latest_info_record.latest_run_record)
+                    if latest_info_record.latest_run_record
                     else None
                 ),
             )
@@ -278,35 +195,6 @@ def get_assets_latest_info(
     return latest_infos
 
 
-def _get_in_progress_runs_for_assets(
-    run_records_by_run_id: Mapping[str, RunRecord],
-    latest_materialization_run_id_by_asset: dict[AssetKey, Optional[str]],
-    latest_run_ids_by_asset: dict[AssetKey, str],
-) -> tuple[Mapping[AssetKey, AbstractSet[str]], Mapping[AssetKey, AbstractSet[str]]]:
-    in_progress_run_ids_by_asset = defaultdict(set)
-    unstarted_run_ids_by_asset = defaultdict(set)
-
-    for asset_key, run_id in latest_run_ids_by_asset.items():
-        record = run_records_by_run_id.get(run_id)
-
-        if not record:
-            continue
-
-        run = record.dagster_run
-        if (
-            run.status not in PENDING_STATUSES
-            or latest_materialization_run_id_by_asset.get(asset_key) == run.run_id
-        ):
-            continue
-
-        if run.status in IN_PROGRESS_STATUSES:
-            in_progress_run_ids_by_asset[asset_key].add(record.dagster_run.run_id)
-        else:
-            unstarted_run_ids_by_asset[asset_key].add(record.dagster_run.run_id)
-
-    return in_progress_run_ids_by_asset, unstarted_run_ids_by_asset
-
-
 def get_runs_count(graphene_info: "ResolveInfo", filters: Optional[RunsFilter]) -> int:
     return graphene_info.context.instance.get_runs_count(filters)
 
@@ -562,8 +450,6 @@ def get_runs_feed_entries(
     # the user chooses the "RUNS" view, we want to flatten backfills into their runs.
     exclude_subruns = view == GrapheneRunsFeedView.ROOTS
 
-    # if using limit, fetch limit+1 of each type to know if there are more than limit remaining
-    fetch_limit = limit + 1
     # filter out any backfills/runs that are newer than the cursor timestamp. See RunsFeedCursor docstring
     # for case when this is necessary
     created_before_cursor = (
@@ -591,53 +477,27 @@ def get_runs_feed_entries(
             )
         backfill_filters = BulkActionsFilter(created_before=created_before_cursor)
 
-    if should_fetch_backfills:
-        backfills = [
-            GraphenePartitionBackfill(backfill)
-            for backfill in instance.get_backfills(
-                cursor=runs_feed_cursor.backfill_cursor,
-                limit=fetch_limit,
-                filters=backfill_filters,
-            )
-        ]
-    else:
-        backfills = []
-
     # if we are not showing runs within backfills and the backfill_id filter is set, we know
     # there will be no results, so we can skip fetching runs
     should_fetch_runs = (
         view == GrapheneRunsFeedView.ROOTS or view == GrapheneRunsFeedView.RUNS
     ) and not (exclude_subruns and run_filters.tags.get(BACKFILL_ID_TAG) is not None)
-    if should_fetch_runs:
-        runs = [
-            GrapheneRun(run)
-            for run in instance.get_run_records(
-                limit=fetch_limit, cursor=runs_feed_cursor.run_cursor, filters=run_filters
-            )
-        ]
-    else:
-        runs = []
-
-    # if we fetched limit+1 of either runs or backfills, we know there must be more results
-    # to fetch on the next call since we will return limit results for this call. Additionally,
-    # if we fetched more than limit of runs and backfill combined, we know there are more results
-    has_more = (
-        len(backfills) == fetch_limit
-        or len(runs) == fetch_limit
-        or len(backfills) + len(runs) > limit
-    )
-
-    all_entries = backfills + runs
 
-    # order runs and backfills by create_time. typically we sort by storage id but that won't work here since
-    # they are different tables
-    all_entries = sorted(
-        all_entries,
-        key=lambda x: x.creation_timestamp,
-        reverse=True,
+    # runs and backfills are merged by creation time in the run storage. Fetch limit+1 entries to
+    # know if there are more results to fetch on the next call
+    entries = instance.get_runs_feed_entries(
+        limit=limit + 1,
+        runs_filter=run_filters if should_fetch_runs else None,
+        backfills_filter=backfill_filters if should_fetch_backfills else None,
+        run_cursor=runs_feed_cursor.run_cursor,
+        backfill_cursor=runs_feed_cursor.backfill_cursor,
     )
+    has_more = len(entries) > limit
 
-    to_return = all_entries[:limit]
+    to_return = [
+        GrapheneRun(entry) if isinstance(entry, RunRecord) else GraphenePartitionBackfill(entry)
+        for entry in entries[:limit]
+    ]
 
     new_run_cursor = None
     new_backfill_cursor = None
@@ -684,15 +544,9 @@ def get_runs_feed_count(
             if filters
             else RunsFilter(exclude_subruns=exclude_subruns)
         )
-    if should_fetch_backfills:
-        backfill_filters = _bulk_action_filters_from_run_filters(run_filters)
-        backfills_count = graphene_info.context.instance.get_backfills_count(backfill_filters)
-    else:
-        backfills_count = 0
-
-    if should_fetch_runs:
-        runs_count = graphene_info.context.instance.get_runs_count(run_filters)
-    else:
-        runs_count = 0
-
-    return runs_count + backfills_count
+    return graphene_info.context.instance.get_runs_feed_count(
+        runs_filter=run_filters if should_fetch_runs else None,
+        backfills_filter=(
+            _bulk_action_filters_from_run_filters(run_filters) if should_fetch_backfills else None
+        ),
+    )
@@ -0,0 +1,208 @@
+import hashlib
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, AbstractSet, Any, NamedTuple, Optional  # noqa: UP035
+
+import dagster._check as check
+from dagster_shared.seven import json
+from graphql import GraphQLError, OperationType, parse
+from graphql.utilities import get_operation_ast
+
+if TYPE_CHECKING:
+    from dagster._core.workspace.context import (
+        BaseWorkspaceRequestContext,
+        IWorkspaceProcessContext,
+    )
+
+
+def get_response_cache_operations() -> AbstractSet[str]:
+    operations = os.getenv("DAGSTER_UI_RESPONSE_CACHE_OPERATIONS", "")
+    return {name.strip() for name in operations.split(",") if name.strip()}
+
+
+def get_response_cache_max_entries() -> int:
+    return int(os.getenv("DAGSTER_UI_RESPONSE_CACHE_MAX_ENTRIES", "1000"))
+
+
+def get_response_cache_ttl() -> float:
+    return float(os.getenv("DAGSTER_UI_RESPONSE_CACHE_TTL_SECONDS", "60"))
+
+
+class ResponseCacheKey(NamedTuple):
+    operation_name: str
+    query_hash: str
+    variables: str
+    permissions: tuple[tuple[str, bool], ...]
+    workspace_version: tuple[tuple[str, str, float], ...]
+    watermark: int
+    generation: int
+
+
+class ResponseCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+
+class GraphQLResponseCache:
+    """Caches the responses to GraphQL queries whose results only change when the workspace is
+    reloaded or new events are written.
+
+    Responses are keyed by the operation, its variables, the permissions of the request, the version
+    of each code location in the workspace and the greatest storage id in the event log, so a
+    cached response is never served once the code it was computed from or the events it was computed
+    from have changed. State which is not tracked by the event log, like dynamic partitions, wiped
+    assets, deleted runs, schedule and sensor state or backfills, is covered by invalidating the
+    cache after every mutation, and by expiring each response after a fixed time. Least recently
+    used responses are evicted once the cache is full.
+
+    Only the operations named in `operation_names` are cached. Since writes made outside of the
+    GraphQL API, for example by the daemon, are only detected through the event log, only operations
+    whose results are derived from the workspace and the event log should be listed, or they may
+    serve stale data for up to the TTL.
+    """
+
+    def __init__(self, operation_names: AbstractSet[str], max_entries: int, ttl_seconds: float):
+        self._operation_names = frozenset(
+            check.set_param(set(operation_names), "operation_names", of_type=str)
+        )
+        self._max_entries = check.int_param(max_entries, "max_entries")
+        self._ttl_seconds = check.numeric_param(ttl_seconds, "ttl_seconds")
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[ResponseCacheKey, tuple[Any, float]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        # bumped on every invalidation, so that responses to requests which started before an
+        # invalidation are never served after it
+        self._generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._operation_names) and self._max_entries > 0
+
+    def make_key(
+        self,
+        context: "BaseWorkspaceRequestContext",
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        operation_name: Optional[str],
+    ) -> Optional[ResponseCacheKey]:
+        """Returns the key of the response to the given request, or None if it cannot be cached."""
+        if not self.enabled or operation_name not in self._operation_names:
+            return None
+
+        try:
+            watermark = context.instance.event_log_storage.get_maximum_record_id()
+        except NotImplementedError:
+            # without a watermark there is no way to tell when cached responses become stale
+            return None
+
+        return ResponseCacheKey(
+            operation_name=operation_name,
+            query_hash=hashlib.sha1(query.encode("utf-8")).hexdigest(),
+            variables=json.dumps(variables or {}, sort_keys=True),
+            permissions=tuple(
+                sorted(
+                    (permission, result.enabled)
+                    for permission, result in context.permissions.items()
+                )
+            ),
+            workspace_version=tuple(
+                sorted(
+                    (name, entry.version_key, entry.update_timestamp)
+                    for name, entry in context.get_code_location_entries().items()
+                )
+            ),
+            watermark=watermark or 0,
+            generation=self._generation,
+        )
+
+    def get(self, key: ResponseCacheKey) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                    self._evictions += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def set(self, key: ResponseCacheKey, response: Any) -> None:
+        with self._lock:
+            self._entries[key] = (response, time.monotonic() + self._ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._invalidations += 1
+            self._generation += 1
+
+    def get_stats(self) -> ResponseCacheStats:
+        with self._lock:
+            return ResponseCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+            )
+
+
+def is_mutation(query: str, operation_name: Optional[str]) -> bool:
+    """Whether the operation of the given GraphQL request is a mutation."""
+    try:
+        operation = get_operation_ast(parse(query), operation_name)
+    except GraphQLError:
+        return False
+    return operation is not None and operation.operation == OperationType.MUTATION
+
+
+_caches: "weakref.WeakKeyDictionary[IWorkspaceProcessContext, GraphQLResponseCache]" = (
+    weakref.WeakKeyDictionary()
+)
+_caches_lock = threading.Lock()
+
+
+def get_response_cache(process_context: "IWorkspaceProcessContext") -> GraphQLResponseCache:
+    """Returns the response cache shared by all requests against the given process context."""
+    with _caches_lock:
+        cache = _caches.get(process_context)
+        if cache is None:
+            cache = GraphQLResponseCache(
+                operation_names=get_response_cache_operations(),
+                max_entries=get_response_cache_max_entries(),
+                ttl_seconds=get_response_cache_ttl(),
+            )
+            _caches[process_context] = cache
+        return cache
+
+
+def invalidate_response_cache(context: "BaseWorkspaceRequestContext") -> None:
+    """Drops every cached response for the process context of the given request. Called after
+    writes through the GraphQL API which cached responses may depend on.
+    """
+    with _caches_lock:
+        cache = _caches.get(context.process_context)
+    if cache is not None:
+        cache.invalidate()
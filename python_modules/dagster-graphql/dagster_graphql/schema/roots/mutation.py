@@ -33,6 +33,7 @@
     launch_reexecution_from_parent_run,
 )
 from dagster_graphql.implementation.external import fetch_workspace, get_full_remote_job_or_raise
+from dagster_graphql.implementation.response_cache import invalidate_response_cache
 from dagster_graphql.implementation.telemetry import log_ui_telemetry_event
 from dagster_graphql.implementation.utils import (
     ExecutionMetadata,
@@ -683,6 +684,7 @@ def mutate(
         # our current WorkspaceRequestContext outdated. Therefore, `reload_repository_location` returns
         # an updated WorkspaceRequestContext for us to use.
         new_context = graphene_info.context.reload_code_location(repositoryLocationName)
+        invalidate_response_cache(new_context)
         return GrapheneWorkspaceLocationEntry(
             check.not_none(new_context.get_location_entry(repositoryLocationName))
         )
@@ -745,6 +747,7 @@ class Meta:
     @check_permission(Permissions.RELOAD_WORKSPACE)
     def mutate(self, graphene_info: ResolveInfo):
         new_context = graphene_info.context.reload_workspace()
+        invalidate_response_cache(new_context)
         return fetch_workspace(new_context)
 
 
@@ -1221,8 +1221,6 @@ def resolve_assetsLatestInfo(
             for remote_node in remote_nodes
         }
 
-        AssetRecord.prepare(graphene_info.context, asset_keys)
-
         return get_assets_latest_info(graphene_info, step_keys_by_asset)
 
     @capture_error
@@ -1946,7 +1946,9 @@ def _get_materialized_partitions():
             )
 
         counts = counter.counts()
-        assert counts.get("DagsterInstance.get_dynamic_partitions") == 1
+        # the partition keys are paged in once and then served from the loader
+        assert counts.get("DagsterInstance.get_paginated_dynamic_partitions") == 1
+        assert counts.get("DagsterInstance.get_dynamic_partitions") is None
 
     def test_dynamic_partitions_exists(self, graphql_context: WorkspaceRequestContext):
         partitions = ["foo", "bar", "baz"]
@@ -2849,7 +2851,9 @@ def test_dynamic_dim_in_multipartitions_def_materialized(
             variables={"pipelineSelector": selector},
         )
         counts = counter.counts()
-        assert counts.get("DagsterInstance.get_dynamic_partitions") == 1
+        # the partition keys are paged in once and then served from the loader
+        assert counts.get("DagsterInstance.get_paginated_dynamic_partitions") == 1
+        assert counts.get("DagsterInstance.get_dynamic_partitions") is None
 
         assert result.data
         assert result.data["assetNodes"]
@@ -0,0 +1,117 @@
+import time
+
+from dagster import AssetMaterialization
+from dagster._core.test_utils import environ, instance_for_test
+from dagster._core.workspace.context import WorkspaceProcessContext
+from dagster._core.workspace.load_target import EmptyWorkspaceTarget
+from dagster_graphql.implementation.response_cache import (
+    GraphQLResponseCache,
+    get_response_cache,
+    invalidate_response_cache,
+    is_mutation,
+)
+
+QUERY = "query AssetGraphQuery { assetNodes { id } }"
+
+
+def test_response_cache_key():
+    cache = GraphQLResponseCache({"AssetGraphQuery"}, max_entries=10, ttl_seconds=60)
+    with (
+        instance_for_test() as instance,
+        WorkspaceProcessContext(instance, EmptyWorkspaceTarget()) as process_context,
+    ):
+        context = process_context.create_request_context()
+        assert cache.make_key(context, QUERY, None, "OtherQuery") is None
+        assert cache.make_key(context, QUERY, None, None) is None
+
+        key = cache.make_key(context, QUERY, {"a": 1, "b": 2}, "AssetGraphQuery")
+        assert key
+        assert key == cache.make_key(context, QUERY, {"b": 2, "a": 1}, "AssetGraphQuery")
+        assert key != cache.make_key(context, QUERY, {"a": 2, "b": 2}, "AssetGraphQuery")
+
+        cache.set(key, b"response")
+        assert cache.get(key) == b"response"
+
+        # new events make previously cached responses unreachable
+        instance.report_runless_asset_event(AssetMaterialization("asset"))
+        new_key = cache.make_key(context, QUERY, {"a": 1, "b": 2}, "AssetGraphQuery")
+        assert new_key != key
+        assert cache.get(new_key) is None
+
+        stats = cache.get_stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.hit_rate == 0.5
+
+
+def test_response_cache_eviction():
+    cache = GraphQLResponseCache({"AssetGraphQuery"}, max_entries=2, ttl_seconds=60)
+    with (
+        instance_for_test() as instance,
+        WorkspaceProcessContext(instance, EmptyWorkspaceTarget()) as process_context,
+    ):
+        context = process_context.create_request_context()
+        keys = [cache.make_key(context, QUERY, {"i": i}, "AssetGraphQuery") for i in range(3)]
+        cache.set(keys[0], b"0")
+        cache.set(keys[1], b"1")
+        # reading the first response makes the second the least recently used
+        assert cache.get(keys[0]) == b"0"
+        cache.set(keys[2], b"2")
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == b"0"
+        assert cache.get(keys[2]) == b"2"
+        assert cache.get_stats().evictions == 1
+
+        expiring_cache = GraphQLResponseCache({"AssetGraphQuery"}, max_entries=2, ttl_seconds=0.1)
+        expiring_cache.set(keys[0], b"0")
+        assert expiring_cache.get(keys[0]) == b"0"
+        time.sleep(0.2)
+        assert expiring_cache.get(keys[0]) is None
+
+
+def test_response_cache_invalidation():
+    with (
+        environ(
+            {"DAGSTER_UI_RESPONSE_CACHE_OPERATIONS": "AssetGraphQuery, AssetCatalogTableQuery"}
+        ),
+        instance_for_test() as instance,
+        WorkspaceProcessContext(instance, EmptyWorkspaceTarget()) as process_context,
+    ):
+        cache = get_response_cache(process_context)
+        assert cache.enabled
+        assert get_response_cache(process_context) is cache
+
+        context = process_context.create_request_context()
+        key = cache.make_key(context, QUERY, None, "AssetCatalogTableQuery")
+        assert key
+        cache.set(key, b"response")
+
+        invalidate_response_cache(context)
+        assert cache.get(key) is None
+        assert cache.get_stats().invalidations == 1
+
+        # responses to requests which started before the invalidation are never served
+        cache.set(key, b"stale response")
+        assert cache.get(cache.make_key(context, QUERY, None, "AssetCatalogTableQuery")) is None
+
+
+def test_response_cache_disabled_by_default():
+    with (
+        instance_for_test() as instance,
+        WorkspaceProcessContext(instance, EmptyWorkspaceTarget()) as process_context,
+    ):
+        cache = get_response_cache(process_context)
+        assert not cache.enabled
+        assert (
+            cache.make_key(process_context.create_request_context(), QUERY, None, "AssetGraphQuery")
+            is None
+        )
+
+
+def test_is_mutation():
+    assert not is_mutation(QUERY, "AssetGraphQuery")
+    assert is_mutation('mutation DeleteRun { deletePipelineRun(runId: "x") { __typename } }', None)
+    document = "query A { version } mutation B { logTelemetry { __typename } }"
+    assert not is_mutation(document, "A")
+    assert is_mutation(document, "B")
+    assert not is_mutation("not a query", None)
@@ -0,0 +1,210 @@
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Sequence
+from unittest import mock
+from unittest.mock import Mock
+
+from dagster._core.event_api import EventLogCursor
+from dagster._core.events.log import EventLogEntry
+from dagster._core.instance import DagsterInstance
+from dagster._core.test_utils import create_run_for_test, environ, instance_for_test
+from dagster_graphql.implementation.execution import gen_events_for_run
+from dagster_graphql.implementation.execution.run_event_hub import RunEventHub, get_run_event_hub
+
+
+def _store_messages(instance: DagsterInstance, run_id: str, messages: Sequence[str]) -> None:
+    for message in messages:
+        instance.store_event(
+            EventLogEntry(
+                error_info=None,
+                level=logging.INFO,
+                user_message=message,
+                run_id=run_id,
+                timestamp=time.time(),
+            )
+        )
+
+
+async def _start_collecting_messages(gen: AsyncIterator, num_messages: int) -> asyncio.Future:
+    future = asyncio.ensure_future(_collect_messages(gen, num_messages))
+    # give the subscription time to start watching for new events before any are written
+    await asyncio.sleep(1)
+    return future
+
+
+async def _collect_messages(gen: AsyncIterator, num_messages: int) -> tuple[list, list[str]]:
+    frames = []
+    messages = []
+    while len(messages) < num_messages:
+        frame = await asyncio.wait_for(gen.__anext__(), timeout=30)
+        frames.append(frame)
+        messages.extend(message.message for message in frame.messages)
+    return frames, messages
+
+
+def _graphene_info(instance: DagsterInstance) -> Mock:
+    graphene_info = Mock()
+    graphene_info.context.instance = instance
+    return graphene_info
+
+
+def test_live_events_are_coalesced():
+    with instance_for_test() as instance:
+        run_id = create_run_for_test(instance).run_id
+        _store_messages(instance, run_id, ["past_0", "past_1"])
+
+        async def _test():
+            gen = gen_events_for_run(_graphene_info(instance), run_id)
+            try:
+                frames, messages = await _collect_messages(gen, 2)
+                assert messages == ["past_0", "past_1"]
+                assert len(frames) == 1
+
+                live_messages = [f"live_{i}" for i in range(100)]
+                collecting = await _start_collecting_messages(gen, 100)
+                _store_messages(instance, run_id, live_messages)
+                frames, messages = await collecting
+                assert messages == live_messages
+                assert len(frames) < len(live_messages)
+                assert frames[-1].cursor
+            finally:
+                await gen.aclose()
+
+        asyncio.run(_test())
+
+
+def test_slow_subscriber_catches_up_from_storage():
+    with (
+        environ(
+            {
+                "DAGSTER_UI_LIVE_EVENT_QUEUE_LIMIT": "5",
+                "DAGSTER_UI_EVENT_LOAD_CHUNK_SIZE": "10",
+            }
+        ),
+        instance_for_test() as instance,
+    ):
+        run_id = create_run_for_test(instance).run_id
+        _store_messages(instance, run_id, ["past_0"])
+
+        async def _test():
+            gen = gen_events_for_run(_graphene_info(instance), run_id)
+            try:
+                _, messages = await _collect_messages(gen, 1)
+                assert messages == ["past_0"]
+
+                collecting = await _start_collecting_messages(gen, 1)
+                _store_messages(instance, run_id, ["live_0"])
+                _, messages = await collecting
+                assert messages == ["live_0"]
+
+                # write many more events than the buffer can hold while the subscriber is not
+                # consuming, and give the watcher time to deliver them
+                live_messages = [f"live_{i}" for i in range(1, 51)]
+                _store_messages(instance, run_id, live_messages)
+                await asyncio.sleep(3)
+
+                frames, messages = await _collect_messages(gen, len(live_messages))
+                assert messages == live_messages
+                # the remaining events were loaded from storage in chunks
+                assert any(frame.hasMorePastEvents for frame in frames)
+
+                # after catching up, live events are delivered again
+                collecting = await _start_collecting_messages(gen, 1)
+                _store_messages(instance, run_id, ["live_51"])
+                _, messages = await collecting
+                assert messages == ["live_51"]
+            finally:
+                await gen.aclose()
+
+        asyncio.run(_test())
+
+
+def test_subscribers_share_run_events():
+    with instance_for_test() as instance:
+        run_id = create_run_for_test(instance).run_id
+        _store_messages(instance, run_id, ["past_0", "past_1"])
+        hub = get_run_event_hub(instance)
+
+        async def _test():
+            gens = [gen_events_for_run(_graphene_info(instance), run_id) for _ in range(3)]
+            try:
+                for gen in gens:
+                    _, messages = await _collect_messages(gen, 2)
+                    assert messages == ["past_0", "past_1"]
+                assert hub.watched_run_ids == [run_id]
+
+                collecting = [await _start_collecting_messages(gen, 10) for gen in gens]
+                live_messages = [f"live_{i}" for i in range(10)]
+                _store_messages(instance, run_id, live_messages)
+                for future in collecting:
+                    _, messages = await future
+                    assert messages == live_messages
+            finally:
+                for gen in gens:
+                    await gen.aclose()
+
+            # the run is evicted once it has no subscribers left
+            assert hub.watched_run_ids == []
+
+        with mock.patch.object(
+            instance, "watch_event_logs", wraps=instance.watch_event_logs
+        ) as watch_event_logs:
+            asyncio.run(_test())
+            assert watch_event_logs.call_count == 1
+
+
+def test_run_event_stream_serves_buffered_pages():
+    with instance_for_test() as instance:
+        run_id = create_run_for_test(instance).run_id
+        _store_messages(instance, run_id, [f"event_{i}" for i in range(8)])
+        records = instance.get_records_for_run(run_id).records
+        hub = RunEventHub(instance, max_events_per_run=5, max_events=100)
+
+        stream = hub.acquire(run_id)
+        try:
+            assert stream.num_buffered_events == 5
+            with mock.patch.object(
+                instance, "get_records_for_run", wraps=instance.get_records_for_run
+            ) as get_records_for_run:
+                # pages after the oldest buffered event are served from memory
+                connection = stream.get_records_for_run(
+                    cursor=str(EventLogCursor.from_storage_id(records[2].storage_id)), limit=3
+                )
+                assert [record.storage_id for record in connection.records] == [
+                    record.storage_id for record in records[3:6]
+                ]
+                assert connection.has_more
+                connection = stream.get_records_for_run(cursor=connection.cursor, limit=3)
+                assert [record.storage_id for record in connection.records] == [
+                    record.storage_id for record in records[6:]
+                ]
+                assert not connection.has_more
+                assert get_records_for_run.call_count == 0
+
+                # older pages are loaded from storage
+                connection = stream.get_records_for_run(cursor=None, limit=100)
+                assert len(connection.records) == 8
+                assert get_records_for_run.call_count == 1
+        finally:
+            hub.release(stream)
+
+
+def test_run_event_hub_memory_limit():
+    with instance_for_test() as instance:
+        run_ids = [create_run_for_test(instance).run_id for _ in range(2)]
+        for run_id in run_ids:
+            _store_messages(instance, run_id, [f"event_{i}" for i in range(5)])
+        hub = RunEventHub(instance, max_events_per_run=5, max_events=6)
+
+        first = hub.acquire(run_ids[0])
+        assert first.num_buffered_events == 5
+        second = hub.acquire(run_ids[1])
+        # the buffers of both runs shrink to fit within the total limit
+        assert first.num_buffered_events == 3
+        assert second.num_buffered_events == 3
+
+        hub.release(second)
+        assert hub.watched_run_ids == [run_ids[0]]
+        hub.release(first)
+        assert hub.watched_run_ids == []
@@ -0,0 +1,119 @@
+# ruff: noqa: T201
+import argparse
+import asyncio
+import os
+
+from dagster import AssetsDefinition, Definitions, asset, define_asset_job, in_process_executor
+from dagster._core.definitions.job_definition import JobDefinition
+from dagster._core.definitions.reconstruct import reconstructable
+from dagster._core.execution.api import execute_job
+from dagster._core.instance_for_test import instance_for_test
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze execution time of an in-process run of many independent I/O-bound async assets. Each asset
+awaits `asyncio.sleep` for `--sleep-seconds`. The run is executed once with the in-process executor
+running steps one at a time, and once with `max_concurrent` set so that async steps await
+concurrently on the run's event loop.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="async_in_process_execution",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-assets", type=int, default=100, help="Number of independent async assets."
+)
+parser.add_argument(
+    "--sleep-seconds", type=float, default=1.0, help="Seconds each asset awaits on `asyncio.sleep`."
+)
+parser.add_argument(
+    "--max-concurrent",
+    type=int,
+    default=100,
+    help="Value of `max_concurrent` for the concurrent in-process executor.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+# The jobs are reconstructed by module path during execution, so the command line args are passed
+# to them through the environment.
+_NUM_ASSETS_ENV_VAR = "DAGSTER_BENCHMARK_NUM_ASSETS"
+_SLEEP_SECONDS_ENV_VAR = "DAGSTER_BENCHMARK_SLEEP_SECONDS"
+_MAX_CONCURRENT_ENV_VAR = "DAGSTER_BENCHMARK_MAX_CONCURRENT"
+
+
+def _build_async_asset(i: int, sleep_seconds: float) -> AssetsDefinition:
+    @asset(name=f"async_asset_{i}")
+    async def async_asset() -> None:
+        await asyncio.sleep(sleep_seconds)
+
+    return async_asset
+
+
+def _get_job(max_concurrent: int) -> JobDefinition:
+    sleep_seconds = float(os.environ[_SLEEP_SECONDS_ENV_VAR])
+    assets = [
+        _build_async_asset(i, sleep_seconds) for i in range(int(os.environ[_NUM_ASSETS_ENV_VAR]))
+    ]
+    return Definitions(
+        assets=assets,
+        jobs=[
+            define_asset_job(
+                "async_assets_job",
+                executor_def=in_process_executor.configured({"max_concurrent": max_concurrent}),
+            )
+        ],
+    ).get_job_def("async_assets_job")
+
+
+def get_serial_job() -> JobDefinition:
+    return _get_job(max_concurrent=1)
+
+
+def get_concurrent_job() -> JobDefinition:
+    return _get_job(max_concurrent=int(os.environ[_MAX_CONCURRENT_ENV_VAR]))
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_assets: int, sleep_seconds: float, max_concurrent: int) -> None:
+    os.environ[_NUM_ASSETS_ENV_VAR] = str(num_assets)
+    os.environ[_SLEEP_SECONDS_ENV_VAR] = str(sleep_seconds)
+    os.environ[_MAX_CONCURRENT_ENV_VAR] = str(max_concurrent)
+
+    with instance_for_test() as instance:
+        session = ProfilingSession(
+            name="Async in-process execution",
+            experiment_settings={
+                "num_assets": num_assets,
+                "sleep_seconds": sleep_seconds,
+                "max_concurrent": max_concurrent,
+            },
+        ).start()
+
+        session.log_start_message()
+
+        with session.logged_execution_time(f"Execute {num_assets} async assets one at a time"):
+            with execute_job(reconstructable(get_serial_job), instance=instance) as result:
+                assert result.success
+
+        with session.logged_execution_time(
+            f"Execute {num_assets} async assets with max_concurrent={max_concurrent}"
+        ):
+            with execute_job(reconstructable(get_concurrent_job), instance=instance) as result:
+                assert result.success
+
+        session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_assets, args.sleep_seconds, args.max_concurrent)
@@ -0,0 +1,229 @@
+# ruff: noqa: T201
+import argparse
+import datetime
+import importlib
+import tempfile
+from collections.abc import Sequence
+
+from dagster import (
+    AutomationCondition,
+    DagsterInstance,
+    DailyPartitionsDefinition,
+    Definitions,
+    HourlyPartitionsDefinition,
+)
+from dagster._core.definitions.module_loaders.load_defs_from_module import (
+    load_definitions_from_module,
+)
+from dagster._core.instance.ref import InstanceRef
+from dagster._time import get_current_datetime
+from rich.console import Console
+from rich.table import Table
+
+from dagster_test.toys.auto_materializing.large_graph import AssetLayerConfig, build_assets
+from dagster_test.utils.automation_replay import (
+    AutomationTickStats,
+    generate_asset_history,
+    import_asset_history,
+    replay_automation_ticks,
+    summarize_tick_stats,
+)
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze the latency of asset daemon ticks by replaying them against a local sqlite instance. By
+default, a layered graph of hourly and daily partitioned assets with asset checks is generated,
+along with a history of materializations for a sample of its assets. Alternatively, the asset
+graph can be loaded from a module and its history imported from an existing instance. For each
+tick, the evaluation time, number of database queries, peak memory and number of requested
+partitions are reported.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="automation_tick_latency",
+    description=DESC,
+)
+
+parser.add_argument("--num-ticks", type=int, default=10, help="Number of ticks to replay.")
+parser.add_argument(
+    "--tick-interval-minutes",
+    type=int,
+    default=60,
+    help="Simulated number of minutes between consecutive ticks.",
+)
+parser.add_argument(
+    "--num-assets-per-layer",
+    type=int,
+    default=100,
+    help="Number of assets in each layer of the generated asset graph.",
+)
+parser.add_argument(
+    "--num-history-partitions",
+    type=int,
+    default=24,
+    help="Number of recent partitions materialized for each asset in the generated history.",
+)
+parser.add_argument(
+    "--materialized-fraction",
+    type=float,
+    default=0.5,
+    help="Fraction of assets which are materialized in the generated history.",
+)
+parser.add_argument(
+    "--definitions-module",
+    type=str,
+    default=None,
+    help="Module to load the asset graph from, instead of generating one.",
+)
+parser.add_argument(
+    "--source-dagster-home",
+    type=str,
+    default=None,
+    help=(
+        "DAGSTER_HOME of an existing instance to import the event history of the asset graph "
+        "from, instead of generating one."
+    ),
+)
+parser.add_argument(
+    "--import-limit-per-asset",
+    type=int,
+    default=1000,
+    help="Maximum number of materializations and observations imported for each asset.",
+)
+parser.add_argument(
+    "--no-simulate-runs",
+    action="store_true",
+    help="Do not report materializations for the partitions requested by each tick.",
+)
+parser.add_argument(
+    "--no-update-root-assets",
+    action="store_true",
+    help="Do not report a materialization of each root asset before each tick after the first.",
+)
+parser.add_argument(
+    "--track-memory",
+    action="store_true",
+    help="Record the peak memory of each tick. This significantly increases tick latency.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def build_generated_definitions(num_assets_per_layer: int) -> Definitions:
+    hourly_partitions_def = HourlyPartitionsDefinition("2020-01-01-00:00")
+    daily_partitions_def = DailyPartitionsDefinition("2020-01-01")
+    return Definitions(
+        assets=build_assets(
+            id="replay",
+            layer_configs=[
+                AssetLayerConfig(num_assets_per_layer, 0, hourly_partitions_def),
+                AssetLayerConfig(
+                    num_assets_per_layer, 2, hourly_partitions_def, n_checks_per_asset=1
+                ),
+                AssetLayerConfig(
+                    num_assets_per_layer, 4, hourly_partitions_def, n_checks_per_asset=2
+                ),
+                AssetLayerConfig(num_assets_per_layer, 4, daily_partitions_def),
+                AssetLayerConfig(num_assets_per_layer, 2, daily_partitions_def),
+                AssetLayerConfig(num_assets_per_layer, 2, None),
+            ],
+            automation_condition=AutomationCondition.eager()
+            & AutomationCondition.all_deps_blocking_checks_passed(),
+        )
+    )
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(args: argparse.Namespace) -> None:
+    start_time = get_current_datetime()
+    session = ProfilingSession(
+        name="Automation tick latency",
+        experiment_settings={key: value for key, value in vars(args).items() if value is not None},
+    ).start()
+    session.log_start_message()
+
+    with session.logged_execution_time("load definitions"):
+        if args.definitions_module:
+            defs = load_definitions_from_module(importlib.import_module(args.definitions_module))
+        else:
+            defs = build_generated_definitions(args.num_assets_per_layer)
+        defs.resolve_asset_graph()
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        instance = DagsterInstance.local_temp(tempdir)
+
+        with session.logged_execution_time("load event history"):
+            if args.source_dagster_home:
+                source_instance = DagsterInstance.from_ref(
+                    InstanceRef.from_dir(args.source_dagster_home)
+                )
+                num_events = import_asset_history(
+                    source_instance, instance, defs, args.import_limit_per_asset
+                )
+            else:
+                num_events = generate_asset_history(
+                    instance,
+                    defs,
+                    num_partitions_per_asset=args.num_history_partitions,
+                    materialized_fraction=args.materialized_fraction,
+                    current_time=start_time,
+                )
+        print(f"Loaded {num_events} events")
+
+        def _log_tick(stats: AutomationTickStats) -> None:
+            print(
+                f"Tick {stats.tick_index} ({stats.evaluation_time.isoformat()}):"
+                f" {stats.duration:.4f} seconds, {stats.num_queries} queries,"
+                f" {stats.num_requested} requested"
+            )
+
+        with session.logged_execution_time(f"replay {args.num_ticks} ticks"):
+            all_stats = replay_automation_ticks(
+                instance,
+                defs,
+                num_ticks=args.num_ticks,
+                start_time=start_time,
+                tick_interval=datetime.timedelta(minutes=args.tick_interval_minutes),
+                simulate_runs=not args.no_simulate_runs,
+                update_root_assets=not args.no_update_root_assets,
+                track_memory=args.track_memory,
+                on_tick=_log_tick,
+            )
+
+    session.log_result_summary()
+    _log_tick_table(all_stats)
+    for key, value in summarize_tick_stats(all_stats).items():
+        print(f"{key}: {value:.4f}" if isinstance(value, float) else f"{key}: {value}")
+
+
+def _log_tick_table(all_stats: Sequence[AutomationTickStats]) -> None:
+    table = Table(title="Ticks")
+    for column in [
+        "Tick",
+        "Duration (s)",
+        "Queries",
+        "Query time (s)",
+        "Peak memory (MB)",
+        "Requested",
+    ]:
+        table.add_column(column, justify="right")
+    for stats in all_stats:
+        table.add_row(
+            str(stats.tick_index),
+            f"{stats.duration:.4f}",
+            str(stats.num_queries),
+            f"{stats.query_duration:.4f}",
+            f"{stats.peak_memory / 2**20:.1f}" if stats.peak_memory is not None else "-",
+            str(stats.num_requested),
+        )
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main(parser.parse_args())
@@ -0,0 +1,173 @@
+# ruff: noqa: T201
+import argparse
+import asyncio
+import tempfile
+import time
+
+from dagster import AssetMaterialization, DagsterInstance
+from dagster._core.test_utils import create_run_for_test
+from dagster._core.workspace.context import WorkspaceProcessContext
+from dagster._core.workspace.load_target import EmptyWorkspaceTarget
+from dagster_shared.seven import json
+from dagster_webserver.webserver import DagsterWebserver
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Load test the execution of concurrent GraphQL requests against a local sqlite instance. A number of
+clients each send requests back to back through the webserver's GraphQL execution path, either on
+its execution pool (the default) or on a thread and event loop per request (--mode threadpool), and
+the throughput and latency percentiles of the requests are reported. The size of the execution pool
+and of the storage executors is configured through the DAGSTER_UI_GRAPHQL_EXECUTION_WORKERS and
+DAGSTER_STORAGE_EXECUTOR_MAX_WORKERS environment variables.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="graphql_concurrent_requests",
+    description=DESC,
+)
+
+parser.add_argument("--num-clients", type=int, default=200, help="Number of concurrent clients.")
+parser.add_argument(
+    "--requests-per-client", type=int, default=10, help="Number of requests sent by each client."
+)
+parser.add_argument("--num-runs", type=int, default=200, help="Number of runs in the instance.")
+parser.add_argument(
+    "--num-assets", type=int, default=200, help="Number of materialized assets in the instance."
+)
+parser.add_argument(
+    "--mode",
+    choices=["pool", "threadpool"],
+    default="pool",
+    help="Whether to execute requests on the execution pool or a thread and event loop per request.",
+)
+
+DASHBOARD_QUERY = """
+    query DashboardQuery {
+        runsOrError(limit: 50) {
+            ... on Runs {
+                results {
+                    runId
+                    status
+                    startTime
+                }
+            }
+        }
+        assetsOrError {
+            ... on AssetConnection {
+                nodes {
+                    key {
+                        path
+                    }
+                    assetMaterializations(limit: 1) {
+                        timestamp
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def _make_request() -> Request:
+    return Request({"type": "http", "method": "POST", "path": "/graphql", "headers": []})
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def _populate(instance: DagsterInstance, num_runs: int, num_assets: int) -> None:
+    for _ in range(num_runs):
+        create_run_for_test(instance)
+    for i in range(num_assets):
+        instance.report_runless_asset_event(AssetMaterialization(f"asset_{i}"))
+
+
+async def _execute(webserver: DagsterWebserver, mode: str) -> None:
+    request = _make_request()
+    if mode == "pool":
+        response = await webserver.execute_graphql_request(
+            request=request, query=DASHBOARD_QUERY, variables=None, operation_name=None
+        )
+    else:
+        # the execution path prior to the execution pool
+        response = await run_in_threadpool(
+            lambda: asyncio.run(
+                webserver.gen_graphql_response_for_request(
+                    request=request, query=DASHBOARD_QUERY, variables=None, operation_name=None
+                )
+            )
+        )
+    assert response.status_code == 200, response.body
+    assert "errors" not in json.loads(bytes(response.body))
+
+
+async def _run_client(webserver: DagsterWebserver, mode: str, num_requests: int) -> list[float]:
+    latencies = []
+    for _ in range(num_requests):
+        start = time.perf_counter()
+        await _execute(webserver, mode)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def _run_clients(
+    webserver: DagsterWebserver, mode: str, num_clients: int, num_requests: int
+) -> list[float]:
+    results = await asyncio.gather(
+        *(_run_client(webserver, mode, num_requests) for _ in range(num_clients))
+    )
+    return sorted(latency for latencies in results for latency in latencies)
+
+
+def _percentile(latencies: list[float], percentile: float) -> float:
+    return latencies[min(int(len(latencies) * percentile), len(latencies) - 1)]
+
+
+def main(
+    num_clients: int, requests_per_client: int, num_runs: int, num_assets: int, mode: str
+) -> None:
+    session = ProfilingSession(
+        name="GraphQL concurrent requests",
+        experiment_settings={
+            "num_clients": num_clients,
+            "requests_per_client": requests_per_client,
+            "num_runs": num_runs,
+            "num_assets": num_assets,
+            "mode": mode,
+        },
+    ).start()
+    session.log_start_message()
+
+    with (
+        tempfile.TemporaryDirectory() as tempdir,
+        WorkspaceProcessContext(
+            DagsterInstance.local_temp(tempdir), EmptyWorkspaceTarget(), read_only=True
+        ) as process_context,
+    ):
+        with session.logged_execution_time(f"populate {num_runs} runs and {num_assets} assets"):
+            _populate(process_context.instance, num_runs, num_assets)
+
+        webserver = DagsterWebserver(process_context)
+        # warm up the schema and the storage connections
+        asyncio.run(_run_clients(webserver, mode, 1, 1))
+
+        num_requests = num_clients * requests_per_client
+        with session.logged_execution_time(f"execute {num_requests} requests"):
+            start = time.perf_counter()
+            latencies = asyncio.run(_run_clients(webserver, mode, num_clients, requests_per_client))
+            duration = time.perf_counter() - start
+
+    session.log_result_summary()
+    print(f"Throughput: {num_requests / duration:.1f} requests/sec")
+    for percentile in (0.5, 0.9, 0.99):
+        print(f"p{int(percentile * 100)} latency: {_percentile(latencies, percentile):.3f}s")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_clients, args.requests_per_client, args.num_runs, args.num_assets, args.mode)
@@ -0,0 +1,186 @@
+# ruff: noqa: T201
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+
+from dagster import DagsterInstance
+from dagster._core.remote_representation.origin import InProcessCodeLocationOrigin
+from dagster._core.test_utils import environ
+from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._core.workspace.context import WorkspaceProcessContext
+from dagster._core.workspace.load_target import InProcessWorkspaceLoadTarget
+from dagster_shared.seven import json
+from dagster_webserver.response_encoding import make_json_response, supported_encodings
+from dagster_webserver.webserver import DagsterWebserver
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure the encoding of a large GraphQL response: the asset graph of a synthetic code location
+holding a large number of assets. The response is encoded by starlette's JSONResponse, as a single
+uncompressed document, and by the webserver's incremental encoder with each of the
+supported compressions, and the time to encode and send it, its size on the wire and the peak memory
+allocated while encoding it are reported. zstd is measured when the zstandard package is installed.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="graphql_large_response",
+    description=DESC,
+)
+
+parser.add_argument("--num-assets", type=int, default=50_000, help="Number of assets to define.")
+parser.add_argument(
+    "--num-iterations", type=int, default=3, help="Number of times each encoding is timed."
+)
+
+DEFS_SOURCE = """
+import os
+
+from dagster import AssetKey, AssetSpec, Definitions
+
+NUM_ASSETS = int(os.environ["BENCHMARK_NUM_ASSETS"])
+
+defs = Definitions(
+    assets=[
+        AssetSpec(
+            AssetKey(["group_" + str(i % 100), "asset_" + str(i)]),
+            deps=[AssetKey(["group_" + str(j % 100), "asset_" + str(j)]) for j in range(max(i - 3, 0), i)],
+            group_name="group_" + str(i % 100),
+            description="Synthetic asset " + str(i) + " of a large code location.",
+            kinds={"python"},
+            tags={"team": "team_" + str(i % 10)},
+        )
+        for i in range(NUM_ASSETS)
+    ]
+)
+"""
+
+ASSET_GRAPH_QUERY = """
+    query AssetGraphQuery {
+        assetNodes {
+            id
+            assetKey {
+                path
+            }
+            groupName
+            description
+            kinds
+            tags {
+                key
+                value
+            }
+            dependencyKeys {
+                path
+            }
+            dependedByKeys {
+                path
+            }
+        }
+    }
+"""
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+async def _send(response) -> int:
+    # the body is discarded as it is sent, as the server would write it to the client
+    if isinstance(response, StreamingResponse):
+        size = 0
+        async for chunk in response.body_iterator:
+            size += len(chunk)
+        return size
+    return len(response.body)
+
+
+async def _read(response) -> bytes:
+    if isinstance(response, StreamingResponse):
+        return b"".join([chunk async for chunk in response.body_iterator])  # pyright: ignore[reportReturnType]
+    return bytes(response.body)
+
+
+def _encode(content, mode: str):
+    if mode == "json":
+        return JSONResponse(content)
+    return make_json_response(content, 200, {}, None if mode == "identity" else mode)
+
+
+def _measure(content, mode: str, num_iterations: int) -> tuple[float, int, int]:
+    durations = []
+    size = 0
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        size = asyncio.run(_send(_encode(content, mode)))
+        durations.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    asyncio.run(_send(_encode(content, mode)))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(durations), size, peak
+
+
+def main(num_assets: int, num_iterations: int) -> None:
+    session = ProfilingSession(
+        name="GraphQL large response",
+        experiment_settings={"num_assets": num_assets, "num_iterations": num_iterations},
+    ).start()
+    session.log_start_message()
+
+    with (
+        tempfile.TemporaryDirectory() as tempdir,
+        environ({"BENCHMARK_NUM_ASSETS": str(num_assets)}),
+    ):
+        defs_path = os.path.join(tempdir, "defs.py")
+        with open(defs_path, "w", encoding="utf8") as f:
+            f.write(DEFS_SOURCE)
+
+        instance = DagsterInstance.local_temp(tempdir)
+        load_target = InProcessWorkspaceLoadTarget(
+            InProcessCodeLocationOrigin(
+                LoadableTargetOrigin(python_file=defs_path, attribute="defs")
+            )
+        )
+        with WorkspaceProcessContext(instance, load_target, read_only=True) as process_context:
+            with session.logged_execution_time(f"load a code location of {num_assets} assets"):
+                # the asset graph of the location is built on first use
+                process_context.create_request_context().asset_graph  # noqa: B018
+
+            webserver = DagsterWebserver(process_context)
+            request = Request({"type": "http", "method": "POST", "path": "/graphql", "headers": []})
+            with session.logged_execution_time("execute the asset graph query"):
+                response = asyncio.run(
+                    webserver.execute_graphql_request(
+                        request=request,
+                        query=ASSET_GRAPH_QUERY,
+                        variables=None,
+                        operation_name="AssetGraphQuery",
+                    )
+                )
+                content = json.loads(asyncio.run(_read(response)))
+            assert len(content["data"]["assetNodes"]) == num_assets
+
+            results = {}
+            for mode in ["json", "identity", *supported_encodings()]:
+                with session.logged_execution_time(f"encode the response ({mode})"):
+                    results[mode] = _measure(content, mode, num_iterations)
+
+        instance.dispose()
+
+    session.log_result_summary()
+    for mode, (duration, size, peak) in results.items():
+        print(
+            f"{mode}: {duration:.3f}s to encode and send, {size / 1024 / 1024:.1f} MiB on the wire,"
+            f" {peak / 1024 / 1024:.1f} MiB peak memory"
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_assets, args.num_iterations)
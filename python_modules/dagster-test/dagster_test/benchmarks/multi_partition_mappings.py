@@ -0,0 +1,136 @@
+# ruff: noqa: T201
+import argparse
+import random
+from datetime import datetime, timedelta
+
+from dagster import (
+    DailyPartitionsDefinition,
+    DimensionPartitionMapping,
+    IdentityPartitionMapping,
+    MultiPartitionMapping,
+    MultiPartitionsDefinition,
+    MultiToSingleDimensionPartitionMapping,
+    StaticPartitionsDefinition,
+    TimeWindowPartitionMapping,
+)
+from dagster._core.definitions.partitions.context import partition_loading_context
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze execution time of partition mappings between multi-partitioned assets with a daily
+dimension and a static dimension, and between multi-partitioned assets and single-dimension
+assets. Each mapping is run both on whole dimension subsets and by mapping each partition key
+individually, for subsets containing all partitions and for a random sample of partitions.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="multi_partition_mappings",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-days", type=int, default=730, help="Number of partitions in the daily dimension."
+)
+parser.add_argument(
+    "--num-static-keys",
+    type=int,
+    default=200,
+    help="Number of partitions in the static dimension.",
+)
+parser.add_argument(
+    "--sample-fraction",
+    type=float,
+    default=0.1,
+    help="Fraction of partitions included in the sampled subsets.",
+)
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_days: int, num_static_keys: int, sample_fraction: float) -> None:
+    current_time = datetime(2025, 1, 1)
+    daily_partitions_def = DailyPartitionsDefinition(
+        start_date=current_time - timedelta(days=num_days)
+    )
+    static_partitions_def = StaticPartitionsDefinition([f"key_{i}" for i in range(num_static_keys)])
+    multi_partitions_def = MultiPartitionsDefinition(
+        {"date": daily_partitions_def, "key": static_partitions_def}
+    )
+    mappings = {
+        "multi to multi": (
+            multi_partitions_def,
+            multi_partitions_def,
+            MultiPartitionMapping(
+                {
+                    "date": DimensionPartitionMapping(
+                        "date", TimeWindowPartitionMapping(start_offset=-1)
+                    ),
+                    "key": DimensionPartitionMapping("key", IdentityPartitionMapping()),
+                }
+            ),
+        ),
+        "multi to single": (
+            multi_partitions_def,
+            daily_partitions_def,
+            MultiToSingleDimensionPartitionMapping(),
+        ),
+        "single to multi": (
+            daily_partitions_def,
+            multi_partitions_def,
+            MultiToSingleDimensionPartitionMapping(),
+        ),
+    }
+
+    session = ProfilingSession(
+        name="Multi-dimensional partition mappings",
+        experiment_settings={
+            "num_days": num_days,
+            "num_static_keys": num_static_keys,
+            "sample_fraction": sample_fraction,
+        },
+    ).start()
+    session.log_start_message()
+
+    with partition_loading_context(effective_dt=current_time):
+        for name, (upstream_def, downstream_def, mapping) in mappings.items():
+            with session.logged_execution_time(f"{name}: build subsets"):
+                all_keys = downstream_def.get_partition_keys()
+                sampled_keys = random.sample(all_keys, int(len(all_keys) * sample_fraction))
+                subsets = {
+                    "all partitions": downstream_def.subset_with_all_partitions(),
+                    f"{len(sampled_keys)} sampled partitions": downstream_def.empty_subset().with_partition_keys(
+                        sampled_keys
+                    ),
+                }
+                # warm up lazily computed state on the partitions definitions so that it is not
+                # attributed to whichever mapping step runs first
+                mapping.get_upstream_mapped_partitions_result_for_partitions(
+                    downstream_def.empty_subset(), downstream_def, upstream_def
+                )
+
+            for subset_name, downstream_subset in subsets.items():
+                with session.logged_execution_time(
+                    f"{name} ({subset_name}): upstream partitions from dimension subsets"
+                ):
+                    result = mapping.get_upstream_mapped_partitions_result_for_partitions(
+                        downstream_subset, downstream_def, upstream_def
+                    )
+
+                with session.logged_execution_time(
+                    f"{name} ({subset_name}): upstream partitions from partition keys"
+                ):
+                    expected = mapping._get_dependency_partitions_subset_from_partition_keys(  # noqa: SLF001
+                        downstream_def, downstream_subset, upstream_def, a_upstream_of_b=False
+                    )
+
+                assert len(result.partitions_subset) == len(expected.partitions_subset)
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_days, args.num_static_keys, args.sample_fraction)
@@ -0,0 +1,196 @@
+# ruff: noqa: T201
+import argparse
+import asyncio
+import logging
+import tempfile
+import threading
+import time
+from typing import NamedTuple
+
+from dagster import DagsterInstance
+from dagster._core.events.log import EventLogEntry
+from dagster._core.test_utils import create_run_for_test
+from dagster._core.workspace.context import WorkspaceProcessContext
+from dagster._core.workspace.load_target import EmptyWorkspaceTarget
+from dagster_graphql.schema import create_schema
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze the throughput of the run logs subscription. A writer thread stores log events for a run
+into a local sqlite instance at a fixed rate, while a number of viewers subscribe to the run's logs
+through the GraphQL schema. For each viewer, the number of events and messages (websocket frames)
+received and the sustained events per second are reported. Viewers can be slowed down to exercise
+the catch-up path for subscribers that fall behind. The live event batching is configured through
+the DAGSTER_UI_LIVE_EVENT_* environment variables.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="run_logs_subscription",
+    description=DESC,
+)
+
+parser.add_argument("--num-viewers", type=int, default=10, help="Number of viewers of the run.")
+parser.add_argument(
+    "--events-per-second",
+    type=int,
+    default=1000,
+    help="Target rate at which events are written.",
+)
+parser.add_argument(
+    "--duration", type=float, default=10.0, help="Number of seconds to write events for."
+)
+parser.add_argument(
+    "--viewer-delay-ms",
+    type=int,
+    default=0,
+    help="Time each viewer spends processing each message, to simulate slow clients.",
+)
+
+RUN_LOGS_SUBSCRIPTION = """
+    subscription RunLogsSubscription($runId: ID!, $cursor: String) {
+        pipelineRunLogs(runId: $runId, cursor: $cursor) {
+            __typename
+            ... on PipelineRunLogsSubscriptionSuccess {
+                messages {
+                    __typename
+                    ... on MessageEvent {
+                        message
+                        timestamp
+                        level
+                    }
+                }
+                cursor
+                hasMorePastEvents
+            }
+        }
+    }
+"""
+
+
+class ViewerResult(NamedTuple):
+    num_events: int
+    num_messages: int
+    end: float
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def _write_events(
+    instance: DagsterInstance,
+    run_id: str,
+    num_events: int,
+    events_per_second: int,
+    write_durations: list[float],
+) -> None:
+    start = time.perf_counter()
+    for i in range(num_events):
+        # write at the target rate, catching up if writes fall behind it
+        delay = start + i / events_per_second - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        instance.store_event(
+            EventLogEntry(
+                error_info=None,
+                level=logging.INFO,
+                user_message=f"event {i}",
+                run_id=run_id,
+                timestamp=time.time(),
+            )
+        )
+    write_durations.append(time.perf_counter() - start)
+
+
+async def _view_run(
+    request_context, run_id: str, num_events: int, viewer_delay: float
+) -> ViewerResult:
+    schema = create_schema()
+    subscription = await schema.subscribe(
+        RUN_LOGS_SUBSCRIPTION,
+        context_value=request_context,
+        variable_values={"runId": run_id, "cursor": "HEAD"},
+    )
+    received_events = 0
+    received_messages = 0
+    async for result in subscription:
+        assert not result.errors, result.errors
+        received_messages += 1
+        received_events += len(result.data["pipelineRunLogs"]["messages"])
+        if viewer_delay:
+            await asyncio.sleep(viewer_delay)
+        if received_events >= num_events:
+            break
+    await subscription.aclose()
+    return ViewerResult(received_events, received_messages, time.perf_counter())
+
+
+async def _run_viewers(
+    request_context, run_id: str, num_viewers: int, num_events: int, viewer_delay: float, writer
+) -> tuple[float, list[ViewerResult]]:
+    viewers = [
+        asyncio.ensure_future(_view_run(request_context, run_id, num_events, viewer_delay))
+        for _ in range(num_viewers)
+    ]
+    # let every viewer start watching the run before any events are written
+    await asyncio.sleep(1)
+    start = time.perf_counter()
+    writer.start()
+    return start, await asyncio.gather(*viewers)
+
+
+def main(num_viewers: int, events_per_second: int, duration: float, viewer_delay_ms: int) -> None:
+    num_events = int(events_per_second * duration)
+    session = ProfilingSession(
+        name="Run logs subscription",
+        experiment_settings={
+            "num_viewers": num_viewers,
+            "events_per_second": events_per_second,
+            "duration": duration,
+            "viewer_delay_ms": viewer_delay_ms,
+        },
+    ).start()
+    session.log_start_message()
+
+    with (
+        tempfile.TemporaryDirectory() as tempdir,
+        WorkspaceProcessContext(
+            DagsterInstance.local_temp(tempdir), EmptyWorkspaceTarget(), read_only=True
+        ) as process_context,
+    ):
+        instance = process_context.instance
+        run_id = create_run_for_test(instance).run_id
+        write_durations = []
+        writer = threading.Thread(
+            target=_write_events,
+            args=(instance, run_id, num_events, events_per_second, write_durations),
+        )
+
+        with session.logged_execution_time(f"stream {num_events} events to {num_viewers} viewers"):
+            start, results = asyncio.run(
+                _run_viewers(
+                    process_context.create_request_context(),
+                    run_id,
+                    num_viewers,
+                    num_events,
+                    viewer_delay_ms / 1000,
+                    writer,
+                )
+            )
+            writer.join()
+
+    session.log_result_summary()
+    # if the writer could not sustain the target rate, viewer throughput is bounded by it
+    print(f"Writer: {num_events / write_durations[0]:.1f} events/sec")
+    for i, result in enumerate(results):
+        print(
+            f"Viewer {i}: {result.num_events} events in {result.num_messages} messages,"
+            f" {result.num_events / (result.end - start):.1f} events/sec"
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_viewers, args.events_per_second, args.duration, args.viewer_delay_ms)
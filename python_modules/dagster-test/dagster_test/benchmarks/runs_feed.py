@@ -0,0 +1,188 @@
+# ruff: noqa: T201
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from dagster import DagsterInstance, DagsterRun
+from dagster._core.execution.backfill import BulkActionsFilter, BulkActionStatus, PartitionBackfill
+from dagster._core.storage.dagster_run import RunsFilter
+from dagster._core.storage.runs.base import RunStorage
+from dagster._core.storage.runs.schema import RunsTable
+from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+from dagster._core.storage.tags import BACKFILL_ID_TAG
+from dagster._core.utils import make_new_run_id
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Page through the runs feed of a local sqlite instance holding a large number of runs and backfills.
+The feed is paginated either in the run storage, which merges runs and backfills in a single query
+(the default), or by fetching a page of runs and a page of backfills and merging them in python
+(--mode merge). The time to fetch each page and to count the entries of the feed is reported.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="runs_feed",
+    description=DESC,
+)
+
+parser.add_argument("--num-runs", type=int, default=1_000_000, help="Number of runs to create.")
+parser.add_argument(
+    "--num-backfills", type=int, default=10_000, help="Number of backfills to create."
+)
+parser.add_argument(
+    "--runs-per-backfill",
+    type=int,
+    default=10,
+    help="Number of the runs which are launched by each backfill.",
+)
+parser.add_argument("--page-size", type=int, default=30, help="Number of entries per page.")
+parser.add_argument("--num-pages", type=int, default=20, help="Number of pages to fetch.")
+parser.add_argument(
+    "--mode",
+    choices=["storage", "merge"],
+    default="storage",
+    help="Whether to merge runs and backfills in the run storage or in python.",
+)
+
+_INSERT_BATCH_SIZE = 10_000
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def _populate(
+    storage: SqlRunStorage, num_runs: int, num_backfills: int, runs_per_backfill: int
+) -> None:
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    # interleave the backfills with the runs so that each page of the feed holds both
+    backfill_every = max(num_runs // max(num_backfills, 1), 1)
+    backfill_id = None
+    num_backfill_runs = 0
+    rows = []
+    for i in range(num_runs):
+        creation_time = start + timedelta(seconds=i)
+        if num_backfills and i % backfill_every == 0 and i // backfill_every < num_backfills:
+            backfill_id = f"backfill_{i // backfill_every}"
+            storage.add_backfill(
+                PartitionBackfill(
+                    backfill_id,
+                    status=BulkActionStatus.COMPLETED_SUCCESS,
+                    from_failure=False,
+                    tags={},
+                    backfill_timestamp=creation_time.timestamp(),
+                    serialized_asset_backfill_data=None,
+                    partition_set_origin=None,
+                    partition_names=[],
+                )
+            )
+            num_backfill_runs = 0
+
+        tags = {}
+        if backfill_id and num_backfill_runs < runs_per_backfill:
+            tags[BACKFILL_ID_TAG] = backfill_id
+            num_backfill_runs += 1
+
+        run = DagsterRun(job_name="some_job", run_id=make_new_run_id(), tags=tags)
+        rows.append(storage._get_run_insertion_values(run, creation_time))  # noqa: SLF001
+        if len(rows) == _INSERT_BATCH_SIZE:
+            with storage.connect() as conn:
+                conn.execute(RunsTable.insert(), rows)
+            rows = []
+
+    if rows:
+        with storage.connect() as conn:
+            conn.execute(RunsTable.insert(), rows)
+
+
+def _get_feed_page(storage: SqlRunStorage, mode: str, limit: int, run_cursor, backfill_cursor):
+    runs_filter = RunsFilter(exclude_subruns=True)
+    backfills_filter = BulkActionsFilter()
+    if mode == "storage":
+        return storage.get_runs_feed_entries(
+            limit, runs_filter, backfills_filter, run_cursor, backfill_cursor
+        )
+
+    # the python merge of a page of runs and a page of backfills
+    return RunStorage.get_runs_feed_entries(
+        storage, limit, runs_filter, backfills_filter, run_cursor, backfill_cursor
+    )
+
+
+def _get_feed_count(storage: SqlRunStorage, mode: str) -> int:
+    runs_filter = RunsFilter(exclude_subruns=True)
+    backfills_filter = BulkActionsFilter()
+    if mode == "storage":
+        return storage.get_runs_feed_count(runs_filter, backfills_filter)
+
+    return RunStorage.get_runs_feed_count(storage, runs_filter, backfills_filter)
+
+
+def main(
+    num_runs: int,
+    num_backfills: int,
+    runs_per_backfill: int,
+    page_size: int,
+    num_pages: int,
+    mode: str,
+) -> None:
+    session = ProfilingSession(
+        name="Runs feed",
+        experiment_settings={
+            "num_runs": num_runs,
+            "num_backfills": num_backfills,
+            "runs_per_backfill": runs_per_backfill,
+            "page_size": page_size,
+            "num_pages": num_pages,
+            "mode": mode,
+        },
+    ).start()
+    session.log_start_message()
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        instance = DagsterInstance.local_temp(tempdir)
+        storage = instance.run_storage
+        assert isinstance(storage, SqlRunStorage)
+
+        with session.logged_execution_time(
+            f"populate {num_runs} runs and {num_backfills} backfills"
+        ):
+            _populate(storage, num_runs, num_backfills, runs_per_backfill)
+
+        page_times = []
+        run_cursor = None
+        backfill_cursor = None
+        with session.logged_execution_time(f"fetch {num_pages} pages of {page_size} entries"):
+            for _ in range(num_pages):
+                start = time.perf_counter()
+                entries = _get_feed_page(storage, mode, page_size, run_cursor, backfill_cursor)
+                page_times.append(time.perf_counter() - start)
+                for entry in entries:
+                    if isinstance(entry, PartitionBackfill):
+                        backfill_cursor = entry.backfill_id
+                    else:
+                        run_cursor = entry.dagster_run.run_id
+
+        with session.logged_execution_time("count the runs feed"):
+            count = _get_feed_count(storage, mode)
+
+        instance.dispose()
+
+    session.log_result_summary()
+    print(f"Runs feed entries: {count}")
+    print(f"Mean page latency: {sum(page_times) / len(page_times):.4f}s")
+    print(f"Max page latency: {max(page_times):.4f}s")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(
+        args.num_runs,
+        args.num_backfills,
+        args.runs_per_backfill,
+        args.page_size,
+        args.num_pages,
+        args.mode,
+    )
@@ -0,0 +1,155 @@
+# ruff: noqa: T201
+import argparse
+import os
+import time
+from collections.abc import Iterator
+
+from dagster import Definitions, executor, job, multiple_process_executor_requirements, op
+from dagster._core.definitions.job_definition import JobDefinition
+from dagster._core.definitions.reconstruct import reconstructable
+from dagster._core.events import DagsterEvent
+from dagster._core.execution.api import execute_job
+from dagster._core.execution.plan.objects import StepSuccessData
+from dagster._core.execution.retries import RetryMode
+from dagster._core.executor.step_delegating import (
+    CheckStepHealthResult,
+    StepDelegatingExecutor,
+    StepHandler,
+    StepHandlerContext,
+)
+from dagster._core.instance_for_test import instance_for_test
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze launch throughput of the step delegating executor for a wide fan-out of steps. Steps are
+launched by a fake step handler that simulates the latency of a remote API call (e.g. creating a
+Kubernetes job) for each launch and health check, and then reports the step as succeeded without
+starting a step worker. The run is executed once launching steps one at a time and once with
+`max_concurrent_step_launches` set.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="step_delegating_launch",
+    description=DESC,
+)
+
+parser.add_argument("--num-steps", type=int, default=1000, help="Number of independent steps.")
+parser.add_argument(
+    "--launch-latency-seconds",
+    type=float,
+    default=0.05,
+    help="Simulated latency of each step launch and health check.",
+)
+parser.add_argument(
+    "--max-concurrent-launches",
+    type=int,
+    default=32,
+    help="Value of `max_concurrent_step_launches` for the concurrent run.",
+)
+
+# ########################
+# ##### STEP HANDLER
+# ########################
+
+# The jobs are reconstructed by module path during execution, so the command line args are passed
+# to them through the environment.
+_NUM_STEPS_ENV_VAR = "DAGSTER_BENCHMARK_NUM_STEPS"
+_LAUNCH_LATENCY_ENV_VAR = "DAGSTER_BENCHMARK_LAUNCH_LATENCY_SECONDS"
+_MAX_CONCURRENT_LAUNCHES_ENV_VAR = "DAGSTER_BENCHMARK_MAX_CONCURRENT_LAUNCHES"
+
+
+class FakeStepHandler(StepHandler):
+    """Step handler that stands in for a remote backend. Each launch waits for the simulated API
+    latency and then reports the step as having run successfully.
+    """
+
+    def __init__(self, latency_seconds: float):
+        self._latency_seconds = latency_seconds
+
+    @property
+    def name(self) -> str:
+        return "FakeStepHandler"
+
+    def launch_step(self, step_handler_context: StepHandlerContext) -> Iterator[DagsterEvent]:
+        time.sleep(self._latency_seconds)
+        for step_key in step_handler_context.execute_step_args.step_keys_to_execute or []:
+            step_context = step_handler_context.get_step_context(step_key)
+            DagsterEvent.step_start_event(step_context)
+            DagsterEvent.step_success_event(step_context, StepSuccessData(duration_ms=0.0))
+        return iter(())
+
+    def check_step_health(self, step_handler_context: StepHandlerContext) -> CheckStepHealthResult:
+        time.sleep(self._latency_seconds)
+        return CheckStepHealthResult.healthy()
+
+    def terminate_step(self, step_handler_context: StepHandlerContext) -> Iterator[DagsterEvent]:
+        return iter(())
+
+
+@executor(
+    name="fake_step_delegating_executor",
+    requirements=multiple_process_executor_requirements(),
+)
+def fake_step_delegating_executor(_init_context):
+    return StepDelegatingExecutor(
+        FakeStepHandler(float(os.environ[_LAUNCH_LATENCY_ENV_VAR])),
+        retries=RetryMode.DISABLED,
+        sleep_seconds=0.1,
+        max_concurrent_step_launches=int(os.environ[_MAX_CONCURRENT_LAUNCHES_ENV_VAR]),
+    )
+
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def get_fan_out_job() -> JobDefinition:
+    @op(out={})
+    def leaf():
+        pass
+
+    @job(executor_def=fake_step_delegating_executor)
+    def fan_out_job():
+        for i in range(int(os.environ[_NUM_STEPS_ENV_VAR])):
+            leaf.alias(f"leaf_{i}")()
+
+    return Definitions(jobs=[fan_out_job]).get_job_def("fan_out_job")
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_steps: int, launch_latency_seconds: float, max_concurrent_launches: int) -> None:
+    os.environ[_NUM_STEPS_ENV_VAR] = str(num_steps)
+    os.environ[_LAUNCH_LATENCY_ENV_VAR] = str(launch_latency_seconds)
+
+    with instance_for_test() as instance:
+        session = ProfilingSession(
+            name="Step delegating executor launch throughput",
+            experiment_settings={
+                "num_steps": num_steps,
+                "launch_latency_seconds": launch_latency_seconds,
+                "max_concurrent_launches": max_concurrent_launches,
+            },
+        ).start()
+
+        session.log_start_message()
+
+        for concurrency in [1, max_concurrent_launches]:
+            os.environ[_MAX_CONCURRENT_LAUNCHES_ENV_VAR] = str(concurrency)
+            with session.logged_execution_time(
+                f"Launch {num_steps} steps with max_concurrent_step_launches={concurrency}"
+            ):
+                with execute_job(reconstructable(get_fan_out_job), instance=instance) as result:
+                    assert result.success
+
+        session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_steps, args.launch_latency_seconds, args.max_concurrent_launches)
@@ -0,0 +1,98 @@
+# ruff: noqa: T201
+import argparse
+import random
+from datetime import datetime, timedelta
+
+from dagster import TimeWindowPartitionsDefinition
+from dagster._core.definitions.partitions.context import partition_loading_context
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze execution time of index and key lookups on time window partitions definitions spanning
+many years. Each operation is run against a regular schedule (every 15 minutes and hourly), whose
+partition boundaries can be computed in closed form, and against an irregular schedule (business
+hours on weekdays), which falls back to iterating over cron ticks.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="time_window_partitions",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-years", type=int, default=5, help="Number of years spanned by each definition."
+)
+parser.add_argument(
+    "--num-keys",
+    type=int,
+    default=1000,
+    help="Number of partition keys passed to bulk key lookups.",
+)
+parser.add_argument(
+    "--timezone", type=str, default="America/Los_Angeles", help="Timezone of each definition."
+)
+
+_FMT = "%Y-%m-%d-%H:%M"
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_years: int, num_keys: int, timezone: str) -> None:
+    current_time = datetime(2025, 1, 1)
+    start = current_time - timedelta(days=365 * num_years)
+    partitions_defs = {
+        "every 15 minutes": TimeWindowPartitionsDefinition(
+            cron_schedule="*/15 * * * *", start=start, fmt=_FMT, timezone=timezone, end_offset=1
+        ),
+        "hourly": TimeWindowPartitionsDefinition(
+            cron_schedule="0 * * * *", start=start, fmt=_FMT, timezone=timezone, end_offset=1
+        ),
+        "business hours": TimeWindowPartitionsDefinition(
+            cron_schedule="0 9-17 * * 1-5", start=start, fmt=_FMT, timezone=timezone, end_offset=1
+        ),
+    }
+
+    session = ProfilingSession(
+        name="Time window partitions index arithmetic",
+        experiment_settings={"num_years": num_years, "num_keys": num_keys, "timezone": timezone},
+    ).start()
+    session.log_start_message()
+
+    with partition_loading_context(effective_dt=current_time):
+        for name, partitions_def in partitions_defs.items():
+            with session.logged_execution_time(f"{name}: get_num_partitions"):
+                num_partitions = partitions_def.get_num_partitions()
+
+            with session.logged_execution_time(f"{name}: get_last_partition_key"):
+                partitions_def.get_last_partition_key()
+
+            with session.logged_execution_time(
+                f"{name}: get_partition_keys_between_indexes (last {num_keys})"
+            ):
+                keys = partitions_def.get_partition_keys_between_indexes(
+                    num_partitions - num_keys, num_partitions
+                )
+
+            with session.logged_execution_time(
+                f"{name}: get_partition_keys ({num_partitions} keys)"
+            ):
+                all_keys = partitions_def.get_partition_keys()
+
+            assert len(all_keys) == num_partitions
+            assert all_keys[-num_keys:] == keys
+
+            sampled_keys = frozenset(random.sample(all_keys, min(num_keys, num_partitions)))
+            with session.logged_execution_time(
+                f"{name}: time_windows_for_partition_keys ({len(sampled_keys)} sampled keys)"
+            ):
+                partitions_def.time_windows_for_partition_keys(sampled_keys)
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_years, args.num_keys, args.timezone)
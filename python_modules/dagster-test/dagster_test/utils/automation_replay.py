@@ -0,0 +1,316 @@
+"""Utilities for measuring the performance of automation condition evaluation against a realistic
+asset graph and event history, by replaying asset daemon ticks against a local instance.
+"""
+
+import datetime
+import logging
+import random
+import time
+import tracemalloc
+from collections.abc import Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Callable, NamedTuple, Optional
+
+from dagster import (
+    AssetCheckEvaluation,
+    AssetCheckKey,
+    AssetMaterialization,
+    AssetRecordsFilter,
+    AssetSelection,
+    DagsterInstance,
+    Definitions,
+    DynamicPartitionsDefinition,
+    MultiPartitionsDefinition,
+    PartitionsDefinition,
+)
+from dagster._core.asset_graph_view.entity_subset import EntitySubset
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.asset_key import EntityKey
+from dagster._core.definitions.assets.graph.asset_graph import AssetGraph
+from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+    AutomationConditionEvaluator,
+)
+from dagster._core.definitions.partitions.context import partition_loading_context
+from dagster._serdes import deserialize_value, serialize_value
+from dagster._time import get_current_datetime
+from dagster._utils.warnings import disable_dagster_warnings
+
+if TYPE_CHECKING:
+    from dagster._core.events.log import EventLogEntry
+
+
+class AutomationTickStats(NamedTuple):
+    """Performance statistics of the evaluation of a single replayed tick.
+
+    Args:
+        tick_index (int): The index of the tick within the replay.
+        evaluation_time (datetime.datetime): The simulated time at which the tick was evaluated.
+        duration (float): The wall time of the evaluation, in seconds.
+        num_queries (int): The number of database queries issued during the evaluation.
+        query_duration (float): The total wall time of those queries, in seconds.
+        peak_memory (Optional[int]): The peak size of the memory allocated by Python during the
+            evaluation, in bytes. Only recorded if memory tracking is enabled.
+        num_requested (int): The number of asset partitions and asset checks requested by the tick.
+    """
+
+    tick_index: int
+    evaluation_time: datetime.datetime
+    duration: float
+    num_queries: int
+    query_duration: float
+    peak_memory: Optional[int]
+    num_requested: int
+
+
+def _get_recent_partition_keys(
+    instance: DagsterInstance,
+    partitions_def: PartitionsDefinition,
+    num_partitions: int,
+    current_time: datetime.datetime,
+) -> Sequence[str]:
+    with partition_loading_context(effective_dt=current_time, dynamic_partitions_store=instance):
+        partition_keys = partitions_def.get_partition_keys()
+    return partition_keys[-num_partitions:]
+
+
+def generate_asset_history(
+    instance: DagsterInstance,
+    defs: Definitions,
+    num_partitions_per_asset: int,
+    materialized_fraction: float,
+    current_time: Optional[datetime.datetime] = None,
+    seed: int = 0,
+) -> int:
+    """Reports materializations for a random sample of the assets in the given definitions, so that
+    the first replayed tick starts from a partially materialized graph. Each sampled asset is
+    materialized once, or once for each of its most recent partitions if it is partitioned. Returns
+    the number of events reported.
+    """
+    current_time = current_time or get_current_datetime()
+    asset_graph = defs.resolve_asset_graph()
+    rng = random.Random(seed)
+
+    partition_keys_by_def: dict[PartitionsDefinition, Sequence[str]] = {}
+    num_events = 0
+    for asset_key in sorted(asset_graph.materializable_asset_keys):
+        if rng.random() >= materialized_fraction:
+            continue
+
+        partitions_def = asset_graph.get(asset_key).partitions_def
+        if partitions_def is None:
+            partition_keys = [None]
+        else:
+            if partitions_def not in partition_keys_by_def:
+                partition_keys_by_def[partitions_def] = _get_recent_partition_keys(
+                    instance, partitions_def, num_partitions_per_asset, current_time
+                )
+            partition_keys = partition_keys_by_def[partitions_def]
+
+        for partition_key in partition_keys:
+            instance.report_runless_asset_event(
+                AssetMaterialization(asset_key=asset_key, partition=partition_key)
+            )
+            num_events += 1
+
+    return num_events
+
+
+def import_asset_history(
+    source_instance: DagsterInstance,
+    instance: DagsterInstance,
+    defs: Definitions,
+    limit_per_asset: int,
+) -> int:
+    """Copies the most recent materializations and observations of each asset in the given
+    definitions, along with the partition keys of their dynamic partitions definitions, from an
+    existing instance into the given instance. Events are stored in the order in which they were
+    originally stored. Returns the number of events copied.
+    """
+    asset_graph = defs.resolve_asset_graph()
+
+    for asset_key in asset_graph.get_all_asset_keys():
+        partitions_def = asset_graph.get(asset_key).partitions_def
+        dimension_defs = (
+            [dimension.partitions_def for dimension in partitions_def.partitions_defs]
+            if isinstance(partitions_def, MultiPartitionsDefinition)
+            else [partitions_def]
+        )
+        for dimension_def in dimension_defs:
+            if isinstance(dimension_def, DynamicPartitionsDefinition) and dimension_def.name:
+                instance.add_dynamic_partitions(
+                    dimension_def.name, source_instance.get_dynamic_partitions(dimension_def.name)
+                )
+
+    entries_by_storage_id: dict[int, EventLogEntry] = {}
+    for asset_key in asset_graph.get_all_asset_keys():
+        for fetch_records in (
+            source_instance.fetch_materializations,
+            source_instance.fetch_observations,
+        ):
+            records = fetch_records(AssetRecordsFilter(asset_key=asset_key), limit=limit_per_asset)
+            for record in records.records:
+                entries_by_storage_id[record.storage_id] = record.event_log_entry
+
+    for storage_id in sorted(entries_by_storage_id):
+        instance.event_log_storage.store_event(entries_by_storage_id[storage_id])
+
+    return len(entries_by_storage_id)
+
+
+def _report_requested_subsets(
+    instance: DagsterInstance, requested_subsets: Iterable[EntitySubset]
+) -> None:
+    # simulates successful runs of everything that was requested, without executing any user code
+    for subset in requested_subsets:
+        if isinstance(subset.key, AssetCheckKey):
+            instance.report_runless_asset_event(
+                AssetCheckEvaluation(
+                    asset_key=subset.key.asset_key, check_name=subset.key.name, passed=True
+                )
+            )
+        elif subset.is_partitioned:
+            for partition_key in sorted(subset.expensively_compute_partition_keys()):
+                instance.report_runless_asset_event(
+                    AssetMaterialization(asset_key=subset.key, partition=partition_key)
+                )
+        else:
+            instance.report_runless_asset_event(AssetMaterialization(asset_key=subset.key))
+
+
+def _report_root_asset_updates(
+    instance: DagsterInstance, asset_graph: AssetGraph, current_time: datetime.datetime
+) -> None:
+    # simulates new data arriving from outside of the graph, which is what eager conditions react to
+    with partition_loading_context(effective_dt=current_time, dynamic_partitions_store=instance):
+        for asset_key in sorted(asset_graph.root_materializable_asset_keys):
+            partitions_def = asset_graph.get(asset_key).partitions_def
+            partition_key = partitions_def.get_last_partition_key() if partitions_def else None
+            if partitions_def is None or partition_key is not None:
+                instance.report_runless_asset_event(
+                    AssetMaterialization(asset_key=asset_key, partition=partition_key)
+                )
+
+
+def replay_automation_ticks(
+    instance: DagsterInstance,
+    defs: Definitions,
+    num_ticks: int,
+    start_time: Optional[datetime.datetime] = None,
+    tick_interval: datetime.timedelta = datetime.timedelta(hours=1),
+    simulate_runs: bool = True,
+    update_root_assets: bool = True,
+    track_memory: bool = False,
+    on_tick: Optional[Callable[[AutomationTickStats], None]] = None,
+) -> Sequence[AutomationTickStats]:
+    """Evaluates the automation conditions of the given definitions for a sequence of ticks, in
+    the same way as the asset daemon, and returns the performance statistics of each tick.
+
+    Args:
+        instance (DagsterInstance): The instance to evaluate against.
+        defs (Definitions): The definitions whose automation conditions are evaluated.
+        num_ticks (int): The number of ticks to evaluate.
+        start_time (Optional[datetime.datetime]): The simulated time of the first tick. Defaults
+            to the current time.
+        tick_interval (datetime.timedelta): The simulated time between consecutive ticks.
+        simulate_runs (bool): Whether to report successful materializations and check evaluations
+            for everything requested by a tick before evaluating the next one.
+        update_root_assets (bool): Whether to report a materialization of the latest partition of
+            each root asset before each tick after the first. Eager conditions only react to
+            updates which happen after their first evaluation, so without new root data the graph
+            quickly settles and later ticks do little work.
+        track_memory (bool): Whether to record the peak memory allocated during each tick. This
+            uses tracemalloc, which significantly slows down evaluation, so the latency of ticks
+            evaluated with memory tracking enabled should not be compared to those without.
+        on_tick (Optional[Callable[[AutomationTickStats], None]]): Called with the statistics of
+            each tick as soon as it has been evaluated.
+    """
+    asset_graph = defs.resolve_asset_graph()
+    entity_keys = _get_automated_entity_keys(asset_graph)
+    evaluation_time = start_time or get_current_datetime()
+    cursor = AssetDaemonCursor.empty()
+    logger = logging.getLogger("dagster.automation_replay")
+
+    all_stats = []
+    for tick_index in range(num_ticks):
+        if update_root_assets and tick_index > 0:
+            _report_root_asset_updates(instance, asset_graph, evaluation_time)
+
+        # round-trip the cursor, as it would be between ticks of the daemon
+        cursor = deserialize_value(serialize_value(cursor), AssetDaemonCursor)
+        evaluator = AutomationConditionEvaluator(
+            entity_keys=entity_keys,
+            instance=instance,
+            asset_graph=asset_graph,
+            cursor=cursor,
+            emit_backfills=False,
+            evaluation_time=evaluation_time,
+            logger=logger,
+            profile=True,
+        )
+
+        if track_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            results, requested_subsets = evaluator.evaluate()
+            duration = time.perf_counter() - start
+            peak_memory = tracemalloc.get_traced_memory()[1] if track_memory else None
+        finally:
+            if track_memory:
+                tracemalloc.stop()
+
+        cursor = cursor.with_updates(
+            evaluation_timestamp=evaluation_time.timestamp(),
+            newly_observe_requested_asset_keys=[],
+            evaluation_id=cursor.evaluation_id + 1,
+            condition_cursors=evaluator.get_new_cursors(results),
+            asset_graph=asset_graph,
+        )
+
+        profiler = evaluator.profiler
+        assert profiler is not None
+        stats = AutomationTickStats(
+            tick_index=tick_index,
+            evaluation_time=evaluation_time,
+            duration=duration,
+            num_queries=profiler.num_queries,
+            query_duration=profiler.query_duration,
+            peak_memory=peak_memory,
+            num_requested=sum(subset.size for subset in requested_subsets),
+        )
+        all_stats.append(stats)
+        if on_tick:
+            on_tick(stats)
+
+        if simulate_runs:
+            _report_requested_subsets(instance, requested_subsets)
+        evaluation_time += tick_interval
+
+    return all_stats
+
+
+def _get_automated_entity_keys(asset_graph: AssetGraph) -> set[EntityKey]:
+    with disable_dagster_warnings():
+        selection = AssetSelection.all(include_sources=True) | AssetSelection.all_asset_checks()
+    return {
+        key
+        for key in selection.resolve(asset_graph) | selection.resolve_checks(asset_graph)
+        if asset_graph.get(key).automation_condition is not None
+    }
+
+
+def summarize_tick_stats(all_stats: Sequence[AutomationTickStats]) -> Mapping[str, float]:
+    """Returns aggregate statistics over a sequence of replayed ticks."""
+    durations = sorted(stats.duration for stats in all_stats)
+    summary = {
+        "num_ticks": len(all_stats),
+        "total_duration": sum(durations),
+        "mean_duration": sum(durations) / len(durations),
+        "median_duration": durations[len(durations) // 2],
+        "max_duration": durations[-1],
+        "mean_num_queries": sum(stats.num_queries for stats in all_stats) / len(all_stats),
+        "total_requested": sum(stats.num_requested for stats in all_stats),
+    }
+    peak_memories = [stats.peak_memory for stats in all_stats if stats.peak_memory is not None]
+    if peak_memories:
+        summary["max_peak_memory"] = max(peak_memories)
+    return summary
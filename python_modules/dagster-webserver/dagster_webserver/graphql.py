@@ -1,12 +1,29 @@
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from asyncio import Task, get_event_loop, run
-from collections.abc import AsyncGenerator, Sequence
+from asyncio import (
+    AbstractEventLoop,
+    Task,
+    get_event_loop,
+    new_event_loop,
+    run_coroutine_threadsafe,
+    set_event_loop,
+    wrap_future,
+)
+from collections.abc import AsyncGenerator, Awaitable, Mapping, Sequence
+from contextvars import Context, ContextVar, copy_context
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar, Union, cast
+from inspect import isawaitable
+from typing import TYPE_CHECKING, Any, Callable, Generic, Optional, TypeVar, Union, cast
 
 import dagster._check as check
+from dagster._core.loader import offload_blocking_loads
 from dagster._serdes import pack_value
+from dagster._utils import Counter, traced_counter
 from dagster._utils.error import serializable_error_info_from_exc_info
+from dagster._utils.tags import get_boolean_tag_value
+from dagster_graphql.implementation.response_cache import GraphQLResponseCache, is_mutation
 from dagster_graphql.implementation.utils import ErrorCapture
 from dagster_shared.seven import json
 from graphene import Schema
@@ -14,13 +31,18 @@
 from graphql.execution import ExecutionResult
 from starlette import status
 from starlette.applications import Starlette
-from starlette.concurrency import run_in_threadpool
 from starlette.middleware import Middleware
 from starlette.requests import HTTPConnection, Request
-from starlette.responses import HTMLResponse, JSONResponse, PlainTextResponse
+from starlette.responses import HTMLResponse, PlainTextResponse, Response
 from starlette.routing import BaseRoute
 from starlette.websockets import WebSocket, WebSocketDisconnect, WebSocketState
 
+from dagster_webserver.response_encoding import (
+    encode_json,
+    make_body_response,
+    make_json_response,
+    negotiate_encoding,
+)
 from dagster_webserver.templates.graphiql import TEMPLATE
 
 if TYPE_CHECKING:
@@ -44,6 +66,246 @@ class GraphQLWS(str, Enum):
 
 
 TRequestContext = TypeVar("TRequestContext")
+T = TypeVar("T")
+
+
+def get_graphql_execution_workers() -> int:
+    return int(os.getenv("DAGSTER_UI_GRAPHQL_EXECUTION_WORKERS", "40"))
+
+
+class GraphQLExecutionPool:
+    """A fixed set of threads, each running a long-lived event loop, on which GraphQL requests are
+    executed.
+
+    Much of the schema resolves synchronously, so requests are executed off of the server's event
+    loop. Reusing the loops avoids starting a thread and an event loop for every request, and lets a
+    loop interleave the requests assigned to it while their batch loads wait on the bounded
+    executor of each storage. Each request is assigned to the loop with the fewest requests in
+    flight. The threads are started on first use.
+    """
+
+    def __init__(self, num_workers: int):
+        self._num_workers = check.int_param(num_workers, "num_workers")
+        check.invariant(num_workers > 0, "num_workers must be positive")
+        self._lock = threading.Lock()
+        self._loops: list[AbstractEventLoop] = []
+        self._num_in_flight: list[int] = []
+
+    @property
+    def num_in_flight(self) -> int:
+        with self._lock:
+            return sum(self._num_in_flight)
+
+    def _start(self) -> None:
+        for i in range(self._num_workers):
+            loop = new_event_loop()
+            threading.Thread(
+                target=_run_event_loop,
+                args=(loop,),
+                name=f"graphql-execution-{i}",
+                daemon=True,
+            ).start()
+            self._loops.append(loop)
+            self._num_in_flight.append(0)
+
+    async def run(self, make_coroutine: Callable[[], Awaitable[T]]) -> T:
+        """Runs the coroutine returned by `make_coroutine` on the least busy loop of the pool, and
+        waits for its result. Cancelling the caller cancels the coroutine.
+        """
+        with self._lock:
+            if not self._loops:
+                self._start()
+            index = min(range(self._num_workers), key=self._num_in_flight.__getitem__)
+            self._num_in_flight[index] += 1
+            loop = self._loops[index]
+
+        try:
+            return await wrap_future(
+                run_coroutine_threadsafe(
+                    _run_offloading_blocking_loads(copy_context(), make_coroutine), loop
+                )
+            )
+        finally:
+            with self._lock:
+                self._num_in_flight[index] -= 1
+
+
+def _run_event_loop(loop: AbstractEventLoop) -> None:
+    set_event_loop(loop)
+    loop.run_forever()
+
+
+async def _run_offloading_blocking_loads(
+    context: Context, make_coroutine: Callable[[], Awaitable[T]]
+) -> T:
+    # the task running on the pool's loop does not inherit the context of the caller, so carry
+    # over its context variables, like the counter of traced calls of the request
+    for var, value in context.items():
+        var.set(value)
+
+    with offload_blocking_loads():
+        return await make_coroutine()
+
+
+def is_graphql_tracing_enabled() -> bool:
+    return get_boolean_tag_value(os.getenv("DAGSTER_UI_GRAPHQL_TRACING"))
+
+
+def get_graphql_slow_query_threshold_ms() -> float:
+    return float(os.getenv("DAGSTER_UI_GRAPHQL_SLOW_QUERY_THRESHOLD_MS", "1000"))
+
+
+def get_graphql_slow_query_log_path() -> Optional[str]:
+    return os.getenv("DAGSTER_UI_GRAPHQL_SLOW_QUERY_LOG")
+
+
+# the number of slowest fields, loaders and storage calls included in a trace summary
+MAX_TRACE_SUMMARY_ENTRIES = 25
+
+
+class GraphQLRequestTrace:
+    """Timings collected while executing a GraphQL request with tracing enabled: the time spent in
+    each field resolver, and the batch loads and traced instance calls recorded by the request's
+    call counter.
+    """
+
+    def __init__(self, counter: Counter):
+        self._counter = counter
+        self._start = time.perf_counter()
+        self._duration: Optional[float] = None
+        self._resolver_counts: dict[str, int] = {}
+        self._resolver_durations: dict[str, float] = {}
+
+    @property
+    def duration(self) -> float:
+        if self._duration is None:
+            return time.perf_counter() - self._start
+        return self._duration
+
+    def finish(self) -> None:
+        self._duration = time.perf_counter() - self._start
+
+    def record_resolver(self, field: str, duration: float) -> None:
+        # resolvers of a request all run on the loop executing it, so no lock is needed
+        self._resolver_counts[field] = self._resolver_counts.get(field, 0) + 1
+        self._resolver_durations[field] = self._resolver_durations.get(field, 0.0) + duration
+
+    def summary(self) -> dict[str, Any]:
+        counts = self._counter.counts()
+        storage_durations = self._counter.durations()
+        batches = self._counter.batches()
+        return {
+            "durationMs": _to_ms(self.duration),
+            "resolvers": [
+                {
+                    "field": field,
+                    "count": self._resolver_counts[field],
+                    "durationMs": _to_ms(duration),
+                }
+                for field, duration in _slowest(self._resolver_durations)
+            ],
+            "loaders": [
+                {
+                    "loader": loader,
+                    "batches": len(batches[loader]),
+                    "keys": sum(size for size, _ in batches[loader]),
+                    "maxBatchSize": max(size for size, _ in batches[loader]),
+                    "durationMs": _to_ms(duration),
+                }
+                for loader, duration in _slowest(
+                    {
+                        loader: sum(duration for _, duration in loader_batches)
+                        for loader, loader_batches in batches.items()
+                    }
+                )
+            ],
+            "storage": [
+                {"method": method, "count": counts.get(method, 0), "durationMs": _to_ms(duration)}
+                for method, duration in _slowest(storage_durations)
+            ],
+        }
+
+    def server_timing_header(self) -> str:
+        storage_durations = self._counter.durations()
+        batches = [
+            batch for loader_batches in self._counter.batches().values() for batch in loader_batches
+        ]
+        return ", ".join(
+            [
+                f"graphql;dur={_to_ms(self.duration)}",
+                f"storage;dur={_to_ms(sum(storage_durations.values()))};"
+                f'desc="{sum(self._counter.counts().values())} calls"',
+                f"loaders;dur={_to_ms(sum(duration for _, duration in batches))};"
+                f'desc="{len(batches)} batches"',
+            ]
+        )
+
+
+def _slowest(durations: Mapping[str, float]) -> Sequence[tuple[str, float]]:
+    return sorted(durations.items(), key=lambda item: item[1], reverse=True)[
+        :MAX_TRACE_SUMMARY_ENTRIES
+    ]
+
+
+def _to_ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+_graphql_request_trace: ContextVar[Optional[GraphQLRequestTrace]] = ContextVar(
+    "graphql_request_trace", default=None
+)
+
+
+class GraphQLTracingMiddleware:
+    """Graphene middleware which records the time spent in each field resolver of a traced request.
+    The time of an async resolver includes the time spent waiting on its batch loads.
+    """
+
+    def resolve(self, next_, root, info, **args):
+        trace = _graphql_request_trace.get()
+        if trace is None:
+            return next_(root, info, **args)
+
+        field = f"{info.parent_type.name}.{info.field_name}"
+        start = time.perf_counter()
+        result = next_(root, info, **args)
+        if isawaitable(result):
+            return _await_traced_resolver(trace, field, start, result)
+
+        trace.record_resolver(field, time.perf_counter() - start)
+        return result
+
+
+async def _await_traced_resolver(
+    trace: GraphQLRequestTrace, field: str, start: float, result: Awaitable[Any]
+) -> Any:
+    try:
+        return await result
+    finally:
+        trace.record_resolver(field, time.perf_counter() - start)
+
+
+_slow_query_log_lock = threading.Lock()
+
+
+def _log_slow_query(
+    path: str,
+    query: str,
+    variables: Optional[dict[str, Any]],
+    operation_name: Optional[str],
+    trace: GraphQLRequestTrace,
+) -> None:
+    entry = {
+        "timestamp": time.time(),
+        "operationName": operation_name,
+        "query": query,
+        "variables": variables,
+        "trace": trace.summary(),
+    }
+    # requests are executed on several threads, so serialize the writes to the log
+    with _slow_query_log_lock:
+        with open(path, "a", encoding="utf8") as f:
+            f.write(json.dumps(entry) + "\n")
 
 
 class GraphQLServer(ABC, Generic[TRequestContext]):
@@ -52,6 +314,14 @@ def __init__(self, app_path_prefix: str = ""):
 
         self._graphql_schema = self.build_graphql_schema()
         self._graphql_middleware = self.build_graphql_middleware()
+        self._execution_pool = GraphQLExecutionPool(get_graphql_execution_workers())
+
+        # tracing is opt-in, as timing every resolver slows down the execution of requests
+        self._tracing_enabled = is_graphql_tracing_enabled()
+        self._slow_query_threshold_ms = get_graphql_slow_query_threshold_ms()
+        self._slow_query_log_path = get_graphql_slow_query_log_path()
+        if self._tracing_enabled:
+            self._graphql_middleware = [*self._graphql_middleware, GraphQLTracingMiddleware()]
 
     @abstractmethod
     def build_graphql_schema(self) -> Schema: ...
@@ -68,6 +338,11 @@ def build_routes(self) -> list[BaseRoute]: ...
     @abstractmethod
     def make_request_context(self, conn: HTTPConnection) -> TRequestContext: ...
 
+    def get_response_cache(
+        self, request_context: TRequestContext
+    ) -> Optional[GraphQLResponseCache]:
+        return None
+
     def handle_graphql_errors(self, errors: Sequence[GraphQLError]):
         results = []
         for err in errors:
@@ -217,32 +492,34 @@ async def execute_graphql_request(
         query: str,
         variables: Optional[dict[str, Any]],
         operation_name: Optional[str],
-    ) -> JSONResponse:
-        # run each query in a separate thread, as much of the schema is sync/blocking
+    ) -> Response:
+        # run each query on the execution pool, as much of the schema is sync/blocking
         # use execute_async to allow async resolvers to facilitate dataloader pattern
-        return await run_in_threadpool(
-            self.graphql_execution_thread,
-            request=request,
-            query=query,
-            variables=variables,
-            operation_name=operation_name,
+        return await self._execution_pool.run(
+            lambda: self.gen_graphql_response_for_request(
+                request=request,
+                query=query,
+                variables=variables,
+                operation_name=operation_name,
+            )
         )
 
-    def graphql_execution_thread(
+    async def gen_graphql_response_for_request(
         self,
         request: Request,
         query: str,
         variables: Optional[dict[str, Any]],
         operation_name: Optional[str],
-    ) -> JSONResponse:
+    ) -> Response:
+        # the request context, and so the data loaders shared by all resolvers of the request, is
+        # created on the loop which executes the request, since data loaders are bound to a loop
         request_context = self.make_request_context(request)
-        return run(
-            self.gen_graphql_response(
-                request_context=request_context,
-                query=query,
-                variables=variables,
-                operation_name=operation_name,
-            )
+        return await self.gen_graphql_response(
+            request_context=request_context,
+            query=query,
+            variables=variables,
+            operation_name=operation_name,
+            accept_encoding=request.headers.get("Accept-Encoding"),
         )
 
     async def gen_graphql_response(
@@ -251,29 +528,91 @@ async def gen_graphql_response(
         query: str,
         variables: Optional[dict[str, Any]],
         operation_name: Optional[str],
-    ) -> JSONResponse:
+        accept_encoding: Optional[str] = None,
+    ) -> Response:
+        """Executes a GraphQL request, and builds its JSON response compressed with the preferred
+        encoding of those accepted by the client.
+        """
+        encoding = negotiate_encoding(accept_encoding)
+        response_cache = self.get_response_cache(request_context)
+        cache_key = (
+            response_cache.make_key(request_context, query, variables, operation_name)
+            if response_cache
+            else None
+        )
+        if response_cache and cache_key:
+            cached_body = response_cache.get(cache_key)
+            if cached_body is not None:
+                return make_body_response(
+                    cached_body,
+                    status_code=status.HTTP_200_OK,
+                    headers={"x-dagster-response-cache": "hit"},
+                    encoding=encoding,
+                )
+
+        trace = self._start_request_trace()
+        trace_token = _graphql_request_trace.set(trace)
         captured_errors: list[Exception] = []
-        with ErrorCapture.watch(captured_errors.append):
-            gql_result = await self._graphql_schema.execute_async(
-                query,
-                variables=variables,
-                operation_name=operation_name,
-                context=request_context,
-                middleware=self._graphql_middleware,
-            )
+        try:
+            with ErrorCapture.watch(captured_errors.append):
+                gql_result = await self._graphql_schema.execute_async(
+                    query,
+                    variables=variables,
+                    operation_name=operation_name,
+                    context=request_context,
+                    middleware=self._graphql_middleware,
+                )
+        finally:
+            _graphql_request_trace.reset(trace_token)
 
         response_data: dict[str, Any] = {"data": gql_result.data}
 
         if gql_result.errors:
             response_data["errors"] = self.handle_graphql_errors(gql_result.errors)
 
-        return JSONResponse(
-            response_data,
-            status_code=self._determine_status_code(
-                resolver_errors=gql_result.errors,
-                captured_errors=captured_errors,
-            ),
+        status_code = self._determine_status_code(
+            resolver_errors=gql_result.errors,
+            captured_errors=captured_errors,
         )
+        content = response_data
+        headers: dict[str, str] = {}
+        if trace:
+            trace.finish()
+            content = {**response_data, "extensions": {"tracing": trace.summary()}}
+            headers["Server-Timing"] = trace.server_timing_header()
+            if self._slow_query_log_path and trace.duration * 1000 >= self._slow_query_threshold_ms:
+                _log_slow_query(self._slow_query_log_path, query, variables, operation_name, trace)
+
+        if response_cache and cache_key:
+            headers["x-dagster-response-cache"] = "miss"
+            # only cache complete responses, so that transient errors are retried
+            if status_code == status.HTTP_200_OK and not gql_result.errors:
+                # the cached body is stored uncompressed, as clients accept different encodings,
+                # and the trace of a request is not replayed on cache hits
+                body = encode_json(response_data)
+                response_cache.set(cache_key, body)
+                if not trace:
+                    return make_body_response(body, status_code, headers, encoding)
+        elif response_cache and response_cache.enabled and is_mutation(query, operation_name):
+            # mutations may write state which is not tracked by the event log, like instigator
+            # state, backfills or deleted runs, so they drop every cached response
+            response_cache.invalidate()
+
+        # large result trees are encoded and compressed as they are sent, rather than held in
+        # memory as a single document
+        return make_json_response(content, status_code, headers, encoding)
+
+    def _start_request_trace(self) -> Optional[GraphQLRequestTrace]:
+        if not self._tracing_enabled:
+            return None
+
+        # traced calls are recorded on the counter of the request, which the webserver sets for
+        # each http request
+        counter = traced_counter.get()
+        if not isinstance(counter, Counter):
+            counter = Counter()
+            traced_counter.set(counter)
+        return GraphQLRequestTrace(counter)
 
     async def execute_graphql_subscription(
         self,
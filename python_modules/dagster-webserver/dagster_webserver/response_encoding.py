@@ -0,0 +1,211 @@
+"""Encoding of the JSON responses of the webserver.
+
+Responses are compressed with the best encoding accepted by the client, and large result trees are
+encoded and compressed incrementally, so that neither the JSON document nor its compressed form has
+to be held in memory in full before the response is sent.
+"""
+
+import json
+import os
+import zlib
+from collections.abc import Iterable, Iterator, Mapping
+from itertools import chain
+from typing import Any, Optional
+
+from starlette.responses import Response, StreamingResponse
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+GZIP_ENCODING = "gzip"
+ZSTD_ENCODING = "zstd"
+
+JSON_MEDIA_TYPE = "application/json"
+
+# containers nested at most this deep in a response are encoded one element at a time, deeper
+# values are encoded in a single call, e.g. the nodes of `{"data": {"assetNodes": [...]}}`
+_ITERENCODE_MAX_DEPTH = 3
+
+# encoded pieces are joined into chunks of about this many bytes before being compressed or sent
+_CHUNK_SIZE = 256 * 1024
+
+# json compresses well at the fastest levels, which keep the cost of compression low
+_GZIP_LEVEL = 1
+_ZSTD_LEVEL = 3
+
+# the same options as starlette's JSONResponse, shared as json.dumps builds an encoder per call
+# when given options
+_ENCODER = json.JSONEncoder(ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":"))
+
+
+def get_response_compression_min_size() -> int:
+    return int(os.getenv("DAGSTER_UI_RESPONSE_COMPRESSION_MIN_SIZE", "1024"))
+
+
+def get_response_streaming_min_size() -> int:
+    return int(os.getenv("DAGSTER_UI_RESPONSE_STREAMING_MIN_SIZE", str(1024 * 1024)))
+
+
+def supported_encodings() -> list[str]:
+    """The encodings the webserver can compress responses with, in order of preference."""
+    return [ZSTD_ENCODING, GZIP_ENCODING] if zstandard else [GZIP_ENCODING]
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Picks the preferred supported encoding of those accepted by an Accept-Encoding header."""
+    if not accept_encoding:
+        return None
+
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(coding.strip().lower())
+
+    for encoding in supported_encodings():
+        if encoding in accepted:
+            return encoding
+    return None
+
+
+def encode_json(content: Any) -> bytes:
+    """Encodes content the same way as starlette's JSONResponse."""
+    return _dumps(content).encode("utf-8")
+
+
+def iterencode_json(content: Any, depth: int = 0) -> Iterator[str]:
+    """Encodes content as pieces of a JSON document, in the same format as encode_json.
+
+    Unlike json.JSONEncoder.iterencode, which falls back to a pure python encoder, only the top
+    levels of the tree are walked in python and their elements are encoded with the C encoder.
+    """
+    if depth >= _ITERENCODE_MAX_DEPTH or not content:
+        yield _dumps(content)
+    elif isinstance(content, dict):
+        separator = "{"
+        for key, value in content.items():
+            yield f"{separator}{_dumps(key)}:"
+            yield from iterencode_json(value, depth + 1)
+            separator = ","
+        yield "}"
+    elif isinstance(content, (list, tuple)):
+        separator = "["
+        for value in content:
+            yield separator
+            yield from iterencode_json(value, depth + 1)
+            separator = ","
+        yield "]"
+    else:
+        yield _dumps(content)
+
+
+def make_json_response(
+    content: Any,
+    status_code: int,
+    headers: Mapping[str, str],
+    encoding: Optional[str],
+) -> Response:
+    """Builds the response for a JSON document, compressed with the given encoding.
+
+    The document is encoded incrementally. If its encoded form outgrows the streaming threshold,
+    the rest of it is encoded while the response is sent.
+    """
+    return _make_response(_join_chunks(iterencode_json(content)), status_code, headers, encoding)
+
+
+def make_body_response(
+    body: bytes,
+    status_code: int,
+    headers: Mapping[str, str],
+    encoding: Optional[str],
+) -> Response:
+    """Builds the response for an encoded JSON document, compressed with the given encoding."""
+    return _make_response(iter([body]), status_code, headers, encoding)
+
+
+def _make_response(
+    chunks: Iterator[bytes],
+    status_code: int,
+    headers: Mapping[str, str],
+    encoding: Optional[str],
+) -> Response:
+    response_headers = {**headers, "Vary": "Accept-Encoding"}
+
+    body: Iterator[bytes] = chunks
+    if encoding:
+        # read enough of the document to tell whether it is worth compressing
+        head = []
+        size = 0
+        min_size = get_response_compression_min_size()
+        for chunk in chunks:
+            head.append(chunk)
+            size += len(chunk)
+            if size >= min_size:
+                body = _compress(chain(head, chunks), encoding)
+                response_headers["Content-Encoding"] = encoding
+                break
+        else:
+            body = iter(head)
+
+    buffered = []
+    size = 0
+    streaming_min_size = get_response_streaming_min_size()
+    for chunk in body:
+        buffered.append(chunk)
+        size += len(chunk)
+        if size >= streaming_min_size:
+            return StreamingResponse(
+                chain(buffered, body),
+                status_code=status_code,
+                headers=response_headers,
+                media_type=JSON_MEDIA_TYPE,
+            )
+
+    return Response(
+        b"".join(buffered),
+        status_code=status_code,
+        headers=response_headers,
+        media_type=JSON_MEDIA_TYPE,
+    )
+
+
+def _join_chunks(pieces: Iterable[str]) -> Iterator[bytes]:
+    chunk = []
+    size = 0
+    for piece in pieces:
+        chunk.append(piece)
+        size += len(piece)
+        if size >= _CHUNK_SIZE:
+            yield "".join(chunk).encode("utf-8")
+            chunk = []
+            size = 0
+    if chunk:
+        yield "".join(chunk).encode("utf-8")
+
+
+def _compress(chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    if encoding == ZSTD_ENCODING and zstandard:
+        compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compressobj()
+    else:
+        # a window of 16 + 15 bits writes the gzip header and trailer around the deflate stream
+        compressor = zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _dumps(content: Any) -> str:
+    return _ENCODER.encode(content)
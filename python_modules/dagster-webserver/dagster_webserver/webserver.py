@@ -3,7 +3,7 @@
 import mimetypes
 import uuid
 from os import path, walk
-from typing import Generic, Optional, TypeVar
+from typing import Any, Generic, Optional, TypeVar
 
 import dagster._check as check
 from dagster import __version__ as dagster_version
@@ -16,6 +16,7 @@
 from dagster._core.workspace.context import BaseWorkspaceRequestContext, IWorkspaceProcessContext
 from dagster._utils import Counter, traced_counter
 from dagster_graphql import __version__ as dagster_graphql_version
+from dagster_graphql.implementation.response_cache import GraphQLResponseCache, get_response_cache
 from dagster_graphql.schema import create_schema
 from dagster_shared.seven import json
 from graphene import Schema
@@ -78,6 +79,11 @@ def relative_path(self, rel: str) -> str:
     def make_request_context(self, conn: HTTPConnection) -> BaseWorkspaceRequestContext:
         return self._process_context.create_request_context(conn)
 
+    def get_response_cache(
+        self, request_context: BaseWorkspaceRequestContext
+    ) -> GraphQLResponseCache:
+        return get_response_cache(self._process_context)
+
     def build_middleware(self) -> list[Middleware]:
         return [Middleware(DagsterTracedCounterMiddleware)]
 
@@ -106,13 +112,16 @@ def make_csp_header(self, nonce: str) -> str:
             )
 
     async def webserver_info_endpoint(self, _request: Request):
-        return JSONResponse(
-            {
-                "dagster_webserver_version": __version__,
-                "dagster_version": dagster_version,
-                "dagster_graphql_version": dagster_graphql_version,
-            }
-        )
+        info: dict[str, Any] = {
+            "dagster_webserver_version": __version__,
+            "dagster_version": dagster_version,
+            "dagster_graphql_version": dagster_graphql_version,
+        }
+        response_cache = get_response_cache(self._process_context)
+        if response_cache.enabled:
+            stats = response_cache.get_stats()
+            info["graphql_response_cache"] = {**stats._asdict(), "hit_rate": stats.hit_rate}
+        return JSONResponse(info)
 
     async def download_debug_file_endpoint(self, request: Request):
         run_id = request.path_params["run_id"]
@@ -0,0 +1,87 @@
+import asyncio
+import contextvars
+import threading
+
+import pytest
+from dagster_webserver.graphql import GraphQLExecutionPool
+
+
+def test_execution_pool_reuses_loops():
+    pool = GraphQLExecutionPool(num_workers=2)
+
+    async def _get_loop_and_thread():
+        return asyncio.get_running_loop(), threading.current_thread()
+
+    async def _main():
+        first = await pool.run(_get_loop_and_thread)
+        second = await pool.run(_get_loop_and_thread)
+        assert first[1] is not threading.current_thread()
+        # idle loops are reused rather than a new one being started for each request
+        assert first == second
+
+        started = asyncio.Event()
+        release = threading.Event()
+
+        async def _block():
+            main_loop.call_soon_threadsafe(started.set)
+            await asyncio.get_running_loop().run_in_executor(None, release.wait)
+            return asyncio.get_running_loop()
+
+        main_loop = asyncio.get_running_loop()
+        blocked = asyncio.ensure_future(pool.run(_block))
+        await started.wait()
+        assert pool.num_in_flight == 1
+        # requests are assigned to the least busy loop
+        other_loop, _ = await pool.run(_get_loop_and_thread)
+        release.set()
+        assert await blocked is not other_loop
+        assert pool.num_in_flight == 0
+
+    asyncio.run(_main())
+
+
+def test_execution_pool_errors_and_cancellation():
+    pool = GraphQLExecutionPool(num_workers=1)
+
+    async def _fail():
+        raise Exception("oops")
+
+    async def _main():
+        with pytest.raises(Exception, match="oops"):
+            await pool.run(_fail)
+
+        cancelled = threading.Event()
+
+        async def _wait_forever():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        task = asyncio.ensure_future(pool.run(_wait_forever))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # the coroutine running on the pool is cancelled along with the caller
+        assert await asyncio.get_running_loop().run_in_executor(None, cancelled.wait, 5)
+        assert pool.num_in_flight == 0
+
+    asyncio.run(_main())
+
+
+def test_execution_pool_carries_over_context():
+    pool = GraphQLExecutionPool(num_workers=1)
+    request_id = contextvars.ContextVar("request_id", default=None)
+
+    async def _get_request_id():
+        return request_id.get()
+
+    async def _main():
+        request_id.set("foo")
+        assert await pool.run(_get_request_id) == "foo"
+        request_id.set("bar")
+        assert await pool.run(_get_request_id) == "bar"
+
+    asyncio.run(_main())
@@ -0,0 +1,85 @@
+import asyncio
+import os
+import tempfile
+
+from dagster._core.test_utils import create_run_for_test, environ, instance_for_test
+from dagster._core.workspace.context import WorkspaceProcessContext
+from dagster._core.workspace.load_target import EmptyWorkspaceTarget
+from dagster_shared.seven import json
+from dagster_webserver.webserver import DagsterWebserver
+from starlette.requests import Request
+
+RUNS_QUERY = """
+    query RunsQuery {
+        runsOrError(limit: 10) {
+            ... on Runs {
+                results {
+                    runId
+                    status
+                }
+            }
+        }
+    }
+"""
+
+
+def _execute(webserver: DagsterWebserver):
+    request = Request({"type": "http", "method": "POST", "path": "/graphql", "headers": []})
+    return asyncio.run(
+        webserver.execute_graphql_request(
+            request=request, query=RUNS_QUERY, variables=None, operation_name="RunsQuery"
+        )
+    )
+
+
+def test_graphql_tracing_disabled():
+    with (
+        instance_for_test() as instance,
+        WorkspaceProcessContext(
+            instance, EmptyWorkspaceTarget(), read_only=True
+        ) as process_context,
+    ):
+        response = _execute(DagsterWebserver(process_context))
+        assert response.status_code == 200
+        assert "Server-Timing" not in response.headers
+        assert "extensions" not in json.loads(bytes(response.body))
+
+
+def test_graphql_tracing():
+    with (
+        tempfile.TemporaryDirectory() as tempdir,
+        environ(
+            {
+                "DAGSTER_UI_GRAPHQL_TRACING": "true",
+                "DAGSTER_UI_GRAPHQL_SLOW_QUERY_THRESHOLD_MS": "0",
+                "DAGSTER_UI_GRAPHQL_SLOW_QUERY_LOG": os.path.join(tempdir, "slow_queries.log"),
+            }
+        ),
+        instance_for_test() as instance,
+        WorkspaceProcessContext(
+            instance, EmptyWorkspaceTarget(), read_only=True
+        ) as process_context,
+    ):
+        run_id = create_run_for_test(instance).run_id
+        response = _execute(DagsterWebserver(process_context))
+        assert response.status_code == 200
+
+        body = json.loads(bytes(response.body))
+        assert body["data"]["runsOrError"]["results"][0]["runId"] == run_id
+
+        trace = body["extensions"]["tracing"]
+        assert trace["durationMs"] > 0
+        fields = {resolver["field"]: resolver for resolver in trace["resolvers"]}
+        assert fields["Query.runsOrError"]["count"] == 1
+        assert {call["method"] for call in trace["storage"]} == {"DagsterInstance.get_run_records"}
+
+        server_timing = response.headers["Server-Timing"]
+        assert server_timing.startswith("graphql;dur=")
+        assert "storage;dur=" in server_timing
+
+        with open(os.path.join(tempdir, "slow_queries.log"), encoding="utf8") as f:
+            entries = [json.loads(line) for line in f]
+        assert len(entries) == 1
+        assert entries[0]["operationName"] == "RunsQuery"
+        assert entries[0]["query"] == RUNS_QUERY
+        assert entries[0]["trace"]["resolvers"]
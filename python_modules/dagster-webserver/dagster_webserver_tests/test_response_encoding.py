@@ -0,0 +1,111 @@
+import asyncio
+import gzip
+
+from dagster._core.test_utils import create_run_for_test, environ, instance_for_test
+from dagster._core.workspace.context import WorkspaceProcessContext
+from dagster._core.workspace.load_target import EmptyWorkspaceTarget
+from dagster_shared.seven import json
+from dagster_webserver.response_encoding import (
+    encode_json,
+    iterencode_json,
+    make_json_response,
+    negotiate_encoding,
+)
+from dagster_webserver.webserver import DagsterWebserver
+from starlette.requests import Request
+from starlette.responses import StreamingResponse
+
+RUNS_QUERY = """
+    query RunsQuery {
+        runsOrError {
+            ... on Runs {
+                results {
+                    runId
+                }
+            }
+        }
+    }
+"""
+
+
+async def _read_body(response) -> bytes:
+    if isinstance(response, StreamingResponse):
+        return b"".join([chunk async for chunk in response.body_iterator])  # pyright: ignore[reportReturnType]
+    return bytes(response.body)
+
+
+def test_negotiate_encoding():
+    assert negotiate_encoding(None) is None
+    assert negotiate_encoding("") is None
+    assert negotiate_encoding("br") is None
+    assert negotiate_encoding("gzip, deflate, br") == "gzip"
+    assert negotiate_encoding("GZIP;q=0.5") == "gzip"
+    assert negotiate_encoding("gzip;q=0") is None
+
+
+def test_iterencode_json():
+    content = {
+        "data": {
+            "assetNodes": [
+                {"id": str(i), "tags": [{"key": "é", "value": None}], "ratio": i / 3}
+                for i in range(100)
+            ],
+            "empty": [],
+            "nested": {"a": {"b": {"c": [1, 2, {"d": True}]}}},
+        },
+        "errors": None,
+    }
+    assert "".join(iterencode_json(content)).encode("utf-8") == encode_json(content)
+
+
+def test_streamed_compressed_response():
+    content = {"data": {"nodes": [{"id": str(i), "name": f"node_{i}"} for i in range(10000)]}}
+    with environ({"DAGSTER_UI_RESPONSE_STREAMING_MIN_SIZE": "1024"}):
+        response = make_json_response(content, 200, {}, "gzip")
+    assert isinstance(response, StreamingResponse)
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert gzip.decompress(asyncio.run(_read_body(response))) == encode_json(content)
+
+    with environ({"DAGSTER_UI_RESPONSE_STREAMING_MIN_SIZE": "1024"}):
+        response = make_json_response(content, 200, {}, None)
+    assert isinstance(response, StreamingResponse)
+    assert "Content-Encoding" not in response.headers
+    assert asyncio.run(_read_body(response)) == encode_json(content)
+
+
+def test_small_response_uncompressed():
+    response = make_json_response({"data": {"id": "1"}}, 200, {}, "gzip")
+    assert not isinstance(response, StreamingResponse)
+    assert "Content-Encoding" not in response.headers
+    assert bytes(response.body) == b'{"data":{"id":"1"}}'
+
+
+def test_graphql_response_compression():
+    with (
+        environ({"DAGSTER_UI_RESPONSE_COMPRESSION_MIN_SIZE": "0"}),
+        instance_for_test() as instance,
+        WorkspaceProcessContext(
+            instance, EmptyWorkspaceTarget(), read_only=True
+        ) as process_context,
+    ):
+        run_id = create_run_for_test(instance).run_id
+        webserver = DagsterWebserver(process_context)
+
+        for accept_encoding, content_encoding in [(b"gzip, deflate", "gzip"), (None, None)]:
+            headers = [(b"accept-encoding", accept_encoding)] if accept_encoding else []
+            request = Request(
+                {"type": "http", "method": "POST", "path": "/graphql", "headers": headers}
+            )
+            response = asyncio.run(
+                webserver.execute_graphql_request(
+                    request=request, query=RUNS_QUERY, variables=None, operation_name="RunsQuery"
+                )
+            )
+            assert response.status_code == 200
+            assert response.headers.get("Content-Encoding") == content_encoding
+
+            body = asyncio.run(_read_body(response))
+            if content_encoding:
+                body = gzip.decompress(body)
+            assert json.loads(body)["data"]["runsOrError"]["results"] == [{"runId": run_id}]
@@ -53,6 +53,7 @@ def get_version():
     ],
     extras_require={
         "notebook": ["nbconvert"],  # notebooks support
+        "zstd": ["zstandard"],  # zstd compression of responses
         "test": ["starlette[full]"],  # TestClient deps in full
     },
     entry_points={
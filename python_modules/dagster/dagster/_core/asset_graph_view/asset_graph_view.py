@@ -29,6 +29,7 @@
 from dagster._core.definitions.partitions.mapping import UpstreamPartitionsResult
 from dagster._core.definitions.partitions.subset import (
     AllPartitionsSubset,
+    DefaultPartitionsSubset,
     TimeWindowPartitionsSubset,
 )
 from dagster._core.definitions.partitions.utils import (
@@ -258,6 +259,13 @@ def _with_current_partitions_def(
                 return SerializableEntitySubset(
                     key, value.with_partitions_def(current_partitions_def)
                 )
+            elif isinstance(value, DefaultPartitionsSubset) and isinstance(
+                current_partitions_def, MultiPartitionsDefinition
+            ):
+                # subsets of multi-partitioned assets are persisted as DefaultPartitionsSubsets
+                return SerializableEntitySubset(
+                    key, current_partitions_def.subset_with_partition_keys(value.subset)
+                )
             else:
                 return serializable_subset
         else:
@@ -282,12 +290,17 @@ def get_subset_from_serializable_subset(
         self, serializable_subset: SerializableEntitySubset[T_EntityKey]
     ) -> Optional[EntitySubset[T_EntityKey]]:
         key = serializable_subset.key
-        if self.asset_graph.has(key) and serializable_subset.is_compatible_with_partitions_def(
-            self._get_partitions_def(key)
-        ):
-            return EntitySubset(
-                self, key=key, value=_ValidatedEntitySubsetValue(serializable_subset.value)
-            )
+        if not self.asset_graph.has(key):
+            return None
+        partitions_def = self._get_partitions_def(key)
+        if serializable_subset.is_compatible_with_partitions_def(partitions_def):
+            value = serializable_subset.value
+            if isinstance(value, DefaultPartitionsSubset) and isinstance(
+                partitions_def, MultiPartitionsDefinition
+            ):
+                # subsets of multi-partitioned assets are persisted as DefaultPartitionsSubsets
+                value = partitions_def.subset_with_partition_keys(value.subset)
+            return EntitySubset(self, key=key, value=_ValidatedEntitySubsetValue(value))
         else:
             return None
 
@@ -10,10 +10,14 @@
 from dagster._core.definitions.asset_key import T_EntityKey
 from dagster._core.definitions.events import AssetKeyPartitionKey
 from dagster._core.definitions.partitions.context import partition_loading_context
-from dagster._core.definitions.partitions.definition import PartitionsDefinition
+from dagster._core.definitions.partitions.definition import (
+    MultiPartitionsDefinition,
+    PartitionsDefinition,
+)
 from dagster._core.definitions.partitions.subset import (
     AllPartitionsSubset,
     DefaultPartitionsSubset,
+    MultiPartitionsSubset,
     PartitionsSubset,
     TimeWindowPartitionsSubset,
 )
@@ -73,6 +77,11 @@ def from_coercible_value(
                     partitions_def.validate_partition_key(value, context=ctx)
             partitions_subset = partitions_def.subset_with_partition_keys([value])
         elif isinstance(value, PartitionsSubset):
+            if isinstance(value, DefaultPartitionsSubset) and isinstance(
+                partitions_def, MultiPartitionsDefinition
+            ):
+                # subsets of multi-partitioned assets are persisted as DefaultPartitionsSubsets
+                value = partitions_def.subset_with_partition_keys(value.subset)
             if partitions_def is not None:
                 check.inst_param(
                     value,
@@ -133,7 +142,10 @@ def is_compatible_with_partitions_def(
         if self.is_partitioned:
             # for some PartitionSubset types, we have access to the underlying partitions
             # definitions, so we can ensure those are identical
-            if isinstance(self.value, (TimeWindowPartitionsSubset, AllPartitionsSubset)):
+            if isinstance(
+                self.value,
+                (TimeWindowPartitionsSubset, MultiPartitionsSubset, AllPartitionsSubset),
+            ):
                 return self.value.partitions_def == partitions_def
             else:
                 return partitions_def is not None
@@ -1,6 +1,6 @@
 import base64
 from collections.abc import Sequence
-from typing import NamedTuple
+from typing import NamedTuple, Optional
 
 from dagster_shared.seven import json
 
@@ -15,6 +15,9 @@ class LogLineCursor(NamedTuple):
     line=0 means no lines from the file have been read.
     line=n means lines 0 through n-1 have been read from the file.
 
+    offset is the byte offset at which the line starts in the file, if known, so that reading can
+    resume from it without scanning the lines already read.
+
     has_more_now indicates if there are more log lines that can be read immediately. If the process writing
     logs is still running, but has not writen a log file, has_more_now will be False once all currently readable
     log files have been read. It does not mean that no new logs will be written in the future.
@@ -23,17 +26,21 @@ class LogLineCursor(NamedTuple):
     log_key: Sequence[str]
     line: int  # maybe rename line_offset?
     has_more_now: bool
+    offset: Optional[int] = None
 
     def __str__(self) -> str:
         return self.to_string()
 
     def to_string(self) -> str:
-        raw = json.dumps(
-            {"log_key": self.log_key, "line": self.line, "has_more_now": self.has_more_now}
-        )
+        cursor = {"log_key": self.log_key, "line": self.line, "has_more_now": self.has_more_now}
+        if self.offset is not None:
+            cursor["offset"] = self.offset
+        raw = json.dumps(cursor)
         return base64.b64encode(bytes(raw, encoding="utf-8")).decode("utf-8")
 
     @staticmethod
     def parse(cursor_str: str) -> "LogLineCursor":
         raw = json.loads(base64.b64decode(cursor_str).decode("utf-8"))
-        return LogLineCursor(raw["log_key"], raw["line"], raw["has_more_now"])
+        return LogLineCursor(
+            raw["log_key"], raw["line"], raw["has_more_now"], offset=raw.get("offset")
+        )
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import logging
 from collections import defaultdict
@@ -15,12 +16,16 @@
 from dagster._core.definitions.backfill_policy import BackfillPolicy, BackfillPolicyType
 from dagster._core.definitions.declarative_automation.automation_condition import (
     AutomationCondition,
-    AutomationResult,
 )
 from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
     AutomationConditionEvaluator,
 )
+from dagster._core.definitions.declarative_automation.parallel_evaluation import (
+    can_evaluate_in_processes,
+    evaluate_in_processes,
+)
 from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionCursor,
     AutomationConditionEvaluation,
 )
 from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
@@ -51,6 +56,7 @@ def __init__(
         emit_backfills: bool,
         default_condition: Optional[AutomationCondition] = None,
         evaluation_time: Optional[datetime.datetime] = None,
+        num_evaluation_processes: int = 1,
     ):
         resolved_entity_keys = {
             entity_key
@@ -74,6 +80,11 @@ def __init__(
         self._materialize_run_tags = materialize_run_tags
         self._observe_run_tags = observe_run_tags
         self._auto_observe_asset_keys = auto_observe_asset_keys or set()
+        # evaluation is only split across forked processes when the caller opts in, as forking is
+        # only safe from callers which do not share their process with other threads doing work
+        self._num_evaluation_processes = check.int_param(
+            num_evaluation_processes, "num_evaluation_processes"
+        )
 
     @property
     def cursor(self) -> AssetDaemonCursor:
@@ -133,11 +144,13 @@ def _build_run_requests(self, entity_subsets: Sequence[EntitySubset]) -> Sequenc
         )
 
     def _get_updated_cursor(
-        self, results: Iterable[AutomationResult], observe_run_requests: Iterable[RunRequest]
+        self,
+        condition_cursors: Sequence[AutomationConditionCursor],
+        observe_run_requests: Iterable[RunRequest],
     ) -> AssetDaemonCursor:
         return self.cursor.with_updates(
             evaluation_id=self._evaluation_id,
-            condition_cursors=[result.get_new_cursor() for result in results],
+            condition_cursors=condition_cursors,
             newly_observe_requested_asset_keys=[
                 asset_key
                 for run_request in observe_run_requests
@@ -150,20 +163,33 @@ def _get_updated_cursor(
             asset_graph=self.asset_graph,
         )
 
-    def _get_updated_evaluations(
-        self, results: Iterable[AutomationResult]
-    ) -> Sequence[AutomationConditionEvaluation[EntityKey]]:
-        # only record evaluation results where something changed
-        updated_evaluations = []
-        for result in results:
-            previous_cursor = self.cursor.get_previous_condition_cursor(result.key)
-            if (
-                previous_cursor is None
-                or previous_cursor.result_value_hash != result.value_hash
-                or not result.true_subset.is_empty
-            ):
-                updated_evaluations.append(result.serializable_evaluation)
-        return updated_evaluations
+    async def _async_evaluate_conditions(
+        self,
+    ) -> tuple[
+        Sequence[EntitySubset],
+        Sequence[AutomationConditionCursor],
+        Sequence[AutomationConditionEvaluation[EntityKey]],
+    ]:
+        if self._num_evaluation_processes > 1 and can_evaluate_in_processes(
+            self._evaluator.asset_graph_view.instance
+        ):
+            result = await evaluate_in_processes(self._evaluator, self._num_evaluation_processes)
+            entity_subsets = [
+                self._evaluator.asset_graph_view.get_subset_from_serializable_subset(subset)
+                for subset in result.requested_subsets
+            ]
+            return (
+                [subset for subset in entity_subsets if subset is not None],
+                result.condition_cursors,
+                result.evaluations,
+            )
+
+        results, entity_subsets = await self._evaluator.async_evaluate()
+        return (
+            entity_subsets,
+            self._evaluator.get_new_cursors(results),
+            self._evaluator.get_updated_evaluations(results),
+        )
 
     async def async_evaluate(
         self,
@@ -171,12 +197,12 @@ async def async_evaluate(
         Sequence[RunRequest], AssetDaemonCursor, Sequence[AutomationConditionEvaluation[EntityKey]]
     ]:
         observe_run_requests = self._legacy_build_auto_observe_run_requests()
-        results, entity_subsets = await self._evaluator.async_evaluate()
+        entity_subsets, condition_cursors, evaluations = await self._async_evaluate_conditions()
 
         return (
             [*self._build_run_requests(entity_subsets), *observe_run_requests],
-            self._get_updated_cursor(results, observe_run_requests),
-            self._get_updated_evaluations(results),
+            self._get_updated_cursor(condition_cursors, observe_run_requests),
+            evaluations,
         )
 
     def evaluate(
@@ -184,14 +210,7 @@ def evaluate(
     ) -> tuple[
         Sequence[RunRequest], AssetDaemonCursor, Sequence[AutomationConditionEvaluation[EntityKey]]
     ]:
-        observe_run_requests = self._legacy_build_auto_observe_run_requests()
-        results, entity_subsets = self._evaluator.evaluate()
-
-        return (
-            [*self._build_run_requests(entity_subsets), *observe_run_requests],
-            self._get_updated_cursor(results, observe_run_requests),
-            self._get_updated_evaluations(results),
-        )
+        return asyncio.run(self.async_evaluate())
 
 
 _PartitionsDefKeyMapping = dict[
@@ -1,10 +1,13 @@
 import asyncio
+import dataclasses
 import datetime
 import logging
+import os
 from collections import defaultdict
 from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, AbstractSet, Optional  # noqa: UP035
 
+import dagster._check as check
 from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
 from dagster._core.asset_graph_view.entity_subset import EntitySubset
 from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
@@ -15,11 +18,25 @@
     AutomationCondition,
     AutomationResult,
 )
-from dagster._core.definitions.declarative_automation.automation_context import AutomationContext
+from dagster._core.definitions.declarative_automation.automation_context import (
+    AutomationContext,
+    ConditionEvaluationCache,
+)
+from dagster._core.definitions.declarative_automation.evaluation_profiler import (
+    AutomationEvaluationProfiler,
+)
+from dagster._core.definitions.declarative_automation.incremental_evaluation import (
+    DirtyEntityResolver,
+)
+from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionCursor,
+    AutomationConditionEvaluation,
+)
 from dagster._core.definitions.events import AssetKey
 from dagster._core.definitions.partitions.context import partition_loading_context
 from dagster._core.instance import DagsterInstance
 from dagster._time import get_current_datetime
+from dagster._utils import mkdir_p
 
 if TYPE_CHECKING:
     from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
@@ -37,6 +54,9 @@ def __init__(
         default_condition: Optional[AutomationCondition] = None,
         evaluation_time: Optional[datetime.datetime] = None,
         logger: logging.Logger = logging.getLogger("dagster.automation"),
+        incremental: bool = False,
+        profile: bool = False,
+        report_profile: bool = True,
     ):
         self.entity_keys = entity_keys
         self.asset_graph_view = AssetGraphView(
@@ -63,11 +83,23 @@ def __init__(
             _instance.auto_materialize_respect_materialization_data_versions
         )
         self.emit_backfills = emit_backfills or _instance.da_request_backfills()
+        self.incremental = incremental or _instance.auto_materialize_incremental_evaluation
+        self.skipped_condition_cursors: dict[EntityKey, AutomationConditionCursor] = {}
 
         self.legacy_expected_data_time_by_key: dict[AssetKey, Optional[datetime.datetime]] = {}
         self.legacy_data_time_resolver = CachingDataTimeResolver(self.instance_queryer)
 
         self.request_subsets_by_key: dict[EntityKey, EntitySubset] = {}
+        self.evaluation_cache = ConditionEvaluationCache()
+        self.profiler = (
+            AutomationEvaluationProfiler()
+            if profile or _instance.auto_materialize_profile_evaluations
+            else None
+        )
+        self.profile_directory = _instance.auto_materialize_evaluation_profile_directory
+        # disabled when the profile is reported by another evaluator, e.g. when this evaluator runs
+        # in a worker process whose profile is merged into the profile of the parent process
+        self.report_profile = report_profile
 
     @property
     def instance_queryer(self) -> "CachingInstanceQueryer":
@@ -113,7 +145,26 @@ async def async_evaluate(
         with partition_loading_context(
             effective_dt=self.evaluation_time, dynamic_partitions_store=self.instance_queryer
         ):
-            return await self._async_evaluate()
+            if self.profiler is None:
+                return await self._async_evaluate()
+
+            with self.profiler.profile():
+                result = await self._async_evaluate()
+            if self.report_profile:
+                self.log_profile(self.profiler)
+            return result
+
+    def log_profile(self, profiler: AutomationEvaluationProfiler) -> None:
+        self.logger.info(profiler.get_summary())
+        if self.profile_directory:
+            mkdir_p(self.profile_directory)
+            path = os.path.join(
+                self.profile_directory,
+                f"automation_evaluation_{self.evaluation_time.strftime('%Y%m%dT%H%M%S')}"
+                f"_{os.getpid()}.json",
+            )
+            profiler.write_chrome_trace(path)
+            self.logger.info(f"Wrote automation evaluation trace to {path}.")
 
     async def _async_evaluate(
         self,
@@ -122,6 +173,20 @@ async def _async_evaluate(
         num_conditions = len(self.entity_keys)
         num_evaluated = 0
 
+        entity_keys_to_evaluate = self.entity_keys
+        if self.incremental:
+            entity_keys_to_evaluate = DirtyEntityResolver(self).get_dirty_entity_keys(
+                self.entity_keys
+            )
+            for key in self.entity_keys - entity_keys_to_evaluate:
+                self.skipped_condition_cursors[key] = check.not_none(
+                    self.cursor.get_previous_condition_cursor(key)
+                )
+            self.logger.info(
+                f"Skipping {self.num_skipped} of {num_conditions} entities whose inputs have not "
+                "changed since the previous evaluation."
+            )
+
         async def _evaluate_entity_async(entity_key: EntityKey, offset: int):
             self.logger.debug(
                 f"Evaluating {entity_key.to_user_string()} ({num_evaluated + offset}/{num_conditions})"
@@ -151,15 +216,67 @@ async def _evaluate_entity_async(entity_key: EntityKey, offset: int):
             coroutines = [
                 _evaluate_entity_async(entity_key, offset)
                 for offset, entity_key in enumerate(topo_level)
-                if entity_key in self.entity_keys
+                if entity_key in entity_keys_to_evaluate
             ]
             await asyncio.gather(*coroutines)
             num_evaluated += len(coroutines)
 
+        self.logger.info(
+            f"Evaluated {self.evaluation_cache.num_node_evaluations} condition nodes "
+            f"({self.evaluation_cache.num_hits} memoized)."
+        )
         return list(self.current_results_by_key.values()), [
             v for v in self.request_subsets_by_key.values() if not v.is_empty
         ]
 
+    @property
+    def num_skipped(self) -> int:
+        """The number of entities that were not evaluated on this tick because incremental
+        evaluation determined that their result could not have changed.
+        """
+        return len(self.skipped_condition_cursors)
+
+    def get_new_cursors(
+        self, results: Sequence[AutomationResult]
+    ) -> Sequence[AutomationConditionCursor]:
+        """Returns the cursors to store for this tick, including the unchanged cursors of any
+        entities that were skipped.
+        """
+        if not self.incremental:
+            return [result.get_new_cursor() for result in results]
+
+        resolver = DirtyEntityResolver(self)
+        new_cursors = list(self.skipped_condition_cursors.values())
+        for result in results:
+            new_cursor = result.get_new_cursor()
+            previous_cursor = self.cursor.get_previous_condition_cursor(result.key)
+            # an entity that was requested on the previous tick must be evaluated again on the
+            # next tick, as the result of `newly_requested` will change
+            if previous_cursor is None or previous_cursor.previous_requested_subset.is_empty:
+                new_cursor = dataclasses.replace(
+                    new_cursor,
+                    incremental_fingerprint=resolver.get_definition_fingerprint(result.key),
+                )
+            new_cursors.append(new_cursor)
+        return new_cursors
+
+    def get_updated_evaluations(
+        self, results: Sequence[AutomationResult]
+    ) -> Sequence[AutomationConditionEvaluation[EntityKey]]:
+        """Returns the evaluations to store for this tick. Only evaluations where something changed
+        since the previous tick are recorded.
+        """
+        updated_evaluations = []
+        for result in results:
+            previous_cursor = self.cursor.get_previous_condition_cursor(result.key)
+            if (
+                previous_cursor is None
+                or previous_cursor.result_value_hash != result.value_hash
+                or not result.true_subset.is_empty
+            ):
+                updated_evaluations.append(result.serializable_evaluation)
+        return updated_evaluations
+
     async def evaluate_entity(self, key: EntityKey) -> None:
         # evaluate the condition of this asset
         result = await AutomationContext.create(key=key, evaluator=self).evaluate_async()
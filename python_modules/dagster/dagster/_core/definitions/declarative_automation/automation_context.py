@@ -1,19 +1,25 @@
+import asyncio
 import datetime
 import inspect
 import logging
-from collections.abc import Mapping, Sequence
+from collections import defaultdict
+from collections.abc import Hashable, Mapping, Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Generic, Optional, TypeVar
 
 import dagster._check as check
 from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
 from dagster._core.asset_graph_view.entity_subset import EntitySubset
+from dagster._core.asset_graph_view.serializable_entity_subset import SerializableEntitySubset
 from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
 from dagster._core.definitions.asset_key import AssetCheckKey, AssetKey, EntityKey, T_EntityKey
 from dagster._core.definitions.declarative_automation.automation_condition import (
     AutomationCondition,
     AutomationResult,
 )
+from dagster._core.definitions.declarative_automation.evaluation_profiler import (
+    AutomationEvaluationProfiler,
+)
 from dagster._core.definitions.declarative_automation.legacy.legacy_context import (
     LegacyRuleEvaluationContext,
 )
@@ -47,6 +53,42 @@ def _has_legacy_condition(condition: AutomationCondition):
         return any(_has_legacy_condition(child) for child in condition.children)
 
 
+class ConditionEvaluationCache:
+    """Memoizes the true subsets of memoizable conditions for the duration of a single tick, so
+    that identical sub-conditions evaluated over the same entity (e.g. the same operand evaluated
+    over a shared parent by many `any_deps_match` conditions) are only computed once.
+
+    Entries are keyed on the structure of the condition, the evaluated entity, the temporal context
+    of the previous evaluation, and the candidate subset. Concurrent evaluations of the same entry
+    wait on the first one rather than computing it again.
+    """
+
+    def __init__(self):
+        self._entries: dict[
+            Hashable, list[tuple[SerializableEntitySubset, asyncio.Future[EntitySubset]]]
+        ] = defaultdict(list)
+        self.num_node_evaluations = 0
+        self.num_hits = 0
+
+    def get(
+        self, key: Hashable, candidate_subset: SerializableEntitySubset
+    ) -> Optional["asyncio.Future[EntitySubset]"]:
+        for entry_candidate_subset, future in self._entries.get(key, []):
+            if entry_candidate_subset == candidate_subset:
+                return future
+        return None
+
+    def add(
+        self, key: Hashable, candidate_subset: SerializableEntitySubset
+    ) -> "asyncio.Future[EntitySubset]":
+        future = asyncio.get_running_loop().create_future()
+        self._entries[key].append((candidate_subset, future))
+        return future
+
+    def discard(self, key: Hashable, future: "asyncio.Future[EntitySubset]") -> None:
+        self._entries[key] = [entry for entry in self._entries[key] if entry[1] is not future]
+
+
 @dataclass(frozen=True)
 class AutomationContext(Generic[T_EntityKey]):
     condition: AutomationCondition
@@ -65,6 +107,8 @@ class AutomationContext(Generic[T_EntityKey]):
     _legacy_context: Optional[LegacyRuleEvaluationContext]
 
     _root_log: logging.Logger
+    _evaluation_cache: ConditionEvaluationCache
+    _profiler: Optional[AutomationEvaluationProfiler]
 
     @staticmethod
     def create(key: EntityKey, evaluator: "AutomationConditionEvaluator") -> "AutomationContext":
@@ -88,6 +132,8 @@ def create(key: EntityKey, evaluator: "AutomationConditionEvaluator") -> "Automa
             if condition.has_rule_condition and isinstance(key, AssetKey)
             else None,
             _root_log=evaluator.logger,
+            _evaluation_cache=evaluator.evaluation_cache,
+            _profiler=evaluator.profiler,
         )
 
     def for_child_condition(
@@ -117,13 +163,70 @@ def for_child_condition(
             if self._legacy_context
             else None,
             _root_log=self._root_log,
+            _evaluation_cache=self._evaluation_cache,
+            _profiler=self._profiler,
         )
 
     async def evaluate_async(self) -> AutomationResult[T_EntityKey]:
+        if self._profiler is None:
+            return await self._evaluate_memoized()
+
+        with self._profiler.profile_node(self) as node_profile:
+            result = await self._evaluate_memoized()
+            node_profile.record_result(result)
+        return result
+
+    async def _evaluate_memoized(self) -> AutomationResult[T_EntityKey]:
+        self._evaluation_cache.num_node_evaluations += 1
+
+        memoization_key = self._get_memoization_key()
+        if memoization_key is None:
+            return await self._evaluate_condition()
+
+        candidate_subset = self.candidate_subset.convert_to_serializable_subset()
+        future = self._evaluation_cache.get(memoization_key, candidate_subset)
+        if future is not None:
+            self._evaluation_cache.num_hits += 1
+            return AutomationResult(self, await future)
+
+        future = self._evaluation_cache.add(memoization_key, candidate_subset)
+        try:
+            result = await self._evaluate_condition()
+        except Exception as e:
+            self._evaluation_cache.discard(memoization_key, future)
+            future.set_exception(e)
+            # the exception is re-raised here, so it does not need to be retrieved from the future
+            future.exception()
+            raise
+        future.set_result(result.true_subset)
+        return result
+
+    async def _evaluate_condition(self) -> AutomationResult[T_EntityKey]:
         if inspect.iscoroutinefunction(self.condition.evaluate):
             return await self.condition.evaluate(self)
         return self.condition.evaluate(self)
 
+    def _get_memoization_key(self) -> Optional[Hashable]:
+        from dagster._core.definitions.declarative_automation.operands.subset_automation_condition import (
+            SubsetAutomationCondition,
+        )
+
+        if (
+            not isinstance(self.condition, SubsetAutomationCondition)
+            or not self.condition.is_memoizable
+            or self._legacy_context is not None
+        ):
+            return None
+
+        previous_temporal_context = self.previous_temporal_context
+        return (
+            self.condition.__class__.__name__,
+            self.condition.get_node_unique_id(parent_unique_id=None, index=None),
+            self.key,
+            previous_temporal_context.effective_dt if previous_temporal_context else None,
+            previous_temporal_context.last_event_id if previous_temporal_context else None,
+        )
+
     @property
     def log(self) -> logging.Logger:
         """The logger for the current condition evaluation."""
@@ -0,0 +1,303 @@
+import json
+import os
+import re
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from dagster._core.definitions.asset_key import EntityKey
+
+if TYPE_CHECKING:
+    from dagster._core.definitions.declarative_automation.automation_condition import (
+        AutomationResult,
+    )
+    from dagster._core.definitions.declarative_automation.automation_context import (
+        AutomationContext,
+    )
+
+_active_profiler: ContextVar[Optional["AutomationEvaluationProfiler"]] = ContextVar(
+    "_active_profiler", default=None
+)
+_current_node: ContextVar[Optional["NodeProfile"]] = ContextVar("_current_node", default=None)
+
+_QUERY_START_INFO_KEY = "dagster_automation_profiler_query_start"
+_MAX_STATEMENT_LENGTH = 120
+
+_listeners_lock = threading.Lock()
+_listeners_registered = False
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _active_profiler.get() is not None:
+        conn.info.setdefault(_QUERY_START_INFO_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    profiler = _active_profiler.get()
+    starts = conn.info.get(_QUERY_START_INFO_KEY)
+    if profiler is None or not starts:
+        return
+    profiler.record_query(statement, time.perf_counter() - starts.pop())
+
+
+def _register_query_listeners() -> None:
+    # listeners are registered on the Engine class so that queries issued by every storage engine
+    # in the process are captured; they are a no-op unless a profiler is active in the current
+    # context
+    global _listeners_registered  # noqa: PLW0603
+    with _listeners_lock:
+        if _listeners_registered:
+            return
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        _listeners_registered = True
+
+
+def _normalize_statement(statement: str) -> str:
+    statement = re.sub(r"\s+", " ", statement).strip()
+    if len(statement) > _MAX_STATEMENT_LENGTH:
+        return statement[: _MAX_STATEMENT_LENGTH - 3] + "..."
+    return statement
+
+
+@dataclass
+class NodeProfile:
+    """The profile of the evaluation of a single condition node over a single entity. The root
+    entity key is the key of the entity whose condition this node is part of, which may differ from
+    the evaluated entity key for nodes that are evaluated over dependencies.
+    """
+
+    root_entity_key: EntityKey
+    entity_key: EntityKey
+    name: str
+    unique_id: str
+    depth: int
+    start: float
+    candidate_size: int
+    end: float = 0.0
+    true_size: Optional[int] = None
+    num_queries: int = 0
+    query_duration: float = 0.0
+    child_duration: float = 0.0
+    pid: int = field(default_factory=os.getpid)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    @property
+    def self_duration(self) -> float:
+        # children of a node may be evaluated concurrently, so their total duration can exceed
+        # the duration of the node itself
+        return max(self.duration - self.child_duration, 0.0)
+
+    def record_result(self, result: "AutomationResult") -> None:
+        self.true_size = result.true_subset.size
+
+
+@dataclass
+class _AggregateStats:
+    count: int = 0
+    duration: float = 0.0
+    self_duration: float = 0.0
+    num_queries: int = 0
+    query_duration: float = 0.0
+    entity_keys: set[EntityKey] = field(default_factory=set)
+
+
+class AutomationEvaluationProfiler:
+    """Records the wall time, subset sizes and database queries of each condition node evaluated
+    during a tick.
+
+    Database queries are captured at the SQLAlchemy engine level and attributed to the innermost
+    condition node being evaluated in the current context. Queries issued outside of any node
+    (e.g. while prefetching asset records) are only counted in the totals.
+    """
+
+    def __init__(self):
+        self.nodes: list[NodeProfile] = []
+        self.num_queries = 0
+        self.query_duration = 0.0
+        self._query_stats: dict[str, _AggregateStats] = {}
+        self._start = time.perf_counter()
+        self._end: Optional[float] = None
+
+    @property
+    def duration(self) -> float:
+        return (self._end or time.perf_counter()) - self._start
+
+    @contextmanager
+    def profile(self) -> Iterator["AutomationEvaluationProfiler"]:
+        """Activates this profiler for the duration of the context, including within any tasks
+        created inside of it.
+        """
+        _register_query_listeners()
+        token = _active_profiler.set(self)
+        self._start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self._end = time.perf_counter()
+            _active_profiler.reset(token)
+
+    @contextmanager
+    def profile_node(self, context: "AutomationContext") -> Iterator[NodeProfile]:
+        parent = _current_node.get()
+        node = NodeProfile(
+            root_entity_key=parent.root_entity_key if parent else context.key,
+            entity_key=context.key,
+            name=context.condition.name,
+            unique_id=context.condition_unique_ids[0],
+            depth=parent.depth + 1 if parent else 0,
+            start=time.perf_counter(),
+            candidate_size=context.candidate_subset.size,
+        )
+        token = _current_node.set(node)
+        try:
+            yield node
+        finally:
+            node.end = time.perf_counter()
+            _current_node.reset(token)
+            if parent is not None:
+                parent.child_duration += node.duration
+            self.nodes.append(node)
+
+    def record_query(self, statement: str, duration: float) -> None:
+        self.num_queries += 1
+        self.query_duration += duration
+
+        stats = self._query_stats.setdefault(_normalize_statement(statement), _AggregateStats())
+        stats.count += 1
+        stats.duration += duration
+
+        node = _current_node.get()
+        if node is not None:
+            node.num_queries += 1
+            node.query_duration += duration
+            stats.entity_keys.add(node.root_entity_key)
+
+    def merge(self, other: "AutomationEvaluationProfiler") -> None:
+        """Adds the nodes and queries recorded by another profiler to this one, e.g. the profile of
+        a worker process which evaluated part of the tick. Timestamps are comparable across
+        processes on the same host, so the nodes of the other profiler keep their place in time.
+        """
+        self.nodes.extend(other.nodes)
+        self.num_queries += other.num_queries
+        self.query_duration += other.query_duration
+        for statement, other_stats in other._query_stats.items():  # noqa: SLF001
+            stats = self._query_stats.setdefault(statement, _AggregateStats())
+            stats.count += other_stats.count
+            stats.duration += other_stats.duration
+            stats.entity_keys.update(other_stats.entity_keys)
+
+    def get_stats_by_condition(self) -> Mapping[str, _AggregateStats]:
+        stats_by_condition: dict[str, _AggregateStats] = {}
+        for node in self.nodes:
+            stats = stats_by_condition.setdefault(node.name, _AggregateStats())
+            stats.count += 1
+            stats.duration += node.duration
+            stats.self_duration += node.self_duration
+            stats.num_queries += node.num_queries
+            stats.query_duration += node.query_duration
+            stats.entity_keys.add(node.root_entity_key)
+        return stats_by_condition
+
+    def get_stats_by_entity(self) -> Mapping[EntityKey, _AggregateStats]:
+        stats_by_entity: dict[EntityKey, _AggregateStats] = {}
+        for node in self.nodes:
+            stats = stats_by_entity.setdefault(node.root_entity_key, _AggregateStats())
+            stats.count += 1
+            if node.depth == 0:
+                stats.duration += node.duration
+            stats.num_queries += node.num_queries
+            stats.query_duration += node.query_duration
+        return stats_by_entity
+
+    def get_summary(self, top_n: int = 10) -> str:
+        """Returns a human-readable summary of the most expensive conditions, entities and
+        queries of the tick.
+        """
+        lines = [
+            f"Profiled {len(self.nodes)} condition node evaluations over "
+            f"{len(self.get_stats_by_entity())} entities in {self.duration:.3f} seconds, issuing "
+            f"{self.num_queries} queries ({self.query_duration:.3f} seconds).",
+            f"Top {top_n} conditions by self time:",
+        ]
+        for name, stats in sorted(
+            self.get_stats_by_condition().items(), key=lambda item: -item[1].self_duration
+        )[:top_n]:
+            lines.append(
+                f"  {name}: {stats.self_duration:.3f}s self, {stats.duration:.3f}s total, "
+                f"{stats.count} evaluations, {stats.num_queries} queries "
+                f"({stats.query_duration:.3f}s)"
+            )
+
+        lines.append(f"Top {top_n} entities by wall time:")
+        for key, stats in sorted(
+            self.get_stats_by_entity().items(), key=lambda item: -item[1].duration
+        )[:top_n]:
+            lines.append(
+                f"  {key.to_user_string()}: {stats.duration:.3f}s, {stats.count} nodes, "
+                f"{stats.num_queries} queries ({stats.query_duration:.3f}s)"
+            )
+
+        lines.append(f"Top {top_n} queries by total time:")
+        for statement, stats in sorted(
+            self._query_stats.items(), key=lambda item: -item[1].duration
+        )[:top_n]:
+            lines.append(
+                f"  {stats.duration:.3f}s over {stats.count} executions "
+                f"({len(stats.entity_keys)} entities): {statement}"
+            )
+        return "\n".join(lines)
+
+    def get_chrome_trace(self) -> Mapping[str, Any]:
+        """Returns the profile in the Chrome trace event format, which can be loaded into
+        chrome://tracing, Perfetto or speedscope. Each entity is displayed as its own thread of
+        the process which evaluated it.
+        """
+        thread_ids: dict[EntityKey, int] = {}
+        events: list[Mapping[str, Any]] = []
+        for node in sorted(self.nodes, key=lambda node: (node.start, node.depth)):
+            if node.root_entity_key not in thread_ids:
+                thread_ids[node.root_entity_key] = len(thread_ids) + 1
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": node.pid,
+                        "tid": thread_ids[node.root_entity_key],
+                        "args": {"name": node.root_entity_key.to_user_string()},
+                    }
+                )
+            events.append(
+                {
+                    "name": node.name,
+                    "cat": "automation_condition",
+                    "ph": "X",
+                    "ts": (node.start - self._start) * 1e6,
+                    "dur": node.duration * 1e6,
+                    "pid": node.pid,
+                    "tid": thread_ids[node.root_entity_key],
+                    "args": {
+                        "entity_key": node.entity_key.to_user_string(),
+                        "unique_id": node.unique_id,
+                        "candidate_size": node.candidate_size,
+                        "true_size": node.true_size,
+                        "num_queries": node.num_queries,
+                        "query_duration_ms": node.query_duration * 1e3,
+                    },
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.get_chrome_trace(), f)
@@ -0,0 +1,239 @@
+import datetime
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, AbstractSet, Optional  # noqa: UP035
+
+from dagster._core.definitions.asset_key import AssetKey, EntityKey
+from dagster._core.definitions.declarative_automation.automation_condition import (
+    AutomationCondition,
+    BuiltinAutomationCondition,
+)
+from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionCursor,
+)
+from dagster._core.definitions.partitions.context import partition_loading_context
+from dagster._core.definitions.partitions.definition import (
+    DynamicPartitionsDefinition,
+    MultiPartitionsDefinition,
+    PartitionsDefinition,
+)
+from dagster._core.definitions.partitions.utils import get_time_partitions_def
+from dagster._time import datetime_from_timestamp
+from dagster._utils.security import non_secure_md5_hash_str
+
+if TYPE_CHECKING:
+    from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+        AutomationConditionEvaluator,
+    )
+
+
+def _iter_condition_tree(condition: AutomationCondition) -> Iterator[AutomationCondition]:
+    yield condition
+    for child in condition.children:
+        yield from _iter_condition_tree(child)
+
+
+def _has_dynamic_partitions(partitions_def: Optional[PartitionsDefinition]) -> bool:
+    if isinstance(partitions_def, DynamicPartitionsDefinition):
+        return True
+    elif isinstance(partitions_def, MultiPartitionsDefinition):
+        return any(
+            isinstance(dim.partitions_def, DynamicPartitionsDefinition)
+            for dim in partitions_def.partitions_defs
+        )
+    return False
+
+
+class DirtyEntityResolver:
+    """Determines which entities need to be evaluated on a tick when incremental evaluation is
+    enabled. All other entities are guaranteed to produce the same result as on the previous tick,
+    so their previous cursor can be carried forward unchanged.
+
+    An entity is dirty if any of the following is true:
+
+    - It has no previous cursor, or its previous cursor was computed against a different
+      definition (condition, partitions, code versions or dependencies).
+    - It, or any of its parents, was requested on either of the previous two ticks.
+    - A materialization, observation, planned materialization or materialization failure has been
+      stored for it or any of its parents since the previous evaluation.
+    - The latest run targeting it or any of its parents is in progress, or finished since the
+      previous evaluation, or it is targeted by an in-progress asset backfill.
+    - A cron tick or time partition boundary relevant to its condition has passed since the
+      previous evaluation.
+    - Its condition can not be reasoned about incrementally (asset checks, dynamic partitions,
+      legacy rules, downstream conditions, or user-defined conditions).
+    - Any of its parents or other members of its execution set are dirty.
+    """
+
+    def __init__(self, evaluator: "AutomationConditionEvaluator"):
+        self._evaluator = evaluator
+
+    @property
+    def _asset_graph(self):
+        return self._evaluator.asset_graph
+
+    @property
+    def _evaluation_time(self) -> datetime.datetime:
+        return self._evaluator.evaluation_time
+
+    def get_condition(self, key: EntityKey) -> Optional[AutomationCondition]:
+        return self._asset_graph.get(key).automation_condition or self._evaluator.default_condition
+
+    def get_definition_fingerprint(self, key: EntityKey) -> Optional[str]:
+        """Returns a hash of the parts of the definitions that the evaluation of this entity depends
+        on, or None if the entity must always be evaluated.
+        """
+        condition = self.get_condition(key)
+        if condition is None or not isinstance(key, AssetKey):
+            return None
+
+        components = [condition.get_unique_id()]
+        for entity_key in sorted([key, *self._asset_graph.get(key).parent_entity_keys]):
+            node = self._asset_graph.get(entity_key)
+            partitions_def = node.partitions_def
+            if _has_dynamic_partitions(partitions_def):
+                # dynamic partitions can be added without writing to the event log
+                return None
+            components.extend(
+                [
+                    entity_key.to_user_string(),
+                    str(node.code_version),
+                    partitions_def.get_serializable_unique_identifier() if partitions_def else "",
+                ]
+            )
+        return non_secure_md5_hash_str("".join(components).encode("utf-8"))
+
+    def get_dirty_entity_keys(self, entity_keys: AbstractSet[EntityKey]) -> AbstractSet[EntityKey]:
+        dirty_keys = {key for key in entity_keys if self._is_locally_dirty(key)}
+
+        # propagate to downstream entities and execution sets until nothing changes, as an entity
+        # may be evaluated differently if any of its parents will be requested on this tick
+        changed = True
+        while changed:
+            changed = False
+            for level in self._asset_graph.toposorted_entity_keys_by_level:
+                for key in level:
+                    if key not in entity_keys or key in dirty_keys:
+                        continue
+                    node = self._asset_graph.get(key)
+                    if any(parent_key in dirty_keys for parent_key in node.parent_entity_keys) or (
+                        isinstance(key, AssetKey)
+                        and any(
+                            neighbor_key in dirty_keys
+                            for neighbor_key in node.execution_set_entity_keys
+                        )
+                    ):
+                        dirty_keys.add(key)
+                        changed = True
+
+        return dirty_keys
+
+    def _is_locally_dirty(self, key: EntityKey) -> bool:
+        cursor = self._evaluator.cursor.get_previous_condition_cursor(key)
+        fingerprint = self.get_definition_fingerprint(key)
+        if (
+            cursor is None
+            or fingerprint is None
+            or cursor.incremental_fingerprint != fingerprint
+            or cursor.effective_timestamp > self._evaluation_time.timestamp()
+        ):
+            return True
+
+        condition = self.get_condition(key)
+        if condition is None or self._condition_requires_evaluation(condition, cursor):
+            return True
+
+        asset_key = key
+        assert isinstance(asset_key, AssetKey)
+        related_keys = {asset_key, *self._asset_graph.get(asset_key).parent_keys}
+        if related_keys & self._in_progress_backfill_asset_keys:
+            return True
+        return any(self._has_changed(related_key, cursor) for related_key in related_keys)
+
+    def _condition_requires_evaluation(
+        self, condition: AutomationCondition, cursor: AutomationConditionCursor
+    ) -> bool:
+        from dagster._core.definitions.declarative_automation.operands import (
+            CronTickPassedCondition,
+            InLatestTimeWindowCondition,
+        )
+        from dagster._core.definitions.declarative_automation.operators import (
+            AnyDownstreamConditionsCondition,
+            ChecksAutomationCondition,
+        )
+
+        if condition.has_rule_condition:
+            return True
+
+        previous_evaluation_time = datetime_from_timestamp(cursor.effective_timestamp)
+        for node in _iter_condition_tree(condition):
+            if not isinstance(node, BuiltinAutomationCondition) or isinstance(
+                node, (AnyDownstreamConditionsCondition, ChecksAutomationCondition)
+            ):
+                return True
+            elif isinstance(node, CronTickPassedCondition):
+                previous_cron_tick = node._get_previous_cron_tick(self._evaluation_time)  # noqa: SLF001
+                if previous_cron_tick >= previous_evaluation_time:
+                    return True
+            elif isinstance(node, InLatestTimeWindowCondition) and node.lookback_timedelta:
+                return True
+        return False
+
+    @property
+    def _in_progress_backfill_asset_keys(self) -> AbstractSet[AssetKey]:
+        return self._evaluator.instance_queryer.get_active_backfill_target_asset_graph_subset().asset_keys
+
+    def _has_changed(self, asset_key: AssetKey, cursor: AutomationConditionCursor) -> bool:
+        time_partitions_def = get_time_partitions_def(
+            self._asset_graph.get(asset_key).partitions_def
+        )
+        if time_partitions_def is not None:
+            with partition_loading_context(
+                effective_dt=datetime_from_timestamp(cursor.effective_timestamp)
+            ):
+                previous_last_window = time_partitions_def.get_last_partition_window()
+            with partition_loading_context(effective_dt=self._evaluation_time):
+                last_window = time_partitions_def.get_last_partition_window()
+            if previous_last_window != last_window:
+                return True
+
+        previous_cursor = self._evaluator.cursor.get_previous_condition_cursor(asset_key)
+        if previous_cursor is not None and (
+            not previous_cursor.previous_requested_subset.is_empty
+            or (
+                asset_key in self._evaluator.entity_keys
+                and previous_cursor.incremental_fingerprint is None
+            )
+        ):
+            # the asset was requested on one of the previous two ticks
+            return True
+
+        queryer = self._evaluator.instance_queryer
+        asset_record = queryer.get_asset_record(asset_key)
+        if asset_record is None:
+            return False
+
+        entry = asset_record.asset_entry
+        storage_ids = [
+            record.storage_id
+            for record in (
+                entry.last_materialization_record,
+                entry.last_observation_record,
+                entry.last_failed_to_materialize_record,
+            )
+            if record is not None
+        ]
+        if entry.last_planned_materialization_storage_id is not None:
+            storage_ids.append(entry.last_planned_materialization_storage_id)
+        if any(storage_id > (cursor.last_event_id or 0) for storage_id in storage_ids):
+            return True
+
+        if entry.last_planned_materialization_run_id is not None:
+            run_record = queryer.get_run_record_by_id(entry.last_planned_materialization_run_id)
+            if run_record is not None and (
+                not run_record.dagster_run.is_finished
+                or run_record.end_time is None
+                or run_record.end_time >= cursor.effective_timestamp
+            ):
+                return True
+
+        return False
@@ -130,6 +130,11 @@ def description(self) -> str:
     def name(self) -> str:
         return "will_be_requested"
 
+    @property
+    def is_memoizable(self) -> bool:
+        # depends on the root entity and on the requests made so far on this tick
+        return False
+
     def _executable_with_root_context_key(self, context: AutomationContext) -> bool:
         # TODO: once we can launch backfills via the asset daemon, this can be removed
         from dagster._core.definitions.assets.graph.asset_graph import executable_in_same_run
@@ -167,6 +172,11 @@ class LatestRunExecutedWithRootTargetCondition(SubsetAutomationCondition):
     def name(self) -> str:
         return "executed_with_root_target"
 
+    @property
+    def is_memoizable(self) -> bool:
+        # depends on the root entity
+        return False
+
     async def compute_subset(self, context: AutomationContext) -> EntitySubset:  # pyright: ignore[reportIncompatibleMethodOverride]
         def _filter_fn(run_record: "RunRecord") -> bool:
             if context.key == context.root_context.key:
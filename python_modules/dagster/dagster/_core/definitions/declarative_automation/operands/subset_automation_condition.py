@@ -19,6 +19,14 @@ class SubsetAutomationCondition(BuiltinAutomationCondition[T_EntityKey]):
     def requires_cursor(self) -> bool:
         return False
 
+    @property
+    def is_memoizable(self) -> bool:
+        """Whether the computed subset depends only on the evaluated entity, the candidate subset
+        and the temporal context of the previous evaluation, in which case it may be shared between
+        all evaluations of this condition over the same entity within a tick.
+        """
+        return True
+
     @abstractmethod
     def compute_subset(
         self, context: AutomationContext[T_EntityKey]
@@ -0,0 +1,221 @@
+import asyncio
+import datetime
+import itertools
+import logging
+import multiprocessing
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, AbstractSet, NamedTuple, Optional  # noqa: UP035
+
+from dagster_shared.serdes import deserialize_value, serialize_value
+
+from dagster._core.asset_graph_view.serializable_entity_subset import SerializableEntitySubset
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.asset_key import AssetKey, EntityKey
+from dagster._core.definitions.assets.graph.base_asset_graph import BaseAssetGraph
+from dagster._core.definitions.declarative_automation.automation_condition import (
+    AutomationCondition,
+)
+from dagster._core.definitions.declarative_automation.evaluation_profiler import (
+    AutomationEvaluationProfiler,
+)
+from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionCursor,
+    AutomationConditionEvaluation,
+)
+from dagster._core.instance import DagsterInstance, InstanceRef
+
+if TYPE_CHECKING:
+    from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+        AutomationConditionEvaluator,
+    )
+
+
+def get_independent_entity_key_groups(
+    asset_graph: BaseAssetGraph, entity_keys: AbstractSet[EntityKey]
+) -> Sequence[AbstractSet[EntityKey]]:
+    """Splits the given entity keys into groups which can be evaluated independently of each other,
+    i.e. the weakly connected components of the asset graph, where the members of an execution set
+    are also considered to be connected.
+    """
+    parents: dict[EntityKey, EntityKey] = {}
+
+    def _find(key: EntityKey) -> EntityKey:
+        root = key
+        while parents.setdefault(root, root) != root:
+            root = parents[root]
+        while key != root:
+            parents[key], key = root, parents[key]
+        return root
+
+    def _union(a: EntityKey, b: EntityKey) -> None:
+        parents[_find(a)] = _find(b)
+
+    for key in asset_graph.get_all_asset_keys() | asset_graph.asset_check_keys:
+        node = asset_graph.get(key)
+        for parent_key in node.parent_entity_keys:
+            if asset_graph.has(parent_key):
+                _union(key, parent_key)
+        if isinstance(key, AssetKey):
+            for neighbor_key in node.execution_set_entity_keys:
+                _union(key, neighbor_key)
+
+    groups: dict[EntityKey, set[EntityKey]] = {}
+    for key in entity_keys:
+        groups.setdefault(_find(key), set()).add(key)
+    return list(groups.values())
+
+
+def partition_entity_keys(
+    asset_graph: BaseAssetGraph, entity_keys: AbstractSet[EntityKey], num_partitions: int
+) -> Sequence[AbstractSet[EntityKey]]:
+    """Assigns the independent groups of entity keys to at most `num_partitions` partitions of
+    roughly equal size.
+    """
+    groups = sorted(
+        get_independent_entity_key_groups(asset_graph, entity_keys), key=len, reverse=True
+    )
+    partitions: list[set[EntityKey]] = [set() for _ in range(min(num_partitions, len(groups)))]
+    for group in groups:
+        min(partitions, key=len).update(group)
+    return partitions
+
+
+class ParallelEvaluationResult(NamedTuple):
+    requested_subsets: Sequence[SerializableEntitySubset]
+    condition_cursors: Sequence[AutomationConditionCursor]
+    evaluations: Sequence[AutomationConditionEvaluation]
+
+
+class _WorkerState(NamedTuple):
+    instance_ref: InstanceRef
+    asset_graph: BaseAssetGraph
+    cursor: AssetDaemonCursor
+    emit_backfills: bool
+    default_condition: Optional[AutomationCondition]
+    evaluation_time: datetime.datetime
+    logger: logging.Logger
+    profile: bool
+
+
+# The state of each in-progress parallel evaluation, keyed by a unique id. Registered in the parent
+# process before the worker processes are forked, so that the workers share the (potentially very
+# large) asset graph without it needing to be serialized. Each evaluation has its own entry, so that
+# concurrent evaluations in the same process never see each other's state.
+_worker_states: dict[int, _WorkerState] = {}
+_worker_states_lock = threading.Lock()
+_worker_state_ids = itertools.count()
+
+
+def can_evaluate_in_processes(instance: DagsterInstance) -> bool:
+    # worker processes connect to the instance from its ref
+    return "fork" in multiprocessing.get_all_start_methods() and not instance.is_ephemeral
+
+
+def _evaluate_entity_keys(
+    state_id: int, entity_keys: AbstractSet[EntityKey]
+) -> tuple[str, str, str, Optional[AutomationEvaluationProfiler]]:
+    from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+        AutomationConditionEvaluator,
+    )
+
+    state = _worker_states.get(state_id)
+    assert state is not None, "Worker state must be set before forking worker processes"
+
+    with DagsterInstance.from_ref(state.instance_ref) as instance:
+        evaluator = AutomationConditionEvaluator(
+            entity_keys=entity_keys,
+            instance=instance,
+            asset_graph=state.asset_graph,
+            cursor=state.cursor,
+            emit_backfills=state.emit_backfills,
+            default_condition=state.default_condition,
+            evaluation_time=state.evaluation_time,
+            logger=state.logger,
+            profile=state.profile,
+            # the profile of each worker is merged into the profile of the parent process, which
+            # reports it for the whole tick
+            report_profile=False,
+        )
+        results, requested_subsets = evaluator.evaluate()
+        # results are passed back to the parent process in their serialized form, as the
+        # in-memory evaluation results reference the asset graph and instance
+        return (
+            serialize_value(
+                [subset.convert_to_serializable_subset() for subset in requested_subsets]
+            ),
+            serialize_value(list(evaluator.get_new_cursors(results))),
+            serialize_value(list(evaluator.get_updated_evaluations(results))),
+            evaluator.profiler,
+        )
+
+
+async def evaluate_in_processes(
+    evaluator: "AutomationConditionEvaluator", num_processes: int
+) -> ParallelEvaluationResult:
+    """Evaluates the entities of the given evaluator across a pool of forked worker processes, one
+    partition of independent graph components per process, and merges their results.
+
+    Forking a process which has other threads running can deadlock the forked process, so this
+    must only be called by callers which do not share their process with other busy threads, like
+    the asset daemon when it evaluates ticks one at a time.
+    """
+    partitions = partition_entity_keys(evaluator.asset_graph, evaluator.entity_keys, num_processes)
+    evaluator.logger.info(
+        f"Evaluating {len(evaluator.entity_keys)} entities across {len(partitions)} processes."
+    )
+
+    state = _WorkerState(
+        instance_ref=evaluator.asset_graph_view.instance.get_ref(),
+        asset_graph=evaluator.asset_graph,
+        cursor=evaluator.cursor,
+        emit_backfills=evaluator.emit_backfills,
+        default_condition=evaluator.default_condition,
+        evaluation_time=evaluator.evaluation_time,
+        logger=evaluator.logger,
+        profile=evaluator.profiler is not None,
+    )
+    with _worker_states_lock:
+        state_id = next(_worker_state_ids)
+        _worker_states[state_id] = state
+    profiler = evaluator.profiler
+    try:
+        with profiler.profile() if profiler else nullcontext():
+            with ProcessPoolExecutor(
+                max_workers=len(partitions), mp_context=multiprocessing.get_context("fork")
+            ) as executor:
+                # worker processes are forked as the partitions are submitted, which happens
+                # before the state is removed below
+                futures = [
+                    asyncio.wrap_future(executor.submit(_evaluate_entity_keys, state_id, partition))
+                    for partition in partitions
+                ]
+                serialized_results = await asyncio.gather(*futures)
+    finally:
+        with _worker_states_lock:
+            del _worker_states[state_id]
+
+    requested_subsets = []
+    condition_cursors = []
+    evaluations = []
+    for (
+        serialized_subsets,
+        serialized_cursors,
+        serialized_evaluations,
+        worker_profiler,
+    ) in serialized_results:
+        requested_subsets.extend(deserialize_value(serialized_subsets, list))
+        condition_cursors.extend(deserialize_value(serialized_cursors, list))
+        evaluations.extend(deserialize_value(serialized_evaluations, list))
+        if profiler and worker_profiler:
+            profiler.merge(worker_profiler)
+
+    if profiler:
+        evaluator.log_profile(profiler)
+    return ParallelEvaluationResult(
+        requested_subsets=requested_subsets,
+        condition_cursors=condition_cursors,
+        evaluations=evaluations,
+    )
@@ -184,6 +184,10 @@ class AutomationConditionCursor(Generic[T_EntityKey]):
             tree to any incremental state calculated for it.
         result_hash: A unique hash of the result for this tick. Used to determine if anything
             has changed since the last time this was evaluated.
+        incremental_fingerprint: A hash of the definitions this cursor was computed against. Only
+            set when incremental evaluation is enabled and the entity was not requested on the
+            previous tick, in which case the entity may be skipped on the next tick if nothing it
+            depends on has changed.
     """
 
     previous_requested_subset: SerializableEntitySubset
@@ -192,6 +196,7 @@ class AutomationConditionCursor(Generic[T_EntityKey]):
 
     node_cursors_by_unique_id: Mapping[str, AutomationConditionNodeCursor]
     result_value_hash: str
+    incremental_fingerprint: Optional[str] = None
 
     @staticmethod
     def backcompat_from_evaluation_state(
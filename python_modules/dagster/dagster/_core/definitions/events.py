@@ -40,7 +40,11 @@
 )
 from dagster._core.definitions.partitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.utils import DEFAULT_OUTPUT, check_valid_name
-from dagster._core.storage.tags import MULTIDIMENSIONAL_PARTITION_PREFIX, REPORTING_USER_TAG
+from dagster._core.storage.tags import (
+    MULTIDIMENSIONAL_PARTITION_PREFIX,
+    REPORTING_USER_TAG,
+    STEP_RESULT_CACHE_KEY_TAG,
+)
 from dagster._record import IHaveNew, record_custom
 from dagster._serdes import whitelist_for_serdes
 
@@ -886,7 +890,14 @@ def is_system_asset_event_tag(key: str) -> bool:
     )
 
     return (
-        key in [CODE_VERSION_TAG, DATA_VERSION_TAG, _OLD_DATA_VERSION_TAG, REPORTING_USER_TAG]
+        key
+        in [
+            CODE_VERSION_TAG,
+            DATA_VERSION_TAG,
+            _OLD_DATA_VERSION_TAG,
+            REPORTING_USER_TAG,
+            STEP_RESULT_CACHE_KEY_TAG,
+        ]
         or key.startswith(INPUT_DATA_VERSION_TAG_PREFIX)
         or key.startswith(INPUT_EVENT_POINTER_TAG_PREFIX)
         or key.startswith(_OLD_INPUT_DATA_VERSION_TAG_PREFIX)
@@ -271,6 +271,8 @@ def _core_in_process_executor_creation(config: ExecutorConfig) -> "InProcessExec
         # shouldn't need to .get() here - issue with defaults in config setup
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore  # (possible none)
         marker_to_close=config.get("marker_to_close"),  # type: ignore  # (should be str)
+        max_concurrent=check.opt_int_elem(config, "max_concurrent"),
+        tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
     )
 
 
@@ -282,6 +284,16 @@ def _core_in_process_executor_creation(config: ExecutorConfig) -> "InProcessExec
             is_required=False,
             description="[DEPRECATED]",
         ),
+        "max_concurrent": Field(
+            Noneable(Int),
+            default_value=None,
+            description=(
+                "The number of steps defined from async functions that may be awaiting"
+                " concurrently on the run's event loop. Synchronous steps are always executed one"
+                " at a time. By default, or if set to 1, all steps are executed one at a time."
+            ),
+        ),
+        "tag_concurrency_limits": get_tag_concurrency_limits_config(),
     },
     description="Execute all steps in a single process.",
 )
@@ -301,6 +313,16 @@ def in_process_executor(init_context):
         execution:
           in_process:
 
+    Steps defined from async functions can await concurrently on a single event loop by setting
+    ``max_concurrent``, which is useful for I/O-bound workloads that don't warrant a process per
+    step. Synchronous steps are still executed one at a time:
+
+    .. code-block:: yaml
+
+        execution:
+          in_process:
+            max_concurrent: 16
+
     Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -515,7 +537,8 @@ def multi_or_in_process_executor(init_context: "InitExecutorContext") -> "Execut
     concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
-    When using the in_process mode, then only retries can be configured.
+    When using the in_process mode, ``retries`` can be configured, as well as ``max_concurrent`` to
+    allow steps defined from async functions to await concurrently on a single event loop.
 
     Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
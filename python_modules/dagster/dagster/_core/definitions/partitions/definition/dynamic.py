@@ -182,7 +182,18 @@ def get_paginated_partition_keys(
         ascending: bool,
         cursor: Optional[str] = None,
     ) -> PaginatedResults[str]:
-        with partition_loading_context(new_ctx=context):
+        with partition_loading_context(new_ctx=context) as ctx:
+            if not self.partition_fn:
+                # page through the stored partition keys, rather than loading all of them
+                return self._ensure_dynamic_partitions_store(
+                    ctx.dynamic_partitions_store
+                ).get_paginated_dynamic_partitions(
+                    partitions_def_name=self._validated_name(),
+                    limit=limit,
+                    ascending=ascending,
+                    cursor=cursor,
+                )
+
             partition_keys = self.get_partition_keys()
             return PaginatedResults.create_from_sequence(
                 partition_keys, limit=limit, ascending=ascending, cursor=cursor
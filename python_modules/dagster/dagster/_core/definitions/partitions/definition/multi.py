@@ -22,7 +22,6 @@
     TimeWindowPartitionsDefinition,
 )
 from dagster._core.definitions.partitions.partition_key_range import PartitionKeyRange
-from dagster._core.definitions.partitions.subset.default import DefaultPartitionsSubset
 from dagster._core.definitions.partitions.utils.multi import (
     INVALID_STATIC_PARTITIONS_KEY_CHARACTERS,
     MULTIPARTITION_KEY_DELIMITER,
@@ -42,6 +41,7 @@
 from dagster._core.types.pagination import PaginatedResults
 
 if TYPE_CHECKING:
+    from dagster._core.definitions.partitions.subset.multi import MultiPartitionsSubset
     from dagster._core.definitions.partitions.subset.partitions_subset import PartitionsSubset
 
 ALLOWED_PARTITION_DIMENSION_TYPES = (
@@ -133,8 +133,24 @@ def __init__(self, partitions_defs: Mapping[str, PartitionsDefinition]):
         )
 
     @property
-    def partitions_subset_class(self) -> type["PartitionsSubset"]:
-        return DefaultPartitionsSubset
+    def partitions_subset_class(self) -> type["MultiPartitionsSubset"]:
+        from dagster._core.definitions.partitions.subset.multi import MultiPartitionsSubset
+
+        return MultiPartitionsSubset
+
+    def subset_with_all_partitions(self) -> "PartitionsSubset":
+        from dagster._core.definitions.partitions.subset.multi import MultiPartitionsSubset
+
+        # every secondary key maps to the same subset of all primary keys, so the cross-product
+        # of partition keys does not need to be constructed
+        primary_subset = self.primary_dimension.partitions_def.subset_with_all_partitions()
+        return MultiPartitionsSubset(
+            self,
+            {
+                secondary_key: primary_subset
+                for secondary_key in self.secondary_dimension.partitions_def.get_partition_keys()
+            },
+        )
 
     def get_partition_keys_in_range(  # pyright: ignore[reportIncompatibleMethodOverride]
         self,
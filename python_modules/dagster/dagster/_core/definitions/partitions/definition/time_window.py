@@ -20,6 +20,7 @@
     ScheduleType,
     cron_schedule_from_schedule_type_and_offsets,
 )
+from dagster._core.definitions.partitions.utils.regular_schedule import RegularCronSchedule
 from dagster._core.definitions.partitions.utils.time_window import TimeWindow, TimeWindowCursor
 from dagster._core.definitions.timestamp import TimestampWithTimezone
 from dagster._core.errors import DagsterInvalidDefinitionError
@@ -190,6 +191,42 @@ def end(self) -> Optional[datetime]:
             get_timezone(end_timestamp_with_timezone.timezone),
         )
 
+    @cached_property
+    def _regular_schedule(self) -> Optional[RegularCronSchedule]:
+        """Closed-form index arithmetic over the partition boundaries, if the cron schedule allows
+        it. Partition i starts at tick i of the schedule.
+        """
+        return RegularCronSchedule.for_cron_schedule(
+            self.cron_schedule, self.timezone, self.start_timestamp
+        )
+
+    def _get_num_partitions_at(
+        self, schedule: RegularCronSchedule, current_timestamp: float
+    ) -> int:
+        # partition i ends at tick i + 1, so the number of partitions ending at or before a given
+        # time is the index of the latest tick at or before it
+        num_partitions = max(schedule.get_index_at_or_before(current_timestamp), 0)
+        num_partitions += max(self.end_offset, 0)
+        if self.end_timestamp is not None:
+            num_partitions = min(
+                num_partitions, max(schedule.get_index_at_or_before(self.end_timestamp), 0)
+            )
+        if self.end_offset < 0:
+            num_partitions = max(num_partitions + self.end_offset, 0)
+        return num_partitions
+
+    def _get_partition_keys_between_ticks(
+        self, schedule: RegularCronSchedule, start_idx: int, end_idx: int
+    ) -> list[str]:
+        # only the second instance of an ambiguous time (fold=1) can require a suffix, so all other
+        # ticks are formatted directly to avoid the overhead of dst_safe_strftime in bulk
+        return [
+            dst_safe_strftime(tick, self.timezone, self.fmt, self.cron_schedule)
+            if tick.fold
+            else tick.strftime(self.fmt)
+            for tick in schedule.iterate_ticks(start_idx, end_idx)
+        ]
+
     def _get_current_timestamp(self) -> float:
         with partition_loading_context() as ctx:
             current_time = ctx.effective_dt
@@ -224,6 +261,10 @@ def get_num_partitions_in_window(self, time_window: TimeWindow) -> int:
         return len(self.get_partition_keys_in_time_window(time_window))
 
     def get_num_partitions(self) -> int:
+        schedule = self._regular_schedule
+        if schedule is not None:
+            return self._get_num_partitions_at(schedule, self._get_current_timestamp())
+
         last_partition_window = self.get_last_partition_window()
         first_partition_window = self.get_first_partition_window()
 
@@ -241,6 +282,13 @@ def get_partition_keys_between_indexes(self, start_idx: int, end_idx: int) -> li
         # partition keys included within the indices.
         current_timestamp = self._get_current_timestamp()
 
+        schedule = self._regular_schedule
+        if schedule is not None:
+            num_partitions = self._get_num_partitions_at(schedule, current_timestamp)
+            return self._get_partition_keys_between_ticks(
+                schedule, max(start_idx, 0), min(end_idx, num_partitions)
+            )
+
         partitions_past_current_time = 0
         partition_keys = []
         reached_end = False
@@ -280,6 +328,12 @@ def get_partition_keys(
         with partition_loading_context(current_time, dynamic_partitions_store):
             current_timestamp = self._get_current_timestamp()
 
+            schedule = self._regular_schedule
+            if schedule is not None:
+                return self._get_partition_keys_between_ticks(
+                    schedule, 0, self._get_num_partitions_at(schedule, current_timestamp)
+                )
+
             partitions_past_current_time = 0
             partition_keys: list[str] = []
             for time_window in self._iterate_time_windows(self.start_timestamp):
@@ -480,6 +534,48 @@ def time_windows_for_partition_keys(
         if len(partition_keys) == 0:
             return []
 
+        schedule = self._regular_schedule
+        if schedule is not None:
+            partition_key_time_windows = sorted(
+                (
+                    self._time_window_for_tick_index(
+                        schedule,
+                        schedule.get_index_at_or_after(
+                            dst_safe_strptime(pk, self.timezone, self.fmt).timestamp()
+                        ),
+                    )
+                    for pk in partition_keys
+                ),
+                key=lambda tw: tw.start.timestamp(),
+            )
+        else:
+            partition_key_time_windows = self._time_windows_for_partition_keys_by_iteration(
+                partition_keys
+            )
+
+        if validate:
+            start_time_window = self.get_first_partition_window()
+            end_time_window = self.get_last_partition_window()
+
+            if start_time_window is None or end_time_window is None:
+                check.failed("No partitions in the PartitionsDefinition")
+
+            start_timestamp = start_time_window.start.timestamp()
+            end_timestamp = end_time_window.end.timestamp()
+
+            partition_key_time_windows = [
+                tw
+                for tw in partition_key_time_windows
+                if tw.start.timestamp() >= start_timestamp and tw.end.timestamp() <= end_timestamp
+            ]
+        return partition_key_time_windows
+
+    def _time_window_for_tick_index(self, schedule: RegularCronSchedule, index: int) -> TimeWindow:
+        return TimeWindow(schedule.get_tick(index), schedule.get_tick(index + 1))
+
+    def _time_windows_for_partition_keys_by_iteration(
+        self, partition_keys: frozenset[str]
+    ) -> list[TimeWindow]:
         sorted_pks = sorted(
             partition_keys,
             key=lambda pk: dst_safe_strptime(pk, self.timezone, self.fmt).timestamp(),
@@ -504,22 +600,6 @@ def time_windows_for_partition_keys(
                     )
                 )
                 partition_key_time_windows.append(next(cur_windows_iterator))
-
-        if validate:
-            start_time_window = self.get_first_partition_window()
-            end_time_window = self.get_last_partition_window()
-
-            if start_time_window is None or end_time_window is None:
-                check.failed("No partitions in the PartitionsDefinition")
-
-            start_timestamp = start_time_window.start.timestamp()
-            end_timestamp = end_time_window.end.timestamp()
-
-            partition_key_time_windows = [
-                tw
-                for tw in partition_key_time_windows
-                if tw.start.timestamp() >= start_timestamp and tw.end.timestamp() <= end_timestamp
-            ]
         return partition_key_time_windows
 
     def start_time_for_partition_key(self, partition_key: str) -> datetime:
@@ -618,10 +698,17 @@ def _get_last_partition_window(self, current_timestamp: float) -> Optional[TimeW
         if self.end_timestamp is not None and self.end_timestamp < current_timestamp:
             current_timestamp = self.end_timestamp
 
+        schedule = self._regular_schedule
         if self.end_offset == 0:
             return next(iter(self._reverse_iterate_time_windows(current_timestamp)))
+        elif schedule is not None:
+            num_partitions = self._get_num_partitions_at(schedule, current_timestamp)
+            return (
+                self._time_window_for_tick_index(schedule, num_partitions - 1)
+                if num_partitions > 0
+                else None
+            )
         else:
-            # TODO: make this efficient
             last_partition_key = super().get_last_partition_key()
             return (
                 self.time_window_for_partition_key(last_partition_key)
@@ -651,6 +738,14 @@ def end_time_for_partition_key(self, partition_key: str) -> datetime:
 
     @functools.lru_cache(maxsize=5)
     def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence[str]:
+        schedule = self._regular_schedule
+        if schedule is not None:
+            return self._get_partition_keys_between_ticks(
+                schedule,
+                schedule.get_index_at_or_after(time_window.start.timestamp()),
+                schedule.get_index_at_or_after(time_window.end.timestamp()),
+            )
+
         result: list[str] = []
         time_window_end_timestamp = time_window.end.timestamp()
         for partition_time_window in self._iterate_time_windows(time_window.start.timestamp()):
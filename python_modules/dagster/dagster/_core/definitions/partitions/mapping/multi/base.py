@@ -1,8 +1,9 @@
 import itertools
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Hashable, Mapping, Sequence
 from datetime import datetime
+from functools import reduce
 from typing import NamedTuple, Optional, Union, cast
 
 import dagster._check as check
@@ -15,8 +16,11 @@
     PartitionMapping,
     UpstreamPartitionsResult,
 )
+from dagster._core.definitions.partitions.subset.all import AllPartitionsSubset
 from dagster._core.definitions.partitions.subset.default import DefaultPartitionsSubset
+from dagster._core.definitions.partitions.subset.multi import MultiPartitionsSubset
 from dagster._core.definitions.partitions.subset.partitions_subset import PartitionsSubset
+from dagster._core.definitions.partitions.subset.time_window import TimeWindowPartitionsSubset
 from dagster._core.definitions.partitions.utils.multi import MultiPartitionKey
 from dagster._core.instance import DynamicPartitionsStore
 from dagster._serdes import whitelist_for_serdes
@@ -28,6 +32,58 @@ class DimensionDependency(NamedTuple):
     downstream_dimension_name: Optional[str] = None
 
 
+def _get_subset_grouping_key(subset: PartitionsSubset) -> Hashable:
+    """Returns a key which is equal for subsets with the same partition keys, without enumerating
+    the keys of subsets which have a compact serialized form.
+    """
+    if isinstance(subset, AllPartitionsSubset):
+        return (AllPartitionsSubset, subset.partitions_def)
+    elif isinstance(subset, (TimeWindowPartitionsSubset, DefaultPartitionsSubset)):
+        return (type(subset), subset.serialize())
+    else:
+        return (type(subset), frozenset(subset.get_partition_keys()))
+
+
+def _get_subset_for_partitions_def(
+    subset: PartitionsSubset, partitions_def: PartitionsDefinition
+) -> PartitionsSubset:
+    """Returns a subset with the same partition keys as the input subset, whose type is the subset
+    class of the given partitions definition.
+    """
+    if isinstance(subset, partitions_def.partitions_subset_class):
+        return subset
+    elif isinstance(subset, AllPartitionsSubset):
+        return partitions_def.subset_with_all_partitions()
+    return partitions_def.empty_subset().with_partition_keys(subset.get_partition_keys())
+
+
+def _is_union_preserving_partition_mapping(partition_mapping: PartitionMapping) -> bool:
+    """Returns True if the partitions that the given partition mapping maps a subset to are always
+    the union of the partitions it maps each key in the subset to. Only these mappings can be
+    applied to a whole subset of a dimension at once, rather than to each key individually.
+    """
+    from dagster._core.definitions.partitions.mapping import (
+        AllPartitionMapping,
+        IdentityPartitionMapping,
+        LastPartitionMapping,
+        SpecificPartitionsPartitionMapping,
+        StaticPartitionMapping,
+        TimeWindowPartitionMapping,
+    )
+
+    return isinstance(
+        partition_mapping,
+        (
+            AllPartitionMapping,
+            IdentityPartitionMapping,
+            LastPartitionMapping,
+            SpecificPartitionsPartitionMapping,
+            StaticPartitionMapping,
+            TimeWindowPartitionMapping,
+        ),
+    )
+
+
 class BaseMultiPartitionMapping(ABC):
     @abstractmethod
     def get_dimension_dependencies(
@@ -54,9 +110,236 @@ def _get_dependency_partitions_subset(
     ) -> Union[UpstreamPartitionsResult, PartitionsSubset]:
         """Given two partitions definitions a_partitions_def and b_partitions_def that have a dependency
         relationship (a_upstream_of_b is True if a_partitions_def is upstream of b_partitions_def),
-        and a_partition_keys, a list of partition keys in a_partitions_def, returns a list of
-        partition keys in the partitions definition b_partitions_def that are
-        dependencies of the partition keys in a_partition_keys.
+        and a_partitions_subset, a subset of a_partitions_def, returns the subset of
+        b_partitions_def that are dependencies of the partitions in a_partitions_subset.
+        """
+        result = self._get_dependency_partitions_subset_from_dimension_subsets(
+            a_partitions_def, a_partitions_subset, b_partitions_def, a_upstream_of_b
+        )
+        if result is not None:
+            return result
+
+        return self._get_dependency_partitions_subset_from_partition_keys(
+            a_partitions_def, a_partitions_subset, b_partitions_def, a_upstream_of_b
+        )
+
+    def _get_dimension_subset_blocks(
+        self,
+        a_partitions_def: PartitionsDefinition,
+        a_partitions_subset: PartitionsSubset,
+        mapped_a_dim_names: Sequence[Optional[str]],
+    ) -> Optional[Sequence[Mapping[Optional[str], PartitionsSubset]]]:
+        """Decomposes a_partitions_subset into blocks, each of which maps every mapped dimension of
+        a_partitions_def to a subset of that dimension. The combinations of keys of the mapped
+        dimensions in a_partitions_subset are the union of the cross-products of the subsets in
+        each block.
+
+        Returns None if a_partitions_subset can't be decomposed without enumerating its keys.
+        """
+        if not isinstance(a_partitions_def, MultiPartitionsDefinition):
+            if len(a_partitions_subset) == 0:
+                return []
+            a_partitions_subset = _get_subset_for_partitions_def(
+                a_partitions_subset, a_partitions_def
+            )
+            return [{dim_name: a_partitions_subset for dim_name in mapped_a_dim_names}]
+
+        multi_subset = MultiPartitionsSubset.attempt_coerce(a_partitions_subset, a_partitions_def)
+        if (
+            not isinstance(multi_subset, MultiPartitionsSubset)
+            or multi_subset.partitions_def != a_partitions_def
+        ):
+            return None
+        if multi_subset.is_empty:
+            return []
+
+        primary_dimension = a_partitions_def.primary_dimension
+        secondary_dimension = a_partitions_def.secondary_dimension
+        secondary_partitions_def = secondary_dimension.partitions_def
+        is_primary_mapped = primary_dimension.name in mapped_a_dim_names
+        is_secondary_mapped = secondary_dimension.name in mapped_a_dim_names
+
+        if is_primary_mapped and is_secondary_mapped:
+            # secondary keys which share an equal primary subset (e.g. when every secondary key is
+            # included with all primary keys) can be mapped together
+            secondary_keys_by_primary_subset_key: dict[Hashable, list[str]] = defaultdict(list)
+            primary_subsets_by_key: dict[Hashable, PartitionsSubset] = {}
+            for secondary_key, primary_subset in multi_subset.subsets_by_secondary_key.items():
+                primary_subset_key = _get_subset_grouping_key(primary_subset)
+                secondary_keys_by_primary_subset_key[primary_subset_key].append(secondary_key)
+                primary_subsets_by_key[primary_subset_key] = primary_subset
+            return [
+                {
+                    primary_dimension.name: primary_subsets_by_key[primary_subset_key],
+                    secondary_dimension.name: secondary_partitions_def.empty_subset().with_partition_keys(
+                        secondary_keys
+                    ),
+                }
+                for primary_subset_key, secondary_keys in secondary_keys_by_primary_subset_key.items()
+            ]
+        elif is_primary_mapped:
+            return [
+                {
+                    primary_dimension.name: reduce(
+                        lambda a, b: a | b, multi_subset.subsets_by_secondary_key.values()
+                    )
+                }
+            ]
+        elif is_secondary_mapped:
+            return [
+                {
+                    secondary_dimension.name: secondary_partitions_def.empty_subset().with_partition_keys(
+                        multi_subset.subsets_by_secondary_key.keys()
+                    )
+                }
+            ]
+        else:
+            return [{}]
+
+    def _get_dependency_partitions_subset_from_dimension_subsets(
+        self,
+        a_partitions_def: PartitionsDefinition,
+        a_partitions_subset: PartitionsSubset,
+        b_partitions_def: PartitionsDefinition,
+        a_upstream_of_b: bool,
+    ) -> Optional[Union[UpstreamPartitionsResult, PartitionsSubset]]:
+        """Computes the result of _get_dependency_partitions_subset by applying each dimension's
+        partition mapping to whole subsets of that dimension, and assembling the result from the
+        mapped subsets, without enumerating the partition keys of either partitions definition.
+
+        Returns None if the result can't be computed this way, in which case the partition keys
+        must be mapped individually.
+        """
+        if a_upstream_of_b:
+            dimension_dependencies = [
+                (
+                    dependency.upstream_dimension_name,
+                    dependency.downstream_dimension_name,
+                    dependency.partition_mapping,
+                )
+                for dependency in self.get_dimension_dependencies(
+                    a_partitions_def, b_partitions_def
+                )
+            ]
+        else:
+            dimension_dependencies = [
+                (
+                    dependency.downstream_dimension_name,
+                    dependency.upstream_dimension_name,
+                    dependency.partition_mapping,
+                )
+                for dependency in self.get_dimension_dependencies(
+                    b_partitions_def, a_partitions_def
+                )
+            ]
+
+        a_dim_names: list[Optional[str]] = (
+            list(a_partitions_def.partition_dimension_names)
+            if isinstance(a_partitions_def, MultiPartitionsDefinition)
+            else [None]
+        )
+        b_dim_names: list[Optional[str]] = (
+            list(b_partitions_def.partition_dimension_names)
+            if isinstance(b_partitions_def, MultiPartitionsDefinition)
+            else [None]
+        )
+        mapped_a_dim_names = [a_dim_name for a_dim_name, _, _ in dimension_dependencies]
+        mapped_b_dim_names = [b_dim_name for _, b_dim_name, _ in dimension_dependencies]
+        if (
+            len(set(mapped_a_dim_names)) != len(mapped_a_dim_names)
+            or len(set(mapped_b_dim_names)) != len(mapped_b_dim_names)
+            or not set(mapped_a_dim_names).issubset(a_dim_names)
+            or not set(mapped_b_dim_names).issubset(b_dim_names)
+            or not all(
+                _is_union_preserving_partition_mapping(partition_mapping)
+                for _, _, partition_mapping in dimension_dependencies
+            )
+        ):
+            return None
+
+        blocks = self._get_dimension_subset_blocks(
+            a_partitions_def, a_partitions_subset, mapped_a_dim_names
+        )
+        if blocks is None:
+            return None
+
+        unmapped_b_subsets_by_dim_name: dict[Optional[str], PartitionsSubset] = {}
+        for b_dim_name in set(b_dim_names) - set(mapped_b_dim_names):
+            b_dimension_partitions_def = self.get_partitions_def(b_partitions_def, b_dim_name)
+            unmapped_b_subsets_by_dim_name[b_dim_name] = _get_subset_for_partitions_def(
+                b_dimension_partitions_def.subset_with_all_partitions(), b_dimension_partitions_def
+            )
+
+        required_but_nonexistent_upstream_partitions = set()
+        b_subsets_by_secondary_key: dict[str, PartitionsSubset] = {}
+        b_subset = b_partitions_def.empty_subset()
+        for block in blocks:
+            b_subsets_by_dim_name = dict(unmapped_b_subsets_by_dim_name)
+            for a_dim_name, b_dim_name, partition_mapping in dimension_dependencies:
+                a_dimension_partitions_def = self.get_partitions_def(a_partitions_def, a_dim_name)
+                b_dimension_partitions_def = self.get_partitions_def(b_partitions_def, b_dim_name)
+                if a_upstream_of_b:
+                    mapped_subset = partition_mapping.get_downstream_partitions_for_partitions(
+                        block[a_dim_name],
+                        a_dimension_partitions_def,
+                        b_dimension_partitions_def,
+                    )
+                else:
+                    mapped_partitions_result = (
+                        partition_mapping.get_upstream_mapped_partitions_result_for_partitions(
+                            block[a_dim_name],
+                            a_dimension_partitions_def,
+                            b_dimension_partitions_def,
+                        )
+                    )
+                    mapped_subset = mapped_partitions_result.partitions_subset
+                    required_but_nonexistent_upstream_partitions.update(
+                        mapped_partitions_result.required_but_nonexistent_subset.get_partition_keys()
+                    )
+                b_subsets_by_dim_name[b_dim_name] = _get_subset_for_partitions_def(
+                    mapped_subset, b_dimension_partitions_def
+                )
+
+            if any(len(subset) == 0 for subset in b_subsets_by_dim_name.values()):
+                continue
+
+            if isinstance(b_partitions_def, MultiPartitionsDefinition):
+                primary_subset = b_subsets_by_dim_name[b_partitions_def.primary_dimension.name]
+                for secondary_key in b_subsets_by_dim_name[
+                    b_partitions_def.secondary_dimension.name
+                ].get_partition_keys():
+                    existing_subset = b_subsets_by_secondary_key.get(secondary_key)
+                    b_subsets_by_secondary_key[secondary_key] = (
+                        existing_subset | primary_subset
+                        if existing_subset is not None
+                        else primary_subset
+                    )
+            else:
+                b_subset = b_subset | b_subsets_by_dim_name[None]
+
+        if isinstance(b_partitions_def, MultiPartitionsDefinition):
+            b_subset = MultiPartitionsSubset(b_partitions_def, b_subsets_by_secondary_key)
+
+        if a_upstream_of_b:
+            return b_subset
+        else:
+            return UpstreamPartitionsResult(
+                partitions_subset=b_subset,
+                required_but_nonexistent_subset=DefaultPartitionsSubset(
+                    required_but_nonexistent_upstream_partitions
+                ),
+            )
+
+    def _get_dependency_partitions_subset_from_partition_keys(
+        self,
+        a_partitions_def: PartitionsDefinition,
+        a_partitions_subset: PartitionsSubset,
+        b_partitions_def: PartitionsDefinition,
+        a_upstream_of_b: bool,
+    ) -> Union[UpstreamPartitionsResult, PartitionsSubset]:
+        """Computes the result of _get_dependency_partitions_subset by mapping each key in
+        a_partitions_subset individually, and constructing the cross-product of the partition keys
+        of b_partitions_def that its dimensions are mapped to.
         """
         a_partition_keys_by_dimension = defaultdict(set)
         if isinstance(a_partitions_def, MultiPartitionsDefinition):
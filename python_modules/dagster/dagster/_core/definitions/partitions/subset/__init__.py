@@ -4,6 +4,9 @@
 from dagster._core.definitions.partitions.subset.default import (
     DefaultPartitionsSubset as DefaultPartitionsSubset,
 )
+from dagster._core.definitions.partitions.subset.multi import (
+    MultiPartitionsSubset as MultiPartitionsSubset,
+)
 from dagster._core.definitions.partitions.subset.partitions_subset import (
     PartitionsSubset as PartitionsSubset,
 )
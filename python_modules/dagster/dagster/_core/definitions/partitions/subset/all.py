@@ -66,8 +66,14 @@ def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset":
 
     @use_partition_loading_context
     def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
-        from dagster._core.definitions.partitions.definition import TimeWindowPartitionsDefinition
-        from dagster._core.definitions.partitions.subset import TimeWindowPartitionsSubset
+        from dagster._core.definitions.partitions.definition import (
+            MultiPartitionsDefinition,
+            TimeWindowPartitionsDefinition,
+        )
+        from dagster._core.definitions.partitions.subset import (
+            MultiPartitionsSubset,
+            TimeWindowPartitionsSubset,
+        )
 
         if self == other:
             return self.partitions_def.empty_subset()
@@ -75,6 +81,10 @@ def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
             self.partitions_def, TimeWindowPartitionsDefinition
         ):
             return TimeWindowPartitionsSubset.from_all_partitions_subset(self) - other
+        elif isinstance(other, MultiPartitionsSubset) and isinstance(
+            self.partitions_def, MultiPartitionsDefinition
+        ):
+            return MultiPartitionsSubset.from_all_partitions_subset(self) - other
         return self.partitions_def.empty_subset().with_partition_keys(
             set(self.get_partition_keys()).difference(set(other.get_partition_keys()))
         )
@@ -84,7 +94,8 @@ def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset":
 
     @use_partition_loading_context
     def __len__(self) -> int:
-        return len(self.get_partition_keys())
+        # avoid materializing every partition key when the definition can count them directly
+        return self.partitions_def.get_num_partitions()
 
     @use_partition_loading_context
     def __contains__(self, value) -> bool:
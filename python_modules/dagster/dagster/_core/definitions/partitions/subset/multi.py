@@ -0,0 +1,347 @@
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from functools import cached_property, reduce
+from typing import TYPE_CHECKING, AbstractSet, NamedTuple, Optional  # noqa: UP035
+
+import dagster._check as check
+from dagster._core.definitions.partitions.definition.multi import MultiPartitionsDefinition
+from dagster._core.definitions.partitions.definition.partitions_definition import (
+    PartitionsDefinition,
+)
+from dagster._core.definitions.partitions.partition_key_range import PartitionKeyRange
+from dagster._core.definitions.partitions.subset.default import DefaultPartitionsSubset
+from dagster._core.definitions.partitions.subset.partitions_subset import PartitionsSubset
+from dagster._core.definitions.partitions.utils.multi import (
+    MULTIPARTITION_KEY_DELIMITER,
+    MultiPartitionKey,
+)
+
+if TYPE_CHECKING:
+    from dagster._core.definitions.partitions.subset.all import AllPartitionsSubset
+
+
+class MultiPartitionsSubset(
+    PartitionsSubset[MultiPartitionKey],
+    NamedTuple(
+        "_MultiPartitionsSubset",
+        [
+            ("partitions_def", MultiPartitionsDefinition),
+            ("subsets_by_secondary_key", Mapping[str, PartitionsSubset]),
+        ],
+    ),
+):
+    """A subset of the partitions of a MultiPartitionsDefinition, stored in factorized form as a
+    mapping from each partition key of the secondary dimension to the subset of the primary
+    dimension that is included alongside it.
+
+    When the definition has a time window dimension, it is the primary dimension, so each
+    secondary key maps to a TimeWindowPartitionsSubset. This allows set operations and counts to
+    be computed per secondary key, without enumerating the cross-product of partition keys.
+
+    This is an in-memory representation. It is serialized in the same format as a
+    DefaultPartitionsSubset containing every partition key in the subset, so that it remains
+    compatible with subsets that have already been stored and with older readers. Serializing a
+    subset therefore still enumerates its partition keys, and its cost and size grow with the
+    number of keys in the subset.
+    """
+
+    def __new__(
+        cls,
+        partitions_def: MultiPartitionsDefinition,
+        subsets_by_secondary_key: Mapping[str, PartitionsSubset],
+    ):
+        check.inst_param(partitions_def, "partitions_def", MultiPartitionsDefinition)
+        check.mapping_param(
+            subsets_by_secondary_key,
+            "subsets_by_secondary_key",
+            key_type=str,
+            value_type=PartitionsSubset,
+        )
+        return super().__new__(
+            cls,
+            partitions_def=partitions_def,
+            # drop empty subsets so that equal subsets have equal representations
+            subsets_by_secondary_key={
+                secondary_key: subset
+                for secondary_key, subset in subsets_by_secondary_key.items()
+                if len(subset) > 0
+            },
+        )
+
+    @staticmethod
+    def attempt_coerce(
+        subset: PartitionsSubset, partitions_def: MultiPartitionsDefinition
+    ) -> PartitionsSubset:
+        """Attempts to convert the input subset into a MultiPartitionsSubset of the given
+        partitions definition. Subsets of multi-partitioned assets are persisted as
+        DefaultPartitionsSubsets, so these are converted when they are combined with a
+        MultiPartitionsSubset. Subsets which can't be converted are returned unchanged.
+        """
+        from dagster._core.definitions.partitions.subset.all import AllPartitionsSubset
+
+        if isinstance(subset, MultiPartitionsSubset):
+            return subset
+        elif isinstance(subset, DefaultPartitionsSubset):
+            return MultiPartitionsSubset.create_empty_subset(partitions_def).with_partition_keys(
+                subset.subset
+            )
+        elif isinstance(subset, AllPartitionsSubset) and subset.partitions_def == partitions_def:
+            return MultiPartitionsSubset.from_all_partitions_subset(subset)
+        else:
+            return subset
+
+    @staticmethod
+    def from_all_partitions_subset(subset: "AllPartitionsSubset") -> "MultiPartitionsSubset":
+        partitions_def = check.inst(
+            subset.partitions_def,
+            MultiPartitionsDefinition,
+            "Provided subset must reference a MultiPartitionsDefinition",
+        )
+        return check.inst(partitions_def.subset_with_all_partitions(), MultiPartitionsSubset)
+
+    @cached_property
+    def _primary_partitions_def(self) -> PartitionsDefinition:
+        return self.partitions_def.primary_dimension.partitions_def
+
+    @cached_property
+    def _dimension_names(self) -> tuple[str, str]:
+        return (
+            self.partitions_def.primary_dimension.name,
+            self.partitions_def.secondary_dimension.name,
+        )
+
+    def _get_multi_partition_key(self, primary_key: str, secondary_key: str) -> MultiPartitionKey:
+        primary_dimension_name, secondary_dimension_name = self._dimension_names
+        return MultiPartitionKey(
+            {primary_dimension_name: primary_key, secondary_dimension_name: secondary_key}
+        )
+
+    @cached_property
+    def _primary_and_secondary_dimension_indexes(self) -> tuple[int, int]:
+        dimension_names = self.partitions_def.partition_dimension_names
+        primary_dimension_name, secondary_dimension_name = self._dimension_names
+        return (
+            dimension_names.index(primary_dimension_name),
+            dimension_names.index(secondary_dimension_name),
+        )
+
+    def _get_primary_and_secondary_key(self, partition_key: str) -> Optional[tuple[str, str]]:
+        # parse the string representation, matching MultiPartitionsDefinition.get_partition_key_from_str
+        partition_key_strs = partition_key.split(MULTIPARTITION_KEY_DELIMITER)
+        if len(partition_key_strs) != len(self.partitions_def.partitions_defs):
+            return None
+        primary_index, secondary_index = self._primary_and_secondary_dimension_indexes
+        return partition_key_strs[primary_index], partition_key_strs[secondary_index]
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self.subsets_by_secondary_key) == 0
+
+    def get_partition_keys_not_in_subset(
+        self, partitions_def: PartitionsDefinition
+    ) -> Iterable[MultiPartitionKey]:
+        return (partitions_def.subset_with_all_partitions() - self).get_partition_keys()
+
+    def get_partition_keys(self) -> AbstractSet[MultiPartitionKey]:
+        # returned as a set, matching DefaultPartitionsSubset which was previously used for
+        # multi-partitioned assets
+        return {
+            self._get_multi_partition_key(primary_key, secondary_key)
+            for secondary_key, primary_subset in self.subsets_by_secondary_key.items()
+            for primary_key in primary_subset.get_partition_keys()
+        }
+
+    def get_partition_key_ranges(
+        self, partitions_def: PartitionsDefinition
+    ) -> Sequence[PartitionKeyRange]:
+        primary_keys_in_subset = reduce(
+            lambda a, b: a | b,
+            self.subsets_by_secondary_key.values(),
+            self._primary_partitions_def.empty_subset(),
+        )
+        if len(self.subsets_by_secondary_key) >= len(primary_keys_in_subset):
+            # ranges are grouped by whichever dimension has fewer distinct keys. grouping by the
+            # primary dimension requires the keys of the subset to be enumerated.
+            return DefaultPartitionsSubset(self.get_partition_keys()).get_partition_key_ranges(
+                partitions_def
+            )
+
+        # hold the secondary key constant, and construct ranges over the primary dimension
+        return [
+            PartitionKeyRange(
+                self._get_multi_partition_key(primary_range.start, secondary_key),
+                self._get_multi_partition_key(primary_range.end, secondary_key),
+            )
+            for secondary_key, primary_subset in self.subsets_by_secondary_key.items()
+            for primary_range in primary_subset.get_partition_key_ranges(
+                self._primary_partitions_def
+            )
+        ]
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> "MultiPartitionsSubset":
+        primary_keys_by_secondary_key: dict[str, list[str]] = defaultdict(list)
+        for partition_key in partition_keys:
+            primary_and_secondary_key = self._get_primary_and_secondary_key(partition_key)
+            if primary_and_secondary_key is None:
+                check.failed(
+                    f"Invalid partition key {partition_key} for partitions definition"
+                    f" {self.partitions_def}"
+                )
+            primary_key, secondary_key = primary_and_secondary_key
+            primary_keys_by_secondary_key[secondary_key].append(primary_key)
+
+        if not primary_keys_by_secondary_key:
+            return self
+
+        subsets_by_secondary_key = dict(self.subsets_by_secondary_key)
+        for secondary_key, primary_keys in primary_keys_by_secondary_key.items():
+            primary_subset = subsets_by_secondary_key.get(secondary_key)
+            if primary_subset is None:
+                primary_subset = self._primary_partitions_def.empty_subset()
+            subsets_by_secondary_key[secondary_key] = primary_subset.with_partition_keys(
+                primary_keys
+            )
+        return MultiPartitionsSubset(self.partitions_def, subsets_by_secondary_key)
+
+    def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        other = self.attempt_coerce(other, self.partitions_def)
+        if (
+            not isinstance(other, MultiPartitionsSubset)
+            or other.partitions_def != self.partitions_def
+        ):
+            return super().__or__(other)
+
+        subsets_by_secondary_key = dict(self.subsets_by_secondary_key)
+        for secondary_key, other_subset in other.subsets_by_secondary_key.items():
+            subset = subsets_by_secondary_key.get(secondary_key)
+            subsets_by_secondary_key[secondary_key] = (
+                subset | other_subset if subset is not None else other_subset
+            )
+        return MultiPartitionsSubset(self.partitions_def, subsets_by_secondary_key)
+
+    def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        other = self.attempt_coerce(other, self.partitions_def)
+        if (
+            not isinstance(other, MultiPartitionsSubset)
+            or other.partitions_def != self.partitions_def
+        ):
+            return super().__and__(other)
+
+        return MultiPartitionsSubset(
+            self.partitions_def,
+            {
+                secondary_key: subset & other.subsets_by_secondary_key[secondary_key]
+                for secondary_key, subset in self.subsets_by_secondary_key.items()
+                if secondary_key in other.subsets_by_secondary_key
+            },
+        )
+
+    def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        other = self.attempt_coerce(other, self.partitions_def)
+        if (
+            not isinstance(other, MultiPartitionsSubset)
+            or other.partitions_def != self.partitions_def
+        ):
+            return super().__sub__(other)
+
+        return MultiPartitionsSubset(
+            self.partitions_def,
+            {
+                secondary_key: (
+                    subset - other.subsets_by_secondary_key[secondary_key]
+                    if secondary_key in other.subsets_by_secondary_key
+                    else subset
+                )
+                for secondary_key, subset in self.subsets_by_secondary_key.items()
+            },
+        )
+
+    def __contains__(self, value) -> bool:
+        if not isinstance(value, str):
+            return False
+        primary_and_secondary_key = self._get_primary_and_secondary_key(value)
+        if primary_and_secondary_key is None:
+            return False
+        primary_key, secondary_key = primary_and_secondary_key
+        primary_subset = self.subsets_by_secondary_key.get(secondary_key)
+        return primary_subset is not None and primary_key in primary_subset
+
+    def __len__(self) -> int:
+        return sum(len(subset) for subset in self.subsets_by_secondary_key.values())
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, MultiPartitionsSubset)
+            and self.partitions_def == other.partitions_def
+            and self.subsets_by_secondary_key == other.subsets_by_secondary_key
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"MultiPartitionsSubset(partitions_def={self.partitions_def},"
+            f" subsets_by_secondary_key={self.subsets_by_secondary_key})"
+        )
+
+    def _get_partition_key_strs(self) -> AbstractSet[str]:
+        # the string forms of the keys in the subset, built without constructing a
+        # MultiPartitionKey for each of them, which dominates the cost for large subsets
+        primary_dimension_name, secondary_dimension_name = self._dimension_names
+        primary_first = primary_dimension_name < secondary_dimension_name
+        partition_key_strs = set()
+        for secondary_key, primary_subset in self.subsets_by_secondary_key.items():
+            if primary_first:
+                suffix = MULTIPARTITION_KEY_DELIMITER + secondary_key
+                partition_key_strs.update(
+                    primary_key + suffix for primary_key in primary_subset.get_partition_keys()
+                )
+            else:
+                prefix = secondary_key + MULTIPARTITION_KEY_DELIMITER
+                partition_key_strs.update(
+                    prefix + primary_key for primary_key in primary_subset.get_partition_keys()
+                )
+        return partition_key_strs
+
+    def to_serializable_subset(self) -> DefaultPartitionsSubset:
+        # the serialized format lists every partition key in the subset, so unlike the other
+        # operations on this subset, serializing it is linear in the number of partition keys
+        return DefaultPartitionsSubset(self._get_partition_key_strs())
+
+    def serialize(self) -> str:
+        return self.to_serializable_subset().serialize()
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> "PartitionsSubset":
+        partitions_def = check.inst_param(
+            partitions_def, "partitions_def", MultiPartitionsDefinition
+        )
+        default_subset = check.inst(
+            DefaultPartitionsSubset.from_serialized(partitions_def, serialized),
+            DefaultPartitionsSubset,
+        )
+        return cls.create_empty_subset(partitions_def).with_partition_keys(default_subset.subset)
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        return DefaultPartitionsSubset.can_deserialize(
+            partitions_def,
+            serialized,
+            serialized_partitions_def_unique_id,
+            serialized_partitions_def_class_name,
+        )
+
+    def empty_subset(self) -> "MultiPartitionsSubset":
+        return MultiPartitionsSubset(self.partitions_def, {})
+
+    @classmethod
+    def create_empty_subset(
+        cls, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "MultiPartitionsSubset":
+        return cls(check.inst(partitions_def, MultiPartitionsDefinition), {})
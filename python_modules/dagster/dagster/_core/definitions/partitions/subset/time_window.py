@@ -1,4 +1,6 @@
+import heapq
 import json
+from bisect import bisect_right
 from collections.abc import Iterable, Sequence
 from datetime import datetime
 from functools import cached_property
@@ -47,6 +49,26 @@ def _attempt_coerce_to_time_window_subset(subset: "PartitionsSubset") -> "Partit
         return subset
 
 
+def _merge_sorted_time_windows(
+    time_windows: Iterable[PersistedTimeWindow], timezone: str
+) -> Sequence[PersistedTimeWindow]:
+    """Takes time windows sorted by start time and merges any that overlap or are adjacent,
+    returning disjoint windows. Windows that do not need to be merged are returned unchanged.
+    """
+    result_windows: list[PersistedTimeWindow] = []
+    for window in time_windows:
+        if result_windows and window.start_timestamp <= result_windows[-1].end_timestamp:
+            latest_window = result_windows[-1]
+            if window.end_timestamp > latest_window.end_timestamp:
+                result_windows[-1] = PersistedTimeWindow(
+                    TimestampWithTimezone(latest_window.start_timestamp, timezone),
+                    TimestampWithTimezone(window.end_timestamp, timezone),
+                )
+        else:
+            result_windows.append(window)
+    return result_windows
+
+
 class TimeWindowPartitionsSubsetSerializer(NamedTupleSerializer):
     # TimeWindowPartitionsSubsets have custom logic to delay calculating num_partitions until it
     # is needed to improve performance. When serializing, we want to serialize the number of
@@ -141,6 +163,30 @@ def from_all_partitions_subset(subset: "AllPartitionsSubset") -> "TimeWindowPart
     def included_time_windows(self) -> Sequence[PersistedTimeWindow]:  # pyright: ignore[reportIncompatibleVariableOverride]
         return self._asdict()["included_time_windows"]
 
+    @cached_property
+    def _sorted_time_windows(self) -> Sequence[PersistedTimeWindow]:
+        """The included time windows, sorted by start time and with any overlapping or adjacent
+        windows merged. Set operations and membership checks operate on this representation, so
+        that they can be performed with linear merges and binary searches.
+        """
+        time_windows = self.included_time_windows
+        if all(
+            time_windows[i].end_timestamp < time_windows[i + 1].start_timestamp
+            for i in range(len(time_windows) - 1)
+        ):
+            return time_windows
+        return _merge_sorted_time_windows(
+            sorted(time_windows, key=lambda tw: tw.start_timestamp), self.partitions_def.timezone
+        )
+
+    @cached_property
+    def _sorted_start_timestamps(self) -> Sequence[float]:
+        return [tw.start_timestamp for tw in self._sorted_time_windows]
+
+    def _contains_timestamp(self, timestamp: float) -> bool:
+        idx = bisect_right(self._sorted_start_timestamps, timestamp) - 1
+        return idx >= 0 and timestamp < self._sorted_time_windows[idx].end_timestamp
+
     @property
     def first_start(self) -> datetime:
         """The start datetime of the earliest partition in the subset."""
@@ -275,87 +321,35 @@ def get_partition_key_ranges(
             ]
 
     def _add_partitions_to_time_windows(
-        self,
-        initial_windows: Sequence[PersistedTimeWindow],
-        partition_keys: Sequence[str],
-        validate: bool = True,
+        self, partition_keys: Sequence[str], validate: bool = True
     ) -> tuple[Sequence[PersistedTimeWindow], int]:
-        """Merges a set of partition keys into an existing set of time windows, returning the
+        """Merges a set of partition keys into the included time windows, returning the
         minimized set of time windows and the number of partitions added.
         """
-        result_windows = [*initial_windows]
         time_windows = cast(
             "TimeWindowPartitionsDefinition", self.partitions_def
         ).time_windows_for_partition_keys(frozenset(partition_keys), validate=validate)
 
-        num_added_partitions = 0
-        for window in sorted(time_windows, key=lambda tw: tw.start.timestamp()):
+        new_windows: dict[float, PersistedTimeWindow] = {}
+        for window in time_windows:
             window_start_timestamp = window.start.timestamp()
-            # go in reverse order because it's more common to add partitions at the end than the
-            # beginning
-            for i in reversed(range(len(result_windows))):
-                included_window = result_windows[i]
-                lt_end_of_range = window_start_timestamp < included_window.end_timestamp
-                gte_start_of_range = window_start_timestamp >= included_window.start_timestamp
-
-                if lt_end_of_range and gte_start_of_range:
-                    break
-
-                if not lt_end_of_range:
-                    merge_with_range = included_window.end_timestamp == window_start_timestamp
-                    merge_with_later_range = i + 1 < len(result_windows) and (
-                        window.end.timestamp() == result_windows[i + 1].start_timestamp
-                    )
-
-                    if merge_with_range and merge_with_later_range:
-                        result_windows[i] = PersistedTimeWindow.from_public_time_window(
-                            TimeWindow(included_window.start, result_windows[i + 1].end),
-                            self.partitions_def.timezone,
-                        )
-                        del result_windows[i + 1]
-                    elif merge_with_range:
-                        result_windows[i] = PersistedTimeWindow.from_public_time_window(
-                            TimeWindow(included_window.start, window.end),
-                            self.partitions_def.timezone,
-                        )
-                    elif merge_with_later_range:
-                        result_windows[i + 1] = PersistedTimeWindow.from_public_time_window(
-                            TimeWindow(window.start, result_windows[i + 1].end),
-                            self.partitions_def.timezone,
-                        )
-                    else:
-                        result_windows.insert(
-                            i + 1,
-                            PersistedTimeWindow.from_public_time_window(
-                                window, self.partitions_def.timezone
-                            ),
-                        )
-
-                    num_added_partitions += 1
-                    break
-            else:
-                if result_windows and window_start_timestamp == result_windows[0].start_timestamp:
-                    result_windows[0] = PersistedTimeWindow.from_public_time_window(
-                        TimeWindow(window.start, included_window.end),  # pyright: ignore[reportPossiblyUnboundVariable]
-                        self.partitions_def.timezone,
-                    )
-                elif result_windows and window.end.timestamp() == result_windows[0].start_timestamp:
-                    result_windows[0] = PersistedTimeWindow.from_public_time_window(
-                        TimeWindow(window.start, included_window.end),  # pyright: ignore[reportPossiblyUnboundVariable]
-                        self.partitions_def.timezone,
-                    )
-                else:
-                    result_windows.insert(
-                        0,
-                        PersistedTimeWindow.from_public_time_window(
-                            window,
-                            self.partitions_def.timezone,
-                        ),
-                    )
+            if not self._contains_timestamp(window_start_timestamp):
+                new_windows[window_start_timestamp] = PersistedTimeWindow.from_public_time_window(
+                    window, self.partitions_def.timezone
+                )
 
-                num_added_partitions += 1
+        if not new_windows:
+            return self.included_time_windows, 0
 
-        return result_windows, num_added_partitions
+        result_windows = _merge_sorted_time_windows(
+            heapq.merge(
+                self._sorted_time_windows,
+                sorted(new_windows.values(), key=lambda tw: tw.start_timestamp),
+                key=lambda tw: tw.start_timestamp,
+            ),
+            self.partitions_def.timezone,
+        )
+        return result_windows, len(new_windows)
 
     @public
     def get_partition_keys(self) -> Iterable[str]:
@@ -369,7 +363,7 @@ def with_partition_keys(
         self, partition_keys: Iterable[str], validate: bool = True
     ) -> "TimeWindowPartitionsSubset":
         result_windows, added_partitions = self._add_partitions_to_time_windows(
-            self.included_time_windows, list(partition_keys), validate=validate
+            list(partition_keys), validate=validate
         )
 
         return TimeWindowPartitionsSubset(
@@ -412,12 +406,8 @@ def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if not isinstance(other, TimeWindowPartitionsSubset):
             return super().__and__(other)
 
-        self_time_windows_iter = iter(
-            sorted(self.included_time_windows, key=lambda tw: tw.start_timestamp)
-        )
-        other_time_windows_iter = iter(
-            sorted(other.included_time_windows, key=lambda tw: tw.start_timestamp)
-        )
+        self_time_windows_iter = iter(self._sorted_time_windows)
+        other_time_windows_iter = iter(other._sorted_time_windows)
 
         result_windows = []
         self_window = next(self_time_windows_iter, None)
@@ -453,21 +443,14 @@ def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if not isinstance(other, TimeWindowPartitionsSubset):
             return super().__or__(other)
 
-        input_time_windows = sorted(
-            [*self.included_time_windows, *other.included_time_windows],
-            key=lambda tw: tw.start_timestamp,
+        result_windows = _merge_sorted_time_windows(
+            heapq.merge(
+                self._sorted_time_windows,
+                other._sorted_time_windows,
+                key=lambda tw: tw.start_timestamp,
+            ),
+            self.partitions_def.timezone,
         )
-        result_windows = [input_time_windows[0]] if len(input_time_windows) > 0 else []
-        for window in input_time_windows[1:]:
-            latest_window = result_windows[-1]
-            if window.start_timestamp <= latest_window.end_timestamp:
-                # merge this window with the latest window
-                result_windows[-1] = PersistedTimeWindow.from_public_time_window(
-                    TimeWindow(latest_window.start, max(latest_window.end, window.end)),
-                    self.partitions_def.timezone,
-                )
-            else:
-                result_windows.append(window)
 
         return TimeWindowPartitionsSubset(
             partitions_def=self.partitions_def,
@@ -480,45 +463,51 @@ def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if not isinstance(other, TimeWindowPartitionsSubset):
             return super().__sub__(other)
 
-        time_windows = sorted(self.included_time_windows, key=lambda tw: tw.start_timestamp)
-        other_time_windows = sorted(other.included_time_windows, key=lambda tw: tw.start_timestamp)
-
-        next_time_window_index_to_process = 0
-        next_other_window_index_to_process = 0
-
-        # Slide through both sets of windows, moving to the next window once its start has passed
-        # the end of the window is it being compared to
-        while (next_time_window_index_to_process < len(time_windows)) and (
-            next_other_window_index_to_process < len(other_time_windows)
-        ):
-            time_window = time_windows[next_time_window_index_to_process]
-            other_time_window = other_time_windows[next_other_window_index_to_process]
-
-            # Perform the subtraction and splice the 0, 1, or 2 result windows
-            # back into the time_windows list
-
-            subtracted_time_windows = time_window.subtract(other_time_window)
-
-            time_windows[
-                next_time_window_index_to_process : next_time_window_index_to_process + 1
-            ] = subtracted_time_windows
+        timezone = self.partitions_def.timezone
+        other_time_windows = other._sorted_time_windows
+
+        time_windows: list[PersistedTimeWindow] = []
+        # index of the first window of other that may intersect the current window. both sets of
+        # windows are sorted and disjoint, so this only ever moves forwards
+        other_idx = 0
+        for time_window in self._sorted_time_windows:
+            start_timestamp = time_window.start_timestamp
+            end_timestamp = time_window.end_timestamp
+            while (
+                other_idx < len(other_time_windows)
+                and other_time_windows[other_idx].end_timestamp <= start_timestamp
+            ):
+                other_idx += 1
+
+            remaining_start_timestamp = start_timestamp
+            idx = other_idx
+            while (
+                idx < len(other_time_windows)
+                and other_time_windows[idx].start_timestamp < end_timestamp
+            ):
+                other_time_window = other_time_windows[idx]
+                if other_time_window.start_timestamp > remaining_start_timestamp:
+                    time_windows.append(
+                        PersistedTimeWindow(
+                            TimestampWithTimezone(remaining_start_timestamp, timezone),
+                            TimestampWithTimezone(other_time_window.start_timestamp, timezone),
+                        )
+                    )
+                remaining_start_timestamp = max(
+                    remaining_start_timestamp, other_time_window.end_timestamp
+                )
+                idx += 1
 
-            if len(subtracted_time_windows) == 0:
-                # other_time_window fully consumed time_window
-                # next_time_window_index_to_process can stay the same since everything has shifted over one
-                pass
-            else:
-                updated_time_window = time_windows[next_time_window_index_to_process]
-                if updated_time_window.end_timestamp <= other_time_window.start_timestamp:
-                    # Current subtractor is too early to intersect, can advance
-                    next_time_window_index_to_process += 1
-                elif other_time_window.end_timestamp <= updated_time_window.start_timestamp:
-                    # current subtractee is too early to intersect, can advance
-                    next_other_window_index_to_process += 1
-                else:
-                    check.failed(
-                        "After subtraction, the new window should no longer intersect with the other window"
+            if remaining_start_timestamp == start_timestamp:
+                # no overlap with other
+                time_windows.append(time_window)
+            elif remaining_start_timestamp < end_timestamp:
+                time_windows.append(
+                    PersistedTimeWindow(
+                        TimestampWithTimezone(remaining_start_timestamp, timezone),
+                        TimestampWithTimezone(end_timestamp, timezone),
                     )
+                )
 
         return TimeWindowPartitionsSubset(
             partitions_def=self.partitions_def,
@@ -538,13 +527,7 @@ def __contains__(self, partition_key: Optional[str]) -> bool:  # pyright: ignore
             # invalid partition key
             return False
 
-        time_window_start_timestamp = time_window.start.timestamp()
-
-        return any(
-            time_window_start_timestamp >= included_time_window.start_timestamp
-            and time_window_start_timestamp < included_time_window.end_timestamp
-            for included_time_window in self.included_time_windows
-        )
+        return self._contains_timestamp(time_window.start.timestamp())
 
     def __len__(self) -> int:
         return self.num_partitions
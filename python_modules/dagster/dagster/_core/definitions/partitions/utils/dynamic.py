@@ -1,10 +1,128 @@
-from collections.abc import Sequence
-from typing import Optional
+import threading
+from collections.abc import Iterator, Sequence
+from typing import AbstractSet, NamedTuple, Optional  # noqa: UP035
 
 from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
 from dagster._core.types.pagination import PaginatedResults
 from dagster._utils.cached_method import cached_method
 
+# the number of partition keys fetched per query when streaming the keys of a dynamic partitions
+# definition from storage
+DYNAMIC_PARTITIONS_PAGE_SIZE = 10000
+
+
+def iterate_paginated_dynamic_partitions(
+    dynamic_partitions_store: DynamicPartitionsStore,
+    partitions_def_name: str,
+    cursor: Optional[str] = None,
+    page_size: int = DYNAMIC_PARTITIONS_PAGE_SIZE,
+) -> Iterator[PaginatedResults[str]]:
+    """Yields successive pages of the partition keys of a dynamic partitions definition, in the
+    order they were added, starting after the given cursor. The cursor of the last page can be
+    used to fetch only the partition keys which were added after it.
+    """
+    while True:
+        page = dynamic_partitions_store.get_paginated_dynamic_partitions(
+            partitions_def_name=partitions_def_name,
+            limit=page_size,
+            ascending=True,
+            cursor=cursor,
+        )
+        yield page
+        if not page.has_more:
+            return
+        cursor = page.cursor
+
+
+class DynamicPartitionsMembership(NamedTuple):
+    """The partition keys of a dynamic partitions definition, along with the pagination cursor
+    after the last key that was loaded.
+    """
+
+    partition_keys: Sequence[str]
+    partition_keys_set: AbstractSet[str]
+    cursor: str
+
+
+class DynamicPartitionsMembershipCache:
+    """Caches the partition keys of dynamic partitions definitions across evaluations.
+
+    Each time the partition keys of a definition are requested, only the keys added since they
+    were last loaded are fetched from storage. If the number of stored keys shows that keys have
+    been deleted in the meantime, all keys are reloaded.
+    """
+
+    def __init__(self, page_size: int = DYNAMIC_PARTITIONS_PAGE_SIZE):
+        self._page_size = page_size
+        self._lock = threading.Lock()
+        self._memberships: dict[str, DynamicPartitionsMembership] = {}
+
+    def get_membership(
+        self, instance: DagsterInstance, partitions_def_name: str
+    ) -> DynamicPartitionsMembership:
+        with self._lock:
+            cached_membership = self._memberships.get(partitions_def_name)
+
+        membership = (
+            self._load_new_partitions(instance, partitions_def_name, cached_membership)
+            if cached_membership is not None
+            else None
+        )
+        if membership is None:
+            membership = self._load_all_partitions(instance, partitions_def_name)
+
+        with self._lock:
+            self._memberships[partitions_def_name] = membership
+        return membership
+
+    def _load_all_partitions(
+        self, instance: DagsterInstance, partitions_def_name: str
+    ) -> DynamicPartitionsMembership:
+        partition_keys = []
+        cursor = None
+        for page in iterate_paginated_dynamic_partitions(
+            instance, partitions_def_name, page_size=self._page_size
+        ):
+            partition_keys.extend(page.results)
+            cursor = page.cursor
+
+        return DynamicPartitionsMembership(
+            partition_keys=partition_keys,
+            partition_keys_set=set(partition_keys),
+            cursor=cursor or "",
+        )
+
+    def _load_new_partitions(
+        self,
+        instance: DagsterInstance,
+        partitions_def_name: str,
+        membership: DynamicPartitionsMembership,
+    ) -> Optional[DynamicPartitionsMembership]:
+        """Returns the given membership updated with the partition keys added since it was loaded,
+        or None if any of its partition keys may have been deleted.
+        """
+        new_partition_keys = []
+        cursor = membership.cursor
+        for page in iterate_paginated_dynamic_partitions(
+            instance, partitions_def_name, cursor=cursor or None, page_size=self._page_size
+        ):
+            new_partition_keys.extend(page.results)
+            cursor = page.cursor
+
+        if instance.get_dynamic_partitions_count(partitions_def_name) != len(
+            membership.partition_keys
+        ) + len(new_partition_keys):
+            return None
+
+        if not new_partition_keys:
+            return membership
+
+        return DynamicPartitionsMembership(
+            partition_keys=[*membership.partition_keys, *new_partition_keys],
+            partition_keys_set=membership.partition_keys_set | set(new_partition_keys),
+            cursor=cursor,
+        )
+
 
 class CachingDynamicPartitionsLoader(DynamicPartitionsStore):
     """A batch loader that caches the partition keys for a given dynamic partitions definition,
@@ -15,8 +133,13 @@ def __init__(self, instance: DagsterInstance):
         self._instance = instance
 
     @cached_method
+    def _get_membership(self, partitions_def_name: str) -> DynamicPartitionsMembership:
+        return self._instance.dynamic_partitions_membership_cache.get_membership(
+            self._instance, partitions_def_name
+        )
+
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
-        return self._instance.get_dynamic_partitions(partitions_def_name)
+        return self._get_membership(partitions_def_name).partition_keys
 
     @cached_method
     def get_paginated_dynamic_partitions(
@@ -26,6 +149,5 @@ def get_paginated_dynamic_partitions(
             partitions_def_name=partitions_def_name, limit=limit, ascending=ascending, cursor=cursor
         )
 
-    @cached_method
     def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> bool:
-        return self._instance.has_dynamic_partition(partitions_def_name, partition_key)
+        return partition_key in self._get_membership(partitions_def_name).partition_keys_set
@@ -0,0 +1,187 @@
+import re
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from dagster._core.definitions.partitions.schedule_type import ScheduleType
+from dagster._time import datetime_from_timestamp, get_timezone
+from dagster._utils.cronstring import get_fixed_minute_interval
+from dagster._utils.schedules import (
+    MAX_DAY_OF_MONTH_WITH_GUARANTEED_MONTHLY_INTERVAL,
+    cron_string_iterator,
+)
+
+_SECONDS_PER_HOUR = 3600
+
+
+def _get_calendar_schedule_type(cron_schedule: str) -> Optional[ScheduleType]:
+    if re.fullmatch(r"\d+ \d+ \* \* \*", cron_schedule):
+        return ScheduleType.DAILY
+    elif re.fullmatch(r"\d+ \d+ \* \* \d+", cron_schedule):
+        return ScheduleType.WEEKLY
+    elif (match := re.fullmatch(r"\d+ \d+ (\d+) \* \*", cron_schedule)) and 0 < int(
+        match.group(1)
+    ) <= MAX_DAY_OF_MONTH_WITH_GUARANTEED_MONTHLY_INTERVAL:
+        return ScheduleType.MONTHLY
+    return None
+
+
+class RegularCronSchedule:
+    """Closed-form arithmetic over the ticks of a cron schedule which has a fixed structure, so
+    that converting between tick indexes and timestamps does not require iterating over every tick
+    in between.
+
+    Tick 0 is the anchor, the first tick of the schedule at or after the start timestamp it was
+    created with. Negative indexes refer to ticks before the anchor.
+
+    Two kinds of schedules are supported, matching the special-cased schedules in
+    `cron_string_iterator`:
+
+    - Hourly and every-n-minutes schedules, whose ticks are a fixed number of seconds apart
+      (including across DST transitions).
+    - Daily, weekly and monthly schedules (for days of the month that exist in every month), which
+      tick exactly once per local calendar day, week or month. The date of a tick is computed
+      directly, and the time of day on that date is resolved with a bounded number of steps of
+      `cron_string_iterator`, so that DST transitions are handled identically.
+
+    All other schedules return None from `for_cron_schedule`, and callers must fall back to
+    iterating over ticks.
+    """
+
+    def __init__(
+        self,
+        cron_schedule: str,
+        timezone: str,
+        anchor: datetime,
+        interval_seconds: Optional[int],
+        schedule_type: Optional[ScheduleType],
+    ):
+        self._cron_schedule = cron_schedule
+        self._timezone = timezone
+        self._tzinfo = get_timezone(timezone)
+        self._anchor_timestamp = anchor.timestamp()
+        self._anchor_date = anchor.date()
+        self._interval_seconds = interval_seconds
+        self._schedule_type = schedule_type
+        if schedule_type is not None:
+            minute, hour = cron_schedule.split(" ")[:2]
+            self._minute, self._hour = int(minute), int(hour)
+
+    @staticmethod
+    def for_cron_schedule(
+        cron_schedule: str, timezone: str, start_timestamp: float
+    ) -> Optional["RegularCronSchedule"]:
+        interval_seconds = None
+        schedule_type = None
+        if re.fullmatch(r"\d+ \* \* \* \*", cron_schedule):
+            interval_seconds = _SECONDS_PER_HOUR
+        elif fixed_minute_interval := get_fixed_minute_interval(cron_schedule):
+            interval_seconds = fixed_minute_interval * 60
+        else:
+            schedule_type = _get_calendar_schedule_type(cron_schedule)
+            if schedule_type is None:
+                return None
+
+        anchor = next(
+            tick
+            for tick in cron_string_iterator(start_timestamp, cron_schedule, timezone)
+            if tick.timestamp() >= start_timestamp
+        )
+        return RegularCronSchedule(
+            cron_schedule=cron_schedule,
+            timezone=timezone,
+            anchor=anchor,
+            interval_seconds=interval_seconds,
+            schedule_type=schedule_type,
+        )
+
+    def _get_date_for_index(self, index: int) -> date:
+        if self._schedule_type == ScheduleType.DAILY:
+            return self._anchor_date + timedelta(days=index)
+        elif self._schedule_type == ScheduleType.WEEKLY:
+            return self._anchor_date + timedelta(weeks=index)
+        else:
+            year, month = divmod(self._anchor_date.month - 1 + index, 12)
+            return date(self._anchor_date.year + year, month + 1, self._anchor_date.day)
+
+    def _get_index_for_date(self, tick_date: date) -> int:
+        if self._schedule_type == ScheduleType.DAILY:
+            return (tick_date - self._anchor_date).days
+        elif self._schedule_type == ScheduleType.WEEKLY:
+            return (tick_date - self._anchor_date).days // 7
+        else:
+            return (tick_date.year - self._anchor_date.year) * 12 + (
+                tick_date.month - self._anchor_date.month
+            )
+
+    def get_tick(self, index: int) -> datetime:
+        """Returns the tick with the given index."""
+        if self._interval_seconds is not None:
+            return datetime_from_timestamp(
+                self._anchor_timestamp + index * self._interval_seconds, self._tzinfo
+            )
+
+        tick_date = self._get_date_for_index(index)
+        tick = datetime(
+            tick_date.year,
+            tick_date.month,
+            tick_date.day,
+            self._hour,
+            self._minute,
+            tzinfo=self._tzinfo,
+        )
+        if tick.replace(fold=1).utcoffset() == tick.utcoffset():
+            # the time of day is not repeated on this date, so if it also exists (i.e. it
+            # survives a round trip through its timestamp), it is the tick
+            tick = datetime_from_timestamp(tick.timestamp(), self._tzinfo)
+            if (tick.hour, tick.minute) == (self._hour, self._minute):
+                return tick
+
+        # start from the beginning of the previous day so that DST transitions around midnight
+        # can not cause the tick to be skipped
+        search_start = datetime(
+            tick_date.year, tick_date.month, tick_date.day, tzinfo=self._tzinfo
+        ) - timedelta(days=1)
+        for tick in cron_string_iterator(
+            search_start.timestamp(), self._cron_schedule, self._timezone
+        ):
+            if tick.date() >= tick_date:
+                return tick
+        raise Exception("unreachable")
+
+    def get_index_at_or_before(self, timestamp: float) -> int:
+        """Returns the index of the latest tick which is at or before the given timestamp."""
+        if self._interval_seconds is not None:
+            return int((timestamp - self._anchor_timestamp) // self._interval_seconds)
+
+        tick = next(
+            cron_string_iterator(timestamp, self._cron_schedule, self._timezone, ascending=False)
+        )
+        return self._get_index_for_date(tick.date())
+
+    def get_index_at_or_after(self, timestamp: float) -> int:
+        """Returns the index of the earliest tick which is at or after the given timestamp."""
+        index = self.get_index_at_or_before(timestamp)
+        if self.get_tick(index).timestamp() < timestamp:
+            return index + 1
+        return index
+
+    def iterate_ticks(self, start_index: int, end_index: int) -> Iterator[datetime]:
+        """Yields the ticks with indexes from start_index (inclusive) to end_index (exclusive)."""
+        if end_index <= start_index:
+            return
+
+        if self._interval_seconds is not None:
+            # compute each tick directly from its index rather than stepping from the previous
+            # tick, which avoids accumulating any error across long ranges
+            for index in range(start_index, end_index):
+                yield datetime.fromtimestamp(
+                    self._anchor_timestamp + index * self._interval_seconds, self._tzinfo
+                )
+            return
+
+        ticks = cron_string_iterator(
+            self.get_tick(start_index).timestamp(), self._cron_schedule, self._timezone
+        )
+        for _ in range(end_index - start_index):
+            yield next(ticks)
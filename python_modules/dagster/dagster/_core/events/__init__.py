@@ -59,6 +59,7 @@
 from dagster._core.execution.plan.inputs import StepInputData
 from dagster._core.execution.plan.objects import StepFailureData, StepRetryData, StepSuccessData
 from dagster._core.execution.plan.outputs import StepOutputData
+from dagster._core.execution.step_profiler import StepProfile
 from dagster._core.log_manager import DagsterLogManager
 from dagster._core.storage.compute_log_manager import CapturedLogContext, LogRetrievalShellCommand
 from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus
@@ -1907,12 +1908,14 @@ class EngineEventData(
             ("error", Optional[SerializableErrorInfo]),
             ("marker_start", Optional[str]),
             ("marker_end", Optional[str]),
+            ("step_profile", Optional[StepProfile]),
         ],
     )
 ):
     # serdes log
     # * added optional error
     # * added marker_start / marker_end
+    # * added optional step_profile
     #
     def __new__(
         cls,
@@ -1920,6 +1923,7 @@ def __new__(
         error: Optional[SerializableErrorInfo] = None,
         marker_start: Optional[str] = None,
         marker_end: Optional[str] = None,
+        step_profile: Optional[StepProfile] = None,
     ):
         return super().__new__(
             cls,
@@ -1931,6 +1935,7 @@ def __new__(
             ),
             marker_start=check.opt_str_param(marker_start, "marker_start"),
             marker_end=check.opt_str_param(marker_end, "marker_end"),
+            step_profile=check.opt_inst_param(step_profile, "step_profile", StepProfile),
         )
 
     @staticmethod
@@ -1973,6 +1978,10 @@ def interrupted(steps_interrupted: Sequence[str]) -> "EngineEventData":
     def engine_error(error: SerializableErrorInfo) -> "EngineEventData":
         return EngineEventData(metadata={}, error=error)
 
+    @staticmethod
+    def step_profiled(step_profile: StepProfile) -> "EngineEventData":
+        return EngineEventData(metadata=step_profile.to_metadata(), step_profile=step_profile)
+
 
 @whitelist_for_serdes(storage_name="PipelineFailureData")
 class JobFailureData(
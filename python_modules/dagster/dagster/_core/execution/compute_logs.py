@@ -1,14 +1,19 @@
 import io
 import os
 import random
+import select
+import selectors
 import string
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import uuid
 import warnings
+from collections.abc import Callable
 from contextlib import contextmanager
+from typing import Optional
 
 from dagster_shared.ipc import interrupt_ipc_subprocess, open_ipc_subprocess
 from dagster_shared.seven import IS_WINDOWS
@@ -35,10 +40,22 @@ def redirect_to_file(stream, filepath):
 
 
 @contextmanager
-def mirror_stream_to_file(stream, filepath):
+def mirror_stream_to_file(stream, filepath, on_write: Optional[Callable[[], None]] = None):
+    """Capture everything written to the file descriptor backing `stream` into `filepath`, while
+    still mirroring it to the original destination.
+
+    On posix, the stream is redirected into a pipe that is drained by a single background thread
+    shared by every capture in the process (see `ComputeLogPump`), so no helper processes are
+    spawned. `on_write` is invoked from that thread whenever new output has been written to the
+    file; it must not write to the captured stream itself.
+    """
     ensure_file(filepath)
-    with tail_to_stream(filepath, stream) as pids:
-        with redirect_to_file(stream, filepath):
+    if IS_WINDOWS:
+        with tail_to_stream(filepath, stream) as pids:
+            with redirect_to_file(stream, filepath):
+                yield pids
+    else:
+        with pump_stream_to_file(stream, filepath, on_write=on_write) as pids:
             yield pids
 
 
@@ -79,6 +96,258 @@ def redirect_stream(to_stream=os.devnull, from_stream=sys.stdout):
             os.dup2(copied.fileno(), from_fd)
 
 
+# upper bound on the size of each read from a capture pipe, and therefore on each write to the
+# capture file and mirrored stream
+COMPUTE_LOG_PUMP_CHUNK_SIZE = 64 * 1024
+
+# how long to wait for the pump to drain a capture pipe when the capture exits
+COMPUTE_LOG_PUMP_DRAIN_TIMEOUT = 30
+
+
+class _PumpedStream:
+    def __init__(
+        self,
+        read_fd: int,
+        file_fd: int,
+        mirror_fd: Optional[int],
+        forward_to: Optional["_PumpedStream"],
+        on_write: Optional[Callable[[], None]],
+    ):
+        self.read_fd = read_fd
+        self.file_fd: Optional[int] = file_fd
+        self.mirror_fd = mirror_fd
+        self.forward_to = forward_to
+        self.on_write = on_write
+        self.pipe_id = _fd_identity(read_fd)
+        self.drain_requested = False
+        self.drained = threading.Event()
+        self.closed = False
+
+
+class ComputeLogPump:
+    """Drains the pipes of all active stdout/stderr captures in the process from a single thread.
+
+    Each capture points its stream's file descriptor at the write end of a pipe. The pump reads
+    from the read ends in chunks of at most `COMPUTE_LOG_PUMP_CHUNK_SIZE` bytes, appends each chunk
+    to the capture file, and mirrors it to the stream's original destination. When a capture
+    exits, the pump drains whatever this process has written and signals the capture. The pipe is
+    kept open until EOF so that output from subprocesses that outlive the capture still lands in
+    the capture file.
+
+    Since a stalled pump would block every process writing to a captured stream, the pump never
+    blocks on its outputs: a capture file that can no longer be written to is dropped while the
+    capture keeps being drained and mirrored, and output which does not fit into a full mirrored
+    destination is discarded.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._selector = selectors.DefaultSelector()
+        self._wake_read_fd, self._wake_write_fd = os.pipe()
+        os.set_blocking(self._wake_read_fd, False)
+        os.set_blocking(self._wake_write_fd, False)
+        self._selector.register(self._wake_read_fd, selectors.EVENT_READ)
+        self._streams: dict[int, _PumpedStream] = {}
+        self._thread = threading.Thread(target=self._run, name="compute-log-pump", daemon=True)
+        self._thread.start()
+
+    def register(
+        self,
+        read_fd: int,
+        file_fd: int,
+        mirror_fd: Optional[int],
+        on_write: Optional[Callable[[], None]] = None,
+    ) -> _PumpedStream:
+        os.set_blocking(read_fd, False)
+        with self._lock:
+            # If the mirrored destination is itself a pipe owned by this pump (i.e. captures are
+            # nested), hand chunks over in memory rather than writing into a pipe that only this
+            # thread can drain.
+            mirror_id = _fd_identity(mirror_fd) if mirror_fd is not None else None
+            forward_to = next(
+                (
+                    pumped
+                    for pumped in self._streams.values()
+                    if mirror_id is not None and pumped.pipe_id == mirror_id
+                ),
+                None,
+            )
+            pumped = _PumpedStream(read_fd, file_fd, mirror_fd, forward_to, on_write)
+            self._streams[read_fd] = pumped
+            self._selector.register(read_fd, selectors.EVENT_READ, pumped)
+        self._wake()
+        return pumped
+
+    def drain(self, pumped: _PumpedStream, timeout: float = COMPUTE_LOG_PUMP_DRAIN_TIMEOUT) -> None:
+        """Block until everything written to the capture pipe so far has been pumped."""
+        pumped.drained.clear()
+        if pumped.closed:
+            # the pipe reached EOF, so there is nothing left to drain
+            pumped.drained.set()
+            return
+        pumped.drain_requested = True
+        self._wake()
+        if threading.current_thread() is not self._thread:
+            pumped.drained.wait(timeout)
+
+    def _wake(self) -> None:
+        try:
+            os.write(self._wake_write_fd, b"\0")
+        except BlockingIOError:
+            # already awake
+            pass
+
+    def _run(self) -> None:
+        while True:
+            for key, _ in self._selector.select():
+                if key.fd == self._wake_read_fd:
+                    self._clear_wake()
+                else:
+                    self._pump(key.data)
+
+            with self._lock:
+                to_drain = [pumped for pumped in self._streams.values() if pumped.drain_requested]
+            for pumped in to_drain:
+                self._pump(pumped, until_empty=True)
+                pumped.drain_requested = False
+                pumped.drained.set()
+
+    def _clear_wake(self) -> None:
+        try:
+            while os.read(self._wake_read_fd, COMPUTE_LOG_PUMP_CHUNK_SIZE):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _pump(self, pumped: _PumpedStream, until_empty: bool = False) -> None:
+        while not pumped.closed:
+            try:
+                chunk = os.read(pumped.read_fd, COMPUTE_LOG_PUMP_CHUNK_SIZE)
+            except BlockingIOError:
+                return
+            except OSError:
+                chunk = b""
+
+            if not chunk:
+                self._close(pumped)
+                return
+
+            self._deliver(pumped, chunk)
+            if not until_empty:
+                return
+
+    def _deliver(self, pumped: _PumpedStream, chunk: bytes) -> None:
+        if pumped.file_fd is not None:
+            try:
+                _write_fully(pumped.file_fd, chunk)
+            except OSError:
+                # e.g. the disk is full, keep draining and mirroring the stream without the file
+                _close_fd(pumped.file_fd)
+                pumped.file_fd = None
+        if pumped.forward_to and not pumped.forward_to.closed:
+            self._deliver(pumped.forward_to, chunk)
+        elif pumped.mirror_fd is not None:
+            try:
+                _write_without_blocking(pumped.mirror_fd, chunk)
+            except OSError:
+                # the mirrored destination went away, keep capturing to the file
+                _close_fd(pumped.mirror_fd)
+                pumped.mirror_fd = None
+        if pumped.on_write:
+            try:
+                pumped.on_write()
+            except Exception:
+                pass
+
+    def _close(self, pumped: _PumpedStream) -> None:
+        with self._lock:
+            self._selector.unregister(pumped.read_fd)
+            del self._streams[pumped.read_fd]
+        pumped.closed = True
+        for fd in (pumped.read_fd, pumped.file_fd, pumped.mirror_fd):
+            if fd is not None:
+                _close_fd(fd)
+        pumped.drained.set()
+
+
+_PUMP_LOCK = threading.Lock()
+_PUMP: Optional[ComputeLogPump] = None
+_PUMP_PID: Optional[int] = None
+
+
+def get_compute_log_pump() -> ComputeLogPump:
+    global _PUMP, _PUMP_PID  # noqa: PLW0603
+
+    with _PUMP_LOCK:
+        # the pump thread does not survive a fork, so each process gets its own
+        if _PUMP is None or _PUMP_PID != os.getpid():
+            _PUMP = ComputeLogPump()
+            _PUMP_PID = os.getpid()
+        return _PUMP
+
+
+@contextmanager
+def pump_stream_to_file(stream, filepath, on_write: Optional[Callable[[], None]] = None):
+    from_fd = _fileno(stream)
+    if not from_fd or should_disable_io_stream_redirect():
+        yield (None, None)
+        return
+
+    pump = get_compute_log_pump()
+    read_fd, write_fd = os.pipe()
+    file_fd = os.open(filepath, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    mirror_fd = os.dup(from_fd)
+    pumped = pump.register(read_fd, file_fd, os.dup(mirror_fd), on_write=on_write)
+
+    stream.flush()
+    os.dup2(write_fd, from_fd)
+    os.close(write_fd)
+    try:
+        yield (None, None)
+    finally:
+        stream.flush()
+        os.dup2(mirror_fd, from_fd)
+        os.close(mirror_fd)
+        pump.drain(pumped)
+
+
+def _fd_identity(fd: int) -> Optional[tuple[int, int]]:
+    try:
+        stat = os.fstat(fd)
+    except OSError:
+        return None
+    return (stat.st_dev, stat.st_ino)
+
+
+def _write_fully(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _write_without_blocking(fd: int, data: bytes) -> None:
+    # The mirrored fd shares its file status flags with the original stream, so it cannot be made
+    # non-blocking without affecting the stream once the capture exits. Instead, only write as much
+    # as the destination reports it can take without blocking, in chunks no larger than the
+    # atomic pipe write size, and drop the rest.
+    poller = select.poll()
+    poller.register(fd, select.POLLOUT)
+    view = memoryview(data)
+    while view:
+        if not poller.poll(0):
+            return
+        written = os.write(fd, view[: select.PIPE_BUF])
+        view = view[written:]
+
+
+def _close_fd(fd: int) -> None:
+    try:
+        os.close(fd)
+    except OSError:
+        pass
+
+
 @contextmanager
 def tail_to_stream(path, stream):
     if IS_WINDOWS:
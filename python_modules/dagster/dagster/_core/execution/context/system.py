@@ -942,6 +942,46 @@ def get_output_asset_keys(self) -> AbstractSet[AssetKey]:
             output_keys.add(asset_key)
         return output_keys
 
+    @cached_property
+    def is_step_result_cacheable(self) -> bool:
+        """Whether the outputs of this step can be reused from a prior materialization with the
+        same step result cache key. Only steps that materialize nothing but assets with explicit
+        code versions, for at most a single partition and without intra-step asset dependencies,
+        qualify.
+        """
+        from dagster._core.definitions.assets.definition.asset_spec import AssetExecutionType
+        from dagster._core.execution.memoization import is_step_result_cache_enabled
+        from dagster._core.storage.dagster_run import assets_are_externally_managed
+
+        if (
+            not is_step_result_cache_enabled(self.dagster_run)
+            or not self.is_sda_step
+            or self.is_op_in_graph
+            or assets_are_externally_managed(self.dagster_run)
+            or (self.has_partitions and not self.has_partition_key)
+        ):
+            return False
+
+        assets_def = self.assets_def
+        if assets_def is None or assets_def.execution_type != AssetExecutionType.MATERIALIZATION:
+            return False
+
+        asset_layer = self.job_def.asset_layer
+        output_asset_keys = self.get_output_asset_keys()
+        for step_output in self.step.step_outputs:
+            if step_output.is_dynamic:
+                return False
+            asset_key = asset_layer.get_asset_key_for_node_output(
+                self.node_handle, step_output.name
+            )
+            if asset_key is None or asset_key not in output_asset_keys:
+                return False
+            asset_node = asset_layer.get(asset_key)
+            if asset_node.code_version is None or asset_node.parent_keys & output_asset_keys:
+                return False
+
+        return True
+
     @cached_property
     def run_partitions_def(self) -> Optional[PartitionsDefinition]:
         job_def_partitions_def = self.job_def.partitions_def
@@ -1,7 +1,16 @@
+import json
+from collections.abc import Mapping
+from hashlib import sha256
+from typing import Any, Optional
+
 import dagster._check as check
+from dagster._core.definitions.data_version import DataVersion
+from dagster._core.definitions.events import AssetKey
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.execution.context.system import IPlanContext
 from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.storage.dagster_run import DagsterRun
+from dagster._core.storage.tags import STEP_RESULT_CACHE_TAG
 
 
 def validate_reexecution_memoization(
@@ -25,3 +34,50 @@ def validate_reexecution_memoization(
         " a persistent io manager, such as the fs_io_manager, in the resource_defs argument on your"
         ' job: resource_defs={"io_manager": fs_io_manager}'
     )
+
+
+def is_step_result_cache_enabled(dagster_run: DagsterRun) -> bool:
+    """Whether the run has opted into reusing prior materializations of unchanged asset steps."""
+    return dagster_run.tags.get(STEP_RESULT_CACHE_TAG, "").lower() == "true"
+
+
+def compute_step_result_cache_key(
+    code_version: str,
+    input_data_versions: Mapping[AssetKey, DataVersion],
+    partition_key: Optional[str],
+    op_config: Any,
+) -> str:
+    """Compute a content-addressed key identifying the result of materializing an asset.
+
+    Two materializations with the same key were produced by the same code version, from inputs with
+    the same data versions, for the same partition and with the same config, so the stored result
+    of one can stand in for the other.
+    """
+    check.str_param(code_version, "code_version")
+    check.mapping_param(
+        input_data_versions, "input_data_versions", key_type=AssetKey, value_type=DataVersion
+    )
+    check.opt_str_param(partition_key, "partition_key")
+
+    hash_sig = sha256()
+    hash_sig.update(
+        bytearray(
+            json.dumps(
+                {
+                    "code_version": code_version,
+                    "input_data_versions": {
+                        key.to_user_string(): version.value
+                        for key, version in sorted(
+                            input_data_versions.items(), key=lambda item: str(item[0])
+                        )
+                    },
+                    "partition_key": partition_key,
+                    "config": op_config,
+                },
+                sort_keys=True,
+                default=str,
+            ),
+            "utf8",
+        )
+    )
+    return hash_sig.hexdigest()
@@ -1,6 +1,8 @@
+import asyncio
 import inspect
-from collections.abc import AsyncIterator, Iterator, Mapping, Sequence
-from typing import Any, TypeVar, Union
+from asyncio import AbstractEventLoop
+from collections.abc import AsyncIterator, Awaitable, Coroutine, Iterator, Mapping, Sequence
+from typing import Any, TypeVar, Union, cast
 
 from typing_extensions import TypeAlias
 
@@ -122,13 +124,23 @@ def _validate_event(event: Any, step_context: StepExecutionContext) -> OpOutputU
     return event
 
 
+def run_on_event_loop(event_loop: AbstractEventLoop, awaitable: Awaitable[T]) -> T:
+    # When async steps are executed concurrently, the event loop is already running in a dedicated
+    # thread and steps submit their coroutines to it instead of running the loop themselves.
+    if event_loop.is_running():
+        return asyncio.run_coroutine_threadsafe(
+            cast("Coroutine[Any, Any, T]", awaitable), event_loop
+        ).result()
+    return event_loop.run_until_complete(awaitable)
+
+
 def gen_from_async_gen(
     context: StepExecutionContext,
     async_gen: AsyncIterator[T],
 ) -> Iterator[T]:
     while True:
         try:
-            yield context.event_loop.run_until_complete(async_gen.__anext__())
+            yield run_on_event_loop(context.event_loop, async_gen.__anext__())
         except StopAsyncIteration:
             return
 
@@ -83,6 +83,19 @@ def compute(
     return compute
 
 
+def is_async_op_compute_fn(op_def: OpDefinition) -> bool:
+    """Whether the op was defined from a coroutine function or an async generator function, and so
+    spends its compute awaiting on the step event loop.
+    """
+    from dagster._core.definitions.decorators.op_decorator import DecoratedOpFunction
+
+    if not isinstance(op_def.compute_fn, DecoratedOpFunction):
+        return False
+
+    fn = op_def.compute_fn.decorated_fn
+    return inspect.iscoroutinefunction(fn) or inspect.isasyncgenfunction(fn)
+
+
 async def _coerce_async_op_to_async_gen(
     awaitable: Awaitable[Any],
     context: ExecutionContextTypes,
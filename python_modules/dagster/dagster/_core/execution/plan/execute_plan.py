@@ -1,7 +1,12 @@
+import asyncio
+import queue
 import sys
+import threading
+from asyncio import AbstractEventLoop
 from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import ExitStack
-from typing import Optional, cast
+from typing import Any, NamedTuple, Optional, cast
 
 from dagster_shared.error import DagsterError
 
@@ -17,6 +22,8 @@
 from dagster._core.events import DagsterEvent, EngineEventData
 from dagster._core.execution.compute_logs import create_compute_log_file_key
 from dagster._core.execution.context.system import PlanExecutionContext, StepExecutionContext
+from dagster._core.execution.plan.active import ActiveExecution
+from dagster._core.execution.plan.compute_generator import is_async_op_compute_fn
 from dagster._core.execution.plan.execute_step import core_dagster_event_sequence_for_step
 from dagster._core.execution.plan.instance_concurrency_context import InstanceConcurrencyContext
 from dagster._core.execution.plan.objects import (
@@ -27,6 +34,8 @@
     step_failure_event_from_exc_info,
 )
 from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.plan.step import ExecutionStep
+from dagster._core.execution.step_profiler import StepProfiler, get_step_profiling_mode
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
 
@@ -34,13 +43,19 @@ def inner_plan_execution_iterator(
     job_context: PlanExecutionContext,
     execution_plan: ExecutionPlan,
     instance_concurrency_context: Optional[InstanceConcurrencyContext] = None,
+    max_concurrent: Optional[int] = None,
+    tag_concurrency_limits: Optional[list[dict[str, Any]]] = None,
 ) -> Iterator[DagsterEvent]:
     check.inst_param(job_context, "pipeline_context", PlanExecutionContext)
     check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+    check.opt_int_param(max_concurrent, "max_concurrent")
     compute_log_manager = job_context.instance.compute_log_manager
     step_keys = [step.key for step in execution_plan.get_steps_to_execute_in_topo_order()]
+    execute_async_steps_concurrently = max_concurrent is not None and max_concurrent > 1
     with execution_plan.start(
         retry_mode=job_context.retry_mode,
+        max_concurrent=max_concurrent if execute_async_steps_concurrently else None,
+        tag_concurrency_limits=tag_concurrency_limits,
         instance_concurrency_context=instance_concurrency_context,
     ) as active_execution:
         with ExitStack() as capture_stack:
@@ -53,53 +68,24 @@ def inner_plan_execution_iterator(
             except Exception:
                 yield from _handle_compute_log_setup_error(job_context, sys.exc_info())
 
-            # It would be good to implement a reference tracking algorithm here to
-            # garbage collect results that are no longer needed by any steps
-            # https://github.com/dagster-io/dagster/issues/811
-            while not active_execution.is_complete:
-                step = active_execution.get_next_step()
-
-                yield from active_execution.concurrency_event_iterator(job_context)
-
-                if not step:
-                    active_execution.sleep_til_ready()
-                    continue
-
-                step_context = cast(
-                    "StepExecutionContext",
-                    job_context.for_step(step, active_execution.get_known_state()),
+            if execute_async_steps_concurrently:
+                yield from _concurrent_async_steps_execution_iterator(
+                    job_context, active_execution, check.not_none(max_concurrent)
                 )
-                step_event_list = []
-
-                missing_resources = [
-                    resource_key
-                    for resource_key in step_context.required_resource_keys
-                    if not hasattr(step_context.resources, resource_key)
-                ]
-                check.invariant(
-                    len(missing_resources) == 0,
-                    (
-                        f"Expected step context for solid {step_context.op.name} to have all required"
-                        f" resources, but missing {missing_resources}."
-                    ),
-                )
-
-                # we have already set up the log capture at the process level, just handle the step events
-                for step_event in check.generator(dagster_event_sequence_for_step(step_context)):
-                    dagster_event = check.inst(step_event, DagsterEvent)
-                    step_event_list.append(dagster_event)
-                    yield dagster_event
-                    active_execution.handle_event(dagster_event)
+            else:
+                # It would be good to implement a reference tracking algorithm here to
+                # garbage collect results that are no longer needed by any steps
+                # https://github.com/dagster-io/dagster/issues/811
+                while not active_execution.is_complete:
+                    step = active_execution.get_next_step()
 
-                active_execution.verify_complete(job_context, step.key)
+                    yield from active_execution.concurrency_event_iterator(job_context)
 
-                # process skips from failures or uncovered inputs
-                for event in active_execution.plan_events_iterator(job_context):
-                    step_event_list.append(event)
-                    yield event
+                    if not step:
+                        active_execution.sleep_til_ready()
+                        continue
 
-                # pass a list of step events to hooks
-                yield from _trigger_hook(step_context, step_event_list)
+                    yield from _inline_step_execution_iterator(job_context, active_execution, step)
 
             try:
                 capture_stack.close()
@@ -107,6 +93,196 @@ def inner_plan_execution_iterator(
                 yield from _handle_compute_log_teardown_error(job_context, sys.exc_info())
 
 
+def _step_context_for_execution(
+    job_context: PlanExecutionContext, active_execution: ActiveExecution, step: ExecutionStep
+) -> StepExecutionContext:
+    step_context = cast(
+        "StepExecutionContext",
+        job_context.for_step(step, active_execution.get_known_state()),
+    )
+
+    missing_resources = [
+        resource_key
+        for resource_key in step_context.required_resource_keys
+        if not hasattr(step_context.resources, resource_key)
+    ]
+    check.invariant(
+        len(missing_resources) == 0,
+        (
+            f"Expected step context for solid {step_context.op.name} to have all required"
+            f" resources, but missing {missing_resources}."
+        ),
+    )
+    return step_context
+
+
+def _inline_step_execution_iterator(
+    job_context: PlanExecutionContext,
+    active_execution: ActiveExecution,
+    step: ExecutionStep,
+    step_context: Optional[StepExecutionContext] = None,
+) -> Iterator[DagsterEvent]:
+    step_context = step_context or _step_context_for_execution(job_context, active_execution, step)
+    step_event_list = []
+
+    # we have already set up the log capture at the process level, just handle the step events
+    for step_event in check.generator(dagster_event_sequence_for_step(step_context)):
+        dagster_event = check.inst(step_event, DagsterEvent)
+        step_event_list.append(dagster_event)
+        yield dagster_event
+        active_execution.handle_event(dagster_event)
+
+    yield from _complete_step_iterator(job_context, active_execution, step_context, step_event_list)
+
+
+def _complete_step_iterator(
+    job_context: PlanExecutionContext,
+    active_execution: ActiveExecution,
+    step_context: StepExecutionContext,
+    step_event_list: list[DagsterEvent],
+) -> Iterator[DagsterEvent]:
+    active_execution.verify_complete(job_context, step_context.step.key)
+
+    # process skips from failures or uncovered inputs
+    for event in active_execution.plan_events_iterator(job_context):
+        step_event_list.append(event)
+        yield event
+
+    # pass a list of step events to hooks
+    yield from _trigger_hook(step_context, step_event_list)
+
+
+class _AsyncStepWorkerMessage(NamedTuple):
+    step_key: str
+    event: Optional[DagsterEvent] = None
+    error: Optional[BaseException] = None
+    is_done: bool = False
+
+
+def _concurrent_async_steps_execution_iterator(
+    job_context: PlanExecutionContext,
+    active_execution: ActiveExecution,
+    max_concurrent: int,
+) -> Iterator[DagsterEvent]:
+    """Execute steps in process, overlapping the compute of steps defined from async functions.
+
+    The run's event loop is run in a dedicated thread, and each ready async step is driven from a
+    worker thread that submits its coroutines to that loop, so that up to `max_concurrent` steps
+    can be awaiting at once. Synchronous steps are still executed one at a time on this thread.
+    Events from the workers are funnelled back through a queue so that all bookkeeping on the
+    active execution, plan events and hooks happen on this thread.
+    """
+    event_loop = job_context.event_loop
+    loop_thread = threading.Thread(
+        target=event_loop.run_forever, name="dagster-async-step-event-loop", daemon=True
+    )
+    messages: queue.Queue[_AsyncStepWorkerMessage] = queue.Queue()
+    in_flight: dict[str, tuple[StepExecutionContext, list[DagsterEvent]]] = {}
+    worker_error: Optional[BaseException] = None
+    stopping = False
+
+    loop_thread.start()
+    try:
+        with ThreadPoolExecutor(
+            max_workers=max_concurrent, thread_name_prefix="dagster-async-step"
+        ) as worker_pool:
+            try:
+                while (not stopping and not active_execution.is_complete) or in_flight:
+                    if not stopping and active_execution.check_for_interrupts():
+                        # the plan is left incomplete, so exiting the active execution will raise
+                        stopping = True
+                        active_execution.mark_interrupted()
+                        _cancel_event_loop_tasks(event_loop)
+
+                    while not stopping:
+                        steps = active_execution.get_steps_to_execute(limit=1)
+
+                        yield from active_execution.concurrency_event_iterator(job_context)
+
+                        if not steps:
+                            break
+
+                        step = steps[0]
+                        step_context = _step_context_for_execution(
+                            job_context, active_execution, step
+                        )
+                        if step_context.step_launcher or not is_async_op_compute_fn(
+                            step_context.op_def
+                        ):
+                            yield from _inline_step_execution_iterator(
+                                job_context, active_execution, step, step_context
+                            )
+                        else:
+                            in_flight[step.key] = (step_context, [])
+                            worker_pool.submit(_execute_step_in_worker, step_context, messages)
+
+                    if not in_flight:
+                        if not stopping and not active_execution.is_complete:
+                            active_execution.sleep_til_ready()
+                        continue
+
+                    try:
+                        message = messages.get(
+                            timeout=active_execution.sleep_interval()
+                            or _ASYNC_STEP_MESSAGE_POLL_INTERVAL
+                        )
+                    except queue.Empty:
+                        continue
+
+                    step_context, step_event_list = in_flight[message.step_key]
+                    if message.event is not None:
+                        step_event_list.append(message.event)
+                        yield message.event
+                        active_execution.handle_event(message.event)
+                    elif message.error is not None:
+                        del in_flight[message.step_key]
+                        if worker_error is None:
+                            worker_error = message.error
+                        if not stopping:
+                            stopping = True
+                            _cancel_event_loop_tasks(event_loop)
+                    elif message.is_done:
+                        del in_flight[message.step_key]
+                        yield from _complete_step_iterator(
+                            job_context, active_execution, step_context, step_event_list
+                        )
+            except BaseException:
+                _cancel_event_loop_tasks(event_loop)
+                raise
+    finally:
+        event_loop.call_soon_threadsafe(event_loop.stop)
+        loop_thread.join()
+
+    if worker_error is not None:
+        raise worker_error
+
+
+_ASYNC_STEP_MESSAGE_POLL_INTERVAL = 1.0
+
+
+def _execute_step_in_worker(
+    step_context: StepExecutionContext, messages: "queue.Queue[_AsyncStepWorkerMessage]"
+) -> None:
+    step_key = step_context.step.key
+    try:
+        for step_event in check.generator(dagster_event_sequence_for_step(step_context)):
+            messages.put(
+                _AsyncStepWorkerMessage(step_key, event=check.inst(step_event, DagsterEvent))
+            )
+    except BaseException as e:
+        messages.put(_AsyncStepWorkerMessage(step_key, error=e))
+    else:
+        messages.put(_AsyncStepWorkerMessage(step_key, is_done=True))
+
+
+def _cancel_event_loop_tasks(event_loop: AbstractEventLoop) -> None:
+    def _cancel_all() -> None:
+        for task in asyncio.all_tasks(event_loop):
+            task.cancel()
+
+    event_loop.call_soon_threadsafe(_cancel_all)
+
+
 def _handle_compute_log_setup_error(
     context: PlanExecutionContext, exc_info
 ) -> Iterator[DagsterEvent]:
@@ -236,6 +412,27 @@ def dagster_event_sequence_for_step(
     """
     check.inst_param(step_context, "step_context", StepExecutionContext)
 
+    profiling_mode = get_step_profiling_mode(step_context.dagster_run.tags)
+    if not profiling_mode:
+        yield from _dagster_event_sequence_for_step(step_context, force_local_execution)
+        return
+
+    profiler = StepProfiler(sample_stacks=profiling_mode == "stack")
+    with profiler:
+        yield from _dagster_event_sequence_for_step(step_context, force_local_execution)
+
+    step_profile = check.not_none(profiler.profile)
+    yield DagsterEvent.engine_event(
+        step_context,
+        f"Profiled step: {step_profile.wall_time_ms:.0f}ms wall time, "
+        f"{step_profile.cpu_time_ms:.0f}ms CPU time.",
+        EngineEventData.step_profiled(step_profile),
+    )
+
+
+def _dagster_event_sequence_for_step(
+    step_context: StepExecutionContext, force_local_execution: bool
+) -> Iterator[DagsterEvent]:
     try:
         if step_context.step_launcher and not force_local_execution:
             # info all on step_context - should deprecate second arg
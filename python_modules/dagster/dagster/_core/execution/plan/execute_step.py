@@ -1,6 +1,6 @@
 import inspect
 from collections import defaultdict
-from collections.abc import Iterable, Iterator, Mapping
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from typing import Any, Optional, Union, cast
 
 from typing_extensions import TypedDict
@@ -28,6 +28,7 @@
     NULL_EVENT_POINTER,
     DataVersion,
     compute_logical_data_version,
+    extract_data_version_from_entry,
     get_input_data_version_tag,
     get_input_event_pointer_tag,
 )
@@ -50,10 +51,12 @@
     DagsterTypeCheckError,
     user_code_error_boundary,
 )
+from dagster._core.event_api import AssetRecordsFilter
 from dagster._core.events import DagsterEvent, DagsterEventBatchMetadata, generate_event_batch_id
 from dagster._core.execution.context.compute import enter_execution_context
 from dagster._core.execution.context.output import OutputContext
 from dagster._core.execution.context.system import StepExecutionContext, TypeCheckContext
+from dagster._core.execution.memoization import compute_step_result_cache_key
 from dagster._core.execution.plan.compute import OpOutputUnion, execute_core_compute
 from dagster._core.execution.plan.compute_generator import create_op_compute_wrapper
 from dagster._core.execution.plan.inputs import StepInputData
@@ -61,7 +64,11 @@
 from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
 from dagster._core.execution.plan.utils import op_execution_error_boundary
 from dagster._core.storage.dagster_run import assets_are_externally_managed
-from dagster._core.storage.tags import BACKFILL_ID_TAG
+from dagster._core.storage.tags import (
+    BACKFILL_ID_TAG,
+    CACHED_MATERIALIZATION_TAG,
+    STEP_RESULT_CACHE_KEY_TAG,
+)
 from dagster._core.types.dagster_type import DagsterType
 from dagster._utils import iterate_with_context
 from dagster._utils.timing import time_execution_scope
@@ -449,13 +456,25 @@ def core_dagster_event_sequence_for_step(
     else:
         yield DagsterEvent.step_start_event(step_context)
 
+    with time_execution_scope() as cache_timer_result:
+        cached_events = _get_cached_step_result_events(step_context)
+    if cached_events is not None:
+        yield from cached_events
+        yield DagsterEvent.step_success_event(
+            step_context, StepSuccessData(duration_ms=cache_timer_result.millis)
+        )
+        return
+
     with (
         time_execution_scope() as timer_result,
         enter_execution_context(step_context) as compute_context,
     ):
         inputs = {}
 
-        if step_context.is_sda_step:
+        if (
+            step_context.is_sda_step
+            and not step_context.is_external_input_asset_version_info_loaded
+        ):
             step_context.fetch_external_input_asset_version_info()
 
         for step_input in step_context.step.step_inputs:
@@ -621,6 +640,11 @@ def _get_output_asset_events(
             input_provenance_data,
             user_provided_data_version is not None,
         )
+        step_result_cache_key = _get_step_result_cache_key(
+            asset_key, step_context, code_version, input_provenance_data
+        )
+        if step_result_cache_key is not None:
+            tags[STEP_RESULT_CACHE_KEY_TAG] = step_result_cache_key
         if not step_context.has_data_version(asset_key):
             data_version = DataVersion(tags[DATA_VERSION_TAG])
             step_context.set_data_version(asset_key, data_version)
@@ -743,6 +767,148 @@ def _build_data_version_tags(
     return tags
 
 
+def _get_step_result_cache_key(
+    asset_key: AssetKey,
+    step_context: StepExecutionContext,
+    code_version: str,
+    input_provenance_data: Mapping[AssetKey, _InputProvenanceData],
+) -> Optional[str]:
+    if not step_context.is_step_result_cacheable:
+        return None
+
+    return compute_step_result_cache_key(
+        code_version,
+        {key: meta["data_version"] for key, meta in input_provenance_data.items()},
+        step_context.partition_key if step_context.has_partition_key else None,
+        step_context.op_config,
+    )
+
+
+def _step_output_exists(step_context: StepExecutionContext, output_name: str) -> bool:
+    """Whether the value stored for the given output by a prior run can still be loaded by
+    downstream steps. Only IO managers which persist outputs across runs and can report whether an
+    output exists qualify, so outputs handled by e.g. the in-memory IO manager are always recomputed.
+    """
+    step_output_handle = StepOutputHandle(step_key=step_context.step.key, output_name=output_name)
+    has_output = getattr(step_context.get_io_manager(step_output_handle), "has_output", None)
+    if not callable(has_output):
+        return False
+
+    try:
+        return bool(has_output(step_context.get_output_context(step_output_handle)))
+    except Exception:
+        step_context.log.debug(
+            f"Could not determine whether output {output_name} exists, executing the step."
+        )
+        return False
+
+
+def _get_cached_step_result_events(
+    step_context: StepExecutionContext,
+) -> Optional[Sequence[DagsterEvent]]:
+    """If every asset materialized by this step has a prior materialization with the same step
+    result cache key, returns the events that stand in for executing the step. Otherwise returns
+    None and the step should be executed normally.
+    """
+    if not step_context.is_step_result_cacheable:
+        return None
+
+    step_context.fetch_external_input_asset_version_info()
+
+    asset_layer = step_context.job_def.asset_layer
+    cached_records = []
+    for step_output in step_context.step.step_outputs:
+        asset_key = check.not_none(
+            asset_layer.get_asset_key_for_node_output(step_context.node_handle, step_output.name)
+        )
+        cache_key = _get_step_result_cache_key(
+            asset_key,
+            step_context,
+            _get_code_version(asset_key, step_context),
+            _get_input_provenance_data(asset_key, step_context),
+        )
+        partition = (
+            step_context.asset_partition_key_for_output(step_output.name)
+            if step_context.has_asset_partitions_for_output(step_output.name)
+            else None
+        )
+        record = next(
+            iter(
+                step_context.instance.fetch_materializations(
+                    AssetRecordsFilter(
+                        asset_key=asset_key,
+                        asset_partitions=[partition] if partition is not None else None,
+                    ),
+                    limit=1,
+                ).records
+            ),
+            None,
+        )
+        materialization = record.asset_materialization if record else None
+        if (
+            record is None
+            or materialization is None
+            or materialization.tags is None
+            or materialization.tags.get(STEP_RESULT_CACHE_KEY_TAG) != cache_key
+        ):
+            return None
+        if not _step_output_exists(step_context, step_output.name):
+            return None
+        cached_records.append((step_output.name, asset_key, partition, record, materialization))
+
+    step_context.log.info(
+        "Code version, input data versions, partition and config are unchanged since run"
+        f" {', '.join(sorted({record.run_id for _, _, _, record, _ in cached_records}))}."
+        " Reusing its materializations instead of executing the step."
+    )
+
+    backfill_id = step_context.get_tag(BACKFILL_ID_TAG)
+    events = []
+    for output_name, asset_key, partition, record, materialization in cached_records:
+        data_version = extract_data_version_from_entry(record.event_log_entry)
+        if data_version is not None:
+            step_context.set_data_version(asset_key, data_version)
+
+        tags = {
+            **{
+                k: v
+                for k, v in check.not_none(materialization.tags).items()
+                if k != BACKFILL_ID_TAG
+            },
+            CACHED_MATERIALIZATION_TAG: "true",
+        }
+        if backfill_id:
+            tags[BACKFILL_ID_TAG] = backfill_id
+
+        events.append(
+            DagsterEvent.step_output_event(
+                step_context=step_context,
+                step_output_data=StepOutputData(
+                    step_output_handle=StepOutputHandle(
+                        step_key=step_context.step.key, output_name=output_name
+                    ),
+                ),
+            )
+        )
+        with disable_dagster_warnings():
+            events.append(
+                DagsterEvent.asset_materialization(
+                    step_context,
+                    AssetMaterialization(
+                        asset_key=asset_key,
+                        partition=partition,
+                        description=materialization.description,
+                        metadata={
+                            **materialization.metadata,
+                            "dagster/cached_from_run_id": MetadataValue.dagster_run(record.run_id),
+                        },
+                        tags=tags,
+                    ),
+                )
+            )
+    return events
+
+
 def _build_data_version_observation_tags(data_version: DataVersion) -> dict[str, str]:
     return {
         DATA_VERSION_TAG: data_version.value,
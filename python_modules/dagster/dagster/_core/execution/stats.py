@@ -9,9 +9,11 @@
     MARKER_EVENTS,
     PIPELINE_EVENTS,
     DagsterEventType,
+    EngineEventData,
     StepExpectationResultData,
 )
 from dagster._core.events.log import EventLogEntry
+from dagster._core.execution.step_profiler import StepProfile
 from dagster._core.storage.dagster_run import DagsterRunStatsSnapshot
 from dagster._record import IHaveNew, record, record_custom
 from dagster._serdes import whitelist_for_serdes
@@ -153,6 +155,7 @@ class RunStepKeyStatsSnapshot(IHaveNew):
     attempts_list: Sequence[RunStepMarker]
     markers: Sequence[RunStepMarker]
     partial_attempt_start: Optional[float]
+    profile: Optional[StepProfile]
 
     def __new__(
         cls,
@@ -167,6 +170,7 @@ def __new__(
         attempts_list: Optional[Sequence[RunStepMarker]] = None,
         markers: Optional[Sequence[RunStepMarker]] = None,
         partial_attempt_start: Optional[float] = None,
+        profile: Optional[StepProfile] = None,
     ):
         return super().__new__(
             cls,
@@ -190,6 +194,8 @@ def __new__(
             partial_attempt_start=check.opt_float_param(
                 partial_attempt_start, "partial_attempt_start"
             ),
+            # resource profile of the latest attempt, if the run opted into step profiling
+            profile=check.opt_inst_param(profile, "profile", StepProfile),
         )
 
 
@@ -229,6 +235,7 @@ def build_run_step_stats_snapshot_from_events(
                 "expectation_results": step_stats.expectation_results,
                 "attempts": step_stats.attempts,
                 "partial_attempt_start": step_stats.partial_attempt_start,
+                "profile": step_stats.profile,
             }
             for attempt in step_stats.attempts_list:
                 attempts[step_stats.step_key].append(attempt)
@@ -315,6 +322,13 @@ def _close_attempt(step_key: str, event: EventLogEntry) -> None:
             step_expectation_results.append(expectation_result)
             by_step_key[step_key]["expectation_results"] = step_expectation_results
 
+        if dagster_event.event_type == DagsterEventType.ENGINE_EVENT and isinstance(
+            dagster_event.event_specific_data, EngineEventData
+        ):
+            step_profile = dagster_event.event_specific_data.step_profile
+            if step_profile:
+                by_step_key[step_key]["profile"] = step_profile
+
         if dagster_event.event_type in MARKER_EVENTS:
             if dagster_event.engine_event_data.marker_start:
                 marker_key = dagster_event.engine_event_data.marker_start
@@ -0,0 +1,189 @@
+import gc
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Mapping
+from types import FrameType
+from typing import Any, Optional
+
+from dagster._core.storage.tags import STEP_PROFILING_TAG
+from dagster._record import record
+from dagster._serdes import whitelist_for_serdes
+
+try:
+    import resource
+except ImportError:
+    # not available on windows
+    resource = None
+
+DEFAULT_STACK_SAMPLE_INTERVAL_SECONDS = 0.01
+MAX_PROFILED_STACKS = 50
+MAX_PROFILED_STACK_DEPTH = 64
+
+STEP_PROFILING_ENABLED_VALUES = {"true", "stack"}
+
+
+@whitelist_for_serdes
+@record
+class StepProfile:
+    """Resource usage of a single step attempt, recorded when the run has opted into profiling
+    with the `dagster/step_profiling` tag.
+
+    CPU time, peak RSS and GC pauses are measured for the whole process, so they include work done
+    by other steps that execute concurrently in the same process. `stack_samples` maps folded stacks
+    (outermost frame first, separated by `;`) to the number of times they were sampled.
+    """
+
+    wall_time_ms: float
+    cpu_time_ms: Optional[float] = None
+    peak_rss_delta_bytes: Optional[int] = None
+    gc_pause_ms: float = 0.0
+    gc_collections: int = 0
+    stack_samples: Optional[Mapping[str, int]] = None
+    sample_interval_ms: Optional[float] = None
+
+    def to_metadata(self) -> Mapping[str, Any]:
+        metadata: dict[str, Any] = {
+            "wall_time_ms": self.wall_time_ms,
+            "gc_pause_ms": self.gc_pause_ms,
+            "gc_collections": self.gc_collections,
+        }
+        if self.cpu_time_ms is not None:
+            metadata["cpu_time_ms"] = self.cpu_time_ms
+        if self.peak_rss_delta_bytes is not None:
+            metadata["peak_rss_delta_bytes"] = self.peak_rss_delta_bytes
+        return metadata
+
+
+def get_step_profiling_mode(tags: Mapping[str, str]) -> Optional[str]:
+    value = tags.get(STEP_PROFILING_TAG)
+    if value is None:
+        return None
+    value = value.lower()
+    return value if value in STEP_PROFILING_ENABLED_VALUES else None
+
+
+class _GCPauseTracker:
+    """Shares a single `gc.callbacks` hook between all active profilers in the process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._profilers: set[StepProfiler] = set()
+        self._collection_start: Optional[float] = None
+
+    def add(self, profiler: "StepProfiler") -> None:
+        with self._lock:
+            if not self._profilers:
+                gc.callbacks.append(self._on_gc)
+            self._profilers.add(profiler)
+
+    def remove(self, profiler: "StepProfiler") -> None:
+        with self._lock:
+            self._profilers.discard(profiler)
+            if not self._profilers and self._on_gc in gc.callbacks:
+                gc.callbacks.remove(self._on_gc)
+
+    def _on_gc(self, phase: str, _info: Mapping[str, Any]) -> None:
+        if phase == "start":
+            self._collection_start = time.perf_counter()
+        elif phase == "stop" and self._collection_start is not None:
+            pause = time.perf_counter() - self._collection_start
+            self._collection_start = None
+            for profiler in list(self._profilers):
+                profiler.record_gc_pause(pause)
+
+
+_gc_pause_tracker = _GCPauseTracker()
+
+
+class StepProfiler:
+    """Context manager that measures the resources used while a step executes.
+
+    When `sample_stacks` is set, a background thread samples the stack of the thread that entered
+    the profiler every `sample_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        sample_stacks: bool = False,
+        sample_interval: float = DEFAULT_STACK_SAMPLE_INTERVAL_SECONDS,
+    ):
+        self._sample_stacks = sample_stacks
+        self._sample_interval = sample_interval
+        self._gc_pause_seconds = 0.0
+        self._gc_collections = 0
+        self._stacks: Counter[str] = Counter()
+        self._stop_sampling = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._profile: Optional[StepProfile] = None
+
+    @property
+    def profile(self) -> Optional[StepProfile]:
+        return self._profile
+
+    def record_gc_pause(self, seconds: float) -> None:
+        self._gc_pause_seconds += seconds
+        self._gc_collections += 1
+
+    def __enter__(self) -> "StepProfiler":
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.process_time()
+        self._start_peak_rss = _get_peak_rss_bytes()
+        _gc_pause_tracker.add(self)
+
+        if self._sample_stacks:
+            self._sampler = threading.Thread(
+                target=self._sample,
+                args=(threading.get_ident(),),
+                name="step-profiler-stack-sampler",
+                daemon=True,
+            )
+            self._sampler.start()
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        if self._sampler:
+            self._stop_sampling.set()
+            self._sampler.join()
+        _gc_pause_tracker.remove(self)
+
+        end_peak_rss = _get_peak_rss_bytes()
+        self._profile = StepProfile(
+            wall_time_ms=(time.perf_counter() - self._start_wall) * 1000,
+            cpu_time_ms=(time.process_time() - self._start_cpu) * 1000,
+            peak_rss_delta_bytes=(
+                max(0, end_peak_rss - self._start_peak_rss)
+                if end_peak_rss is not None and self._start_peak_rss is not None
+                else None
+            ),
+            gc_pause_ms=self._gc_pause_seconds * 1000,
+            gc_collections=self._gc_collections,
+            stack_samples=(
+                dict(self._stacks.most_common(MAX_PROFILED_STACKS)) if self._sample_stacks else None
+            ),
+            sample_interval_ms=self._sample_interval * 1000 if self._sample_stacks else None,
+        )
+
+    def _sample(self, thread_id: int) -> None:
+        while not self._stop_sampling.wait(self._sample_interval):
+            frame = sys._current_frames().get(thread_id)  # noqa: SLF001
+            if frame is not None:
+                self._stacks[_fold_stack(frame)] += 1
+
+
+def _fold_stack(frame: Optional[FrameType]) -> str:
+    entries = []
+    while frame is not None and len(entries) < MAX_PROFILED_STACK_DEPTH:
+        code = frame.f_code
+        entries.append(f"{code.co_filename}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(entries))
+
+
+def _get_peak_rss_bytes() -> Optional[int]:
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
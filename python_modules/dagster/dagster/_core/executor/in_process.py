@@ -1,6 +1,7 @@
 import os
 from collections.abc import Iterator
-from typing import Optional
+from functools import partial
+from typing import Any, Optional
 
 import dagster._check as check
 from dagster._core.events import DagsterEvent, EngineEventData
@@ -19,19 +20,35 @@ def inprocess_execution_iterator(
     job_context: PlanExecutionContext,
     execution_plan: ExecutionPlan,
     instance_concurrency_context: Optional[InstanceConcurrencyContext] = None,
+    max_concurrent: Optional[int] = None,
+    tag_concurrency_limits: Optional[list[dict[str, Any]]] = None,
 ) -> Iterator[DagsterEvent]:
     with InstanceConcurrencyContext(
         job_context.instance, job_context.dagster_run
     ) as instance_concurrency_context:
         yield from inner_plan_execution_iterator(
-            job_context, execution_plan, instance_concurrency_context
+            job_context,
+            execution_plan,
+            instance_concurrency_context,
+            max_concurrent=max_concurrent,
+            tag_concurrency_limits=tag_concurrency_limits,
         )
 
 
 class InProcessExecutor(Executor):
-    def __init__(self, retries: RetryMode, marker_to_close: Optional[str] = None):
+    def __init__(
+        self,
+        retries: RetryMode,
+        marker_to_close: Optional[str] = None,
+        max_concurrent: Optional[int] = None,
+        tag_concurrency_limits: Optional[list[dict[str, Any]]] = None,
+    ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         self.marker_to_close = check.opt_str_param(marker_to_close, "marker_to_close")
+        self._max_concurrent = check.opt_int_param(max_concurrent, "max_concurrent")
+        self._tag_concurrency_limits = check.opt_list_param(
+            tag_concurrency_limits, "tag_concurrency_limits"
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -55,7 +72,11 @@ def execute(
             yield from iter(
                 ExecuteRunWithPlanIterable(
                     execution_plan=plan_context.execution_plan,
-                    iterator=inprocess_execution_iterator,
+                    iterator=partial(
+                        inprocess_execution_iterator,
+                        max_concurrent=self._max_concurrent,
+                        tag_concurrency_limits=self._tag_concurrency_limits,
+                    ),
                     execution_context_manager=PlanExecutionContextManager(
                         job=plan_context.job,
                         retry_mode=plan_context.retry_mode,
@@ -31,6 +31,10 @@ def _default_sleep_seconds():
     return float(os.environ.get("DAGSTER_STEP_DELEGATING_EXECUTOR_SLEEP_SECONDS", "1.0"))
 
 
+def _default_max_concurrent_step_launches():
+    return int(os.environ.get("DAGSTER_STEP_DELEGATING_EXECUTOR_MAX_CONCURRENT_LAUNCHES", "1"))
+
+
 class StepDelegatingExecutor(Executor):
     """This executor tails the event log for events from the steps that it spins up. It also
     sometimes creates its own events - when it does, that event is automatically written to the
@@ -47,6 +51,7 @@ def __init__(
         max_concurrent: Optional[int] = None,
         tag_concurrency_limits: Optional[list[dict[str, Any]]] = None,
         should_verify_step: bool = False,
+        max_concurrent_step_launches: Optional[int] = None,
     ):
         self._step_handler = step_handler
         self._retries = retries
@@ -70,8 +75,19 @@ def __init__(
             ),
         )
         self._should_verify_step = should_verify_step
+        # number of step launches / health checks that may be in flight against the step handler
+        # at once
+        self._max_concurrent_step_launches = check.opt_int_param(
+            max_concurrent_step_launches,
+            "max_concurrent_step_launches",
+            default=_default_max_concurrent_step_launches(),
+        )
+        check.invariant(
+            self._max_concurrent_step_launches > 0, "max_concurrent_step_launches must be > 0"
+        )
 
         self._event_cursor: Optional[str] = None
+        self._has_more_events = False
 
         self._pop_events_limit = int(os.getenv("DAGSTER_EXECUTOR_POP_EVENTS_LIMIT", "1000"))
 
@@ -101,6 +117,9 @@ def _pop_events(
         ]
 
         returned_storage_ids = {record.storage_id for record in conn.records}
+        self._has_more_events = len(conn.records) == self._pop_events_limit and bool(
+            returned_storage_ids - seen_storage_ids
+        )
 
         pop_events_offset = self._get_pop_events_offset(instance)
 
@@ -139,7 +158,7 @@ def _pop_events(
         return dagster_events
 
     def _get_step_handler_context(
-        self, plan_context, steps, active_execution
+        self, plan_context, steps, active_execution, known_state=None
     ) -> StepHandlerContext:
         return StepHandlerContext(
             instance=plan_context.plan_data.instance,
@@ -151,13 +170,52 @@ def _get_step_handler_context(
                 step_keys_to_execute=[step.key for step in steps],
                 instance_ref=plan_context.plan_data.instance.get_ref(),
                 retry_mode=self.retries.for_inner_plan(),
-                known_state=active_execution.get_known_state(),
+                known_state=known_state or active_execution.get_known_state(),
                 should_verify_step=self._should_verify_step,
                 print_serialized_events=False,
             ),
             dagster_run=plan_context.dagster_run,
         )
 
+    def _get_step_handler_contexts(
+        self, plan_context, steps, active_execution
+    ) -> Sequence[StepHandlerContext]:
+        # the known state is the same for every step in the batch, so only compute it once
+        known_state = active_execution.get_known_state()
+        return [
+            self._get_step_handler_context(plan_context, [step], active_execution, known_state)
+            for step in steps
+        ]
+
+    def _launch_steps(self, plan_context, steps, active_execution, running_steps) -> None:
+        if not steps:
+            return
+        steps_by_key = {step.key: step for step in steps}
+        for dagster_event in self._step_handler.launch_steps(
+            self._get_step_handler_contexts(plan_context, steps, active_execution),
+            max_concurrent_launches=self._max_concurrent_step_launches,
+        ):
+            # track each step as soon as its launch is reported, so that the steps which were
+            # launched before a failed launch are still terminated
+            if dagster_event.step_key in steps_by_key:
+                running_steps[dagster_event.step_key] = steps_by_key[dagster_event.step_key]
+        for step in steps:
+            running_steps[step.key] = step
+
+    def _check_steps_health(self, plan_context, steps, active_execution):
+        if not steps:
+            return []
+        health_check_results = self._step_handler.check_steps_health(
+            self._get_step_handler_contexts(plan_context, steps, active_execution),
+            max_concurrent_checks=self._max_concurrent_step_launches,
+        )
+        check.invariant(
+            len(health_check_results) == len(steps),
+            f"Step handler returned {len(health_check_results)} health check results for"
+            f" {len(steps)} steps",
+        )
+        return health_check_results
+
     def execute(self, plan_context: PlanOrchestrationContext, execution_plan: ExecutionPlan):
         check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
@@ -197,56 +255,42 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
 
                     possibly_in_flight_steps = active_execution.rebuild_from_events(prior_events)
                     for step in possibly_in_flight_steps:
-                        step_handler_context = self._get_step_handler_context(
-                            plan_context, [step], active_execution
-                        )
-
                         DagsterEvent.engine_event(
-                            step_handler_context.get_step_context(step.key),
+                            plan_context.for_step(step),
                             f"Checking on status of in-progress step {step.key} from previous run",
                             EngineEventData(),
                         )
 
-                        should_retry_step = False
-                        health_check = None
-
-                        try:
-                            health_check = self._step_handler.check_step_health(
-                                step_handler_context
-                            )
-                        except Exception:
+                    health_checks = self._check_steps_health(
+                        plan_context, possibly_in_flight_steps, active_execution
+                    )
+                    steps_to_retry = []
+                    for step, health_check in zip(possibly_in_flight_steps, health_checks):
+                        if health_check.error:
                             # For now we assume that an exception indicates that the step should be resumed.
                             # This should probably be a separate should_resume_step method on the step handler.
                             DagsterEvent.engine_event(
-                                step_handler_context.get_step_context(step.key),
+                                plan_context.for_step(step),
                                 f"Including {step.key} in the new run since it raised an error"
                                 " when checking whether it was running",
-                                EngineEventData(
-                                    error=serializable_error_info_from_exc_info(sys.exc_info())
-                                ),
+                                EngineEventData(error=health_check.error),
                             )
-                            should_retry_step = True
-                        else:
-                            if not health_check.is_healthy:
-                                DagsterEvent.engine_event(
-                                    step_handler_context.get_step_context(step.key),
-                                    f"Including step {step.key} in the new run since it is not"
-                                    f" currently running: {health_check.unhealthy_reason}",
-                                    EngineEventData(),
-                                )
-                                should_retry_step = True
-
-                        if should_retry_step:
-                            # health check failed, launch the step
-                            list(
-                                self._step_handler.launch_step(
-                                    self._get_step_handler_context(
-                                        plan_context, [step], active_execution
-                                    )
-                                )
+                            steps_to_retry.append(step)
+                        elif not health_check.is_healthy:
+                            DagsterEvent.engine_event(
+                                plan_context.for_step(step),
+                                f"Including step {step.key} in the new run since it is not"
+                                f" currently running: {health_check.unhealthy_reason}",
+                                EngineEventData(),
                             )
+                            steps_to_retry.append(step)
+                        else:
+                            running_steps[step.key] = step
 
-                        running_steps[step.key] = step
+                    # health check failed, launch the steps
+                    self._launch_steps(
+                        plan_context, steps_to_retry, active_execution, running_steps
+                    )
 
                 last_check_step_health_time = get_current_datetime()
 
@@ -287,6 +331,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
 
                             return
 
+                        self._has_more_events = False
                         if active_execution.has_in_flight_steps:
                             for dagster_event in self._pop_events(
                                 plan_context.instance,
@@ -326,41 +371,36 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                             curr_time - last_check_step_health_time
                         ).total_seconds() >= self._check_step_health_interval_seconds:
                             last_check_step_health_time = curr_time
-                            for step in running_steps.values():
+                            steps_to_check = list(running_steps.values())
+                            health_check_results = self._check_steps_health(
+                                plan_context, steps_to_check, active_execution
+                            )
+                            for step, health_check_result in zip(
+                                steps_to_check, health_check_results
+                            ):
                                 step_context = plan_context.for_step(step)
-
-                                try:
-                                    health_check_result = self._step_handler.check_step_health(
-                                        self._get_step_handler_context(
-                                            plan_context, [step], active_execution
-                                        )
-                                    )
-                                    if not health_check_result.is_healthy:
-                                        health_check_error = SerializableErrorInfo(
-                                            message=f"Step {step.key} failed health check: {health_check_result.unhealthy_reason}",
-                                            stack=[],
-                                            cls_name=None,
-                                        )
-
-                                        self.get_failure_or_retry_event_after_crash(
-                                            step_context,
-                                            health_check_error,
-                                            active_execution.get_known_state(),
-                                        )
-
-                                except Exception:
-                                    serializable_error = serializable_error_info_from_exc_info(
-                                        sys.exc_info()
-                                    )
+                                if health_check_result.error:
                                     # Log a step failure event if there was an error during the health
                                     # check
                                     DagsterEvent.step_failure_event(
-                                        step_context=plan_context.for_step(step),
+                                        step_context=step_context,
                                         step_failure_data=StepFailureData(
-                                            error=serializable_error,
+                                            error=health_check_result.error,
                                             user_failure_data=None,
                                         ),
                                     )
+                                elif not health_check_result.is_healthy:
+                                    health_check_error = SerializableErrorInfo(
+                                        message=f"Step {step.key} failed health check: {health_check_result.unhealthy_reason}",
+                                        stack=[],
+                                        cls_name=None,
+                                    )
+
+                                    self.get_failure_or_retry_event_after_crash(
+                                        step_context,
+                                        health_check_error,
+                                        active_execution.get_known_state(),
+                                    )
 
                         if self._max_concurrent is not None:
                             max_steps_to_run = self._max_concurrent - len(running_steps)
@@ -373,17 +413,17 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                         # process events from concurrency blocked steps
                         list(active_execution.concurrency_event_iterator(plan_context))
 
-                        for step in active_execution.get_steps_to_execute(max_steps_to_run):
-                            running_steps[step.key] = step
-                            list(
-                                self._step_handler.launch_step(
-                                    self._get_step_handler_context(
-                                        plan_context, [step], active_execution
-                                    )
-                                )
-                            )
+                        self._launch_steps(
+                            plan_context,
+                            active_execution.get_steps_to_execute(max_steps_to_run),
+                            active_execution,
+                            running_steps,
+                        )
 
-                        time.sleep(self._sleep_seconds)
+                        # if the last query hit the page limit there is a backlog of step events to
+                        # work through, so keep draining the event log without waiting
+                        if not self._has_more_events:
+                            time.sleep(self._sleep_seconds)
                 except Exception:
                     if not active_execution.is_complete and running_steps:
                         serializable_error = serializable_error_info_from_exc_info(sys.exc_info())
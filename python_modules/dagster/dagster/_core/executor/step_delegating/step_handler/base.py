@@ -1,6 +1,8 @@
+import sys
 from abc import ABC, abstractmethod
-from collections.abc import Iterator, Mapping, Sequence
-from typing import NamedTuple, Optional
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Optional, TypeVar
 
 from dagster import (
     DagsterInstance,
@@ -11,6 +13,9 @@
 from dagster._core.execution.plan.step import ExecutionStep
 from dagster._core.storage.dagster_run import DagsterRun
 from dagster._grpc.types import ExecuteStepArgs
+from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
+
+T = TypeVar("T")
 
 
 class StepHandlerContext:
@@ -58,14 +63,25 @@ def get_step_context(self, step_key: str) -> IStepContext:
 
 class CheckStepHealthResult(
     NamedTuple(
-        "_CheckStepHealthResult", [("is_healthy", bool), ("unhealthy_reason", Optional[str])]
+        "_CheckStepHealthResult",
+        [
+            ("is_healthy", bool),
+            ("unhealthy_reason", Optional[str]),
+            ("error", Optional[SerializableErrorInfo]),
+        ],
     )
 ):
-    def __new__(cls, is_healthy: bool, unhealthy_reason: Optional[str] = None):
+    def __new__(
+        cls,
+        is_healthy: bool,
+        unhealthy_reason: Optional[str] = None,
+        error: Optional[SerializableErrorInfo] = None,
+    ):
         return super().__new__(
             cls,
             check.bool_param(is_healthy, "is_healthy"),
             check.opt_str_param(unhealthy_reason, "unhealthy_reason"),
+            check.opt_inst_param(error, "error", SerializableErrorInfo),
         )
 
     @staticmethod
@@ -76,6 +92,11 @@ def healthy() -> "CheckStepHealthResult":
     def unhealthy(reason: str) -> "CheckStepHealthResult":
         return CheckStepHealthResult(is_healthy=False, unhealthy_reason=reason)
 
+    @staticmethod
+    def errored(error: SerializableErrorInfo) -> "CheckStepHealthResult":
+        """The health of the step could not be determined because the check raised an error."""
+        return CheckStepHealthResult(is_healthy=False, unhealthy_reason=error.message, error=error)
+
 
 class StepHandler(ABC):
     @property
@@ -94,3 +115,67 @@ def check_step_health(self, step_handler_context: StepHandlerContext) -> CheckSt
     @abstractmethod
     def terminate_step(self, step_handler_context: StepHandlerContext) -> Iterator[DagsterEvent]:
         pass
+
+    def launch_steps(
+        self,
+        step_handler_contexts: Sequence[StepHandlerContext],
+        max_concurrent_launches: int = 1,
+    ) -> Iterator[DagsterEvent]:
+        """Launch a batch of steps, each described by its own StepHandlerContext.
+
+        The default implementation calls `launch_step` for each context, running up to
+        `max_concurrent_launches` launches at once. Step handlers whose backend can launch many
+        steps in a single request may override this.
+        """
+        if max_concurrent_launches <= 1:
+            # yield the events of each launch as soon as it completes
+            for step_handler_context in step_handler_contexts:
+                yield from self.launch_step(step_handler_context)
+            return
+
+        for events in _map_bounded(
+            lambda context: list(self.launch_step(context)),
+            step_handler_contexts,
+            max_concurrent_launches,
+        ):
+            yield from events
+
+    def check_steps_health(
+        self,
+        step_handler_contexts: Sequence[StepHandlerContext],
+        max_concurrent_checks: int = 1,
+    ) -> Sequence[CheckStepHealthResult]:
+        """Check the health of a batch of steps, returning a result for each context in order.
+
+        The default implementation calls `check_step_health` for each context, running up to
+        `max_concurrent_checks` checks at once. A check that raises an error is reported with
+        `CheckStepHealthResult.errored`.
+        """
+        return _map_bounded(
+            self._check_step_health_or_error, step_handler_contexts, max_concurrent_checks
+        )
+
+    def _check_step_health_or_error(
+        self, step_handler_context: StepHandlerContext
+    ) -> CheckStepHealthResult:
+        try:
+            return self.check_step_health(step_handler_context)
+        except Exception:
+            return CheckStepHealthResult.errored(
+                serializable_error_info_from_exc_info(sys.exc_info())
+            )
+
+
+def _map_bounded(
+    fn: Callable[[StepHandlerContext], T],
+    step_handler_contexts: Sequence[StepHandlerContext],
+    max_workers: int,
+) -> Sequence[T]:
+    if max_workers <= 1 or len(step_handler_contexts) <= 1:
+        return [fn(context) for context in step_handler_contexts]
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(step_handler_contexts)),
+        thread_name_prefix="step_handler_worker",
+    ) as executor:
+        return list(executor.map(fn, step_handler_contexts))
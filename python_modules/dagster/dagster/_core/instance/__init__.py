@@ -129,6 +129,7 @@
     )
     from dagster._core.definitions.job_definition import JobDefinition
     from dagster._core.definitions.partitions.definition import PartitionsDefinition
+    from dagster._core.definitions.partitions.utils.dynamic import DynamicPartitionsMembershipCache
     from dagster._core.definitions.repository_definition.repository_definition import (
         RepositoryLoadData,
     )
@@ -534,6 +535,8 @@ def __init__(
         # Used for batched event handling
         self._event_buffer: dict[str, list[EventLogEntry]] = defaultdict(list)
 
+        self._dynamic_partitions_membership_cache: Optional[DynamicPartitionsMembershipCache] = None
+
     # ctors
 
     @public
@@ -1020,6 +1023,22 @@ def auto_materialize_max_tick_retries(self) -> int:
     def auto_materialize_use_sensors(self) -> bool:
         return self.get_settings("auto_materialize").get("use_sensors", True)
 
+    @property
+    def auto_materialize_incremental_evaluation(self) -> bool:
+        return self.get_settings("auto_materialize").get("incremental_evaluation", False)
+
+    @property
+    def auto_materialize_num_evaluation_processes(self) -> int:
+        return self.get_settings("auto_materialize").get("num_evaluation_processes", 1)
+
+    @property
+    def auto_materialize_profile_evaluations(self) -> bool:
+        return self.get_settings("auto_materialize").get("profile_evaluations", False)
+
+    @property
+    def auto_materialize_evaluation_profile_directory(self) -> Optional[str]:
+        return self.get_settings("auto_materialize").get("evaluation_profile_directory")
+
     @property
     def global_op_concurrency_default_limit(self) -> Optional[int]:
         return self.get_concurrency_config().pool_config.default_pool_limit
@@ -2614,6 +2633,29 @@ def get_paginated_dynamic_partitions(
             cursor=cursor,
         )
 
+    @traced
+    def get_dynamic_partitions_count(self, partitions_def_name: str) -> int:
+        """Get the number of partition keys for the specified :py:class:`DynamicPartitionsDefinition`.
+
+        Args:
+            partitions_def_name (str): The name of the `DynamicPartitionsDefinition`.
+        """
+        check.str_param(partitions_def_name, "partitions_def_name")
+        return self._event_storage.get_dynamic_partitions_count(partitions_def_name)
+
+    @property
+    def dynamic_partitions_membership_cache(self) -> "DynamicPartitionsMembershipCache":
+        """Caches the partition keys of dynamic partitions definitions for the lifetime of this
+        instance, so that only newly added partition keys need to be loaded from storage.
+        """
+        from dagster._core.definitions.partitions.utils.dynamic import (
+            DynamicPartitionsMembershipCache,
+        )
+
+        if self._dynamic_partitions_membership_cache is None:
+            self._dynamic_partitions_membership_cache = DynamicPartitionsMembershipCache()
+        return self._dynamic_partitions_membership_cache
+
     @public
     @traced
     def add_dynamic_partitions(
@@ -3470,6 +3512,31 @@ def get_backfills(
     def get_backfills_count(self, filters: Optional["BulkActionsFilter"] = None) -> int:
         return self._run_storage.get_backfills_count(filters=filters)
 
+    def get_runs_feed_entries(
+        self,
+        limit: int,
+        runs_filter: Optional[RunsFilter] = None,
+        backfills_filter: Optional["BulkActionsFilter"] = None,
+        run_cursor: Optional[str] = None,
+        backfill_cursor: Optional[str] = None,
+    ) -> Sequence[Union[RunRecord, "PartitionBackfill"]]:
+        return self._run_storage.get_runs_feed_entries(
+            limit=limit,
+            runs_filter=runs_filter,
+            backfills_filter=backfills_filter,
+            run_cursor=run_cursor,
+            backfill_cursor=backfill_cursor,
+        )
+
+    def get_runs_feed_count(
+        self,
+        runs_filter: Optional[RunsFilter] = None,
+        backfills_filter: Optional["BulkActionsFilter"] = None,
+    ) -> int:
+        return self._run_storage.get_runs_feed_count(
+            runs_filter=runs_filter, backfills_filter=backfills_filter
+        )
+
     def get_backfill(self, backfill_id: str) -> Optional["PartitionBackfill"]:
         return self._run_storage.get_backfill(backfill_id)
 
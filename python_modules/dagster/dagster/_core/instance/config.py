@@ -597,6 +597,39 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                     ),
                 ),
                 "use_sensors": Field(BoolSource, is_required=False),
+                "incremental_evaluation": Field(
+                    BoolSource,
+                    is_required=False,
+                    description=(
+                        "Whether to skip evaluating automation conditions for assets whose"
+                        " inputs have not changed since the previous tick"
+                    ),
+                ),
+                "num_evaluation_processes": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "How many processes to use to evaluate the automation conditions of"
+                        " independent parts of the asset graph in parallel on each tick"
+                    ),
+                ),
+                "profile_evaluations": Field(
+                    BoolSource,
+                    is_required=False,
+                    description=(
+                        "Whether to record the wall time, subset sizes and database queries of each"
+                        " automation condition node evaluated on each tick, and log a summary of"
+                        " the most expensive nodes"
+                    ),
+                ),
+                "evaluation_profile_directory": Field(
+                    StringSource,
+                    is_required=False,
+                    description=(
+                        "If profile_evaluations is enabled, a directory to which a Chrome trace"
+                        " of each tick's condition evaluations will be written"
+                    ),
+                ),
                 "use_threads": Field(Bool, is_required=False, default_value=False),
                 "num_workers": Field(
                     int,
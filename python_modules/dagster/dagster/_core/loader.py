@@ -1,11 +1,20 @@
+import asyncio
+import os
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
 from functools import partial
 from typing import TYPE_CHECKING, Generic, Optional
 
 from typing_extensions import Self, TypeVar
 
 import dagster._check as check
+from dagster._utils import traced_counter
 from dagster._utils.aiodataloader import BlockingDataLoader, DataLoader
 
 if TYPE_CHECKING:
@@ -39,6 +48,46 @@
 """
 
 
+def get_storage_executor_max_workers() -> int:
+    return int(os.getenv("DAGSTER_STORAGE_EXECUTOR_MAX_WORKERS", "8"))
+
+
+_offload_blocking_loads: ContextVar[bool] = ContextVar("offload_blocking_loads", default=False)
+
+_storage_executors: "weakref.WeakKeyDictionary[object, ThreadPoolExecutor]" = (
+    weakref.WeakKeyDictionary()
+)
+_storage_executors_lock = threading.Lock()
+
+
+def get_storage_executor(storage: object) -> ThreadPoolExecutor:
+    """Returns the bounded executor on which blocking batch loads against the given storage are
+    run, shared by every loading context in the process.
+    """
+    with _storage_executors_lock:
+        executor = _storage_executors.get(storage)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=get_storage_executor_max_workers(),
+                thread_name_prefix=f"dagster-storage-{type(storage).__name__}",
+            )
+            _storage_executors[storage] = executor
+        return executor
+
+
+@contextmanager
+def offload_blocking_loads() -> Iterator[None]:
+    """Within this context, the batch loads of Loadables without an async implementation are run
+    on the executor of the storage they read from instead of blocking the event loop, so that an
+    event loop can keep serving other requests while they wait on storage.
+    """
+    token = _offload_blocking_loads.set(True)
+    try:
+        yield
+    finally:
+        _offload_blocking_loads.reset(token)
+
+
 class LoadingContext(ABC):
     """A scoped object in which Loadable objects will be fetched in batches and cached.
 
@@ -60,8 +109,16 @@ def get_loaders_for(self, ttype: type) -> tuple[DataLoader, BlockingDataLoader]:
             if not issubclass(ttype, LoadableBy):
                 check.failed(f"{ttype} is not Loadable")
 
-            batch_load_fn = partial(ttype._batch_load, context=self)  # noqa
-            blocking_batch_load_fn = partial(ttype._blocking_batch_load, context=self)  # noqa
+            batch_load_fn = partial(
+                _traced_batch_load,
+                ttype.__name__,
+                partial(ttype._batch_load, context=self),  # noqa
+            )
+            blocking_batch_load_fn = partial(
+                _traced_blocking_batch_load,
+                ttype.__name__,
+                partial(ttype._blocking_batch_load, context=self),  # noqa
+            )
 
             self.loaders[ttype] = (
                 DataLoader(batch_load_fn=batch_load_fn),
@@ -71,8 +128,31 @@ def get_loaders_for(self, ttype: type) -> tuple[DataLoader, BlockingDataLoader]:
         return self.loaders[ttype]
 
     def clear_loaders(self) -> None:
-        for ttype in self.loaders:
-            del self.loaders[ttype]
+        self.loaders.clear()
+
+
+async def _traced_batch_load(name: str, batch_load_fn, keys):
+    counter = traced_counter.get()
+    if counter is None:
+        return await batch_load_fn(keys)
+
+    start = time.perf_counter()
+    try:
+        return await batch_load_fn(keys)
+    finally:
+        counter.record_batch(name, len(keys), time.perf_counter() - start)
+
+
+def _traced_blocking_batch_load(name: str, batch_load_fn, keys):
+    counter = traced_counter.get()
+    if counter is None:
+        return batch_load_fn(keys)
+
+    start = time.perf_counter()
+    try:
+        return batch_load_fn(keys)
+    finally:
+        counter.record_batch(name, len(keys), time.perf_counter() - start)
 
 
 TResult = TypeVar("TResult")
@@ -85,7 +165,21 @@ class LoadableBy(ABC, Generic[TKey, TContext]):
 
     @classmethod
     async def _batch_load(cls, keys: Iterable[TKey], context: TContext) -> Iterable[Optional[Self]]:
-        return cls._blocking_batch_load(keys, context)
+        if not _offload_blocking_loads.get():
+            return cls._blocking_batch_load(keys, context)
+
+        # run in a copy of the current context, so that the load is traced for the request
+        return await asyncio.get_running_loop().run_in_executor(
+            get_storage_executor(cls._get_batch_load_storage(context)),
+            partial(copy_context().run, cls._blocking_batch_load, keys, context),
+        )
+
+    @classmethod
+    def _get_batch_load_storage(cls, context: TContext) -> object:
+        """The storage which `_blocking_batch_load` reads from, which determines the executor it is
+        run on when blocking loads are offloaded.
+        """
+        return context.instance.event_log_storage
 
     @classmethod
     @abstractmethod
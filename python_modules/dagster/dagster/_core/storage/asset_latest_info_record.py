@@ -0,0 +1,126 @@
+from collections.abc import Iterable, Mapping
+from typing import AbstractSet, Optional  # noqa: UP035
+
+from dagster._core.definitions.asset_key import AssetCheckKey, AssetKey
+from dagster._core.events.log import EventLogEntry
+from dagster._core.loader import LoadableBy, LoadingContext
+from dagster._core.storage.asset_check_execution_record import AssetCheckExecutionRecord
+from dagster._core.storage.dagster_run import DagsterRunStatus, RunRecord
+from dagster._core.storage.event_log.base import AssetRecord
+from dagster._record import record
+
+PENDING_STATUSES = {
+    DagsterRunStatus.STARTING,
+    DagsterRunStatus.MANAGED,
+    DagsterRunStatus.NOT_STARTED,
+    DagsterRunStatus.QUEUED,
+    DagsterRunStatus.STARTED,
+    DagsterRunStatus.CANCELING,
+}
+IN_PROGRESS_STATUSES = {
+    DagsterRunStatus.STARTED,
+    DagsterRunStatus.CANCELING,
+}
+
+
+@record
+class AssetLatestInfoRecord(LoadableBy[AssetKey]):
+    """The latest materialization of an asset, the state of the latest run planned to materialize
+    it, and the latest execution of each of its checks.
+
+    Loading these for a batch of assets takes a fixed number of set-based queries: one for the
+    asset records, one for the latest planned materializations if the asset records do not track
+    them, one for the latest planned runs and one for the latest check executions.
+    """
+
+    asset_key: AssetKey
+    asset_record: Optional[AssetRecord]
+    latest_run_record: Optional[RunRecord]
+    # runs planned to materialize the asset which have not done so yet
+    in_progress_run_ids: AbstractSet[str]
+    unstarted_run_ids: AbstractSet[str]
+    # runs planned to materialize the asset which failed before doing so
+    failed_run_ids: AbstractSet[str]
+    latest_check_executions: Mapping[AssetCheckKey, AssetCheckExecutionRecord]
+
+    @property
+    def latest_materialization(self) -> Optional[EventLogEntry]:
+        return self.asset_record.asset_entry.last_materialization if self.asset_record else None
+
+    @classmethod
+    def _blocking_batch_load(
+        cls, keys: Iterable[AssetKey], context: LoadingContext
+    ) -> Iterable[Optional["AssetLatestInfoRecord"]]:
+        keys = list(keys)
+        storage = context.instance.event_log_storage
+
+        asset_records = {
+            asset_record.asset_entry.asset_key: asset_record
+            for asset_record in AssetRecord.blocking_get_many(context, keys)
+            if asset_record is not None
+        }
+
+        if storage.asset_records_have_last_planned_and_failed_materializations:
+            latest_planned_run_ids = {
+                asset_key: asset_record.asset_entry.last_planned_materialization_run_id
+                for asset_key, asset_record in asset_records.items()
+                if asset_record.asset_entry.last_planned_materialization_run_id
+            }
+        else:
+            latest_planned_run_ids = {
+                asset_key: planned_info.run_id
+                for asset_key, planned_info in (
+                    storage.get_latest_planned_materialization_info_by_asset_key(
+                        list(asset_records.keys())
+                    ).items()
+                )
+            }
+
+        run_ids = list(set(latest_planned_run_ids.values()))
+        # the latest planned run may have been deleted since it was planned
+        run_records_by_id = {
+            run_id: run_record
+            for run_id, run_record in zip(run_ids, RunRecord.blocking_get_many(context, run_ids))
+            if run_record is not None
+        }
+
+        try:
+            check_executions = storage.get_latest_asset_check_executions_by_asset_key(keys)
+        except NotImplementedError:
+            check_executions = {}
+
+        results = []
+        for asset_key in keys:
+            asset_record = asset_records.get(asset_key)
+            latest_materialization = (
+                asset_record.asset_entry.last_materialization if asset_record else None
+            )
+            run_id = latest_planned_run_ids.get(asset_key)
+            run_record = run_records_by_id.get(run_id) if run_id else None
+            # runs which have already materialized the asset are neither in progress nor failed
+            status = (
+                run_record.dagster_run.status
+                if run_record
+                and (not latest_materialization or latest_materialization.run_id != run_id)
+                else None
+            )
+            results.append(
+                AssetLatestInfoRecord(
+                    asset_key=asset_key,
+                    asset_record=asset_record,
+                    latest_run_record=run_record,
+                    in_progress_run_ids=(
+                        {run_id} if run_id and status in IN_PROGRESS_STATUSES else set()
+                    ),
+                    unstarted_run_ids=(
+                        {run_id}
+                        if run_id and status in PENDING_STATUSES - IN_PROGRESS_STATUSES
+                        else set()
+                    ),
+                    failed_run_ids=(
+                        {run_id} if run_id and status == DagsterRunStatus.FAILURE else set()
+                    ),
+                    latest_check_executions=check_executions.get(asset_key, {}),
+                )
+            )
+        return results
@@ -79,6 +79,20 @@ def download_from_cloud_storage(
     ) -> None:
         """Downloads the logs for a given log key from cloud storage to local storage."""
 
+    def download_range_from_cloud_storage(
+        self,
+        log_key: Sequence[str],
+        io_type: ComputeIOType,
+        offset: int,
+        max_bytes: int,
+        partial: bool = False,
+    ) -> Optional[bytes]:
+        """Downloads at most max_bytes of the logs for a given log key from cloud storage, starting
+        at the given offset. Returns None if the cloud storage does not support ranged downloads, in
+        which case the whole logs are downloaded instead.
+        """
+        return None
+
     @contextmanager
     def capture_logs(self, log_key: Sequence[str]) -> Iterator[CapturedLogContext]:
         with self._poll_for_local_upload(log_key):
@@ -129,6 +143,14 @@ def get_log_data_for_type(
             )
             return self.local_manager.read_path(local_path, offset=offset, max_bytes=max_bytes)
         if self.cloud_storage_has_logs(log_key, io_type, partial=True):
+            # partial logs are uploaded again as they grow, so only the requested range is
+            # downloaded when following them
+            if max_bytes is not None:
+                data = self.download_range_from_cloud_storage(
+                    log_key, io_type, offset, max_bytes, partial=True
+                )
+                if data is not None:
+                    return data, offset + len(data)
             self.download_from_cloud_storage(log_key, io_type, partial=True)
             local_path = self.local_manager.get_captured_local_path(
                 log_key, IO_TYPE_EXTENSION[io_type], partial=True
@@ -137,6 +159,11 @@ def get_log_data_for_type(
 
         return None, offset
 
+    def get_log_size(self, log_key: Sequence[str], io_type: ComputeIOType) -> Optional[int]:
+        if self.has_local_file(log_key, io_type):
+            return self.local_manager.get_log_size(log_key, io_type)
+        return super().get_log_size(log_key, io_type)
+
     def get_log_metadata(self, log_key: Sequence[str]) -> CapturedLogMetadata:
         return CapturedLogMetadata(
             stdout_location=self.display_path_for_type(log_key, ComputeIOType.STDOUT),
@@ -139,6 +139,8 @@ def __init__(
         self._log_key = log_key
         self._cursor = cursor
         self._observer: Optional[Callable[[CapturedLogData], None]] = None
+        self._on_update: Optional[Callable[[], None]] = None
+        self._has_read = False
         self.is_complete = False
 
     def __call__(self, observer: Optional[Callable[[CapturedLogData], None]]) -> Self:
@@ -148,15 +150,59 @@ def __call__(self, observer: Optional[Callable[[CapturedLogData], None]]) -> Sel
             self.complete()
         return self
 
+    def follow(self, on_update: Callable[[], None]) -> Self:
+        """Follows the captured logs without reading them: `on_update` is called whenever data may
+        have been appended to the logs or the capture completes, and the appended data is then read
+        with `read_frame`. Unlike an observer, which is pushed every chunk of the logs as soon as it
+        is read, this lets the consumer read the logs only as fast as it can send them.
+        """
+        self._on_update = on_update
+        if self._manager.is_capture_complete(self._log_key):
+            self.complete()
+        else:
+            on_update()
+        return self
+
+    def read_frame(self, max_bytes: int = MAX_BYTES_CHUNK_READ) -> Optional[CapturedLogData]:
+        """Reads at most `max_bytes` of each of stdout and stderr appended since the last frame,
+        returning None if nothing was appended. The first frame is always returned, so that the
+        consumer receives the cursor of the logs. Frames end on a character boundary, so that each
+        frame can be decoded on its own.
+        """
+        log_data = self._manager.get_log_data(self._log_key, self._cursor, max_bytes=max_bytes)
+        stdout, stdout_partial = _split_partial_character(log_data.stdout)
+        stderr, stderr_partial = _split_partial_character(log_data.stderr)
+        if stdout_partial or stderr_partial:
+            stdout_offset, stderr_offset = self._manager.parse_cursor(log_data.cursor)
+            log_data = CapturedLogData(
+                log_key=log_data.log_key,
+                stdout=stdout,
+                stderr=stderr,
+                cursor=self._manager.build_cursor(
+                    stdout_offset - stdout_partial, stderr_offset - stderr_partial
+                ),
+            )
+
+        if self._has_read and log_data.cursor == self._cursor:
+            return None
+        self._has_read = True
+        self._cursor = log_data.cursor
+        return log_data
+
     @property
     def log_key(self) -> Sequence[str]:
         return self._log_key
 
     def dispose(self) -> None:
         self._observer = None
+        self._on_update = None
         self._manager.unsubscribe(self)
 
     def fetch(self) -> None:
+        if self._on_update:
+            self._on_update()
+            return
+
         if not self._observer:
             return
 
@@ -174,6 +220,8 @@ def fetch(self) -> None:
 
     def complete(self) -> None:
         self.is_complete = True
+        if self._on_update:
+            self._on_update()
 
 
 def _has_max_data(chunk: Optional[bytes]) -> bool:
@@ -181,6 +229,30 @@ def _has_max_data(chunk: Optional[bytes]) -> bool:
     return chunk and len(chunk) >= MAX_BYTES_CHUNK_READ  # type: ignore
 
 
+def _split_partial_character(chunk: Optional[bytes]) -> tuple[Optional[bytes], int]:
+    """Splits off the bytes of a multi-byte utf-8 character which is cut off at the end of a chunk,
+    returning the rest of the chunk and the number of bytes split off.
+    """
+    if not chunk:
+        return chunk, 0
+
+    for i in range(1, min(len(chunk), 4) + 1):
+        byte = chunk[-i]
+        if byte & 0xC0 == 0x80:
+            # a continuation byte, keep looking for the first byte of the character
+            continue
+        if byte & 0xE0 == 0xC0:
+            length = 2
+        elif byte & 0xF0 == 0xE0:
+            length = 3
+        elif byte & 0xF8 == 0xF0:
+            length = 4
+        else:
+            length = 1
+        return (chunk[:-i], i) if i < length else (chunk, 0)
+    return chunk, 0
+
+
 @public
 class ComputeLogManager(ABC, MayHaveInstanceWeakref[T_DagsterInstance]):
     """Abstract base class for capturing the unstructured logs (stdout/stderr) in the current
@@ -331,6 +403,111 @@ def get_log_data(
             cursor=self.build_cursor(new_stdout_offset, new_stderr_offset),
         )
 
+    def get_log_size(self, log_key: Sequence[str], io_type: ComputeIOType) -> Optional[int]:
+        """Returns the size in bytes of the captured io_type logs for a given log key, or None if
+        there are no logs. Implementations which can stat their logs should override this, as by
+        default the logs are read in bounded chunks to count their bytes.
+
+        Args:
+            log_key (List[String]): The log key identifying the captured logs
+            io_type (ComputeIOType): stderr or stdout
+
+        Returns:
+            Optional[int]
+        """
+        size = None
+        offset = 0
+        while True:
+            chunk, offset = self.get_log_data_for_type(
+                log_key, io_type, offset, max_bytes=MAX_BYTES_CHUNK_READ
+            )
+            if chunk is None:
+                return size
+            size = offset
+            if len(chunk) < MAX_BYTES_CHUNK_READ:
+                return size
+
+    def read_log_tail(
+        self, log_key: Sequence[str], io_type: ComputeIOType, max_bytes: int
+    ) -> tuple[Optional[bytes], int]:
+        """Returns the last lines of the captured io_type logs for a given log key, reading at most
+        the last max_bytes of the logs. A line cut off by the start of the range is dropped.
+
+        Args:
+            log_key (List[String]): The log key identifying the captured logs
+            io_type (ComputeIOType): stderr or stdout
+            max_bytes (int): A limit on the size of the tail to read
+
+        Returns:
+            Tuple[Optional[bytes], int]: The content read and offset of its end in to the logs
+        """
+        size = self.get_log_size(log_key, io_type)
+        if size is None:
+            return None, 0
+
+        start = max(size - max_bytes, 0)
+        data, offset = self.get_log_data_for_type(log_key, io_type, start, max_bytes=size - start)
+        if data and start > 0:
+            # drop the partial line at the start of the range, unless it is the only line read
+            newline = data.find(b"\n")
+            if newline != -1 and newline + 1 < len(data):
+                data = data[newline + 1 :]
+        return data, offset
+
+    def get_log_data_tail(self, log_key: Sequence[str], max_bytes: int) -> CapturedLogData:
+        """Returns the last lines of the captured stdout and stderr for a given log key, with a
+        cursor at the end of the logs from which new data can be read with get_log_data.
+
+        Args:
+            log_key (List[String]): The log key identifying the captured logs
+            max_bytes (int): A limit on the size of the tail of each of stdout and stderr
+
+        Returns:
+            CapturedLogData
+        """
+        stdout, stdout_offset = self.read_log_tail(log_key, ComputeIOType.STDOUT, max_bytes)
+        stderr, stderr_offset = self.read_log_tail(log_key, ComputeIOType.STDERR, max_bytes)
+        return CapturedLogData(
+            log_key=log_key,
+            stdout=stdout,
+            stderr=stderr,
+            cursor=self.build_cursor(stdout_offset, stderr_offset),
+        )
+
+    def seek_log_line(
+        self, log_key: Sequence[str], io_type: ComputeIOType, line: int, offset: int = 0
+    ) -> Optional[int]:
+        """Returns the byte offset at which the given line of the captured io_type logs starts, or
+        None if the logs have fewer lines. The logs are scanned in bounded chunks.
+
+        Args:
+            log_key (List[String]): The log key identifying the captured logs
+            io_type (ComputeIOType): stderr or stdout
+            line (int): The index of the line, counted from the given offset
+            offset (int): The offset of a line start in to the logs to scan from
+
+        Returns:
+            Optional[int]
+        """
+        remaining = line
+        while remaining > 0:
+            chunk, next_offset = self.get_log_data_for_type(
+                log_key, io_type, offset, max_bytes=MAX_BYTES_CHUNK_READ
+            )
+            if not chunk:
+                return None
+            num_newlines = chunk.count(b"\n")
+            if num_newlines < remaining:
+                remaining -= num_newlines
+                offset = next_offset
+                continue
+
+            index = -1
+            for _ in range(remaining):
+                index = chunk.index(b"\n", index + 1)
+            return offset + index + 1
+        return offset
+
     def build_log_key_for_run(self, run_id: str, step_key: str) -> Sequence[str]:
         """Legacy adapter to translate run_id/key to captured log manager-based log_key."""
         return [run_id, "compute_logs", step_key]
@@ -347,18 +524,26 @@ def _get_log_lines_for_log_key(
         self,
         log_key: Sequence[str],
         io_type: ComputeIOType,
+        offset: int = 0,
+        max_lines: Optional[int] = None,
     ) -> Sequence[str]:
-        """For a log key, gets the corresponding file, and splits the file into lines."""
-        log_data, _ = self.get_log_data_for_type(
-            log_key,
-            io_type,
-            offset=0,
-            max_bytes=None,
-        )
-        raw_logs = log_data.decode("utf-8") if log_data else ""
-        log_lines = raw_logs.split("\n")
+        """For a log key, reads the lines of the corresponding file starting at the given byte
+        offset, reading only as many chunks of the file as needed for max_lines lines.
+        """
+        chunks = []
+        num_newlines = 0
+        while max_lines is None or num_newlines < max_lines:
+            chunk, offset = self.get_log_data_for_type(
+                log_key, io_type, offset=offset, max_bytes=MAX_BYTES_CHUNK_READ
+            )
+            if not chunk:
+                break
+            chunks.append(chunk)
+            num_newlines += chunk.count(b"\n")
 
-        return log_lines
+        raw_logs = b"".join(chunks).decode("utf-8")
+        log_lines = raw_logs.split("\n")
+        return log_lines if max_lines is None else log_lines[:max_lines]
 
     def read_log_lines_for_log_key_prefix(
         self,
@@ -400,18 +585,38 @@ def read_log_lines_for_log_key_prefix(
             log_key_to_fetch_idx += 1
             line_cursor = 0
 
-        log_lines = self._get_log_lines_for_log_key(log_keys[log_key_to_fetch_idx], io_type=io_type)
+        # the cursor holds the byte offset of its line, so that the lines already read are not
+        # scanned again
+        if log_cursor and log_cursor.line == line_cursor and log_cursor.offset is not None:
+            line_offset = log_cursor.offset
+        else:
+            line_offset = self.seek_log_line(
+                log_keys[log_key_to_fetch_idx], io_type=io_type, line=line_cursor
+            )
+
+        if line_offset is None:
+            log_lines = []
+            line_offset = 0
+        else:
+            # read one more line than needed, to tell whether the file has more lines
+            log_lines = self._get_log_lines_for_log_key(
+                log_keys[log_key_to_fetch_idx],
+                io_type=io_type,
+                offset=line_offset,
+                max_lines=num_lines + 1,
+            )
         records = []
         has_more = True
 
         while len(records) < num_lines:
-            remaining_log_lines = log_lines[line_cursor:]
             remaining_lines_to_fetch = num_lines - len(records)
-            if remaining_lines_to_fetch < len(remaining_log_lines):
-                records.extend(remaining_log_lines[:remaining_lines_to_fetch])
+            if remaining_lines_to_fetch < len(log_lines):
+                lines_read = log_lines[:remaining_lines_to_fetch]
+                records.extend(lines_read)
                 line_cursor += remaining_lines_to_fetch
+                line_offset += sum(len(line.encode("utf-8")) + 1 for line in lines_read)
             else:
-                records.extend(remaining_log_lines)
+                records.extend(log_lines)
                 line_cursor = -1
 
             if line_cursor == -1:
@@ -422,15 +627,19 @@ def read_log_lines_for_log_key_prefix(
                     break
                 log_key_to_fetch_idx += 1
                 line_cursor = 0
+                line_offset = 0
                 if len(records) < num_lines:
                     # we still need more records, so fetch the next file
                     log_lines = self._get_log_lines_for_log_key(
-                        log_keys[log_key_to_fetch_idx], io_type=io_type
+                        log_keys[log_key_to_fetch_idx],
+                        io_type=io_type,
+                        max_lines=num_lines - len(records) + 1,
                     )
 
         new_cursor = LogLineCursor(
             log_key=log_keys[log_key_to_fetch_idx],
             line=line_cursor,
             has_more_now=has_more,
+            offset=line_offset if line_cursor != -1 else None,
         )
         return records, new_cursor
@@ -739,6 +739,10 @@ def _blocking_batch_load(
 
         return result_map.values()
 
+    @classmethod
+    def _get_batch_load_storage(cls, context: LoadingContext) -> object:
+        return context.instance.run_storage
+
 
 @whitelist_for_serdes
 class RunPartitionData(
@@ -561,6 +561,10 @@ def get_paginated_dynamic_partitions(
     ) -> PaginatedResults[str]:
         raise NotImplementedError()
 
+    def get_dynamic_partitions_count(self, partitions_def_name: str) -> int:
+        """Get the number of partition keys for a dynamic partitions definition."""
+        return len(self.get_dynamic_partitions(partitions_def_name))
+
     @abstractmethod
     def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> bool:
         """Check if a dynamic partition exists."""
@@ -689,6 +693,12 @@ def get_latest_asset_check_execution_by_key(
         """Get the latest executions for a list of asset checks."""
         pass
 
+    def get_latest_asset_check_executions_by_asset_key(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Mapping[AssetCheckKey, AssetCheckExecutionRecord]]:
+        """Get the latest execution of every check of each of the given assets."""
+        raise NotImplementedError()
+
     @abstractmethod
     def fetch_materializations(
         self,
@@ -741,6 +751,19 @@ def get_latest_planned_materialization_info(
     ) -> Optional[PlannedMaterializationInfo]:
         raise NotImplementedError()
 
+    def get_latest_planned_materialization_info_by_asset_key(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, PlannedMaterializationInfo]:
+        """Get the latest planned materialization of each of the given assets, across all of their
+        partitions.
+        """
+        planned_infos = {}
+        for asset_key in asset_keys:
+            planned_info = self.get_latest_planned_materialization_info(asset_key)
+            if planned_info:
+                planned_infos[asset_key] = planned_info
+        return planned_infos
+
     @abstractmethod
     def get_updated_data_version_partitions(
         self, asset_key: AssetKey, partitions: Iterable[str], since_storage_id: int
@@ -119,6 +119,9 @@
 
 MIN_ASSET_ROWS = 25
 DEFAULT_MAX_LIMIT_EVENT_RECORDS = 10000
+# the number of dynamic partitions inserted per statement, which keeps the number of bound
+# parameters per statement below the limits of each supported database
+DYNAMIC_PARTITIONS_INSERT_CHUNK_SIZE = 500
 
 
 def get_max_event_records_limit() -> int:
@@ -2114,6 +2117,14 @@ def get_paginated_dynamic_partitions(
             has_more=len(rows) == limit,
         )
 
+    def get_dynamic_partitions_count(self, partitions_def_name: str) -> int:
+        self._check_partitions_table()
+        query = db_select([db.func.count()]).where(
+            DynamicPartitionsTable.c.partitions_def_name == partitions_def_name
+        )
+        with self.index_connection() as conn:
+            return cast("int", conn.execute(query).scalar())
+
     def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> bool:
         self._check_partitions_table()
         query = (
@@ -2135,30 +2146,57 @@ def add_dynamic_partitions(
         self, partitions_def_name: str, partition_keys: Sequence[str]
     ) -> None:
         self._check_partitions_table()
+        # dedupe the keys, preserving their order so that ids are assigned in the order given
+        partition_keys = list(dict.fromkeys(partition_keys))
         with self.index_connection() as conn:
-            existing_rows = conn.execute(
-                db_select([DynamicPartitionsTable.c.partition]).where(
-                    db.and_(
-                        DynamicPartitionsTable.c.partition.in_(partition_keys),
-                        DynamicPartitionsTable.c.partitions_def_name == partitions_def_name,
-                    )
+            for chunk_start in range(0, len(partition_keys), DYNAMIC_PARTITIONS_INSERT_CHUNK_SIZE):
+                self._add_dynamic_partitions_chunk(
+                    conn,
+                    partitions_def_name,
+                    partition_keys[
+                        chunk_start : chunk_start + DYNAMIC_PARTITIONS_INSERT_CHUNK_SIZE
+                    ],
                 )
-            ).fetchall()
-            existing_keys = set([row[0] for row in existing_rows])
-            new_keys = [
-                partition_key
-                for partition_key in partition_keys
-                if partition_key not in existing_keys
-            ]
 
-            if new_keys:
-                conn.execute(
-                    DynamicPartitionsTable.insert(),
+    def _add_dynamic_partitions_chunk(
+        self, conn: Connection, partitions_def_name: str, partition_keys: Sequence[str]
+    ) -> None:
+        existing_rows = conn.execute(
+            db_select([DynamicPartitionsTable.c.partition]).where(
+                db.and_(
+                    DynamicPartitionsTable.c.partition.in_(partition_keys),
+                    DynamicPartitionsTable.c.partitions_def_name == partitions_def_name,
+                )
+            )
+        ).fetchall()
+        existing_keys = set([row[0] for row in existing_rows])
+        new_keys = [
+            partition_key for partition_key in partition_keys if partition_key not in existing_keys
+        ]
+        if not new_keys:
+            return
+
+        try:
+            conn.execute(
+                DynamicPartitionsTable.insert().values(
                     [
                         dict(partitions_def_name=partitions_def_name, partition=partition_key)
                         for partition_key in new_keys
-                    ],
+                    ]
                 )
+            )
+        except db_exc.IntegrityError:
+            # some of the keys were added concurrently, so insert the keys one at a time,
+            # skipping any that now exist
+            for partition_key in new_keys:
+                try:
+                    conn.execute(
+                        DynamicPartitionsTable.insert().values(
+                            partitions_def_name=partitions_def_name, partition=partition_key
+                        )
+                    )
+                except db_exc.IntegrityError:
+                    pass
 
     def delete_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> None:
         self._check_partitions_table()
@@ -3149,20 +3187,41 @@ def get_latest_asset_check_execution_by_key(
         if not check_keys:
             return {}
 
+        return self._get_latest_asset_check_executions(
+            db.and_(
+                AssetCheckExecutionsTable.c.asset_key.in_(
+                    [key.asset_key.to_string() for key in check_keys]
+                ),
+                AssetCheckExecutionsTable.c.check_name.in_([key.name for key in check_keys]),
+            )
+        )
+
+    def get_latest_asset_check_executions_by_asset_key(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Mapping[AssetCheckKey, AssetCheckExecutionRecord]]:
+        if not asset_keys or not self.supports_asset_checks:
+            return {}
+
+        executions = self._get_latest_asset_check_executions(
+            AssetCheckExecutionsTable.c.asset_key.in_(
+                [asset_key.to_string() for asset_key in asset_keys]
+            )
+        )
+        executions_by_asset_key = defaultdict(dict)
+        for check_key, execution in executions.items():
+            executions_by_asset_key[check_key.asset_key][check_key] = execution
+        return executions_by_asset_key
+
+    def _get_latest_asset_check_executions(
+        self, where_clause: db.sql.ColumnElement
+    ) -> Mapping[AssetCheckKey, AssetCheckExecutionRecord]:
         latest_ids_subquery = db_subquery(
             db_select(
                 [
                     db.func.max(AssetCheckExecutionsTable.c.id).label("id"),
                 ]
             )
-            .where(
-                db.and_(
-                    AssetCheckExecutionsTable.c.asset_key.in_(
-                        [key.asset_key.to_string() for key in check_keys]
-                    ),
-                    AssetCheckExecutionsTable.c.check_name.in_([key.name for key in check_keys]),
-                )
-            )
+            .where(where_clause)
             .group_by(
                 AssetCheckExecutionsTable.c.asset_key,
                 AssetCheckExecutionsTable.c.check_name,
@@ -3226,6 +3285,53 @@ def get_latest_planned_materialization_info(
             run_id=records[0].run_id,
         )
 
+    def get_latest_planned_materialization_info_by_asset_key(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, PlannedMaterializationInfo]:
+        if not asset_keys:
+            return {}
+
+        latest_ids_subquery = db_subquery(
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.asset_key,
+                    db.func.max(SqlEventLogStorageTable.c.id).label("id"),
+                ]
+            )
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.asset_key.in_(
+                        [asset_key.to_string() for asset_key in asset_keys]
+                    ),
+                    SqlEventLogStorageTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION_PLANNED.value,
+                )
+            )
+            .group_by(SqlEventLogStorageTable.c.asset_key)
+        )
+        query = db_select(
+            [
+                SqlEventLogStorageTable.c.asset_key,
+                SqlEventLogStorageTable.c.id,
+                SqlEventLogStorageTable.c.run_id,
+            ]
+        ).select_from(
+            latest_ids_subquery.join(
+                SqlEventLogStorageTable,
+                SqlEventLogStorageTable.c.id == latest_ids_subquery.c.id,
+            )
+        )
+
+        with self.index_connection() as conn:
+            rows = db_fetch_mappings(conn, query)
+
+        return {
+            check.not_none(AssetKey.from_db_string(row["asset_key"])): PlannedMaterializationInfo(
+                storage_id=row["id"], run_id=row["run_id"]
+            )
+            for row in rows
+        }
+
     def _get_partition_data_versions(
         self,
         asset_key: AssetKey,
@@ -338,6 +338,31 @@ def get_backfills(
     def get_backfills_count(self, filters: Optional["BulkActionsFilter"] = None) -> int:
         return self._storage.run_storage.get_backfills_count(filters=filters)
 
+    def get_runs_feed_entries(
+        self,
+        limit: int,
+        runs_filter: Optional["RunsFilter"] = None,
+        backfills_filter: Optional["BulkActionsFilter"] = None,
+        run_cursor: Optional[str] = None,
+        backfill_cursor: Optional[str] = None,
+    ) -> Sequence[Union["RunRecord", "PartitionBackfill"]]:
+        return self._storage.run_storage.get_runs_feed_entries(
+            limit=limit,
+            runs_filter=runs_filter,
+            backfills_filter=backfills_filter,
+            run_cursor=run_cursor,
+            backfill_cursor=backfill_cursor,
+        )
+
+    def get_runs_feed_count(
+        self,
+        runs_filter: Optional["RunsFilter"] = None,
+        backfills_filter: Optional["BulkActionsFilter"] = None,
+    ) -> int:
+        return self._storage.run_storage.get_runs_feed_count(
+            runs_filter=runs_filter, backfills_filter=backfills_filter
+        )
+
     def get_backfill(self, backfill_id: str) -> Optional["PartitionBackfill"]:
         return self._storage.run_storage.get_backfill(backfill_id)
 
@@ -543,6 +568,13 @@ def get_latest_planned_materialization_info(
             asset_key, partition
         )
 
+    def get_latest_planned_materialization_info_by_asset_key(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, PlannedMaterializationInfo]:
+        return self._storage.event_log_storage.get_latest_planned_materialization_info_by_asset_key(
+            asset_keys
+        )
+
     def get_updated_data_version_partitions(
         self, asset_key: AssetKey, partitions: Iterable[str], since_storage_id: int
     ) -> set[str]:
@@ -643,6 +675,9 @@ def get_paginated_dynamic_partitions(
             partitions_def_name=partitions_def_name, limit=limit, ascending=ascending, cursor=cursor
         )
 
+    def get_dynamic_partitions_count(self, partitions_def_name: str) -> int:
+        return self._storage.event_log_storage.get_dynamic_partitions_count(partitions_def_name)
+
     def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> bool:
         return self._storage.event_log_storage.has_dynamic_partition(
             partitions_def_name, partition_key
@@ -759,6 +794,13 @@ def get_latest_asset_check_execution_by_key(  # pyright: ignore[reportIncompatib
     ) -> Mapping["AssetCheckKey", Optional[AssetCheckExecutionRecord]]:
         return self._storage.event_log_storage.get_latest_asset_check_execution_by_key(check_keys)
 
+    def get_latest_asset_check_executions_by_asset_key(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Mapping["AssetCheckKey", AssetCheckExecutionRecord]]:
+        return self._storage.event_log_storage.get_latest_asset_check_executions_by_asset_key(
+            asset_keys
+        )
+
 
 class LegacyScheduleStorage(ScheduleStorage, ConfigurableClass):
     def __init__(self, storage: DagsterStorage, inst_data: Optional[ConfigurableClassData] = None):
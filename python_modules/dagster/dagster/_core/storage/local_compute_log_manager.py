@@ -1,6 +1,7 @@
 import os
 import shutil
 import sys
+import threading
 from collections import defaultdict
 from collections.abc import Generator, Iterator, Mapping, Sequence
 from contextlib import contextmanager
@@ -8,8 +9,6 @@
 from typing import IO, Final, Optional
 
 from dagster_shared.seven import json
-from watchdog.events import PatternMatchingEventHandler
-from watchdog.observers.polling import PollingObserver
 
 from dagster import (
     Field,
@@ -29,10 +28,10 @@
     ComputeLogManager,
 )
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
-from dagster._utils import ensure_dir, ensure_file, touch_file
+from dagster._utils import ensure_file, touch_file
 from dagster._utils.security import non_secure_md5_hash_str
 
-DEFAULT_WATCHDOG_POLLING_TIMEOUT: Final = 2.5
+DEFAULT_POLLING_TIMEOUT: Final = 2.5
 
 IO_TYPE_EXTENSION: Final[Mapping[ComputeIOType, str]] = {
     ComputeIOType.STDOUT: "out",
@@ -54,7 +53,7 @@ def __init__(
     ):
         self._base_dir = base_dir
         self._polling_timeout = check.opt_float_param(
-            polling_timeout, "polling_timeout", DEFAULT_WATCHDOG_POLLING_TIMEOUT
+            polling_timeout, "polling_timeout", DEFAULT_POLLING_TIMEOUT
         )
         self._subscription_manager = LocalComputeLogSubscriptionManager(self)
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
@@ -84,11 +83,21 @@ def from_config_value(
     def capture_logs(self, log_key: Sequence[str]) -> Generator[CapturedLogContext, None, None]:
         outpath = self.get_captured_local_path(log_key, IO_TYPE_EXTENSION[ComputeIOType.STDOUT])
         errpath = self.get_captured_local_path(log_key, IO_TYPE_EXTENSION[ComputeIOType.STDERR])
-        with mirror_stream_to_file(sys.stdout, outpath), mirror_stream_to_file(sys.stderr, errpath):
+
+        # subscribers in this process are pushed updates as output is pumped, rather than waiting
+        # for the next poll of the log files
+        def on_write():
+            self._subscription_manager.notify_updated(log_key)
+
+        with (
+            mirror_stream_to_file(sys.stdout, outpath, on_write=on_write),
+            mirror_stream_to_file(sys.stderr, errpath, on_write=on_write),
+        ):
             yield CapturedLogContext(log_key)
 
         # leave artifact on filesystem so that we know the capture is completed
         touch_file(self.complete_artifact_path(log_key))
+        self._subscription_manager.notify_updated(log_key)
 
     @contextmanager
     def open_log_stream(
@@ -167,6 +176,12 @@ def get_log_data_for_type(
         path = self.get_captured_local_path(log_key, IO_TYPE_EXTENSION[io_type])
         return self.read_path(path, offset or 0, max_bytes)
 
+    def get_log_size(self, log_key: Sequence[str], io_type: ComputeIOType) -> Optional[int]:
+        path = self.get_captured_local_path(log_key, IO_TYPE_EXTENSION[io_type])
+        if not os.path.isfile(path):
+            return None
+        return os.path.getsize(path)
+
     def complete_artifact_path(self, log_key):
         return self.get_captured_local_path(log_key, "complete")
 
@@ -242,11 +257,22 @@ def dispose(self) -> None:
 
 
 class LocalComputeLogSubscriptionManager:
+    """Pushes new log data to subscribers of captures that are still in progress.
+
+    Captures running in this process notify the manager directly as output is written. Captures
+    running in other processes are picked up by a single thread that polls the sizes of the
+    subscribed log files every `polling_timeout` seconds, which avoids watching whole directories.
+    """
+
     def __init__(self, manager):
         self._manager = manager
+        self._lock = threading.RLock()
         self._subscriptions = defaultdict(list)
-        self._watchers = {}
-        self._observer = None
+        self._file_sizes: dict[str, tuple[Optional[int], ...]] = {}
+        self._updated: set[str] = set()
+        self._wake_event = threading.Event()
+        self._shutdown_event = threading.Event()
+        self._polling_thread = None
 
     def add_subscription(self, subscription: CapturedLogSubscription) -> None:
         check.inst_param(subscription, "subscription", CapturedLogSubscription)
@@ -257,8 +283,11 @@ def add_subscription(self, subscription: CapturedLogSubscription) -> None:
         else:
             log_key = self._log_key(subscription)
             watch_key = self._watch_key(log_key)
-            self._subscriptions[watch_key].append(subscription)
-            self.watch(subscription)
+            with self._lock:
+                if watch_key not in self._file_sizes:
+                    self._file_sizes[watch_key] = self._get_file_sizes(log_key)
+                self._subscriptions[watch_key].append(subscription)
+            self._start_polling_thread()
 
     def is_complete(self, subscription: CapturedLogSubscription) -> bool:
         check.inst_param(subscription, "subscription", CapturedLogSubscription)
@@ -269,9 +298,13 @@ def remove_subscription(self, subscription: CapturedLogSubscription) -> None:
         check.inst_param(subscription, "subscription", CapturedLogSubscription)
         log_key = self._log_key(subscription)
         watch_key = self._watch_key(log_key)
-        if subscription in self._subscriptions[watch_key]:
+        with self._lock:
+            if subscription not in self._subscriptions.get(watch_key, ()):
+                return
             self._subscriptions[watch_key].remove(subscription)
-            subscription.complete()
+            if not self._subscriptions[watch_key]:
+                self._unwatch(watch_key)
+        subscription.complete()
 
     def _log_key(self, subscription: CapturedLogSubscription) -> Sequence[str]:
         check.inst_param(subscription, "subscription", CapturedLogSubscription)
@@ -283,16 +316,37 @@ def _watch_key(self, log_key: Sequence[str]) -> str:
 
     def remove_all_subscriptions(self, log_key: Sequence[str]) -> None:
         watch_key = self._watch_key(log_key)
-        for subscription in self._subscriptions.pop(watch_key, []):
+        with self._lock:
+            subscriptions = self._subscriptions.get(watch_key, [])
+            self._unwatch(watch_key)
+        for subscription in subscriptions:
             subscription.complete()
 
-    def watch(self, subscription: CapturedLogSubscription) -> None:
-        log_key = self._log_key(subscription)
+    def _unwatch(self, watch_key: str) -> None:
+        self._subscriptions.pop(watch_key, None)
+        self._file_sizes.pop(watch_key, None)
+        self._updated.discard(watch_key)
+
+    def notify_updated(self, log_key: Sequence[str]) -> None:
+        """Flag that new data is available for the given log key, waking the polling thread if
+        anyone is subscribed to it. Safe to call from any thread.
+        """
         watch_key = self._watch_key(log_key)
-        if watch_key in self._watchers:
-            return
+        with self._lock:
+            if watch_key not in self._subscriptions:
+                return
+            self._updated.add(watch_key)
+        self._wake_event.set()
 
-        update_paths = [
+    def notify_subscriptions(self, log_key: Sequence[str]) -> None:
+        watch_key = self._watch_key(log_key)
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(watch_key, []))
+        for subscription in subscriptions:
+            subscription.fetch()
+
+    def _get_file_sizes(self, log_key: Sequence[str]) -> tuple[Optional[int], ...]:
+        paths = [
             self._manager.get_captured_local_path(log_key, IO_TYPE_EXTENSION[ComputeIOType.STDOUT]),
             self._manager.get_captured_local_path(log_key, IO_TYPE_EXTENSION[ComputeIOType.STDERR]),
             self._manager.get_captured_local_path(
@@ -302,53 +356,56 @@ def watch(self, subscription: CapturedLogSubscription) -> None:
                 log_key, IO_TYPE_EXTENSION[ComputeIOType.STDERR], partial=True
             ),
         ]
-        complete_paths = [self._manager.complete_artifact_path(log_key)]
-        directory = os.path.dirname(
-            self._manager.get_captured_local_path(log_key, ComputeIOType.STDERR),
-        )
-
-        if not self._observer:
-            self._observer = PollingObserver(timeout=self._manager.polling_timeout)
-            self._observer.start()
-
-        ensure_dir(directory)
-
-        self._watchers[watch_key] = self._observer.schedule(
-            LocalComputeLogFilesystemEventHandler(self, log_key, update_paths, complete_paths),
-            str(directory),
-        )
-
-    def notify_subscriptions(self, log_key: Sequence[str]) -> None:
-        watch_key = self._watch_key(log_key)
-        for subscription in self._subscriptions[watch_key]:
-            subscription.fetch()
-
-    def unwatch(self, log_key: Sequence[str], handler) -> None:
-        watch_key = self._watch_key(log_key)
-        if watch_key in self._watchers:
-            self._observer.remove_handler_for_watch(handler, self._watchers[watch_key])  # type: ignore
-        del self._watchers[watch_key]
+        sizes = []
+        for path in paths:
+            try:
+                sizes.append(os.stat(path).st_size)
+            except OSError:
+                sizes.append(None)
+        return tuple(sizes)
+
+    def _start_polling_thread(self) -> None:
+        with self._lock:
+            if self._polling_thread:
+                return
+            self._polling_thread = threading.Thread(
+                target=self._poll,
+                name="local-compute-log-subscription",
+                daemon=True,
+            )
+            self._polling_thread.start()
+
+    def _poll(self) -> None:
+        while not self._shutdown_event.is_set():
+            self._wake_event.wait(self._manager.polling_timeout)
+            self._wake_event.clear()
+            if self._shutdown_event.is_set():
+                return
+
+            with self._lock:
+                watched = {
+                    watch_key: subscriptions[0].log_key
+                    for watch_key, subscriptions in self._subscriptions.items()
+                    if subscriptions
+                }
+                updated = set(self._updated)
+                self._updated.clear()
+
+            for watch_key, log_key in watched.items():
+                sizes = self._get_file_sizes(log_key)
+                with self._lock:
+                    if watch_key not in self._file_sizes:
+                        continue
+                    changed = self._file_sizes[watch_key] != sizes
+                    self._file_sizes[watch_key] = sizes
+                is_complete = self._manager.is_capture_complete(log_key)
+                if changed or is_complete or watch_key in updated:
+                    self.notify_subscriptions(log_key)
+                if is_complete:
+                    self.remove_all_subscriptions(log_key)
 
     def dispose(self) -> None:
-        if self._observer:
-            self._observer.stop()
-            self._observer.join(15)
-
-
-class LocalComputeLogFilesystemEventHandler(PatternMatchingEventHandler):
-    def __init__(self, manager, log_key, update_paths, complete_paths):
-        self.manager = manager
-        self.log_key = log_key
-        self.update_paths = update_paths
-        self.complete_paths = complete_paths
-        patterns = update_paths + complete_paths
-        super().__init__(patterns=patterns)
-
-    def on_created(self, event):
-        if event.src_path in self.complete_paths:
-            self.manager.remove_all_subscriptions(self.log_key)
-            self.manager.unwatch(self.log_key, self)
-
-    def on_modified(self, event):
-        if event.src_path in self.update_paths:
-            self.manager.notify_subscriptions(self.log_key)
+        self._shutdown_event.set()
+        self._wake_event.set()
+        if self._polling_thread:
+            self._polling_thread.join(15)
@@ -387,6 +387,61 @@ def get_backfills_count(self, filters: Optional[BulkActionsFilter] = None) -> in
             int: The number of backfills that match the given filters.
         """
 
+    def get_runs_feed_entries(
+        self,
+        limit: int,
+        runs_filter: Optional[RunsFilter] = None,
+        backfills_filter: Optional[BulkActionsFilter] = None,
+        run_cursor: Optional[str] = None,
+        backfill_cursor: Optional[str] = None,
+    ) -> Sequence[Union[RunRecord, PartitionBackfill]]:
+        """Return a page of the runs feed: run records and backfills merged into a single list,
+        ordered by creation time, newest first.
+
+        Args:
+            limit (int): The maximum number of entries to return.
+            runs_filter (Optional[RunsFilter]): The filter by which to filter runs. If None, no
+                runs are included in the feed.
+            backfills_filter (Optional[BulkActionsFilter]): The filter by which to filter
+                backfills. If None, no backfills are included in the feed.
+            run_cursor (Optional[str]): The run id of the oldest run returned by the previous page.
+            backfill_cursor (Optional[str]): The id of the oldest backfill returned by the previous
+                page.
+        """
+        runs = (
+            self.get_run_records(filters=runs_filter, limit=limit, cursor=run_cursor)
+            if runs_filter is not None
+            else []
+        )
+        backfills = (
+            self.get_backfills(filters=backfills_filter, cursor=backfill_cursor, limit=limit)
+            if backfills_filter is not None
+            else []
+        )
+        # backfills come first so that they sort ahead of runs created at the same time
+        entries = sorted(
+            [*backfills, *runs],
+            key=lambda entry: (
+                entry.create_timestamp.timestamp()
+                if isinstance(entry, RunRecord)
+                else entry.backfill_timestamp
+            ),
+            reverse=True,
+        )
+        return entries[:limit]
+
+    def get_runs_feed_count(
+        self,
+        runs_filter: Optional[RunsFilter] = None,
+        backfills_filter: Optional[BulkActionsFilter] = None,
+    ) -> int:
+        """Return the number of entries in the runs feed, see `get_runs_feed_entries`."""
+        runs_count = self.get_runs_count(runs_filter) if runs_filter is not None else 0
+        backfills_count = (
+            self.get_backfills_count(backfills_filter) if backfills_filter is not None else 0
+        )
+        return runs_count + backfills_count
+
     @abstractmethod
     def get_backfill(self, backfill_id: str) -> Optional[PartitionBackfill]:
         """Get the partition backfill of the given backfill id."""
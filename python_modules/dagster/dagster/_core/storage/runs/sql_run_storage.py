@@ -80,6 +80,9 @@
 from dagster._utils import PrintFn
 from dagster._utils.merger import merge_dicts
 
+RUNS_FEED_RUN_ENTRY = "run"
+RUNS_FEED_BACKFILL_ENTRY = "backfill"
+
 
 class SnapshotType(Enum):
     PIPELINE = "PIPELINE"
@@ -413,15 +416,11 @@ def get_run_records(
         filters = check.opt_inst_param(filters, "filters", RunsFilter, default=RunsFilter())
         check.opt_int_param(limit, "limit")
 
-        columns = ["id", "run_body", "status", "create_timestamp", "update_timestamp"]
-
-        if self.has_run_stats_index_cols():
-            columns += ["start_time", "end_time"]
         # only fetch columns we use to build RunRecord
         query = self._runs_query(
             filters=filters,
             limit=limit,
-            columns=columns,
+            columns=self._run_record_columns(),
             order_by=order_by,
             ascending=ascending,
             cursor=cursor,
@@ -429,23 +428,23 @@ def get_run_records(
         )
 
         rows = self.fetchall(query)
-        return [
-            RunRecord(
-                storage_id=check.int_param(row["id"], "id"),
-                dagster_run=self._row_to_run(row),
-                create_timestamp=utc_datetime_from_naive(
-                    check.inst(row["create_timestamp"], datetime)
-                ),
-                update_timestamp=utc_datetime_from_naive(
-                    check.inst(row["update_timestamp"], datetime)
-                ),
-                start_time=(
-                    check.opt_inst(row["start_time"], float) if "start_time" in row else None
-                ),
-                end_time=check.opt_inst(row["end_time"], float) if "end_time" in row else None,
-            )
-            for row in rows
-        ]
+        return [self._row_to_run_record(row) for row in rows]
+
+    def _run_record_columns(self) -> Sequence[str]:
+        columns = ["id", "run_body", "status", "create_timestamp", "update_timestamp"]
+        if self.has_run_stats_index_cols():
+            columns += ["start_time", "end_time"]
+        return columns
+
+    def _row_to_run_record(self, row: dict) -> RunRecord:
+        return RunRecord(
+            storage_id=check.int_param(row["id"], "id"),
+            dagster_run=self._row_to_run(row),
+            create_timestamp=utc_datetime_from_naive(check.inst(row["create_timestamp"], datetime)),
+            update_timestamp=utc_datetime_from_naive(check.inst(row["update_timestamp"], datetime)),
+            start_time=(check.opt_inst(row["start_time"], float) if "start_time" in row else None),
+            end_time=check.opt_inst(row["end_time"], float) if "end_time" in row else None,
+        )
 
     def get_run_tags(
         self,
@@ -882,8 +881,13 @@ def _add_backfill_filters_to_table(
             return table
         return table
 
-    def _backfills_query(self, filters: Optional[BulkActionsFilter] = None):
-        query = db_select([BulkActionsTable.c.body, BulkActionsTable.c.timestamp])
+    def _backfills_query(
+        self, filters: Optional[BulkActionsFilter] = None, columns: Optional[Sequence[Any]] = None
+    ):
+        if columns is None:
+            columns = [BulkActionsTable.c.body, BulkActionsTable.c.timestamp]
+
+        query = db_select(columns)
         if filters and filters.tags:
             if not self.has_built_index(BACKFILL_JOB_NAME_AND_TAGS):
                 # if the migration was run, we added the query for tags filtering in _add_backfill_filters_to_table
@@ -1031,6 +1035,149 @@ def get_backfills_count(self, filters: Optional[BulkActionsFilter] = None) -> in
         count = row["count"] if row else 0
         return count
 
+    def _can_query_runs_feed(self, backfills_filter: Optional[BulkActionsFilter]) -> bool:
+        # without the backfill tags table, backfills are filtered by tag in python after they are
+        # fetched, so the number of backfills matching a query is not known in the db
+        return not (
+            backfills_filter
+            and backfills_filter.tags
+            and not self.has_built_index(BACKFILL_JOB_NAME_AND_TAGS)
+        )
+
+    def _runs_feed_query(
+        self,
+        runs_filter: Optional[RunsFilter],
+        backfills_filter: Optional[BulkActionsFilter],
+        limit: Optional[int] = None,
+        run_cursor: Optional[str] = None,
+        backfill_cursor: Optional[str] = None,
+    ) -> Optional[SqlAlchemyQuery]:
+        """Union of the (entry_type, id, timestamp) of the runs and backfills in the runs feed. Each
+        side of the union is paginated on its own storage id, so that only limit rows of each table
+        need to be read to merge a page of the feed.
+        """
+        subqueries = []
+        if runs_filter is not None:
+            runs_query = db_select(
+                [
+                    db.literal(RUNS_FEED_RUN_ENTRY).label("entry_type"),
+                    RunsTable.c.id.label("id"),
+                    RunsTable.c.create_timestamp.label("timestamp"),
+                ]
+            ).select_from(self._add_filters_to_table(RunsTable, runs_filter))
+            runs_query = self._add_filters_to_query(runs_query, runs_filter)
+            runs_query = self._add_cursor_limit_to_query(
+                runs_query, run_cursor, limit, order_by=None, ascending=False
+            )
+            subqueries.append(db_subquery(runs_query, "runs_feed_runs"))
+
+        if backfills_filter is not None:
+            backfills_query = self._backfills_query(
+                filters=backfills_filter,
+                columns=[
+                    db.literal(RUNS_FEED_BACKFILL_ENTRY).label("entry_type"),
+                    BulkActionsTable.c.id.label("id"),
+                    BulkActionsTable.c.timestamp.label("timestamp"),
+                ],
+            ).select_from(self._add_backfill_filters_to_table(BulkActionsTable, backfills_filter))
+            backfills_query = self._add_cursor_limit_to_backfills_query(
+                backfills_query, cursor=backfill_cursor, limit=limit
+            ).order_by(BulkActionsTable.c.id.desc())
+            subqueries.append(db_subquery(backfills_query, "runs_feed_backfills"))
+
+        if not subqueries:
+            return None
+
+        if len(subqueries) == 1:
+            return db_select([subqueries[0]])
+
+        return db.union_all(*(db_select([subquery]) for subquery in subqueries))
+
+    def get_runs_feed_entries(
+        self,
+        limit: int,
+        runs_filter: Optional[RunsFilter] = None,
+        backfills_filter: Optional[BulkActionsFilter] = None,
+        run_cursor: Optional[str] = None,
+        backfill_cursor: Optional[str] = None,
+    ) -> Sequence[Union[RunRecord, PartitionBackfill]]:
+        check.int_param(limit, "limit")
+        check.opt_inst_param(runs_filter, "runs_filter", RunsFilter)
+        check.opt_inst_param(backfills_filter, "backfills_filter", BulkActionsFilter)
+        check.opt_str_param(run_cursor, "run_cursor")
+        check.opt_str_param(backfill_cursor, "backfill_cursor")
+
+        if not self._can_query_runs_feed(backfills_filter):
+            return super().get_runs_feed_entries(
+                limit, runs_filter, backfills_filter, run_cursor, backfill_cursor
+            )
+
+        feed_query = self._runs_feed_query(
+            runs_filter, backfills_filter, limit, run_cursor, backfill_cursor
+        )
+        if feed_query is None:
+            return []
+
+        feed = db_subquery(feed_query, "runs_feed")
+        # backfills sort ahead of runs created at the same time, and entries of the same type
+        # are ordered by storage id like the rest of the run storage
+        page_query = (
+            db_select([feed.c.entry_type, feed.c.id, feed.c.timestamp])
+            .order_by(feed.c.timestamp.desc(), feed.c.entry_type.asc(), feed.c.id.desc())
+            .limit(limit)
+        )
+        page = db_subquery(page_query, "runs_feed_page")
+
+        # join the page back to the runs and backfills tables to fetch it in a single round trip
+        run_columns = [
+            getattr(RunsTable.c, column) for column in self._run_record_columns() if column != "id"
+        ]
+        query = (
+            db_select([page.c.entry_type, page.c.id, *run_columns, BulkActionsTable.c.body])
+            .select_from(
+                page.outerjoin(
+                    RunsTable,
+                    db.and_(page.c.entry_type == RUNS_FEED_RUN_ENTRY, RunsTable.c.id == page.c.id),
+                ).outerjoin(
+                    BulkActionsTable,
+                    db.and_(
+                        page.c.entry_type == RUNS_FEED_BACKFILL_ENTRY,
+                        BulkActionsTable.c.id == page.c.id,
+                    ),
+                )
+            )
+            .order_by(page.c.timestamp.desc(), page.c.entry_type.asc(), page.c.id.desc())
+        )
+        rows = self.fetchall(query)
+        return [
+            self._row_to_run_record(row)
+            if row["entry_type"] == RUNS_FEED_RUN_ENTRY
+            else deserialize_value(row["body"], PartitionBackfill)
+            for row in rows
+        ]
+
+    def get_runs_feed_count(
+        self,
+        runs_filter: Optional[RunsFilter] = None,
+        backfills_filter: Optional[BulkActionsFilter] = None,
+    ) -> int:
+        check.opt_inst_param(runs_filter, "runs_filter", RunsFilter)
+        check.opt_inst_param(backfills_filter, "backfills_filter", BulkActionsFilter)
+
+        if not self._can_query_runs_feed(backfills_filter):
+            return super().get_runs_feed_count(runs_filter, backfills_filter)
+
+        feed_query = self._runs_feed_query(runs_filter, backfills_filter)
+        if feed_query is None:
+            return 0
+
+        query = db_select([db.func.count().label("count")]).select_from(
+            db_subquery(feed_query, "runs_feed")
+        )
+        row = self.fetchone(query)
+        count = row["count"] if row else 0
+        return count
+
     def get_backfill(self, backfill_id: str) -> Optional[PartitionBackfill]:
         check.str_param(backfill_id, "backfill_id")
         query = db_select([BulkActionsTable.c.body]).where(BulkActionsTable.c.key == backfill_id)
@@ -118,6 +118,18 @@
 
 EXTERNALLY_MANAGED_ASSETS_TAG = f"{SYSTEM_TAG_PREFIX}defer_asset_events"
 
+# Run tag that opts a run into reusing prior materializations of asset steps whose code version,
+# input data versions, partition and config are unchanged.
+STEP_RESULT_CACHE_TAG = f"{SYSTEM_TAG_PREFIX}step_result_cache"
+# Materialization tags recording the step result cache key, and marking materializations that were
+# reused from a prior run rather than recomputed.
+STEP_RESULT_CACHE_KEY_TAG = f"{SYSTEM_TAG_PREFIX}step_result_cache_key"
+CACHED_MATERIALIZATION_TAG = f"{SYSTEM_TAG_PREFIX}cached_materialization"
+
+# Run tag that opts a run into recording a resource profile for each step attempt. Set to "true" to
+# record wall/CPU time, peak RSS and GC pauses, or to "stack" to also sample the step's stacks.
+STEP_PROFILING_TAG = f"{SYSTEM_TAG_PREFIX}step_profiling"
+
 TAGS_TO_MAYBE_OMIT_ON_RETRY = {
     *RUN_METRIC_TAGS,
     RUN_FAILURE_REASON_TAG,
@@ -152,6 +152,10 @@ def make_directory(self, path: "UPath"):
         path.mkdir(parents=True, exist_ok=True)
 
     def has_output(self, context: OutputContext) -> bool:
+        if context.has_asset_partitions:
+            return all(
+                self.path_exists(path) for path in self._get_paths_for_partitions(context).values()
+            )
         return self.path_exists(self._get_path(context))
 
     def _with_extension(self, path: "UPath") -> "UPath":
@@ -1011,6 +1011,13 @@ async def _evaluate_auto_materialize_tick(
                 ),
                 auto_observe_asset_keys=auto_observe_asset_keys,
                 logger=self._logger,
+                # ticks evaluated on a thread pool may run concurrently with each other, so worker
+                # processes are only forked when ticks are evaluated one at a time on the daemon loop
+                num_evaluation_processes=(
+                    1
+                    if self._settings.get("use_threads")
+                    else instance.auto_materialize_num_evaluation_processes
+                ),
             ).async_evaluate()
 
             check.invariant(new_cursor.evaluation_id == evaluation_id)
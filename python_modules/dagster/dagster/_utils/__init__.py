@@ -564,17 +564,38 @@ class Counter:
     def __init__(self):
         self._lock = threading.Lock()
         self._counts = {}
+        self._durations = {}
+        self._batches = {}
         super().__init__()
 
-    def increment(self, key: str) -> None:
+    def increment(self, key: str, duration: Optional[float] = None) -> None:
         with self._lock:
             self._counts[key] = self._counts.get(key, 0) + 1
+            if duration is not None:
+                self._durations[key] = self._durations.get(key, 0.0) + duration
+
+    def record_batch(self, key: str, size: int, duration: float) -> None:
+        """Record a batch load of `size` keys which took `duration` seconds."""
+        with self._lock:
+            self._batches.setdefault(key, []).append((size, duration))
 
     def counts(self) -> Mapping[str, int]:
         with self._lock:
             copy = {k: v for k, v in self._counts.items()}
         return copy
 
+    def durations(self) -> Mapping[str, float]:
+        """The total number of seconds spent in each traced call."""
+        with self._lock:
+            copy = {k: v for k, v in self._durations.items()}
+        return copy
+
+    def batches(self) -> Mapping[str, Sequence[tuple[int, float]]]:
+        """The (size, duration) of each recorded batch load, by key."""
+        with self._lock:
+            copy = {k: list(v) for k, v in self._batches.items()}
+        return copy
+
 
 traced_counter: contextvars.ContextVar[Optional[Counter]] = contextvars.ContextVar(
     "traced_counts",
@@ -585,15 +606,21 @@ def counts(self) -> Mapping[str, int]:
 
 
 def traced(func: T_Callable) -> T_Callable:
-    """A decorator that keeps track of how many times a function is called."""
+    """A decorator that keeps track of how many times a function is called, and how long the calls
+    take.
+    """
 
     @functools.wraps(func)
     def inner(*args, **kwargs):
         counter = traced_counter.get()
-        if counter and isinstance(counter, Counter):
-            counter.increment(func.__qualname__)
+        if not (counter and isinstance(counter, Counter)):
+            return func(*args, **kwargs)
 
-        return func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            counter.increment(func.__qualname__, duration=time.perf_counter() - start)
 
     return cast("T_Callable", inner)
 
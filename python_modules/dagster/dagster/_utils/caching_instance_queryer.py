@@ -22,6 +22,7 @@
     get_time_partition_key,
     get_time_partitions_def,
 )
+from dagster._core.definitions.partitions.utils.dynamic import DynamicPartitionsMembership
 from dagster._core.errors import (
     DagsterDefinitionChangedDeserializationError,
     DagsterInvalidDefinitionError,
@@ -83,7 +84,7 @@ def __init__(
             AssetKeyPartitionKey, int
         ] = {}
 
-        self._dynamic_partitions_cache: dict[str, Sequence[str]] = {}
+        self._dynamic_partitions_cache: dict[str, DynamicPartitionsMembership] = {}
 
         self._evaluation_time = evaluation_time if evaluation_time else get_current_datetime()
 
@@ -467,6 +468,9 @@ def next_version_record(
     def _get_run_record_by_id(self, *, run_id: str) -> Optional[RunRecord]:
         return self.instance.get_run_record_by_id(run_id)
 
+    def get_run_record_by_id(self, run_id: str) -> Optional[RunRecord]:
+        return self._get_run_record_by_id(run_id=run_id)
+
     def _get_run_by_id(self, run_id: str) -> Optional[DagsterRun]:
         run_record = self._get_run_record_by_id(run_id=run_id)
         if run_record is not None:
@@ -631,14 +635,21 @@ def get_materialized_partitions(
     # DYNAMIC PARTITIONS
     ####################
 
-    def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
-        """Returns a list of partitions for a partitions definition."""
+    def _get_dynamic_partitions_membership(
+        self, partitions_def_name: str
+    ) -> DynamicPartitionsMembership:
         if partitions_def_name not in self._dynamic_partitions_cache:
             self._dynamic_partitions_cache[partitions_def_name] = (
-                self.instance.get_dynamic_partitions(partitions_def_name)
+                self.instance.dynamic_partitions_membership_cache.get_membership(
+                    self.instance, partitions_def_name
+                )
             )
         return self._dynamic_partitions_cache[partitions_def_name]
 
+    def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
+        """Returns a list of partitions for a partitions definition."""
+        return self._get_dynamic_partitions_membership(partitions_def_name).partition_keys
+
     def get_paginated_dynamic_partitions(
         self, partitions_def_name: str, limit: int, ascending: bool, cursor: Optional[str] = None
     ) -> PaginatedResults[str]:
@@ -651,13 +662,16 @@ def get_paginated_dynamic_partitions(
             )
 
         # the full set of partition keys are cached... create a sequence connection from the cached keys
-        partition_keys = self._dynamic_partitions_cache[partitions_def_name]
+        partition_keys = self._dynamic_partitions_cache[partitions_def_name].partition_keys
         return PaginatedResults.create_from_sequence(
             seq=partition_keys, limit=limit, ascending=ascending, cursor=cursor
         )
 
     def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> bool:
-        return partition_key in self.get_dynamic_partitions(partitions_def_name)
+        return (
+            partition_key
+            in self._get_dynamic_partitions_membership(partitions_def_name).partition_keys_set
+        )
 
     @cached_method
     def asset_partitions_with_newly_updated_parents_and_new_cursor(
@@ -1,3 +1,4 @@
+import random
 from datetime import datetime, timedelta
 
 import dagster as dg
@@ -5,6 +6,7 @@
 from dagster import AssetExecutionContext, DagsterInstance
 from dagster._check import CheckError
 from dagster._core.definitions.partitions.subset import DefaultPartitionsSubset
+from dagster._core.definitions.partitions.subset.multi import MultiPartitionsSubset
 
 
 def test_get_downstream_partitions_single_key_in_range():
@@ -48,7 +50,7 @@ def test_get_downstream_partitions_single_key_in_range():
         upstream_partitions_def=single_dimension_def,
         downstream_partitions_def=multipartitions_def,
     )
-    assert result == DefaultPartitionsSubset(
+    assert result == multipartitions_def.empty_subset().with_partition_keys(
         {
             dg.MultiPartitionKey({"abc": "b", "xyz": "x"}),
             dg.MultiPartitionKey({"abc": "b", "xyz": "y"}),
@@ -968,3 +970,170 @@ def test_description():
     )
 
     assert dg.MultiPartitionMapping({}).description == ""
+
+
+daily_jan = dg.DailyPartitionsDefinition(start_date="2023-01-01", end_date="2023-02-01")
+daily_mid_jan = dg.DailyPartitionsDefinition(start_date="2023-01-15", end_date="2023-02-15")
+weekly_jan = dg.WeeklyPartitionsDefinition(start_date="2023-01-01", end_date="2023-02-05")
+static_abc = dg.StaticPartitionsDefinition(["a", "b", "c", "d"])
+static_123 = dg.StaticPartitionsDefinition(["1", "2", "3"])
+daily_abc = dg.MultiPartitionsDefinition({"daily": daily_jan, "abc": static_abc})
+mid_daily_abc = dg.MultiPartitionsDefinition({"daily": daily_mid_jan, "abc": static_abc})
+weekly_123 = dg.MultiPartitionsDefinition({"weekly": weekly_jan, "123": static_123})
+abc_123 = dg.MultiPartitionsDefinition({"abc": static_abc, "123": static_123})
+
+abc_to_123 = dg.StaticPartitionMapping({"a": "1", "b": ["1", "2"], "c": "3"})
+
+
+@pytest.mark.parametrize(
+    "upstream_partitions_def,downstream_partitions_def,partition_mapping",
+    [
+        (daily_abc, daily_jan, dg.MultiToSingleDimensionPartitionMapping()),
+        (daily_jan, daily_abc, dg.MultiToSingleDimensionPartitionMapping()),
+        (daily_abc, static_abc, dg.MultiToSingleDimensionPartitionMapping()),
+        (static_abc, daily_abc, dg.MultiToSingleDimensionPartitionMapping()),
+        (daily_abc, weekly_jan, dg.MultiToSingleDimensionPartitionMapping()),
+        (weekly_jan, daily_abc, dg.MultiToSingleDimensionPartitionMapping()),
+        (abc_123, static_123, dg.MultiToSingleDimensionPartitionMapping("123")),
+        (
+            daily_abc,
+            weekly_123,
+            dg.MultiPartitionMapping(
+                {
+                    "daily": dg.DimensionPartitionMapping(
+                        "weekly", dg.TimeWindowPartitionMapping()
+                    ),
+                    "abc": dg.DimensionPartitionMapping("123", abc_to_123),
+                }
+            ),
+        ),
+        (
+            weekly_123,
+            daily_abc,
+            dg.MultiPartitionMapping(
+                {"weekly": dg.DimensionPartitionMapping("daily", dg.TimeWindowPartitionMapping())}
+            ),
+        ),
+        (
+            daily_abc,
+            mid_daily_abc,
+            dg.MultiPartitionMapping(
+                {
+                    "daily": dg.DimensionPartitionMapping(
+                        "daily",
+                        dg.TimeWindowPartitionMapping(
+                            start_offset=-3, allow_nonexistent_upstream_partitions=True
+                        ),
+                    ),
+                    "abc": dg.DimensionPartitionMapping("abc", dg.IdentityPartitionMapping()),
+                }
+            ),
+        ),
+        (
+            daily_abc,
+            mid_daily_abc,
+            dg.MultiPartitionMapping(
+                {
+                    "daily": dg.DimensionPartitionMapping(
+                        "daily", dg.TimeWindowPartitionMapping(start_offset=-1, end_offset=-1)
+                    ),
+                    "abc": dg.DimensionPartitionMapping("abc", dg.IdentityPartitionMapping()),
+                }
+            ),
+        ),
+        (
+            daily_abc,
+            abc_123,
+            dg.MultiPartitionMapping(
+                {
+                    "daily": dg.DimensionPartitionMapping("abc", dg.LastPartitionMapping()),
+                    "abc": dg.DimensionPartitionMapping("123", abc_to_123),
+                }
+            ),
+        ),
+        (
+            abc_123,
+            daily_abc,
+            dg.MultiPartitionMapping(
+                {"abc": dg.DimensionPartitionMapping("abc", dg.AllPartitionMapping())}
+            ),
+        ),
+        (abc_123, daily_abc, dg.MultiPartitionMapping({})),
+    ],
+)
+def test_multi_partition_mapping_subsets_match_partition_keys(
+    upstream_partitions_def, downstream_partitions_def, partition_mapping
+):
+    def _sample_subsets(partitions_def):
+        all_keys = partitions_def.get_partition_keys()
+        yield partitions_def.empty_subset()
+        yield partitions_def.subset_with_all_partitions()
+        for _ in range(10):
+            keys = random.sample(all_keys, random.randint(1, len(all_keys)))
+            yield partitions_def.empty_subset().with_partition_keys(keys)
+            # subsets of multi-partitioned assets are stored as DefaultPartitionsSubsets
+            yield DefaultPartitionsSubset(set(keys))
+
+    for upstream_subset in _sample_subsets(upstream_partitions_def):
+        result = partition_mapping.get_downstream_partitions_for_partitions(
+            upstream_subset, upstream_partitions_def, downstream_partitions_def
+        )
+        expected = partition_mapping._get_dependency_partitions_subset_from_partition_keys(  # noqa: SLF001
+            upstream_partitions_def,
+            upstream_subset,
+            downstream_partitions_def,
+            a_upstream_of_b=True,
+        )
+        assert result.get_partition_keys() == expected.get_partition_keys()
+        if isinstance(downstream_partitions_def, dg.MultiPartitionsDefinition):
+            assert isinstance(result, MultiPartitionsSubset)
+
+    for downstream_subset in _sample_subsets(downstream_partitions_def):
+        result = partition_mapping.get_upstream_mapped_partitions_result_for_partitions(
+            downstream_subset, downstream_partitions_def, upstream_partitions_def
+        )
+        expected = partition_mapping._get_dependency_partitions_subset_from_partition_keys(  # noqa: SLF001
+            downstream_partitions_def,
+            downstream_subset,
+            upstream_partitions_def,
+            a_upstream_of_b=False,
+        )
+        assert (
+            result.partitions_subset.get_partition_keys()
+            == expected.partitions_subset.get_partition_keys()
+        )
+        assert (
+            result.required_but_nonexistent_subset.get_partition_keys()
+            == expected.required_but_nonexistent_subset.get_partition_keys()
+        )
+
+
+def test_multi_partition_mapping_groups_equal_primary_subsets():
+    # the regions share equal, but separately built, subsets of dates
+    subset = daily_abc.empty_subset().with_partition_keys(
+        [
+            "a|2023-01-01",
+            "a|2023-01-02",
+            "b|2023-01-01",
+            "b|2023-01-02",
+            "c|2023-01-05",
+        ]
+    )
+    assert isinstance(subset, MultiPartitionsSubset)
+    primary_subsets = subset.subsets_by_secondary_key
+    assert primary_subsets["a"] is not primary_subsets["b"]
+
+    partition_mapping = dg.MultiPartitionMapping(
+        {
+            "daily": dg.DimensionPartitionMapping("weekly", dg.TimeWindowPartitionMapping()),
+            "abc": dg.DimensionPartitionMapping("123", abc_to_123),
+        }
+    )
+    blocks = partition_mapping._get_dimension_subset_blocks(  # noqa: SLF001
+        daily_abc, subset, ["daily", "abc"]
+    )
+    assert blocks is not None
+    assert sorted(sorted(block["abc"].get_partition_keys()) for block in blocks) == [
+        ["a", "b"],
+        ["c"],
+    ]
@@ -1,3 +1,4 @@
+import random
 from typing import cast
 from unittest.mock import MagicMock
 
@@ -12,6 +13,7 @@
 from dagster._core.definitions.partitions.subset import (
     AllPartitionsSubset,
     DefaultPartitionsSubset,
+    MultiPartitionsSubset,
     TimeWindowPartitionsSubset,
 )
 from dagster._core.definitions.partitions.utils import PersistedTimeWindow
@@ -128,6 +130,74 @@ def test_time_window_partitions_subset_serialization_deserialization(
     )
 
 
+def test_time_window_partitions_subset_set_operations_match_partition_keys():
+    partitions_def = dg.DailyPartitionsDefinition("2023-01-01", end_date="2024-01-01")
+    all_keys = partitions_def.get_partition_keys()
+    rng = random.Random(42)
+
+    for _ in range(10):
+        keys_a = set(rng.sample(all_keys, rng.randint(0, 100)))
+        keys_b = set(rng.sample(all_keys, rng.randint(0, 100)))
+        # build subsets both in a single batch and incrementally, so that windows are merged
+        # into existing windows from either side
+        subset_a = partitions_def.empty_subset().with_partition_keys(keys_a)
+        subset_b = partitions_def.empty_subset()
+        for key in keys_b:
+            subset_b = subset_b.with_partition_keys([key])
+
+        for subset, keys in [(subset_a, keys_a), (subset_b, keys_b)]:
+            assert isinstance(subset, TimeWindowPartitionsSubset)
+            assert set(subset.get_partition_keys()) == keys
+            assert len(subset) == len(keys)
+            assert all(
+                window.end_timestamp < next_window.start_timestamp
+                for window, next_window in zip(
+                    subset.included_time_windows, subset.included_time_windows[1:]
+                )
+            )
+            assert all((key in subset) == (key in keys) for key in all_keys)
+
+        assert set((subset_a | subset_b).get_partition_keys()) == keys_a | keys_b
+        assert set((subset_a & subset_b).get_partition_keys()) == keys_a & keys_b
+        assert set((subset_a - subset_b).get_partition_keys()) == keys_a - keys_b
+        assert set((subset_b - subset_a).get_partition_keys()) == keys_b - keys_a
+        assert len(subset_a - subset_b) == len(keys_a - keys_b)
+
+
+def test_time_window_partitions_subset_unsorted_time_windows():
+    partitions_def = dg.DailyPartitionsDefinition("2023-01-01", end_date="2023-02-01")
+
+    def _window(start_day: int, end_day: int) -> PersistedTimeWindow:
+        return PersistedTimeWindow.from_public_time_window(
+            dg.TimeWindow(create_datetime(2023, 1, start_day), create_datetime(2023, 1, end_day)),
+            "UTC",
+        )
+
+    # windows which are out of order, overlapping and adjacent
+    subset = TimeWindowPartitionsSubset(
+        partitions_def,
+        num_partitions=None,
+        included_time_windows=[_window(10, 15), _window(2, 5), _window(12, 17), _window(5, 7)],
+    )
+    expected_keys = {f"2023-01-{day:02d}" for day in [*range(2, 7), *range(10, 17)]}
+    assert set(subset.get_partition_keys()) == expected_keys
+    assert all(
+        (key in subset) == (key in expected_keys) for key in partitions_def.get_partition_keys()
+    )
+    assert "2023-01-08" not in subset
+
+    other = partitions_def.empty_subset().with_partition_keys(["2023-01-03", "2023-01-12"])
+    assert set((subset - other).get_partition_keys()) == expected_keys - {
+        "2023-01-03",
+        "2023-01-12",
+    }
+    assert set((subset & other).get_partition_keys()) == {"2023-01-03", "2023-01-12"}
+    assert (subset | other).included_time_windows == [_window(2, 7), _window(10, 17)]
+    assert set(subset.with_partition_keys(["2023-01-07"]).get_partition_keys()) == expected_keys | {
+        "2023-01-07"
+    }
+
+
 def test_time_window_partitions_subset_num_partitions_serialization():
     daily_partitions_def = dg.DailyPartitionsDefinition("2023-01-01")
     time_partitions_def = dg.TimeWindowPartitionsDefinition(
@@ -221,6 +291,115 @@ def test_partitions_set_short_circuiting() -> None:
     assert (default_ps - all_ps) == DefaultPartitionsSubset.create_empty_subset()
 
 
+def test_multi_partitions_subset_set_operations_match_partition_keys():
+    partitions_def = dg.MultiPartitionsDefinition(
+        {
+            "date": dg.DailyPartitionsDefinition("2023-01-01", end_date="2023-03-01"),
+            "region": dg.StaticPartitionsDefinition([f"region_{i}" for i in range(10)]),
+        }
+    )
+    all_keys = partitions_def.get_partition_keys()
+    rng = random.Random(42)
+
+    for _ in range(10):
+        keys_a = set(rng.sample(all_keys, rng.randint(0, 200)))
+        keys_b = set(rng.sample(all_keys, rng.randint(0, 200)))
+        subset_a = partitions_def.empty_subset().with_partition_keys(keys_a)
+        subset_b = partitions_def.empty_subset().with_partition_keys(keys_b)
+
+        for subset, keys in [(subset_a, keys_a), (subset_b, keys_b)]:
+            assert isinstance(subset, MultiPartitionsSubset)
+            assert set(subset.get_partition_keys()) == keys
+            assert len(subset) == len(keys)
+            assert all((key in subset) == (key in keys) for key in all_keys)
+            # the primary dimension is the time dimension, so each region maps to time windows
+            assert all(
+                isinstance(primary_subset, TimeWindowPartitionsSubset)
+                for primary_subset in subset.subsets_by_secondary_key.values()
+            )
+
+        assert set((subset_a | subset_b).get_partition_keys()) == keys_a | keys_b
+        assert set((subset_a & subset_b).get_partition_keys()) == keys_a & keys_b
+        assert set((subset_a - subset_b).get_partition_keys()) == keys_a - keys_b
+        assert len(subset_a - subset_b) == len(keys_a - keys_b)
+        assert set(subset_a.get_partition_keys_not_in_subset(partitions_def)) == (
+            set(all_keys) - keys_a
+        )
+
+        # subsets loaded from storage are DefaultPartitionsSubsets
+        assert set((subset_a | DefaultPartitionsSubset(keys_b)).get_partition_keys()) == (
+            keys_a | keys_b
+        )
+        assert set((subset_a - DefaultPartitionsSubset(keys_b)).get_partition_keys()) == (
+            keys_a - keys_b
+        )
+
+
+def test_multi_partitions_subset_all_partitions():
+    partitions_def = dg.MultiPartitionsDefinition(
+        {
+            "date": dg.DailyPartitionsDefinition("2020-01-01", end_date="2025-01-01"),
+            "region": dg.StaticPartitionsDefinition([f"region_{i}" for i in range(2000)]),
+        }
+    )
+    all_subset = partitions_def.subset_with_all_partitions()
+    assert isinstance(all_subset, MultiPartitionsSubset)
+    assert len(all_subset) == partitions_def.get_num_partitions() == 1827 * 2000
+
+    subset = partitions_def.empty_subset().with_partition_keys(
+        ["2020-01-01|region_1", "2020-01-02|region_1", "2024-12-31|region_5"]
+    )
+    assert len(all_subset - subset) == 1827 * 2000 - 3
+    assert (all_subset & subset) == subset
+    assert "2020-01-03|region_1" in all_subset - subset
+    assert "2020-01-02|region_1" not in all_subset - subset
+
+
+def test_multi_partitions_subset_serialization():
+    partitions_def = dg.MultiPartitionsDefinition(
+        {
+            "date": dg.DailyPartitionsDefinition("2023-01-01", end_date="2023-03-01"),
+            "region": dg.StaticPartitionsDefinition(["a", "b"]),
+        }
+    )
+    keys = {"2023-01-01|a", "2023-01-02|a", "2023-02-01|b"}
+    subset = partitions_def.empty_subset().with_partition_keys(keys)
+
+    # serialized in the same format as the DefaultPartitionsSubset that was previously used
+    serialized = subset.serialize()
+    assert serialized == DefaultPartitionsSubset(keys).serialize()
+    assert partitions_def.deserialize_subset(serialized) == subset
+    assert serialize_value(subset.to_serializable_subset()) == serialize_value(
+        DefaultPartitionsSubset(keys)
+    )
+
+    previously_stored = DefaultPartitionsSubset(keys).serialize()
+    assert partitions_def.can_deserialize_subset(
+        previously_stored,
+        serialized_partitions_def_unique_id=partitions_def.get_serializable_unique_identifier(),
+        serialized_partitions_def_class_name=partitions_def.__class__.__name__,
+    )
+    assert partitions_def.deserialize_subset(previously_stored) == subset
+
+
+def test_multi_partitions_subset_serialization_dimension_order():
+    # the secondary dimension sorts first, so its key comes first in the serialized keys
+    partitions_def = dg.MultiPartitionsDefinition(
+        {
+            "date": dg.DailyPartitionsDefinition("2023-01-01", end_date="2023-03-01"),
+            "a_region": dg.StaticPartitionsDefinition(["a", "b"]),
+        }
+    )
+    keys = {"a|2023-01-01", "a|2023-01-02", "b|2023-02-01"}
+    subset = partitions_def.empty_subset().with_partition_keys(keys)
+    assert isinstance(subset, MultiPartitionsSubset)
+    assert set(subset.subsets_by_secondary_key) == {"a", "b"}
+
+    assert subset.serialize() == DefaultPartitionsSubset(keys).serialize()
+    assert subset.to_serializable_subset() == DefaultPartitionsSubset(subset.get_partition_keys())
+    assert partitions_def.deserialize_subset(subset.serialize()) == subset
+
+
 def test_multi_partition_subset_to_range_conversion():
     # Test that converting from a list of partitions keys to a subset, to a list of ranges, and back to
     # a list of partition keys for MultiPartitionsDefinitions does not lose any partitions.
@@ -0,0 +1,63 @@
+import dagster as dg
+from dagster import AutomationCondition
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+    AutomationConditionEvaluator,
+)
+
+
+def _get_defs(num_children: int) -> dg.Definitions:
+    @dg.asset
+    def parent() -> None: ...
+
+    children = [
+        dg.AssetSpec(
+            f"child_{i}",
+            deps=[parent],
+            automation_condition=AutomationCondition.any_deps_match(
+                AutomationCondition.missing() | AutomationCondition.will_be_requested()
+            ),
+        )
+        for i in range(num_children)
+    ]
+    return dg.Definitions(assets=[parent, *children])
+
+
+def _evaluate(defs: dg.Definitions, instance: dg.DagsterInstance) -> AutomationConditionEvaluator:
+    asset_graph = defs.resolve_asset_graph()
+    evaluator = AutomationConditionEvaluator(
+        entity_keys={
+            key
+            for key in asset_graph.get_all_asset_keys()
+            if asset_graph.get(key).automation_condition is not None
+        },
+        instance=instance,
+        asset_graph=asset_graph,
+        cursor=AssetDaemonCursor.empty(),
+        emit_backfills=False,
+    )
+    evaluator.evaluate()
+    return evaluator
+
+
+def test_shared_operand_is_computed_once() -> None:
+    defs = _get_defs(num_children=5)
+    instance = dg.DagsterInstance.ephemeral()
+
+    evaluator = _evaluate(defs, instance)
+    # the parent is missing, so every child is requested
+    assert all(result.true_subset.size == 1 for result in evaluator.current_results_by_key.values())
+    # each child evaluates any_deps_match, parent, or, missing and will_be_requested, but missing
+    # is only computed over the parent for the first child
+    assert evaluator.evaluation_cache.num_node_evaluations == 5 * 5
+    assert evaluator.evaluation_cache.num_hits == 4
+
+
+def test_memoized_operand_false() -> None:
+    defs = _get_defs(num_children=3)
+    instance = dg.DagsterInstance.ephemeral()
+    instance.report_runless_asset_event(dg.AssetMaterialization("parent"))
+
+    evaluator = _evaluate(defs, instance)
+    assert all(result.true_subset.size == 0 for result in evaluator.current_results_by_key.values())
+    assert evaluator.evaluation_cache.num_hits == 2
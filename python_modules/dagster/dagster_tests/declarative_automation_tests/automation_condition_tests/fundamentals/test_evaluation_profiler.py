@@ -0,0 +1,79 @@
+import json
+import os
+
+import dagster as dg
+from dagster import AutomationCondition
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+    AutomationConditionEvaluator,
+)
+
+
+@dg.asset
+def upstream() -> None: ...
+
+
+@dg.asset(deps=[upstream], automation_condition=AutomationCondition.eager())
+def downstream() -> None: ...
+
+
+def test_profile_records_nodes_and_queries() -> None:
+    asset_graph = dg.Definitions(assets=[upstream, downstream]).resolve_asset_graph()
+    with dg.instance_for_test() as instance:
+        instance.report_runless_asset_event(dg.AssetMaterialization("upstream"))
+        evaluator = AutomationConditionEvaluator(
+            entity_keys={downstream.key},
+            instance=instance,
+            asset_graph=asset_graph,
+            cursor=AssetDaemonCursor.empty(),
+            emit_backfills=False,
+            profile=True,
+        )
+        evaluator.evaluate()
+
+    profiler = evaluator.profiler
+    assert profiler is not None
+    assert len(profiler.nodes) == evaluator.evaluation_cache.num_node_evaluations
+
+    root_nodes = [node for node in profiler.nodes if node.depth == 0]
+    assert len(root_nodes) == 1
+    assert root_nodes[0].entity_key == downstream.key
+    assert root_nodes[0].candidate_size == 1
+    assert root_nodes[0].true_size == 0
+    # nodes evaluated over the dependencies are attributed to the evaluated entity
+    assert any(node.entity_key == upstream.key for node in profiler.nodes)
+    assert {node.root_entity_key for node in profiler.nodes} == {downstream.key}
+
+    assert profiler.num_queries > 0
+    assert sum(node.num_queries for node in profiler.nodes) <= profiler.num_queries
+    assert all(0 <= node.self_duration <= node.duration for node in profiler.nodes)
+
+    summary = profiler.get_summary(top_n=3)
+    assert "Top 3 conditions by self time" in summary
+    assert "downstream" in summary
+
+
+def test_profile_trace_export(tmp_path) -> None:
+    defs = dg.Definitions(assets=[upstream, downstream])
+    trace_dir = str(tmp_path / "traces")
+    with dg.instance_for_test(
+        overrides={
+            "auto_materialize": {
+                "profile_evaluations": True,
+                "evaluation_profile_directory": trace_dir,
+            }
+        }
+    ) as instance:
+        result = dg.evaluate_automation_conditions(defs=defs, instance=instance)
+        assert result.total_requested == 0
+
+    (trace_file,) = os.listdir(trace_dir)
+    with open(os.path.join(trace_dir, trace_file)) as f:
+        trace = json.load(f)
+
+    events = trace["traceEvents"]
+    assert [event["args"]["name"] for event in events if event["ph"] == "M"] == ["downstream"]
+    complete_events = [event for event in events if event["ph"] == "X"]
+    assert complete_events
+    assert all(event["dur"] >= 0 for event in complete_events)
+    assert {event["args"]["entity_key"] for event in complete_events} == {"upstream", "downstream"}
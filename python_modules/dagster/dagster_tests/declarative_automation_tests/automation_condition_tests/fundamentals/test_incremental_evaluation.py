@@ -0,0 +1,150 @@
+import datetime
+
+import dagster as dg
+from dagster import AutomationCondition
+
+
+@dg.asset
+def upstream() -> None: ...
+
+
+@dg.asset(deps=[upstream], automation_condition=AutomationCondition.eager())
+def downstream() -> None: ...
+
+
+@dg.asset(automation_condition=AutomationCondition.on_cron("0 * * * *"))
+def hourly_cron() -> None: ...
+
+
+@dg.asset(deps=[downstream], automation_condition=AutomationCondition.eager())
+def downstream_of_downstream() -> None: ...
+
+
+def _evaluated_keys(result) -> set[dg.AssetKey]:
+    return {r.key for r in result.results}
+
+
+def test_incremental_evaluation_skips_unchanged_entities() -> None:
+    defs = dg.Definitions(assets=[upstream, downstream, downstream_of_downstream])
+    with dg.instance_for_test(
+        overrides={"auto_materialize": {"incremental_evaluation": True}}
+    ) as instance:
+        # initial evaluation, everything is evaluated
+        result = dg.evaluate_automation_conditions(defs=defs, instance=instance)
+        assert _evaluated_keys(result) == {downstream.key, downstream_of_downstream.key}
+        assert result.total_requested == 0
+
+        # nothing changed, so nothing is evaluated and the cursors are carried forward
+        result = dg.evaluate_automation_conditions(
+            defs=defs, instance=instance, cursor=result.cursor
+        )
+        assert _evaluated_keys(result) == set()
+        assert result.total_requested == 0
+        assert {cursor.key for cursor in result.cursor.previous_condition_cursors or []} == {
+            downstream.key,
+            downstream_of_downstream.key,
+        }
+
+        # upstream updates, so downstream and everything below it is evaluated
+        instance.report_runless_asset_event(dg.AssetMaterialization("upstream"))
+        result = dg.evaluate_automation_conditions(
+            defs=defs, instance=instance, cursor=result.cursor
+        )
+        assert _evaluated_keys(result) == {downstream.key, downstream_of_downstream.key}
+        assert result.get_num_requested(downstream.key) == 1
+
+        # downstream was requested on the previous two ticks, so it must be evaluated
+        for _ in range(2):
+            result = dg.evaluate_automation_conditions(
+                defs=defs, instance=instance, cursor=result.cursor
+            )
+            assert downstream.key in _evaluated_keys(result)
+            assert result.total_requested == 0
+
+        result = dg.evaluate_automation_conditions(
+            defs=defs, instance=instance, cursor=result.cursor
+        )
+        assert _evaluated_keys(result) == set()
+
+
+def test_incremental_evaluation_matches_full_evaluation() -> None:
+    defs = dg.Definitions(assets=[upstream, downstream, downstream_of_downstream])
+    with (
+        dg.instance_for_test() as full_instance,
+        dg.instance_for_test(
+            overrides={"auto_materialize": {"incremental_evaluation": True}}
+        ) as incremental_instance,
+    ):
+        full_cursor = None
+        incremental_cursor = None
+        for i in range(8):
+            if i in (1, 4):
+                for instance in (full_instance, incremental_instance):
+                    instance.report_runless_asset_event(dg.AssetMaterialization("upstream"))
+            if i == 6:
+                for instance in (full_instance, incremental_instance):
+                    instance.report_runless_asset_event(dg.AssetMaterialization("downstream"))
+
+            full_result = dg.evaluate_automation_conditions(
+                defs=defs, instance=full_instance, cursor=full_cursor
+            )
+            incremental_result = dg.evaluate_automation_conditions(
+                defs=defs, instance=incremental_instance, cursor=incremental_cursor
+            )
+            for key in (downstream.key, downstream_of_downstream.key):
+                assert full_result.get_num_requested(key) == incremental_result.get_num_requested(
+                    key
+                )
+            full_cursor = full_result.cursor
+            incremental_cursor = incremental_result.cursor
+
+
+def test_incremental_evaluation_cron_tick() -> None:
+    defs = dg.Definitions(assets=[hourly_cron])
+    current_time = datetime.datetime(2024, 1, 1, 0, 10)
+    with dg.instance_for_test(
+        overrides={"auto_materialize": {"incremental_evaluation": True}}
+    ) as instance:
+        result = dg.evaluate_automation_conditions(
+            defs=defs, instance=instance, evaluation_time=current_time
+        )
+        assert _evaluated_keys(result) == {hourly_cron.key}
+
+        current_time += datetime.timedelta(minutes=10)
+        result = dg.evaluate_automation_conditions(
+            defs=defs, instance=instance, evaluation_time=current_time, cursor=result.cursor
+        )
+        assert _evaluated_keys(result) == set()
+
+        # the cron tick passes, so the asset must be evaluated again
+        current_time += datetime.timedelta(hours=1)
+        result = dg.evaluate_automation_conditions(
+            defs=defs, instance=instance, evaluation_time=current_time, cursor=result.cursor
+        )
+        assert _evaluated_keys(result) == {hourly_cron.key}
+        assert result.get_num_requested(hourly_cron.key) == 1
+
+
+def test_incremental_evaluation_definition_change() -> None:
+    with dg.instance_for_test(
+        overrides={"auto_materialize": {"incremental_evaluation": True}}
+    ) as instance:
+        defs = dg.Definitions(assets=[upstream, downstream])
+        result = dg.evaluate_automation_conditions(defs=defs, instance=instance)
+        result = dg.evaluate_automation_conditions(
+            defs=defs, instance=instance, cursor=result.cursor
+        )
+        assert _evaluated_keys(result) == set()
+
+        @dg.asset(
+            name="downstream",
+            deps=[upstream],
+            automation_condition=AutomationCondition.on_missing(),
+        )
+        def new_downstream() -> None: ...
+
+        defs = dg.Definitions(assets=[upstream, new_downstream])
+        result = dg.evaluate_automation_conditions(
+            defs=defs, instance=instance, cursor=result.cursor
+        )
+        assert _evaluated_keys(result) == {downstream.key}
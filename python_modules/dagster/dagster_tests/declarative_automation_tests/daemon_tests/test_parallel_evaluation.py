@@ -0,0 +1,174 @@
+import asyncio
+import json
+import logging
+import os
+
+import dagster as dg
+from dagster import AssetSelection, AutomationCondition
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.automation_tick_evaluation_context import (
+    AutomationTickEvaluationContext,
+)
+from dagster._core.definitions.declarative_automation.parallel_evaluation import (
+    get_independent_entity_key_groups,
+    partition_entity_keys,
+)
+
+
+def _get_defs() -> dg.Definitions:
+    assets = []
+    for component in range(4):
+
+        @dg.asset(name=f"root_{component}", automation_condition=AutomationCondition.eager())
+        def root() -> None: ...
+
+        assets.append(root)
+        for i in range(3):
+
+            @dg.asset(
+                name=f"child_{component}_{i}",
+                deps=[root],
+                automation_condition=AutomationCondition.eager(),
+            )
+            def child() -> None: ...
+
+            assets.append(child)
+
+    @dg.multi_asset(
+        specs=[
+            dg.AssetSpec("multi_a", automation_condition=AutomationCondition.on_missing()),
+            dg.AssetSpec("multi_b", automation_condition=AutomationCondition.on_missing()),
+        ]
+    )
+    def multi(): ...
+
+    return dg.Definitions(assets=[*assets, multi])
+
+
+def _get_context(
+    instance: dg.DagsterInstance, cursor: AssetDaemonCursor, num_evaluation_processes: int
+) -> AutomationTickEvaluationContext:
+    return AutomationTickEvaluationContext(
+        evaluation_id=cursor.evaluation_id + 1,
+        instance=instance,
+        asset_graph=_get_defs().resolve_asset_graph(),
+        cursor=cursor,
+        materialize_run_tags={},
+        observe_run_tags={},
+        auto_observe_asset_keys=set(),
+        asset_selection=AssetSelection.all(),
+        logger=logging.getLogger("dagster.automation"),
+        emit_backfills=False,
+        num_evaluation_processes=num_evaluation_processes,
+    )
+
+
+def _evaluate(
+    instance: dg.DagsterInstance, cursor: AssetDaemonCursor, num_evaluation_processes: int = 1
+):
+    return _get_context(instance, cursor, num_evaluation_processes).evaluate()
+
+
+def test_independent_entity_key_groups() -> None:
+    asset_graph = _get_defs().resolve_asset_graph()
+    entity_keys = asset_graph.get_all_asset_keys()
+
+    groups = get_independent_entity_key_groups(asset_graph, entity_keys)
+    assert len(groups) == 5
+    assert {dg.AssetKey("multi_a"), dg.AssetKey("multi_b")} in groups
+    assert {
+        dg.AssetKey("root_0"),
+        dg.AssetKey("child_0_0"),
+        dg.AssetKey("child_0_1"),
+        dg.AssetKey("child_0_2"),
+    } in groups
+
+    partitions = partition_entity_keys(asset_graph, entity_keys, 2)
+    assert len(partitions) == 2
+    assert sorted(len(partition) for partition in partitions) == [8, 10]
+    assert set().union(*partitions) == entity_keys
+
+    assert len(partition_entity_keys(asset_graph, entity_keys, 16)) == 5
+
+
+def test_parallel_evaluation_matches_serial_evaluation() -> None:
+    with (
+        dg.instance_for_test() as serial_instance,
+        dg.instance_for_test() as parallel_instance,
+    ):
+        serial_cursor = AssetDaemonCursor.empty()
+        parallel_cursor = AssetDaemonCursor.empty()
+        for i in range(3):
+            if i == 1:
+                for instance in (serial_instance, parallel_instance):
+                    instance.report_runless_asset_event(dg.AssetMaterialization("root_2"))
+
+            serial_run_requests, serial_cursor, serial_evaluations = _evaluate(
+                serial_instance, serial_cursor
+            )
+            parallel_run_requests, parallel_cursor, parallel_evaluations = _evaluate(
+                parallel_instance, parallel_cursor, num_evaluation_processes=3
+            )
+
+            assert sorted(
+                tuple(sorted(run_request.asset_selection or []))
+                for run_request in serial_run_requests
+            ) == sorted(
+                tuple(sorted(run_request.asset_selection or []))
+                for run_request in parallel_run_requests
+            )
+            assert {evaluation.key for evaluation in serial_evaluations} == {
+                evaluation.key for evaluation in parallel_evaluations
+            }
+            assert {cursor.key for cursor in serial_cursor.previous_condition_cursors or []} == {
+                cursor.key for cursor in parallel_cursor.previous_condition_cursors or []
+            }
+
+            if i == 1:
+                # the children of the updated root are requested
+                assert parallel_run_requests
+
+        assert len(parallel_cursor.previous_condition_cursors or []) == 18
+
+
+def test_concurrent_parallel_evaluations() -> None:
+    with dg.instance_for_test() as instance_a, dg.instance_for_test() as instance_b:
+        instance_b.report_runless_asset_event(dg.AssetMaterialization("root_2"))
+        cursor = AssetDaemonCursor.empty()
+
+        async def _evaluate_concurrently():
+            return await asyncio.gather(
+                _get_context(instance_a, cursor, 3).async_evaluate(),
+                _get_context(instance_b, cursor, 3).async_evaluate(),
+            )
+
+        # each evaluation is served by its own workers, even though both are in flight at once
+        (run_requests_a, _, _), (run_requests_b, _, _) = asyncio.run(_evaluate_concurrently())
+        assert (run_requests_a, run_requests_b) == (
+            _evaluate(instance_a, cursor)[0],
+            _evaluate(instance_b, cursor)[0],
+        )
+
+
+def test_parallel_evaluation_profile(tmp_path) -> None:
+    trace_dir = str(tmp_path / "traces")
+    with dg.instance_for_test(
+        overrides={
+            "auto_materialize": {
+                "profile_evaluations": True,
+                "evaluation_profile_directory": trace_dir,
+            }
+        }
+    ) as instance:
+        _evaluate(instance, AssetDaemonCursor.empty(), num_evaluation_processes=3)
+
+    # the profiles of the workers are merged into a single trace written by the parent process
+    (trace_file,) = os.listdir(trace_dir)
+    with open(os.path.join(trace_dir, trace_file)) as f:
+        trace = json.load(f)
+
+    complete_events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert len({event["pid"] for event in complete_events}) == 3
+    assert {event["args"]["name"] for event in trace["traceEvents"] if event["ph"] == "M"} == {
+        key.to_user_string() for key in _get_defs().resolve_asset_graph().get_all_asset_keys()
+    }
@@ -0,0 +1,59 @@
+import dagster as dg
+from dagster import AutomationCondition
+from dagster_test.toys.auto_materializing.large_graph import AssetLayerConfig, build_assets
+from dagster_test.utils.automation_replay import (
+    generate_asset_history,
+    import_asset_history,
+    replay_automation_ticks,
+    summarize_tick_stats,
+)
+
+
+def _get_defs() -> dg.Definitions:
+    return dg.Definitions(
+        assets=build_assets(
+            id="replay",
+            layer_configs=[
+                AssetLayerConfig(4, 0, dg.DailyPartitionsDefinition("2020-01-01")),
+                AssetLayerConfig(4, 2, dg.DailyPartitionsDefinition("2020-01-01")),
+                AssetLayerConfig(4, 2, None, n_checks_per_asset=1),
+            ],
+            automation_condition=AutomationCondition.eager(),
+        )
+    )
+
+
+def test_replay_automation_ticks() -> None:
+    defs = _get_defs()
+    with dg.instance_for_test() as instance:
+        num_events = generate_asset_history(
+            instance, defs, num_partitions_per_asset=2, materialized_fraction=0.5
+        )
+        assert num_events > 0
+
+        all_stats = replay_automation_ticks(instance, defs, num_ticks=3, track_memory=True)
+        assert [stats.tick_index for stats in all_stats] == [0, 1, 2]
+        assert all(stats.num_queries > 0 for stats in all_stats)
+        assert all(stats.peak_memory for stats in all_stats)
+        assert all_stats[1].evaluation_time > all_stats[0].evaluation_time
+
+        # eager conditions do not react to the history on their initial evaluation, but do react
+        # to the new root asset materializations reported before each subsequent tick
+        assert all_stats[0].num_requested == 0
+        assert all_stats[1].num_requested > 0
+
+        summary = summarize_tick_stats(all_stats)
+        assert summary["num_ticks"] == 3
+        assert summary["total_requested"] == sum(stats.num_requested for stats in all_stats)
+
+        with dg.instance_for_test() as target_instance:
+            num_imported = import_asset_history(instance, target_instance, defs, limit_per_asset=2)
+            assert num_imported > 0
+            for asset_key in defs.resolve_asset_graph().materializable_asset_keys:
+                assert [
+                    record.partition_key
+                    for record in target_instance.fetch_materializations(asset_key, limit=2).records
+                ] == [
+                    record.partition_key
+                    for record in instance.fetch_materializations(asset_key, limit=2).records
+                ]
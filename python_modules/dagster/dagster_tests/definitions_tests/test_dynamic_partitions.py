@@ -1,11 +1,16 @@
 from collections.abc import Sequence
 from datetime import datetime
 from typing import Callable, Optional
+from unittest import mock
 
 import dagster as dg
 import pytest
 from dagster import AssetExecutionContext
 from dagster._check import CheckError
+from dagster._core.definitions.partitions.utils.dynamic import (
+    CachingDynamicPartitionsLoader,
+    DynamicPartitionsMembershipCache,
+)
 from dagster._core.test_utils import get_paginated_partition_keys
 
 
@@ -62,6 +67,51 @@ def test_dynamic_partitions_def_methods():
         assert instance.has_dynamic_partition("foo", "a") is False
 
 
+def test_dynamic_partitions_membership_cache():
+    cache = DynamicPartitionsMembershipCache(page_size=2)
+    with dg.instance_for_test() as instance:
+        assert cache.get_membership(instance, "foo").partition_keys == []
+
+        instance.add_dynamic_partitions("foo", ["a", "b", "c"])
+        membership = cache.get_membership(instance, "foo")
+        assert membership.partition_keys == ["a", "b", "c"]
+        assert membership.partition_keys_set == {"a", "b", "c"}
+
+        # no partitions were added, so the cached membership is reused
+        assert cache.get_membership(instance, "foo") is membership
+
+        instance.add_dynamic_partitions("foo", ["d", "e", "f"])
+        loaded_keys = []
+        get_paginated_dynamic_partitions = instance.get_paginated_dynamic_partitions
+
+        def _get_paginated_dynamic_partitions(**kwargs):
+            page = get_paginated_dynamic_partitions(**kwargs)
+            loaded_keys.extend(page.results)
+            return page
+
+        with mock.patch.object(
+            instance,
+            "get_paginated_dynamic_partitions",
+            side_effect=_get_paginated_dynamic_partitions,
+        ):
+            membership = cache.get_membership(instance, "foo")
+        # only the new partition keys are loaded
+        assert loaded_keys == ["d", "e", "f"]
+        assert membership.partition_keys == ["a", "b", "c", "d", "e", "f"]
+
+        # deleting a partition causes all partitions to be reloaded
+        instance.delete_dynamic_partition("foo", "b")
+        instance.add_dynamic_partitions("foo", ["g"])
+        membership = cache.get_membership(instance, "foo")
+        assert membership.partition_keys == ["a", "c", "d", "e", "f", "g"]
+        assert "b" not in membership.partition_keys_set
+
+        loader = CachingDynamicPartitionsLoader(instance)
+        assert loader.has_dynamic_partition("foo", "g")
+        assert not loader.has_dynamic_partition("foo", "b")
+        assert loader.get_dynamic_partitions("foo") == ["a", "c", "d", "e", "f", "g"]
+
+
 def test_dynamic_partitioned_run():
     with dg.instance_for_test() as instance:
         partitions_def = dg.DynamicPartitionsDefinition(name="foo")
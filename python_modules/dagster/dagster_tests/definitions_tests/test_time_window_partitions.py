@@ -2085,3 +2085,102 @@ def test_reverse_pagination_negative_end_offset():
     assert get_paginated_partition_keys(
         partitions_def, current_time=current_time, ascending=False
     ) == list(reversed(all_keys))
+
+
+@pytest.mark.parametrize(
+    "cron_schedule, fmt",
+    [
+        ("0 * * * *", DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE),
+        ("*/15 * * * *", DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE),
+        ("30 2 * * *", DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE),
+        ("0 0 * * 0", DATE_FORMAT),
+        ("0 1 15 * *", DATE_FORMAT),
+    ],
+)
+@pytest.mark.parametrize("timezone", ["UTC", "America/Los_Angeles", "Europe/Berlin"])
+@pytest.mark.parametrize("end_offset", [0, 2, -1])
+def test_closed_form_index_arithmetic_matches_iteration(
+    cron_schedule: str, fmt: str, timezone: str, end_offset: int
+):
+    # spans both the fall back and spring forward DST transitions
+    start = datetime(2020, 10, 20)
+    end = datetime(2021, 3, 30) if end_offset < 0 else None
+    current_time = (
+        datetime(2020, 11, 3, 5, 7)
+        if cron_schedule.endswith("* * * *")
+        else datetime(2021, 4, 2, 5, 7)
+    )
+
+    partitions_def = TimeWindowPartitionsDefinition(
+        cron_schedule=cron_schedule,
+        start=start,
+        end=end,
+        fmt=fmt,
+        timezone=timezone,
+        end_offset=end_offset,
+    )
+    assert partitions_def._regular_schedule is not None  # noqa: SLF001
+    iterating_partitions_def = copy(partitions_def)
+    # force the fallback to iterating over every cron tick
+    iterating_partitions_def.__dict__["_regular_schedule"] = None
+
+    with partition_loading_context(effective_dt=current_time):
+        partition_keys = partitions_def.get_partition_keys()
+        assert partition_keys == iterating_partitions_def.get_partition_keys()
+        assert partitions_def.get_num_partitions() == len(partition_keys)
+        assert (
+            partitions_def.get_last_partition_window()
+            == iterating_partitions_def.get_last_partition_window()
+        )
+        for start_idx, end_idx in [
+            (0, 5),
+            (7, 40),
+            (len(partition_keys) - 3, len(partition_keys) + 3),
+        ]:
+            assert (
+                partitions_def.get_partition_keys_between_indexes(start_idx, end_idx)
+                == partition_keys[start_idx:end_idx]
+            )
+
+        sampled_keys = frozenset(random.sample(partition_keys, min(25, len(partition_keys))))
+        assert partitions_def.time_windows_for_partition_keys(
+            sampled_keys
+        ) == iterating_partitions_def.time_windows_for_partition_keys(sampled_keys)
+
+        time_window = dg.TimeWindow(
+            partitions_def.time_window_for_partition_key(partition_keys[2]).start,
+            partitions_def.time_window_for_partition_key(partition_keys[-3]).end,
+        )
+        assert partitions_def.get_partition_keys_in_time_window(
+            time_window
+        ) == iterating_partitions_def.get_partition_keys_in_time_window(time_window)
+
+
+def test_partition_keys_between_indexes_stop_at_end():
+    partitions_def = dg.DailyPartitionsDefinition("2023-01-01", end_date="2023-01-10")
+    with partition_loading_context(effective_dt=datetime(2024, 1, 1)):
+        # indexes past the end of a bounded definition previously returned keys past its end
+        assert partitions_def.get_partition_keys_between_indexes(5, 20) == [
+            "2023-01-06",
+            "2023-01-07",
+            "2023-01-08",
+            "2023-01-09",
+        ]
+        assert (
+            partitions_def.get_partition_keys_between_indexes(5, 20)
+            == partitions_def.get_partition_keys()[5:20]
+        )
+
+
+def test_num_partitions_on_partition_boundary_in_offset_timezone():
+    partitions_def = TimeWindowPartitionsDefinition(
+        cron_schedule="30 * * * *",
+        start=datetime(2023, 1, 1),
+        fmt="%Y-%m-%d-%H:%M",
+        timezone="Asia/Kolkata",
+    )
+    # exactly on a partition boundary, which previously counted one partition more than
+    # get_partition_keys returned
+    with partition_loading_context(effective_dt=datetime(2023, 1, 2, 3, 30)):
+        assert partitions_def.get_num_partitions() == len(partitions_def.get_partition_keys())
+        assert partitions_def.get_num_partitions() == 27
@@ -282,6 +282,111 @@ def test_max_concurrent():
             active_step = None
 
 
+def test_max_concurrent_step_launches():
+    TestStepHandler.reset()
+    with dg.instance_for_test() as instance:
+        result = dg.execute_job(
+            dg.reconstructable(three_op_job),
+            instance=instance,
+            run_config={
+                "execution": {
+                    "config": {
+                        "max_concurrent_step_launches": 3,
+                        "check_step_health_interval_seconds": 0,
+                    }
+                }
+            },
+        )
+        TestStepHandler.wait_for_processes()
+
+    assert result.success
+    assert TestStepHandler.launch_step_count == 3
+
+
+class BatchTestStepHandler(StepHandler):
+    def __init__(self, latency_seconds: float = 0.0):
+        self.latency_seconds = latency_seconds
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.num_calls = 0
+
+    @property
+    def name(self):
+        return "BatchTestStepHandler"
+
+    def _call(self):
+        with self.lock:
+            self.in_flight += 1
+            self.num_calls += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency_seconds)
+        with self.lock:
+            self.in_flight -= 1
+
+    def launch_step(self, step_handler_context):
+        self._call()
+        yield step_handler_context
+
+    def check_step_health(self, step_handler_context) -> CheckStepHealthResult:
+        self._call()
+        if step_handler_context == "error":
+            raise Exception("health check failed")
+        if step_handler_context == "unhealthy":
+            return CheckStepHealthResult.unhealthy("not running")
+        return CheckStepHealthResult.healthy()
+
+    def terminate_step(self, step_handler_context):
+        raise NotImplementedError()
+
+
+@pytest.mark.parametrize("max_concurrent_launches", [1, 4])
+def test_batched_launch_steps(max_concurrent_launches):
+    step_handler = BatchTestStepHandler(latency_seconds=0.1)
+    contexts = [f"step_{i}" for i in range(8)]
+
+    # events are yielded in the order the contexts were passed in
+    assert (
+        list(
+            step_handler.launch_steps(
+                contexts,  # pyright: ignore[reportArgumentType]
+                max_concurrent_launches=max_concurrent_launches,
+            )
+        )
+        == contexts
+    )
+    assert step_handler.max_in_flight == max_concurrent_launches
+
+
+def test_serial_launch_steps_yields_each_launch():
+    step_handler = BatchTestStepHandler()
+    events = step_handler.launch_steps(
+        ["step_0", "step_1"],  # pyright: ignore[reportArgumentType]
+        max_concurrent_launches=1,
+    )
+
+    # the events of a launch are yielded before the next step is launched, so the executor can
+    # track the steps which were launched before a launch fails
+    assert next(events) == "step_0"
+    assert step_handler.num_calls == 1
+    assert list(events) == ["step_1"]
+    assert step_handler.num_calls == 2
+
+
+def test_batched_check_steps_health():
+    step_handler = BatchTestStepHandler()
+    results = step_handler.check_steps_health(
+        ["healthy", "error", "unhealthy"],  # pyright: ignore[reportArgumentType]
+        max_concurrent_checks=2,
+    )
+
+    assert results[0] == CheckStepHealthResult.healthy()
+    assert not results[1].is_healthy
+    assert results[1].error
+    assert "health check failed" in results[1].error.message
+    assert results[2] == CheckStepHealthResult.unhealthy("not running")
+
+
 def test_tag_concurrency_limits():
     TestStepHandler.reset()
     with dg.instance_for_test() as instance:
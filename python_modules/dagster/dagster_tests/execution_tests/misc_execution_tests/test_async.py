@@ -98,3 +98,105 @@ async def aio_asset(aio_resource: AioResource):
     loop = asyncio.new_event_loop()
     with dg.build_asset_context({"aio_resource": AioResource()}, event_loop=loop) as ctx:
         assert loop.run_until_complete(aio_asset(ctx)) == "done"  # type: ignore
+
+
+_concurrency_state = {"in_flight": 0, "max_in_flight": 0}
+
+
+def _concurrent_async_assets_job(max_concurrent: int, num_assets: int = 8):
+    def _build_async_asset(i: int) -> dg.AssetsDefinition:
+        @dg.asset(name=f"aio_asset_{i}")
+        async def aio_asset():
+            _concurrency_state["in_flight"] += 1
+            _concurrency_state["max_in_flight"] = max(
+                _concurrency_state["max_in_flight"], _concurrency_state["in_flight"]
+            )
+            await asyncio.sleep(0.2)
+            _concurrency_state["in_flight"] -= 1
+            return i
+
+        return aio_asset
+
+    async_assets = [_build_async_asset(i) for i in range(num_assets)]
+
+    @dg.asset(ins={asset.key.path[0]: dg.AssetIn(asset.key) for asset in async_assets})
+    def sync_total(**values):
+        return sum(values.values())
+
+    @dg.asset
+    async def aio_downstream(sync_total):
+        await asyncio.sleep(0)
+        return sync_total + 1
+
+    return dg.Definitions(
+        assets=[*async_assets, sync_total, aio_downstream],
+        jobs=[
+            dg.define_asset_job(
+                "concurrent_async_job",
+                executor_def=dg.in_process_executor.configured({"max_concurrent": max_concurrent}),
+            )
+        ],
+    ).get_job_def("concurrent_async_job")
+
+
+def get_concurrent_async_job():
+    return _concurrent_async_assets_job(max_concurrent=4)
+
+
+def get_serial_async_job():
+    return _concurrent_async_assets_job(max_concurrent=1)
+
+
+@pytest.mark.parametrize(
+    "job_fn, expected_max_in_flight",
+    [(get_concurrent_async_job, 4), (get_serial_async_job, 1)],
+)
+def test_in_process_executor_concurrent_async_steps(job_fn, expected_max_in_flight):
+    _concurrency_state.update(in_flight=0, max_in_flight=0)
+    with dg.instance_for_test() as instance:
+        with dg.execute_job(dg.reconstructable(job_fn), instance=instance) as result:
+            assert result.success
+            assert len(result.get_step_success_events()) == 10
+
+    assert _concurrency_state["max_in_flight"] == expected_max_in_flight
+
+
+def _failing_concurrent_async_job():
+    @dg.asset
+    async def aio_fails():
+        await asyncio.sleep(0)
+        raise Exception("boom")
+
+    @dg.asset
+    async def aio_succeeds():
+        await asyncio.sleep(0.1)
+        return 1
+
+    @dg.asset
+    async def aio_after_failure(aio_fails):
+        return aio_fails
+
+    return dg.Definitions(
+        assets=[aio_fails, aio_succeeds, aio_after_failure],
+        jobs=[
+            dg.define_asset_job(
+                "failing_async_job",
+                executor_def=dg.in_process_executor.configured({"max_concurrent": 4}),
+            )
+        ],
+    ).get_job_def("failing_async_job")
+
+
+def test_in_process_executor_concurrent_async_step_failure():
+    with dg.instance_for_test() as instance:
+        with dg.execute_job(
+            dg.reconstructable(_failing_concurrent_async_job), instance=instance
+        ) as result:
+            assert not result.success
+            assert {event.step_key for event in result.get_step_success_events()} == {
+                "aio_succeeds"
+            }
+            assert {event.step_key for event in result.get_step_failure_events()} == {"aio_fails"}
+            assert "aio_after_failure" not in {
+                event.step_key for event in result.all_events if event.is_step_start
+            }
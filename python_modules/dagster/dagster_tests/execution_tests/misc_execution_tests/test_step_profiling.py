@@ -0,0 +1,80 @@
+import time
+
+import dagster as dg
+from dagster import DagsterEventType
+from dagster._core.storage.tags import STEP_PROFILING_TAG
+
+
+def define_job() -> dg.JobDefinition:
+    @dg.op
+    def busy():
+        end = time.time() + 0.2
+        total = 0
+        while time.time() < end:
+            total += sum(range(1000))
+        return total
+
+    @dg.op
+    def allocate(_busy):
+        return len([object() for _ in range(100_000)])
+
+    @dg.job
+    def profiled():
+        allocate(busy())
+
+    return profiled
+
+
+def _profile_events(instance, run_id):
+    return [
+        event
+        for event in instance.all_logs(run_id, of_type=DagsterEventType.ENGINE_EVENT)
+        if event.get_dagster_event().engine_event_data.step_profile
+    ]
+
+
+def test_step_profiling_disabled():
+    with dg.instance_for_test() as instance:
+        result = define_job().execute_in_process(instance=instance)
+        assert result.success
+
+        assert not _profile_events(instance, result.run_id)
+        step_stats = instance.get_run_step_stats(result.run_id)
+        assert all(stats.profile is None for stats in step_stats)
+
+
+def test_step_profiling():
+    with dg.instance_for_test() as instance:
+        result = define_job().execute_in_process(
+            instance=instance, tags={STEP_PROFILING_TAG: "true"}
+        )
+        assert result.success
+
+        assert len(_profile_events(instance, result.run_id)) == 2
+
+        step_stats = {stats.step_key: stats for stats in instance.get_run_step_stats(result.run_id)}
+        profile = step_stats["busy"].profile
+        assert profile
+        assert profile.wall_time_ms >= 200
+        assert profile.cpu_time_ms and profile.cpu_time_ms > 0
+        assert profile.stack_samples is None
+        assert step_stats["allocate"].profile
+
+
+def test_step_profiling_stack_samples():
+    with dg.instance_for_test() as instance:
+        with dg.execute_job(
+            dg.reconstructable(define_job),
+            instance=instance,
+            tags={STEP_PROFILING_TAG: "stack"},
+        ) as result:
+            assert result.success
+
+            step_stats = {
+                stats.step_key: stats for stats in instance.get_run_step_stats(result.run_id)
+            }
+            profile = step_stats["busy"].profile
+            assert profile
+            assert profile.stack_samples
+            assert profile.sample_interval_ms
+            assert any("busy" in stack for stack in profile.stack_samples)
@@ -0,0 +1,164 @@
+import dagster as dg
+from dagster import DagsterInstance
+from dagster._core.definitions.data_version import extract_data_version_from_entry
+from dagster._core.storage.tags import (
+    CACHED_MATERIALIZATION_TAG,
+    STEP_RESULT_CACHE_KEY_TAG,
+    STEP_RESULT_CACHE_TAG,
+)
+
+CACHE_TAGS = {STEP_RESULT_CACHE_TAG: "true"}
+
+
+def _latest_materialization_record(instance: DagsterInstance, asset_key: dg.AssetKey):
+    return instance.fetch_materializations(asset_key, limit=1).records[0]
+
+
+def test_unchanged_steps_are_not_recomputed():
+    calls = []
+
+    @dg.asset(code_version="1")
+    def upstream():
+        calls.append("upstream")
+        return 1
+
+    @dg.asset(code_version="1")
+    def downstream(upstream):
+        calls.append("downstream")
+        return upstream + 1
+
+    instance = DagsterInstance.ephemeral()
+    assert dg.materialize([upstream, downstream], instance=instance, tags=CACHE_TAGS).success
+    assert calls == ["upstream", "downstream"]
+    first_record = _latest_materialization_record(instance, downstream.key)
+    assert STEP_RESULT_CACHE_KEY_TAG in first_record.asset_materialization.tags
+
+    result = dg.materialize([upstream, downstream], instance=instance, tags=CACHE_TAGS)
+    assert result.success
+    assert calls == ["upstream", "downstream"]
+    assert len(result.get_asset_materialization_events()) == 2
+
+    second_record = _latest_materialization_record(instance, downstream.key)
+    assert second_record.asset_materialization.tags[CACHED_MATERIALIZATION_TAG] == "true"
+    assert extract_data_version_from_entry(
+        second_record.event_log_entry
+    ) == extract_data_version_from_entry(first_record.event_log_entry)
+    assert (
+        second_record.asset_materialization.tags[STEP_RESULT_CACHE_KEY_TAG]
+        == first_record.asset_materialization.tags[STEP_RESULT_CACHE_KEY_TAG]
+    )
+
+
+def test_cache_requires_opt_in():
+    calls = []
+
+    @dg.asset(code_version="1")
+    def asset1():
+        calls.append("asset1")
+
+    instance = DagsterInstance.ephemeral()
+    assert dg.materialize([asset1], instance=instance).success
+    assert dg.materialize([asset1], instance=instance).success
+    assert calls == ["asset1", "asset1"]
+    record = _latest_materialization_record(instance, asset1.key)
+    assert STEP_RESULT_CACHE_KEY_TAG not in record.asset_materialization.tags
+
+
+def test_changed_inputs_invalidate_cache():
+    calls = []
+
+    @dg.asset
+    def unversioned_upstream():
+        return 1
+
+    @dg.asset(code_version="1")
+    def downstream(unversioned_upstream):
+        calls.append("downstream")
+
+    instance = DagsterInstance.ephemeral()
+    assets = [unversioned_upstream, downstream]
+    assert dg.materialize(assets, instance=instance, tags=CACHE_TAGS).success
+    assert dg.materialize(assets, instance=instance, tags=CACHE_TAGS).success
+    assert calls == ["downstream", "downstream"]
+
+
+def test_changed_config_and_code_version_invalidate_cache():
+    calls = []
+
+    def _build_asset(code_version: str):
+        @dg.asset(code_version=code_version, config_schema={"value": int})
+        def asset1(context):
+            calls.append(context.op_config["value"])
+
+        return asset1
+
+    def _run_config(value: int):
+        return {"ops": {"asset1": {"config": {"value": value}}}}
+
+    instance = DagsterInstance.ephemeral()
+    for code_version, value in [("1", 1), ("1", 1), ("1", 2), ("2", 2), ("2", 2)]:
+        assert dg.materialize(
+            [_build_asset(code_version)],
+            instance=instance,
+            tags=CACHE_TAGS,
+            run_config=_run_config(value),
+        ).success
+    assert calls == [1, 2, 2]
+
+
+def test_partitions_are_cached_independently():
+    calls = []
+
+    @dg.asset(code_version="1", partitions_def=dg.StaticPartitionsDefinition(["a", "b"]))
+    def asset1(context):
+        calls.append(context.partition_key)
+
+    instance = DagsterInstance.ephemeral()
+    for partition_key in ["a", "a", "b", "a", "b"]:
+        assert dg.materialize(
+            [asset1], instance=instance, tags=CACHE_TAGS, partition_key=partition_key
+        ).success
+    assert calls == ["a", "b"]
+
+
+def test_outputs_which_cannot_be_loaded_are_recomputed():
+    calls = []
+
+    @dg.asset(code_version="1")
+    def upstream():
+        calls.append("upstream")
+        return 1
+
+    @dg.asset(code_version="1")
+    def downstream(upstream):
+        calls.append("downstream")
+        return upstream + 1
+
+    instance = DagsterInstance.ephemeral()
+    for _ in range(2):
+        # in-memory outputs do not outlive the run, so the downstream step could not load them
+        assert dg.materialize_to_memory(
+            [upstream, downstream], instance=instance, tags=CACHE_TAGS
+        ).success
+    assert calls == ["upstream", "downstream", "upstream", "downstream"]
+
+
+def test_missing_persisted_outputs_are_recomputed(tmp_path):
+    calls = []
+
+    @dg.asset(code_version="1")
+    def asset1():
+        calls.append("asset1")
+        return 1
+
+    instance = DagsterInstance.ephemeral()
+    resources = {"io_manager": dg.FilesystemIOManager(base_dir=str(tmp_path))}
+    for _ in range(2):
+        assert dg.materialize(
+            [asset1], instance=instance, tags=CACHE_TAGS, resources=resources
+        ).success
+    assert calls == ["asset1"]
+
+    (tmp_path / "asset1").unlink()
+    assert dg.materialize([asset1], instance=instance, tags=CACHE_TAGS, resources=resources).success
+    assert calls == ["asset1", "asset1"]
@@ -1,7 +1,10 @@
+import os
 import sys
+import threading
 
 import pytest
 from dagster._core.execution.compute_logs import (
+    get_compute_log_pump,
     mirror_stream_to_file,
     should_disable_io_stream_redirect,
 )
@@ -18,3 +21,95 @@ def test_capture():
 
         with open(capture_filepath, encoding="utf8") as capture_stream:
             assert "HELLO" in capture_stream.read()
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_capture_nested():
+    with get_temp_file_name() as outer_filepath, get_temp_file_name() as inner_filepath:
+        with mirror_stream_to_file(sys.stdout, outer_filepath):
+            print("OUTER")  # noqa: T201
+            with mirror_stream_to_file(sys.stdout, inner_filepath):
+                print("INNER")  # noqa: T201
+
+        with open(outer_filepath, encoding="utf8") as capture_stream:
+            outer = capture_stream.read()
+        with open(inner_filepath, encoding="utf8") as capture_stream:
+            inner = capture_stream.read()
+
+        assert "OUTER" in outer and "INNER" in outer
+        assert "INNER" in inner and "OUTER" not in inner
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_capture_large_output():
+    line = "x" * 1023
+    num_lines = 1024
+    writes = []
+    with get_temp_file_name() as capture_filepath:
+        with mirror_stream_to_file(
+            sys.stderr, capture_filepath, on_write=lambda: writes.append(True)
+        ):
+            for _ in range(num_lines):
+                print(line, file=sys.stderr)  # noqa: T201
+
+        with open(capture_filepath, encoding="utf8") as capture_stream:
+            assert capture_stream.read() == f"{line}\n" * num_lines
+
+    assert writes
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_pump_survives_failed_file_writes():
+    pump = get_compute_log_pump()
+    with get_temp_file_name() as capture_filepath:
+        read_fd, write_fd = os.pipe()
+        mirror_read_fd, mirror_write_fd = os.pipe()
+        # writing to a file opened for reading fails
+        file_fd = os.open(capture_filepath, os.O_RDONLY)
+        pumped = pump.register(read_fd, file_fd, mirror_write_fd)
+
+        os.write(write_fd, b"HELLO")
+        pump.drain(pumped)
+        assert pumped.file_fd is None
+        assert os.read(mirror_read_fd, 1024) == b"HELLO"
+
+        os.write(write_fd, b"WORLD")
+        pump.drain(pumped)
+        assert os.read(mirror_read_fd, 1024) == b"WORLD"
+
+        os.close(write_fd)
+        pump.drain(pumped)
+        assert pumped.closed
+        os.close(mirror_read_fd)
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_pump_does_not_block_on_full_mirror():
+    pump = get_compute_log_pump()
+    with get_temp_file_name() as capture_filepath:
+        read_fd, write_fd = os.pipe()
+        # nothing ever reads from the mirrored pipe, so it fills up
+        mirror_read_fd, mirror_write_fd = os.pipe()
+        file_fd = os.open(capture_filepath, os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+        pumped = pump.register(read_fd, file_fd, mirror_write_fd)
+
+        data = b"x" * 1024 * 1024
+        writer = threading.Thread(target=os.write, args=(write_fd, data))
+        writer.start()
+        writer.join(timeout=30)
+        assert not writer.is_alive()
+
+        os.close(write_fd)
+        pump.drain(pumped)
+        assert pumped.closed
+        with open(capture_filepath, "rb") as f:
+            assert f.read() == data
+        os.close(mirror_read_fd)
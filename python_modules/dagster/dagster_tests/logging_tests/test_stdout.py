@@ -385,3 +385,36 @@ def test_multi():
         assert normalize_file_content(full_data.stdout.decode("utf-8")).startswith(  # pyright: ignore[reportOptionalMemberAccess]
             expected_outer_prefix()
         )
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_compute_log_manager_subscription_in_process_capture():
+    from dagster._core.storage.local_compute_log_manager import LocalComputeLogManager
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # poll infrequently so that updates can only arrive by being pushed from the capture
+        compute_log_manager = LocalComputeLogManager(temp_dir, polling_timeout=60.0)
+        log_key = [make_new_run_id(), "compute_logs", "spew"]
+
+        messages = []
+        subscription = compute_log_manager.subscribe(log_key)
+        subscription(messages.append)
+        assert len(messages) == 1
+
+        with compute_log_manager.capture_logs(log_key):
+            print(HELLO_FROM_OP)  # noqa: T201
+            sys.stdout.flush()
+            start_time = time.time()
+            while len(messages) < 2 and time.time() - start_time < 10:
+                time.sleep(0.1)
+
+        assert len(messages) >= 2
+        assert HELLO_FROM_OP in b"".join(m.stdout or b"" for m in messages).decode("utf-8")
+
+        start_time = time.time()
+        while not subscription.is_complete and time.time() - start_time < 10:
+            time.sleep(0.1)
+        assert subscription.is_complete
+        compute_log_manager.dispose()
@@ -0,0 +1,97 @@
+import time
+
+import dagster as dg
+from dagster._core.definitions.asset_checks.asset_check_evaluation import (
+    AssetCheckEvaluationPlanned,
+)
+from dagster._core.events import (
+    AssetMaterializationPlannedData,
+    DagsterEventType,
+    StepMaterializationData,
+)
+from dagster._core.loader import LoadingContextForTest
+from dagster._core.storage.asset_latest_info_record import AssetLatestInfoRecord
+from dagster._core.test_utils import create_run_for_test, instance_for_test
+
+
+def _store_event(instance: dg.DagsterInstance, run_id: str, event_type: DagsterEventType, data):
+    instance.store_event(
+        dg.EventLogEntry(
+            error_info=None,
+            level="debug",
+            user_message="",
+            run_id=run_id,
+            timestamp=time.time(),
+            dagster_event=dg.DagsterEvent(event_type.value, "nonce", event_specific_data=data),
+        )
+    )
+
+
+def _plan(instance: dg.DagsterInstance, run_id: str, asset_key: dg.AssetKey) -> None:
+    _store_event(
+        instance,
+        run_id,
+        DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+        AssetMaterializationPlannedData(asset_key),
+    )
+
+
+def test_asset_latest_info_record():
+    a, b, c, d, e = [dg.AssetKey(key) for key in "abcde"]
+    with instance_for_test() as instance:
+        unstarted_run_id = create_run_for_test(
+            instance, status=dg.DagsterRunStatus.NOT_STARTED
+        ).run_id
+        started_run_id = create_run_for_test(instance, status=dg.DagsterRunStatus.STARTED).run_id
+        failed_run_id = create_run_for_test(instance, status=dg.DagsterRunStatus.FAILURE).run_id
+        materialized_run_id = create_run_for_test(
+            instance, status=dg.DagsterRunStatus.STARTED
+        ).run_id
+
+        _plan(instance, unstarted_run_id, a)
+        _plan(instance, started_run_id, b)
+        _plan(instance, failed_run_id, c)
+        _plan(instance, materialized_run_id, d)
+        _store_event(
+            instance,
+            materialized_run_id,
+            DagsterEventType.ASSET_MATERIALIZATION,
+            StepMaterializationData(dg.AssetMaterialization(asset_key=d)),
+        )
+        _store_event(
+            instance,
+            started_run_id,
+            DagsterEventType.ASSET_CHECK_EVALUATION_PLANNED,
+            AssetCheckEvaluationPlanned(asset_key=b, check_name="my_check"),
+        )
+
+        context = LoadingContextForTest(instance)
+        records = {
+            record.asset_key: record
+            for record in AssetLatestInfoRecord.blocking_get_many(context, [a, b, c, d, e])
+            if record
+        }
+        assert set(records.keys()) == {a, b, c, d, e}
+
+        assert records[a].unstarted_run_ids == {unstarted_run_id}
+        assert not records[a].in_progress_run_ids
+        assert records[a].latest_materialization is None
+
+        assert records[b].in_progress_run_ids == {started_run_id}
+        assert not records[b].unstarted_run_ids
+        assert records[b].latest_run_record
+        assert records[b].latest_run_record.dagster_run.run_id == started_run_id
+        assert set(records[b].latest_check_executions.keys()) == {dg.AssetCheckKey(b, "my_check")}
+
+        assert records[c].failed_run_ids == {failed_run_id}
+        assert not records[c].in_progress_run_ids
+
+        # the latest planned run has already materialized the asset
+        assert records[d].latest_materialization
+        assert records[d].latest_materialization.run_id == materialized_run_id
+        assert not records[d].in_progress_run_ids
+        assert not records[d].failed_run_ids
+
+        assert records[e].asset_record is None
+        assert records[e].latest_run_record is None
+        assert not records[e].latest_check_executions
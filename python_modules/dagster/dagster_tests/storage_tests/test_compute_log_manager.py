@@ -172,7 +172,11 @@ def test_broken_compute_log_manager():
 
 import pytest
 from dagster._core.events import DagsterEventType
-from dagster._core.storage.compute_log_manager import CapturedLogContext, ComputeIOType
+from dagster._core.storage.compute_log_manager import (
+    MAX_BYTES_CHUNK_READ,
+    CapturedLogContext,
+    ComputeIOType,
+)
 from dagster._core.storage.local_compute_log_manager import LocalComputeLogManager
 from dagster._core.storage.noop_compute_log_manager import NoOpComputeLogManager
 from dagster._serdes import ConfigurableClassData
@@ -388,3 +392,62 @@ def test_file_keys_unique_even_if_random_is_seeded():
     assert key1 != key2
     # state returned to seeded version
     assert random.getstate() == seeded_state
+
+
+def test_follow_subscription_frames():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        cm = LocalComputeLogManager(tmpdir_path)
+        log_key = ["some", "log", "key"]
+        # a multi-byte character straddles the end of the first frame
+        content = "a" * (MAX_BYTES_CHUNK_READ - 1) + "é" + "b" * 10
+        with cm.open_log_stream(log_key, ComputeIOType.STDOUT) as f:
+            f.write(content)  # pyright: ignore[reportOptionalMemberAccess]
+
+        subscription = cm.subscribe(log_key)
+        notifications = []
+        subscription.follow(lambda: notifications.append(True))
+        assert notifications
+
+        frames = []
+        while (frame := subscription.read_frame()) is not None:
+            frames.append(frame)
+        assert len(frames) == 2
+        assert all(len(frame.stdout) <= MAX_BYTES_CHUNK_READ for frame in frames)  # pyright: ignore[reportArgumentType]
+        assert "".join(frame.stdout.decode("utf-8") for frame in frames) == content  # pyright: ignore[reportOptionalMemberAccess]
+        subscription.dispose()
+
+        # following from a cursor only reads the data appended after it
+        subscription = cm.subscribe(log_key, frames[-1].cursor)
+        subscription.follow(lambda: None)
+        frame = subscription.read_frame()
+        assert frame and not frame.stdout
+        assert subscription.read_frame() is None
+        subscription.dispose()
+        cm.dispose()
+
+
+def test_read_log_lines_cursor_offset():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        cm = LocalComputeLogManager(tmpdir_path)
+        log_key_prefix = ["test_log_bucket", "offsets"]
+        with cm.open_log_stream([*log_key_prefix, "0"], ComputeIOType.STDERR) as f:
+            f.write("\n".join(f"é line {i}" for i in range(10)))  # pyright: ignore[reportOptionalMemberAccess]
+
+        with environ({"DAGSTER_CAPTURED_LOG_CHUNK_SIZE": "4"}):
+            log_lines, cursor = cm.read_log_lines_for_log_key_prefix(
+                log_key_prefix, cursor=None, io_type=ComputeIOType.STDERR
+            )
+            assert log_lines == [f"é line {i}" for i in range(4)]
+            assert cursor
+            assert cursor.line == 4
+            assert cursor.offset == cm.seek_log_line(cursor.log_key, ComputeIOType.STDERR, 4)
+
+            # the offset of the cursor is used to resume reading, rather than its line
+            log_lines, _ = cm.read_log_lines_for_log_key_prefix(
+                log_key_prefix,
+                cursor=cursor._replace(
+                    offset=cm.seek_log_line(cursor.log_key, ComputeIOType.STDERR, 6)
+                ).to_string(),
+                io_type=ComputeIOType.STDERR,
+            )
+            assert log_lines == [f"é line {i}" for i in range(6, 10)]
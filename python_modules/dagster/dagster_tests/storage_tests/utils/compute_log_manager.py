@@ -224,3 +224,34 @@ def test_delete_log_prefix(self, compute_log_manager):
         assert log_data.stdout is None
         other_log_data = compute_log_manager.get_log_data(other_log_key)
         assert other_log_data.stdout is None
+
+    def test_range_reads(self, compute_log_manager):
+        log_key = ["some", "log", "key"]
+        lines = [f"line {i} é" for i in range(1000)]
+        with compute_log_manager.open_log_stream(log_key, ComputeIOType.STDOUT) as write_stream:
+            write_stream.write("\n".join(lines) + "\n")
+        content = ("\n".join(lines) + "\n").encode("utf-8")
+
+        assert compute_log_manager.get_log_size(log_key, ComputeIOType.STDOUT) == len(content)
+        assert (
+            compute_log_manager.get_log_size(["other", "log", "key"], ComputeIOType.STDOUT) is None
+        )
+
+        tail, offset = compute_log_manager.read_log_tail(log_key, ComputeIOType.STDOUT, 100)
+        assert offset == len(content)
+        assert tail and len(tail) <= 100
+        assert content.endswith(tail)
+        assert tail.startswith(b"line ")
+
+        line_offset = compute_log_manager.seek_log_line(log_key, ComputeIOType.STDOUT, 500)
+        data, _ = compute_log_manager.get_log_data_for_type(
+            log_key, ComputeIOType.STDOUT, line_offset, max_bytes=len("line 500")
+        )
+        assert data == b"line 500"
+        assert compute_log_manager.seek_log_line(
+            log_key, ComputeIOType.STDOUT, 10, offset=line_offset
+        ) == compute_log_manager.seek_log_line(log_key, ComputeIOType.STDOUT, 510)
+        assert compute_log_manager.seek_log_line(log_key, ComputeIOType.STDOUT, 1000) == len(
+            content
+        )
+        assert compute_log_manager.seek_log_line(log_key, ComputeIOType.STDOUT, 1001) is None
@@ -3955,6 +3955,11 @@ def test_get_latest_planned_materialization_info(self, storage, instance):
             info = storage.get_latest_planned_materialization_info(asset_key=b)
             assert not info
 
+            infos = storage.get_latest_planned_materialization_info_by_asset_key([a, b])
+            assert set(infos.keys()) == {a}
+            assert infos[a] == storage.get_latest_planned_materialization_info(asset_key=a)
+            assert infos[a].run_id == run_id_1
+
     def test_get_latest_planned_materialization_info_partitioned(self, storage, instance):
         a = dg.AssetKey(["a"])
         b = dg.AssetKey(["b"])
@@ -4034,6 +4039,11 @@ def test_get_latest_planned_materialization_info_partitioned(self, storage, inst
             # assert unplanned materializations don't affect planned materializations
             assert not storage.get_latest_planned_materialization_info(asset_key=b, partition="foo")
 
+            # the latest planned materialization across all partitions
+            assert storage.get_latest_planned_materialization_info_by_asset_key([a, b]) == {
+                a: bar_info
+            }
+
     def test_partitions_methods_on_materialization_planned_event_with_partitions_subset(
         self, storage, instance
     ) -> None:
@@ -5265,6 +5275,23 @@ def test_add_dynamic_partitions(self, storage: EventLogStorage):
         # Adding no partitions is a no-op
         storage.add_dynamic_partitions(partitions_def_name="foo", partition_keys=[])
 
+    def test_add_dynamic_partitions_bulk(self, storage: EventLogStorage):
+        assert storage
+
+        partition_keys = [f"key_{i}" for i in range(2500)]
+        # add keys spanning multiple insert statements, including duplicates and keys that
+        # already exist
+        storage.add_dynamic_partitions(partitions_def_name="foo", partition_keys=["key_1000"])
+        storage.add_dynamic_partitions(
+            partitions_def_name="foo", partition_keys=[*partition_keys, *partition_keys[:10]]
+        )
+        assert storage.get_dynamic_partitions("foo") == [
+            "key_1000",
+            *[key for key in partition_keys if key != "key_1000"],
+        ]
+        assert storage.get_dynamic_partitions_count("foo") == 2500
+        assert storage.get_dynamic_partitions_count("bar") == 0
+
     def test_delete_dynamic_partitions(self, storage: EventLogStorage):
         assert storage
 
@@ -6075,6 +6102,56 @@ def test_external_asset_event(
         assert mat.asset_materialization
         assert mat.asset_materialization.metadata["was"].value == "here"
 
+    def test_get_latest_asset_check_executions_by_asset_key(
+        self,
+        storage: EventLogStorage,
+        instance: DagsterInstance,
+    ) -> None:
+        run_id_0, run_id_1 = [make_new_run_id() for _ in range(2)]
+        with create_and_delete_test_runs(instance, [run_id_0, run_id_1]):
+            check_key_1 = dg.AssetCheckKey(dg.AssetKey(["my_asset"]), "my_check")
+            check_key_2 = dg.AssetCheckKey(dg.AssetKey(["my_asset"]), "my_check_2")
+            check_key_3 = dg.AssetCheckKey(dg.AssetKey(["my_other_asset"]), "my_check")
+
+            assert storage.get_latest_asset_check_executions_by_asset_key([]) == {}
+            assert not storage.get_latest_asset_check_executions_by_asset_key(
+                [check_key_1.asset_key]
+            )
+
+            for run_id, check_key in [
+                (run_id_0, check_key_1),
+                (run_id_0, check_key_2),
+                (run_id_1, check_key_1),
+                (run_id_1, check_key_3),
+            ]:
+                storage.store_event(
+                    dg.EventLogEntry(
+                        error_info=None,
+                        user_message="",
+                        level="debug",
+                        run_id=run_id,
+                        timestamp=time.time(),
+                        dagster_event=dg.DagsterEvent(
+                            DagsterEventType.ASSET_CHECK_EVALUATION_PLANNED.value,
+                            "nonce",
+                            event_specific_data=AssetCheckEvaluationPlanned(
+                                asset_key=check_key.asset_key, check_name=check_key.name
+                            ),
+                        ),
+                    )
+                )
+
+            executions = storage.get_latest_asset_check_executions_by_asset_key(
+                [check_key_1.asset_key, dg.AssetKey(["missing"])]
+            )
+            assert set(executions.keys()) == {check_key_1.asset_key}
+            assert set(executions[check_key_1.asset_key].keys()) == {check_key_1, check_key_2}
+            assert executions[check_key_1.asset_key][check_key_1].run_id == run_id_1
+            assert executions[check_key_1.asset_key][check_key_2].run_id == run_id_0
+            assert executions[
+                check_key_1.asset_key
+            ] == storage.get_latest_asset_check_execution_by_key([check_key_1, check_key_2])
+
     def test_asset_check_summary_record(
         self,
         storage: EventLogStorage,
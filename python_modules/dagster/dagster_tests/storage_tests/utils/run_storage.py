@@ -1739,6 +1739,72 @@ def test_backfill_id_filtering(self, storage: RunStorage):
         )
         assert backfills_for_id[0].backfill_id == backfill.backfill_id
 
+    def test_runs_feed_entries(self, storage: RunStorage):
+        if not self.supports_add_historical_run():
+            pytest.skip("Storage does not support adding a historical run")
+        origin = self.fake_partition_set_origin("fake_partition_set")
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+        expected_entries = []
+        for i in range(3):
+            run = dg.DagsterRun(run_id=make_new_run_id(), job_name="some_job")
+            storage.add_historical_run(run, start + timedelta(hours=2 * i))
+            backfill = PartitionBackfill(
+                f"backfill_{i}",
+                partition_set_origin=origin,
+                status=BulkActionStatus.REQUESTED,
+                partition_names=["a", "b", "c"],
+                from_failure=False,
+                tags={},
+                backfill_timestamp=(start + timedelta(hours=2 * i + 1)).timestamp(),
+            )
+            storage.add_backfill(backfill)
+            # runs launched by a backfill are excluded from the feed
+            storage.add_historical_run(
+                dg.DagsterRun(
+                    run_id=make_new_run_id(),
+                    job_name="some_job",
+                    tags={BACKFILL_ID_TAG: backfill.backfill_id},
+                ),
+                start + timedelta(hours=2 * i + 1),
+            )
+            expected_entries = [backfill.backfill_id, run.run_id, *expected_entries]
+
+        def _entry_ids(entries):
+            return [
+                entry.dagster_run.run_id if isinstance(entry, dg.RunRecord) else entry.backfill_id
+                for entry in entries
+            ]
+
+        runs_filter = dg.RunsFilter(exclude_subruns=True)
+        backfills_filter = BulkActionsFilter()
+        first_page = storage.get_runs_feed_entries(
+            limit=4, runs_filter=runs_filter, backfills_filter=backfills_filter
+        )
+        assert _entry_ids(first_page) == expected_entries[:4]
+
+        second_page = storage.get_runs_feed_entries(
+            limit=4,
+            runs_filter=runs_filter,
+            backfills_filter=backfills_filter,
+            run_cursor=expected_entries[3],
+            backfill_cursor=expected_entries[2],
+        )
+        assert _entry_ids(second_page) == expected_entries[4:]
+
+        assert _entry_ids(storage.get_runs_feed_entries(limit=10, runs_filter=runs_filter)) == [
+            expected_entries[i] for i in (1, 3, 5)
+        ]
+        assert _entry_ids(
+            storage.get_runs_feed_entries(limit=10, backfills_filter=backfills_filter)
+        ) == [expected_entries[i] for i in (0, 2, 4)]
+        assert storage.get_runs_feed_entries(limit=10) == []
+
+        assert storage.get_runs_feed_count(runs_filter, backfills_filter) == 6
+        assert storage.get_runs_feed_count(dg.RunsFilter(), backfills_filter) == 9
+        assert storage.get_runs_feed_count(backfills_filter=backfills_filter) == 3
+        assert storage.get_runs_feed_count() == 0
+
     def test_secondary_index(self, storage):
         self._skip_in_memory(storage)
 
@@ -1,11 +1,18 @@
 import asyncio
 import random
+import threading
 from collections.abc import Iterable
 from functools import cached_property
 from unittest import mock
 
 import pytest
-from dagster._core.loader import LoadableBy, LoadingContext
+from dagster._core.loader import (
+    LoadableBy,
+    LoadingContext,
+    get_storage_executor,
+    offload_blocking_loads,
+)
+from dagster._utils import Counter, traced_counter
 from dagster._utils.aiodataloader import DataLoader
 from dagster_shared.record import record
 
@@ -202,3 +209,67 @@ def test_sync_loadable_by() -> None:
     d2 = LoadableThing.blocking_get(context, "d")
     assert d1 == d2
     assert context.instance.query.call_count == 2
+
+
+def test_offload_blocking_loads() -> None:
+    class ThreadRecordingThing(LoadableThing):
+        @classmethod
+        def _blocking_batch_load(
+            cls,
+            keys: Iterable[str],
+            context: BasicLoadingContext,
+        ) -> list["LoadableThing"]:
+            context.instance.query(list(keys), threading.current_thread())
+            return [LoadableThing(key, 0) for key in keys]
+
+    async def _load(context: BasicLoadingContext) -> None:
+        await asyncio.gather(
+            ThreadRecordingThing.gen(context, "a"), ThreadRecordingThing.gen(context, "b")
+        )
+
+    context = BasicLoadingContext()
+    asyncio.run(_load(context))
+    context.instance.query.assert_called_once_with(["a", "b"], threading.current_thread())
+
+    async def _load_offloaded(context: BasicLoadingContext) -> None:
+        with offload_blocking_loads():
+            await _load(context)
+
+    context = BasicLoadingContext()
+    asyncio.run(_load_offloaded(context))
+    # still batched, but run on the executor of the storage instead of the event loop
+    context.instance.query.assert_called_once()
+    keys, thread = context.instance.query.call_args.args
+    assert keys == ["a", "b"]
+    assert thread is not threading.current_thread()
+    assert get_storage_executor(context.instance.event_log_storage) is get_storage_executor(
+        context.instance.event_log_storage
+    )
+    assert get_storage_executor(context.instance.event_log_storage) is not get_storage_executor(
+        context.instance.run_storage
+    )
+
+    context.clear_loaders()
+    assert not context.loaders
+
+
+def test_traced_batch_loads() -> None:
+    async def _load(context: BasicLoadingContext) -> None:
+        await asyncio.gather(LoadableThing.gen(context, "a"), LoadableThing.gen(context, "b"))
+
+    async def _load_offloaded(context: BasicLoadingContext) -> None:
+        traced_counter.set(Counter())
+        with offload_blocking_loads():
+            await _load(context)
+            # the counter of the caller is used by loads run on the storage executor
+            return traced_counter.get()
+
+    counter = asyncio.run(_load_offloaded(BasicLoadingContext()))
+    assert [size for size, _ in counter.batches()["LoadableThing"]] == [2]
+
+    traced_counter.set(Counter())
+    context = BasicLoadingContext()
+    LoadableThing.blocking_get_many(context, ["a", "b", "c"])
+    counter = traced_counter.get()
+    assert counter
+    assert [size for size, _ in counter.batches()["LoadableThing"]] == [3]
@@ -260,6 +260,28 @@ def download_from_cloud_storage(
         with open(path, "wb") as fileobj:
             self._s3_session.download_fileobj(self._s3_bucket, s3_key, fileobj)
 
+    def download_range_from_cloud_storage(
+        self,
+        log_key: Sequence[str],
+        io_type: ComputeIOType,
+        offset: int,
+        max_bytes: int,
+        partial=False,
+    ) -> Optional[bytes]:
+        if max_bytes <= 0:
+            return b""
+        s3_key = self._s3_key(log_key, io_type, partial=partial)
+        try:
+            response = self._s3_session.get_object(
+                Bucket=self._s3_bucket, Key=s3_key, Range=f"bytes={offset}-{offset + max_bytes - 1}"
+            )
+        except ClientError as e:
+            # the range starts past the end of the object
+            if e.response.get("Error", {}).get("Code") == "InvalidRange":
+                return b""
+            raise
+        return response["Body"].read()
+
     def get_log_keys_for_log_key_prefix(
         self, log_key_prefix: Sequence[str], io_type: ComputeIOType
     ) -> Sequence[Sequence[str]]:
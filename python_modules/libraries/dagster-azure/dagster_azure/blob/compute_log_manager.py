@@ -32,7 +32,7 @@
 from dagster._utils import ensure_dir
 from typing_extensions import Self
 
-from dagster_azure.blob.utils import create_blob_client, generate_blob_sas
+from dagster_azure.blob.utils import HttpResponseError, create_blob_client, generate_blob_sas
 
 
 class AzureBlobComputeLogManager(TruncatingCloudStorageComputeLogManager, ConfigurableClass):
@@ -367,6 +367,26 @@ def download_from_cloud_storage(
             blob = self._container_client.get_blob_client(blob_key)
             blob.download_blob().readinto(fileobj)
 
+    def download_range_from_cloud_storage(
+        self,
+        log_key: Sequence[str],
+        io_type: ComputeIOType,
+        offset: int,
+        max_bytes: int,
+        partial=False,
+    ) -> Optional[bytes]:
+        if max_bytes <= 0:
+            return b""
+        blob_key = self._blob_key(log_key, io_type, partial=partial)
+        blob = self._container_client.get_blob_client(blob_key)
+        try:
+            return blob.download_blob(offset=offset, length=max_bytes).readall()
+        except HttpResponseError as e:
+            # the range starts past the end of the blob
+            if e.status_code == 416:
+                return b""
+            raise
+
     def get_log_keys_for_log_key_prefix(
         self, log_key_prefix: Sequence[str], io_type: ComputeIOType
     ) -> Sequence[Sequence[str]]:
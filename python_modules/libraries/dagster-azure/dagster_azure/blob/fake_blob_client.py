@@ -4,7 +4,7 @@
 from dataclasses import dataclass
 from unittest import mock
 
-from dagster_azure.blob.utils import ResourceNotFoundError
+from dagster_azure.blob.utils import HttpResponseError, ResourceNotFoundError
 
 
 class FakeBlobServiceClient:
@@ -157,10 +157,17 @@ def acquire_lease(self, lease_duration=-1):
         else:
             raise Exception("Lease already held")
 
-    def download_blob(self):
+    def download_blob(self, offset=None, length=None):
         if self.contents is None:
             raise ResourceNotFoundError("File does not exist!")
-        return FakeBlobDownloader(contents=self.contents)
+        if offset is None:
+            return FakeBlobDownloader(contents=self.contents)
+        if offset >= len(self.contents):
+            error = HttpResponseError("The range specified is invalid!")
+            error.status_code = 416
+            raise error
+        end = None if length is None else offset + length
+        return FakeBlobDownloader(contents=self.contents[offset:end])
 
 
 class FakeBlobDownloader:
@@ -2,7 +2,7 @@
 
 try:
     # Centralise Azure imports here so we only need to warn in one place
-    from azure.core.exceptions import ResourceNotFoundError
+    from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
     from azure.storage.blob import BlobLeaseClient, BlobServiceClient, generate_blob_sas
 except ImportError:
     msg = (
@@ -31,6 +31,7 @@ def create_blob_client(storage_account: str, credential) -> BlobServiceClient:
 __all__ = [
     "BlobLeaseClient",
     "BlobServiceClient",
+    "HttpResponseError",
     "ResourceNotFoundError",
     "create_blob_client",
     "generate_blob_sas",
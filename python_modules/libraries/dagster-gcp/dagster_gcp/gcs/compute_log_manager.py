@@ -23,6 +23,7 @@
 )
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 from dagster._utils import ensure_dir
+from google.api_core.exceptions import RequestRangeNotSatisfiable
 from google.cloud import storage
 from typing_extensions import Self
 
@@ -230,6 +231,25 @@ def download_from_cloud_storage(
         with open(path, "wb") as fileobj:
             self._bucket.blob(gcs_key).download_to_file(fileobj)
 
+    def download_range_from_cloud_storage(
+        self,
+        log_key: Sequence[str],
+        io_type: ComputeIOType,
+        offset: int,
+        max_bytes: int,
+        partial=False,
+    ) -> Optional[bytes]:
+        if max_bytes <= 0:
+            return b""
+        gcs_key = self._gcs_key(log_key, io_type, partial=partial)
+        try:
+            return self._bucket.blob(gcs_key).download_as_bytes(
+                start=offset, end=offset + max_bytes - 1
+            )
+        except RequestRangeNotSatisfiable:
+            # the range starts past the end of the blob
+            return b""
+
     def get_log_keys_for_log_key_prefix(
         self, log_key_prefix: Sequence[str], io_type: ComputeIOType
     ) -> Sequence[Sequence[str]]:
@@ -22,6 +22,7 @@
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
 from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
+from dagster._core.storage.event_log.sql_event_log import DYNAMIC_PARTITIONS_INSERT_CHUNK_SIZE
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -299,16 +300,19 @@ def add_dynamic_partitions(
         # Overload base implementation to push upsert logic down into the db layer
         self._check_partitions_table()
         with self.index_connection() as conn:
-            conn.execute(
-                db_dialects.postgresql.insert(DynamicPartitionsTable)
-                .values(
-                    [
-                        dict(partitions_def_name=partitions_def_name, partition=partition_key)
-                        for partition_key in partition_keys
-                    ]
+            for chunk_start in range(0, len(partition_keys), DYNAMIC_PARTITIONS_INSERT_CHUNK_SIZE):
+                conn.execute(
+                    db_dialects.postgresql.insert(DynamicPartitionsTable)
+                    .values(
+                        [
+                            dict(partitions_def_name=partitions_def_name, partition=partition_key)
+                            for partition_key in partition_keys[
+                                chunk_start : chunk_start + DYNAMIC_PARTITIONS_INSERT_CHUNK_SIZE
+                            ]
+                        ]
+                    )
+                    .on_conflict_do_nothing(),
                 )
-                .on_conflict_do_nothing(),
-            )
 
     def _connect(self) -> ContextManager[Connection]:
         return create_pg_connection(self._engine)